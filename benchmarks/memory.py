@@ -0,0 +1,83 @@
+"""
+Benchmark of memory overhead of objects created during selection.
+
+Measures with `tracemalloc` memory allocated per element wrapper
+for each backend, per entry of `TagResultSet` set operations
+and per operation instance, excluding memory of parsed documents.
+
+Usage
+-----
+>>> python -m benchmarks.memory --elements 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from benchmarks.parsing import generate_page
+
+
+def allocated(factory: Callable[[], Any]) -> tuple[int, Any]:
+    """Returns number of bytes allocated by the factory and its result."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = factory()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    return after - before, result
+
+
+def roots(markup: str) -> dict[str, Callable[[], Any]]:
+    """Returns factories of root elements of the page for each backend."""
+    from bs4 import BeautifulSoup
+    from lxml import html
+
+    from soupsavvy.implementation.bs4 import SoupElement
+    from soupsavvy.implementation.compact import CompactElement
+    from soupsavvy.implementation.lxml import LXMLElement
+
+    soup = BeautifulSoup(markup, "lxml")
+    tree = html.fromstring(markup)
+    compact = CompactElement.from_html(markup)
+
+    return {
+        "bs4": lambda: SoupElement(soup),
+        "lxml": lambda: LXMLElement(tree),
+        "compact": lambda: CompactElement(compact.node),
+    }
+
+
+def main() -> None:
+    from soupsavvy.operations import Operation, Text
+    from soupsavvy.utils.selector_utils import TagResultSet
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--elements", type=int, default=20_000)
+    args = parser.parse_args()
+
+    markup = generate_page(args.elements)
+    print(f"{'measurement':<32}{'count':>10}{'bytes/object':>14}")
+
+    for name, root in roots(markup).items():
+        size, elements = allocated(lambda: list(root().descendants))
+        label = f"{name} element"
+        print(f"{label:<32}{len(elements):>10}{size / len(elements):>14.1f}")
+
+        results = TagResultSet(elements)
+        size, wrappers = allocated(lambda: results._to_set(base=True))
+        label = f"{name} result set entry"
+        print(f"{label:<32}{len(wrappers):>10}{size / len(wrappers):>14.1f}")
+
+    count = args.elements
+    size, _ = allocated(lambda: [Text() | Operation(int) for _ in range(count)])
+    print(f"{'operation pipeline':<32}{count:>10}{size / count:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark of parsing html into trees used by `soupsavvy` backends.
+
+Compares dependency-free `CompactHTMLParser` with `bs4` using `html.parser`
+and `lxml` features and with `lxml.html` parser, including import time
+of each parser measured in a fresh interpreter.
+
+Usage
+-----
+>>> python -m benchmarks.parsing --elements 20000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+import timeit
+from collections.abc import Callable
+
+IMPORTS = {
+    "compact": "from soupsavvy.implementation.compact import CompactDocument",
+    "bs4 (html.parser)": "from bs4 import BeautifulSoup",
+    "bs4 (lxml)": "from bs4 import BeautifulSoup; import lxml",
+    "lxml.html": "import lxml.html",
+}
+
+
+def generate_page(elements: int) -> str:
+    """Generates product listing page with approximately given number of elements."""
+    items = "".join(
+        f'<li class="product item-{i % 7}" data-id="{i}">'
+        f'<a href="/product/{i}" title="Product {i}">Product &amp; {i}</a>'
+        f'<span class="price">{i % 100}.99</span><br>'
+        f"<p>Description of product {i} with <b>bold</b> text.</p></li>"
+        for i in range(elements // 6)
+    )
+    return (
+        "<!DOCTYPE html><html><head><title>Listing</title>"
+        "<script>var a = 1 < 2;</script></head>"
+        f'<body><div id="main"><ul>{items}</ul></div></body></html>'
+    )
+
+
+def parsers() -> dict[str, Callable[[str], object]]:
+    from bs4 import BeautifulSoup
+    from lxml import html
+
+    from soupsavvy.implementation.compact import CompactDocument
+
+    return {
+        "compact": CompactDocument.from_html,
+        "bs4 (html.parser)": lambda markup: BeautifulSoup(markup, "html.parser"),
+        "bs4 (lxml)": lambda markup: BeautifulSoup(markup, "lxml"),
+        "lxml.html": html.fromstring,
+    }
+
+
+def import_time(statement: str) -> float:
+    """Measures import time of the statement in a fresh interpreter."""
+    code = (
+        "import time; start = time.perf_counter(); "
+        f"{statement}; print(time.perf_counter() - start)"
+    )
+    output = subprocess.check_output([sys.executable, "-c", code], text=True)
+    return float(output)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--elements", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    markup = generate_page(args.elements)
+    print(f"page: {len(markup) / 1e6:.2f} MB, ~{args.elements} elements")
+    print(f"{'parser':<20}{'import [ms]':>12}{'parse [ms]':>12}")
+
+    for name, parse in parsers().items():
+        imported = import_time(IMPORTS[name]) * 1000
+        parsed = min(timeit.repeat(lambda: parse(markup), number=1, repeat=args.repeat))
+        print(f"{name:<20}{imported:>12.1f}{parsed * 1000:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark of partial parsing of documents limited to the scope of the model.
+
+Compares time and peak memory of parsing whole page with `bs4` (`lxml` features)
+and `lxml`
+with parsing only subtrees matched by the scope selector with
+`SoupElement.from_scope` and `LXMLElement.from_scope`, followed by extraction
+of the model from the document. Peak memory is traced only for python
+objects, trees of `lxml` are allocated by `libxml2`, so number of elements
+kept in the document is reported as well.
+
+Usage
+-----
+>>> python -m benchmarks.partial --elements 100000 --repeat 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from benchmarks.parsing import generate_page
+
+if TYPE_CHECKING:
+    from soupsavvy.models import BaseModel
+
+
+def peak(function: Callable[[], Any]) -> int:
+    """Returns peak memory in bytes allocated while calling the function."""
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def cases(markup: str) -> tuple[type[BaseModel], dict[str, Callable[[], Any]]]:
+    """Returns model and functions parsing the page into its root element."""
+    from bs4 import BeautifulSoup
+    from lxml import html
+
+    from soupsavvy import ClassSelector, TypeSelector
+    from soupsavvy.implementation.bs4 import SoupElement
+    from soupsavvy.implementation.lxml import LXMLElement
+    from soupsavvy.models import BaseModel
+    from soupsavvy.operations import Text
+
+    class Price(BaseModel):
+        __scope__ = TypeSelector("span") & ClassSelector("price")
+
+        value = Text()
+
+    scope = Price.__scope__
+
+    return Price, {
+        "bs4 (full)": lambda: SoupElement(BeautifulSoup(markup, "lxml")),
+        "bs4 (scope)": lambda: SoupElement.from_scope(markup, scope, features="lxml"),
+        "lxml (full)": lambda: LXMLElement(html.fromstring(markup)),
+        "lxml (scope)": lambda: LXMLElement.from_scope(markup, scope),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--elements", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    markup = generate_page(args.elements)
+    print(f"page: {len(markup) / 1e6:.2f} MB, ~{args.elements} elements")
+    print(f"{'case':<16}{'time [ms]':>12}{'peak [MB]':>12}{'elements':>10}")
+    model, parsers = cases(markup)
+
+    for name, parse in parsers.items():
+        function = lambda: model.find_all(parse())  # noqa: E731
+        timing = min(timeit.repeat(function, number=1, repeat=args.repeat))
+        memory = peak(function) / 1e6
+        elements = sum(1 for _ in parse().descendants)
+        print(f"{name:<16}{timing * 1000:>12.1f}{memory:>12.1f}{elements:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark of traversal of `bs4` trees by `SoupElement`.
+
+Compares traversal and search of `SoupElement` with generator-based traversal
+of `bs4` (`descendants` filtered with `isinstance`) and with native `bs4`
+searches: `find_all` with filters and `SoupStrainer` and `select`.
+
+Usage
+-----
+>>> python -m benchmarks.traversal --elements 20000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import timeit
+from collections.abc import Callable
+from typing import Any
+
+from benchmarks.parsing import generate_page
+
+
+def cases(markup: str) -> dict[str, dict[str, Callable[[], Any]]]:
+    """Returns implementations of each traversal case to compare."""
+    import bs4
+    from bs4 import BeautifulSoup, SoupStrainer
+
+    from soupsavvy import ClassSelector, PatternSelector, TypeSelector
+    from soupsavvy.implementation.bs4 import SoupElement
+
+    soup = BeautifulSoup(markup, "lxml")
+    element = SoupElement(soup)
+    ul = soup.find("ul")
+    assert isinstance(ul, bs4.Tag)
+    pattern = re.compile(r"^9\d\.99$")
+
+    def generator(node: bs4.Tag) -> list[bs4.Tag]:
+        return [x for x in node.descendants if isinstance(x, bs4.Tag)]
+
+    return {
+        "descendants": {
+            "generator": lambda: generator(soup),
+            "find_all(True)": lambda: soup.find_all(True),
+            "soupsavvy": lambda: list(element.descendants),
+        },
+        "children": {
+            "generator": lambda: [x for x in ul.children if isinstance(x, bs4.Tag)],
+            "find_all(True)": lambda: ul.find_all(True, recursive=False),
+            "soupsavvy": lambda: list(SoupElement(ul).children),
+        },
+        "type": {
+            "generator": lambda: [x for x in generator(soup) if x.name == "a"],
+            "find_all": lambda: soup.find_all("a"),
+            "select": lambda: soup.select("a"),
+            "soupsavvy": lambda: TypeSelector("a").find_all(element),
+        },
+        "class": {
+            "find_all": lambda: soup.find_all(None, {"class": "price"}),
+            "SoupStrainer": lambda: soup.find_all(SoupStrainer(class_="price")),
+            "select": lambda: soup.select(".price"),
+            "soupsavvy": lambda: ClassSelector("price").find_all(element),
+        },
+        "text": {
+            "find_all": lambda: soup.find_all(string=pattern),
+            "soupsavvy": lambda: PatternSelector(pattern).find_all(element),
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--elements", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    markup = generate_page(args.elements)
+    print(f"page: {len(markup) / 1e6:.2f} MB, ~{args.elements} elements")
+    print(f"{'case':<14}{'implementation':<18}{'time [ms]':>10}")
+
+    for case, implementations in cases(markup).items():
+        for name, function in implementations.items():
+            timing = min(timeit.repeat(function, number=1, repeat=args.repeat))
+            print(f"{case:<14}{name:<18}{timing * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,7 +7,17 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from collections.abc import Iterable
-from typing import TYPE_CHECKING, Any, Literal, Optional, Union, cast, overload
+from contextvars import ContextVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Literal,
+    Optional,
+    Pattern,
+    Union,
+    cast,
+    overload,
+)
 
 from typing_extensions import deprecated
 
@@ -15,6 +25,7 @@ import soupsavvy.exceptions as exc
 from soupsavvy.interfaces import (
     Comparable,
     Executable,
+    IAsyncElement,
     IBrowser,
     IElement,
     TagSearcher,
@@ -34,6 +45,10 @@ if TYPE_CHECKING:
     )
     from soupsavvy.selectors.logical import AndSelector, SelectorList, XORSelector
 
+# set while selector is searched in python after its program could not be executed,
+# selectors nested in it are searched in python without compiling them again
+_SEARCHING: ContextVar[bool] = ContextVar("_SEARCHING", default=False)
+
 
 def check_selector(x: Any, message: Optional[str] = None) -> SoupSelector:
     """
@@ -151,15 +166,56 @@ class SoupSelector(TagSearcher, Comparable):
         and returns them in a list.
         Additionally `limit` and `recursive` parameters can be set.
 
+    - afind, afind_all
+
+        Asynchronous counterparts of `find` and `find_all` for `IAsyncElement`,
+        which return live elements found with a single awaited call.
+
     Notes
     -----
     - Specific selector inheriting from this class, need to implement:
-        - `find_all` method that returns a list of matching elements.
+        - `_find_all` method that returns a list of matching elements.
         - `__eq__` method to compare two selectors for equality.
     - Optionally `find` method can be implemented to return first matching element,
     but, by default, it uses `find_all` under the hood.
+    - Elements, which execute selector programs natively, like browser elements,
+    are searched by `find_all` with a single call running whole selector,
+    when it can be serialized, before `_find_all` of the selector is used.
+    Selectors overriding `find_all` itself are always searched with their method.
     """
 
+    # selector is context-free if matching of an element does not depend on
+    # the element the search was started from, which allows sharing results
+    # of a single search across many elements of the same document
+    _CONTEXT_FREE = False
+
+    @property
+    def _context_free(self) -> bool:
+        """Returns True if results of the selector do not depend on searched element."""
+        return self._CONTEXT_FREE
+
+    @property
+    def _requirements(self) -> frozenset[tuple[str, str]]:
+        """
+        Returns tag name ("tag", name) and class tokens ("class", token),
+        that every element matched by the selector has. Subtrees of indexed
+        documents, which do not contain all of them, are skipped in searches.
+        """
+        return frozenset()
+
+    @property
+    def _parse_filter(
+        self,
+    ) -> Optional[tuple[Optional[str], dict[str, list[Union[str, Pattern[str]]]]]]:
+        """
+        Returns tag name and attributes, which element needs to have to be matched
+        by the selector, if selector is fully described by them. Each attribute
+        maps to the list of values, which all need to be matched by the element.
+        Such selectors can be evaluated by parsers, while the document is being
+        parsed. Returns None if selector depends on anything else.
+        """
+        return None
+
     @overload
     def find(
         self,
@@ -226,7 +282,6 @@ class SoupSelector(TagSearcher, Comparable):
 
         return result
 
-    @abstractmethod
     def find_all(
         self,
         tag: IElement,
@@ -235,6 +290,10 @@ class SoupSelector(TagSearcher, Comparable):
     ) -> list[IElement]:
         """
         Finds all elements matching selector in provided `IElement`.
+        Elements, which execute selector programs natively, like browser elements,
+        are searched with a single call running whole selector, if it can be
+        serialized. Otherwise, selector is searched with `_find_all` and selectors
+        nested in it are searched in python as well.
 
         Parameters
         ----------
@@ -254,6 +313,35 @@ class SoupSelector(TagSearcher, Comparable):
             List of `IElement` objects matching selector.
             If none found, the list is empty.
         """
+        if not tag._EXECUTES_PROGRAMS or _SEARCHING.get():
+            return self._find_all(tag, recursive=recursive, limit=limit)
+
+        from soupsavvy.implementation import remote
+
+        found = remote.execute(self, tag, recursive=recursive, limit=limit)
+
+        if found is not None:
+            return found
+
+        # program is compiled once, nested selectors are not executed again
+        token = _SEARCHING.set(True)
+
+        try:
+            return self._find_all(tag, recursive=recursive, limit=limit)
+        finally:
+            _SEARCHING.reset(token)
+
+    def _find_all(
+        self,
+        tag: IElement,
+        recursive: bool = True,
+        limit: Optional[int] = None,
+    ) -> list[IElement]:
+        """
+        Finds all elements matching selector in provided `IElement` in python,
+        implemented by specific selectors. Parameters and returned value
+        are the same as of `find_all`.
+        """
         raise NotImplementedError(
             f"{self.__class__.__name__} is an interface, "
             "and does not implement this method."
@@ -280,6 +368,81 @@ class SoupSelector(TagSearcher, Comparable):
         elements = self.find_all(tag, recursive=recursive, limit=1)
         return elements[0] if elements else None
 
+    async def afind(
+        self,
+        tag: IAsyncElement,
+        strict: bool = False,
+        recursive: bool = True,
+    ) -> Optional[IAsyncElement]:
+        """
+        Finds the first matching element in provided `IAsyncElement`.
+        Selector is executed in the page with a single awaited call if possible,
+        otherwise it is searched in snapshot of the element.
+
+        Parameters
+        ----------
+        tag : IAsyncElement
+            Any `IAsyncElement` object to search within.
+        strict : bool, optional
+            If `True`, raises an exception if element was not found in markup,
+            if `False` and element was not found, returns `None`.
+            By default `False`.
+        recursive : bool, optional
+            Specifies if search should be recursive.
+            If set to `False`, only direct children of the element will be searched.
+            By default `True`.
+
+        Returns
+        -------
+        IAsyncElement | None
+            First live element matching selector or `None` if none matching.
+
+        Raises
+        ------
+        TagNotFoundException
+            If strict parameter is set to `True` and none matching element was found.
+        """
+        from soupsavvy.implementation import remote
+
+        result = await remote.afind(self, tag, recursive=recursive)
+
+        if result is None and strict:
+            raise exc.TagNotFoundException("Tag was not found in markup.")
+
+        return result
+
+    async def afind_all(
+        self,
+        tag: IAsyncElement,
+        recursive: bool = True,
+        limit: Optional[int] = None,
+    ) -> list[IAsyncElement]:
+        """
+        Finds all elements matching selector in provided `IAsyncElement`.
+        Selector is executed in the page with a single awaited call if possible,
+        otherwise it is searched in snapshot of the element.
+
+        Parameters
+        ----------
+        tag : IAsyncElement
+            Any `IAsyncElement` object to search within.
+        recursive : bool, optional
+            Specifies if search should be recursive.
+            If set to `False`, only direct children of the element will be searched.
+            By default `True`.
+        limit : int, optional
+            Specifies maximum number of elements to return.
+            By default `None`, all found elements are returned.
+
+        Returns
+        -------
+        list[IAsyncElement]
+            List of live elements matching selector.
+        """
+        from soupsavvy.implementation import remote
+
+        return await remote.afind_all(self, tag, recursive=recursive, limit=limit)
+
     @overload
     def __or__(self, x: SoupSelector) -> SelectorList: ...
 
@@ -746,6 +909,16 @@ class CompositeSoupSelector(SoupSelector):
         """
         self._selectors = [check_selector(selector) for selector in selectors]
 
+    @property
+    def _context_free(self) -> bool:
+        """
+        Composite selector is context-free if it is declared as such
+        and all of its selectors are context-free.
+        """
+        return self._CONTEXT_FREE and all(
+            selector._context_free for selector in self.selectors
+        )
+
     @property
     def selectors(self) -> list[SoupSelector]:
         """
@@ -819,6 +992,8 @@ class BaseOperation(Executable, Comparable):
     `__eq__` method needs to be implemented in derived classes.
     """
 
+    __slots__ = ()
+
     def execute(self, arg: Any) -> Any:
         """
         Execute the operation on the given argument and return the result.
@@ -898,6 +1073,8 @@ class OperationSearcherMixin(BaseOperation, TagSearcher):
     to perform operation directly on scope element.
     """
 
+    __slots__ = ()
+
     def find_all(
         self,
         tag: IElement,
@@ -967,6 +1144,8 @@ class BrowserOperation(BaseOperation):
     Each derived operation class needs to implement `__eq__` method.
     """
 
+    __slots__ = ()
+
     _PASSTHROUGH_BROWSER = True
 
     def execute(self, arg: IBrowser) -> Any:
@@ -1010,6 +1189,8 @@ class ElementAction(Comparable):
     `__eq__` method needs to be implemented in derived classes.
     """
 
+    __slots__ = ()
+
     def execute(self, browser: IBrowser, element: IElement) -> None:
         """
         Execute the action on provided element within the browser context.
@@ -34,6 +34,14 @@ class NotSoupSelectorException(SoupSelectorException, TypeError):
     """
 
 
+class UnsupportedScopeException(SoupSelectorException):
+    """
+    Exception to be raised when document can not be parsed partially
+    for the scope selector, because matching of the selector does not depend
+    only on tag name and attributes of the element.
+    """
+
+
 class InvalidCSSSelector(SoupsavvyException):
     """
     Raised when the provided CSS selector is invalid.
@@ -191,6 +199,14 @@ class NotBrowserException(OperationException, TypeError):
     """
 
 
+class StaleSnapshotException(SoupsavvyException):
+    """
+    Exception to be raised when element of the page snapshot can not be mapped
+    back to the live element, because page was changed, navigated
+    or newer snapshot was taken.
+    """
+
+
 #! MODELS
 
 
@@ -266,3 +282,13 @@ class ModelNotJsonSerializableException(BaseModelException):
     Exception raised by `BaseModel` when trying to serialize model to JSON
     but one of its fields is not JSON serializable.
     """
+
+
+#! DOCUMENTS
+
+
+class InvalidDocumentFormat(SoupsavvyException):
+    """
+    Exception raised when loading compact document from a file, which is not
+    a valid document file or was written in unsupported version of the format.
+    """
@@ -0,0 +1,303 @@
+"""
+Module with asynchronous implementation for `playwright.async_api`.
+
+Single event loop can drive many pages concurrently, as each search
+is awaited as a single call to the page. Selectors, which can be serialized,
+are executed in the page and return live elements. Other selectors, models
+and pipelines are processed in-process on snapshot of the element.
+Live elements are read with awaited accessors, like `get_text`.
+
+Classes
+-------
+- `AsyncPlaywrightElement` - Asynchronous element wrapping `ElementHandle`.
+- `AsyncPlaywrightBrowser` - Asynchronous browser wrapping `Page`.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Optional, Union, cast
+from uuid import uuid4
+
+from playwright.async_api import ElementHandle, JSHandle, Page
+from typing_extensions import Self
+
+import soupsavvy.exceptions as exc
+import soupsavvy.implementation.snippets.js.playwright as js
+from soupsavvy.implementation.compact import CompactElement
+from soupsavvy.implementation.snapshot import (
+    SNAPSHOT_ATTRIBUTE,
+    get_snapshot,
+    parse_snapshot,
+)
+from soupsavvy.implementation.snippets import xpath
+from soupsavvy.interfaces import IAsyncBrowser, IAsyncElement, IElement
+
+
+class AsyncPlaywrightElement(IAsyncElement[ElementHandle]):
+    """
+    Implementation of `IAsyncElement` for asynchronous `playwright` handles.
+    Element is searched with awaited `afind` and `afind_all` methods
+    of selectors, models and pipelines.
+
+    Example
+    -------
+    >>> from playwright.async_api import async_playwright
+    >>> from soupsavvy.implementation.async_playwright import AsyncPlaywrightElement
+    >>> async with async_playwright() as p:
+    ...     browser = await p.chromium.launch()
+    ...     page = await browser.new_page()
+    ...     await page.goto("https://example.com")
+    ...     handle = await page.query_selector("body")
+    ...     element = await AsyncPlaywrightElement.from_node(handle)
+    ...     links = await TypeSelector("a").afind_all(element)
+    ...     texts = [await link.get_text() for link in links]
+    """
+
+    __slots__ = ("_id",)
+
+    _NODE_TYPE = ElementHandle
+    # property of the element matching text returned by `text_content`
+    _TEXT_PROPERTY = "textContent"
+
+    def __init__(self, node: ElementHandle, *args, identifier: str, **kwargs):
+        """
+        Initializes the implementation with the given handle.
+
+        Parameters
+        ----------
+        node : ElementHandle
+            Handle of the element to wrap.
+        identifier : str
+            Identifier already assigned to the element in the page,
+            elements are created with `from_node`, which assigns it.
+        """
+        super().__init__(node, *args, **kwargs)
+        self._id = identifier
+
+    @classmethod
+    async def from_node(cls, node: ElementHandle) -> Self:
+        """
+        Creates a new instance of the implementation from a handle,
+        assigning identifier to the element with a call to the page.
+
+        Parameters
+        ----------
+        node : ElementHandle
+            Handle of the element to wrap.
+
+        Returns
+        -------
+        Self
+            New instance of the implementation with the given handle.
+        """
+        identifier = await node.evaluate(js.ADD_IDENTIFIER_SCRIPT)
+        return cls(node, identifier=identifier)
+
+    async def _map(self, handles: list[ElementHandle]) -> list[Self]:
+        """
+        Maps handles to the implementation, assigning identifiers
+        to all elements in a single call to the page.
+        """
+        if not handles:
+            return []
+
+        identifiers = await self.node.evaluate(js.ADD_IDENTIFIERS_SCRIPT, handles)
+        return [
+            self.__class__(handle, identifier=identifier)
+            for handle, identifier in zip(handles, identifiers)
+        ]
+
+    async def _execute(
+        self,
+        program: list,
+        recursive: bool = True,
+        limit: Optional[int] = None,
+    ) -> Optional[list[Self]]:
+        found = await self.node.evaluate_handle(
+            js.EXECUTE_PROGRAM_SCRIPT,
+            [program, recursive, limit, self._TEXT_PROPERTY],
+        )
+        handles = await _as_handles(found)
+        return await self._map([handle for handle in handles if handle is not None])
+
+    async def get_name(self) -> str:
+        name = await self.node.evaluate(js.TAG_NAME_SCRIPT)
+        return name.lower()
+
+    async def get_text(self) -> str:
+        return await self.node.text_content() or ""
+
+    async def get_attribute(self, name: str) -> Optional[str]:
+        # get live JS property first, then html attribute
+        property_ = await self.node.evaluate(js.GET_ATTRIBUTE_SCRIPT, name)
+
+        if property_ is not None:
+            return property_
+
+        return await self.node.get_attribute(name)
+
+    async def get_attributes(self) -> dict[str, str]:
+        return await self.node.evaluate(js.ATTRIBUTES_SCRIPT)
+
+    async def get_parent(self) -> Optional[Self]:
+        handle = await self.node.evaluate_handle(js.PARENT_ELEMENT_SCRIPT)
+        element = handle.as_element()
+
+        if element is None:
+            return None
+
+        mapped = await self._map([element])
+        return mapped[0]
+
+    async def get_children(self) -> list[Self]:
+        handles = await self.node.query_selector_all(
+            f"xpath={xpath.FIND_ALL_CHILDREN_SELECTOR}"
+        )
+        return await self._map(handles)
+
+    async def snapshot(self) -> CompactElement:
+        markup = await self.node.evaluate(
+            js.SNAPSHOT_ELEMENT_SCRIPT, SNAPSHOT_ATTRIBUTE
+        )
+        # identifier of the element marks snapshots taken from it
+        return parse_snapshot(markup, self._id, root=self)
+
+    async def resolve(self, elements: Iterable[IElement]) -> list[Self]:
+        targets = []
+
+        for element in elements:
+            snapshot = get_snapshot(element)
+            identifier = None
+
+            if snapshot is not None and snapshot.token == self._id:
+                identifier = snapshot.identifier(element)  # type: ignore[arg-type]
+
+            if identifier is None:
+                raise exc.StaleSnapshotException(
+                    f"Element {element!r} is not part of the snapshot of {self!r}."
+                )
+
+            targets.append([identifier, element.name])
+
+        if not targets:
+            return []
+
+        found = await self.node.evaluate_handle(js.RESOLVE_ELEMENTS_SCRIPT, targets)
+        handles = await _as_handles(found)
+
+        if None in handles:
+            raise exc.StaleSnapshotException(
+                f"Elements can not be found in {self!r}, "
+                "element has changed since the snapshot was taken."
+            )
+
+        return await self._map(handles)  # type: ignore[arg-type]
+
+    def __hash__(self) -> int:
+        return hash((self._id, self.__class__))
+
+    def __eq__(self, other):
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+
+        return self._id == other._id
+
+
+async def _as_handles(handle: JSHandle) -> list[Optional[ElementHandle]]:
+    """Returns element handles from handle of the array, `None` for other items."""
+    properties = await handle.get_properties()
+    return [prop.as_element() for prop in properties.values()]
+
+
+class AsyncPlaywrightBrowser(IAsyncBrowser[Page, AsyncPlaywrightElement]):
+    """
+    Implementation of `IAsyncBrowser` for asynchronous `playwright` Page.
+
+    Example
+    -------
+    >>> from playwright.async_api import async_playwright
+    >>> from soupsavvy.implementation.async_playwright import AsyncPlaywrightBrowser
+    ...
+    >>> async with async_playwright() as p:
+    ...     browser = await p.chromium.launch()
+    ...     page = await browser.new_page()
+    ...     pw_browser = AsyncPlaywrightBrowser(page)
+    ...     await pw_browser.navigate("https://example.com")
+    ...     document = await pw_browser.get_document()
+    """
+
+    async def navigate(self, url: str) -> None:
+        await self.browser.goto(url)
+
+    async def click(self, element: Union[AsyncPlaywrightElement, IElement]) -> None:
+        live = await self.resolve(element)
+        await self.browser.evaluate(js.CLICK_ELEMENT_SCRIPT, live.node)
+
+    async def send_keys(
+        self,
+        element: Union[AsyncPlaywrightElement, IElement],
+        value: str,
+        clear: bool = True,
+    ) -> None:
+        live = await self.resolve(element)
+
+        if clear:
+            await live.node.fill("")
+
+        await live.node.type(value)
+
+    async def get_document(self) -> AsyncPlaywrightElement:
+        element = await self.browser.query_selector("html")
+
+        if element is None:
+            raise exc.TagNotFoundException("Could not find <html> element on the page.")
+
+        return await AsyncPlaywrightElement.from_node(element)
+
+    async def snapshot(self) -> CompactElement:
+        token = uuid4().hex
+        markup = await self.browser.evaluate(
+            js.SNAPSHOT_SCRIPT, [SNAPSHOT_ATTRIBUTE, token]
+        )
+        return parse_snapshot(markup, token)
+
+    async def resolve(
+        self, element: Union[AsyncPlaywrightElement, IElement]
+    ) -> AsyncPlaywrightElement:
+        snapshot = get_snapshot(element)
+
+        if snapshot is None:
+            return cast(AsyncPlaywrightElement, element)
+
+        if not snapshot.is_page:
+            # elements of snapshots of elements are mapped within that element
+            root = cast(AsyncPlaywrightElement, snapshot.root)
+            resolved = await root.resolve([cast(IElement, element)])
+            return resolved[0]
+
+        identifier = snapshot.identifier(element)  # type: ignore[arg-type]
+
+        if identifier is None:
+            raise exc.StaleSnapshotException(
+                f"Element {element!r} of the snapshot is not present in the page."
+            )
+
+        handle = await self.browser.evaluate_handle(
+            js.RESOLVE_SNAPSHOT_SCRIPT, [snapshot.token, identifier]
+        )
+        node = handle.as_element()
+
+        if node is None:
+            raise exc.StaleSnapshotException(
+                f"Element {element!r} can not be found in the page, "
+                "page has changed since the snapshot was taken."
+            )
+
+        return await AsyncPlaywrightElement.from_node(node)
+
+    async def close(self) -> None:
+        await self.browser.close()
+
+    async def get_current_url(self) -> str:
+        return self.browser.url
@@ -6,15 +6,28 @@ compatible with `IElement` interface and usable across the library.
 
 from __future__ import annotations
 
-from collections.abc import Iterable
-from typing import Optional, Pattern, Union
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Optional, Pattern, Union
 
 import bs4
+from bs4.builder import HTMLTreeBuilder
 from typing_extensions import Self
 
+import soupsavvy.exceptions as exc
+from soupsavvy.implementation.tracking import DocumentState
+from soupsavvy.indexing.index import get_index
 from soupsavvy.interfaces import IElement, SelectionApi
 from soupsavvy.selectors.css.api import SoupsieveApi
 
+if TYPE_CHECKING:
+    from soupsavvy.base import SoupSelector
+
+# name of attribute of the root node, under which document state is stored
+_STATE_ATTR = "_soupsavvy_state"
+# attributes split into lists of tokens by html tree builders of bs4
+_MULTI_VALUED = HTMLTreeBuilder.DEFAULT_CDATA_LIST_ATTRIBUTES
+
 
 class SoupElement(IElement[bs4.Tag]):
     """
@@ -29,7 +42,119 @@ class SoupElement(IElement[bs4.Tag]):
     ... element = SoupElement(node)
     """
 
+    __slots__ = ()
+
     _NODE_TYPE = bs4.Tag
+    _POOLED = True
+
+    @classmethod
+    def from_scope(
+        cls,
+        markup: str,
+        scope: SoupSelector,
+        features: str = "html.parser",
+    ) -> Self:
+        """
+        Parses only subtrees of the markup matched by the scope selector
+        and returns root of the reduced document.
+
+        Tree is built only for matching elements and their descendants,
+        so memory used by the document scales with extracted content
+        instead of the size of the page. Searches of elements within the scope,
+        like models with the same scope, can be performed on the reduced tree.
+
+        Parameters
+        ----------
+        markup : str
+            Html string to parse.
+        scope : SoupSelector
+            Selector of subtrees to parse, like scope of the model.
+            Needs to depend only on tag name and attributes of the element.
+        features : str, optional
+            Features of `BeautifulSoup` parser, by default "html.parser".
+
+        Returns
+        -------
+        SoupElement
+            Root of the document containing only matched subtrees.
+
+        Raises
+        ------
+        UnsupportedScopeException
+            If scope can not be evaluated during parsing.
+
+        Example
+        -------
+        >>> element = SoupElement.from_scope(markup, ProductModel.scope)
+        ... products = ProductModel.find_all(element)
+        """
+        strainer = ScopeStrainer(scope)
+        return cls(bs4.BeautifulSoup(markup, features, parse_only=strainer))
+
+    @property
+    def state(self) -> Optional[DocumentState]:
+        if self._state is None:
+            # state is anchored in the root node, it is shared by all its elements
+            self._state = self._get_root().__dict__.get(_STATE_ATTR)
+
+        return self._state
+
+    def track(self) -> DocumentState:
+        state = self.state
+
+        if state is None:
+            root = self._get_root()
+            state = DocumentState(root)
+            root.__dict__[_STATE_ATTR] = state
+            self._state = state
+
+        return state
+
+    def decompose(self) -> None:
+        state = self.state
+        self.node.decompose()
+
+        if state is not None:
+            state.bump()
+
+    def extract(self) -> Self:
+        state = self.state
+        node = self.node.extract()
+
+        if state is not None:
+            state.bump()
+
+        # extracted element is a root of a new, untracked document
+        return self.from_node(node)
+
+    def insert(self, position: int, element: Self) -> None:
+        states = {id(state): state for state in (self.state, element.state) if state}
+        children = [child for child in self.node.children if isinstance(child, bs4.Tag)]
+
+        if position < len(children):
+            # position of element among all nodes, including text nodes
+            index = next(
+                i
+                for i, child in enumerate(self.node.contents)
+                if child is children[position]
+            )
+            self.node.insert(index, element.node)
+        else:
+            self.node.append(element.node)
+
+        for state in states.values():
+            state.bump()
+
+        element._state = self._state
+
+    def _get_root(self) -> bs4.Tag:
+        """Returns root node of the document this element belongs to."""
+        node = self.node
+
+        while node.parent is not None:
+            node = node.parent
+
+        return node
 
     def find_all(
         self,
@@ -39,10 +164,108 @@ class SoupElement(IElement[bs4.Tag]):
         limit: Optional[int] = None,
     ) -> list[Self]:
         attrs = attrs or {}
-        iterable = self.node.find_all(
-            name=name, attrs=attrs, recursive=recursive, limit=limit
+        index = get_index(self) if recursive else None
+
+        if index is not None:
+            found = index.find_all(
+                self, name=name, attrs=attrs, limit=limit, match=self._match
+            )
+
+            if found is not None:
+                return found  # type: ignore
+
+        if name is not None and ":" in name:
+            # prefixed names are matched by bs4 also against their local part
+            # values of bs4 filters are wider, dict is invariant in them
+            filters: dict[str, Any] = attrs
+            iterable = self.node.find_all(
+                name=name, attrs=filters, recursive=recursive, limit=limit
+            )
+            return list(self._map(iterable))
+
+        iterator = self._iterate(recursive)
+
+        if name is not None or attrs:
+            iterator = (node for node in iterator if self._match(node, name, attrs))
+
+        return list(islice(self._map(iterator), limit))
+
+    def _find_text(
+        self,
+        pattern: Union[str, Pattern[str]],
+        recursive: bool = True,
+        limit: Optional[int] = None,
+    ) -> Optional[list[Self]]:
+        tag = self._NODE_TYPE
+        # returns truthy value for matching text
+        match: Callable[[str], object]
+
+        if isinstance(pattern, Pattern):
+            match = pattern.search
+        else:
+            match = pattern.__eq__
+
+        # leaf tags are filtered on nodes, only matching ones are wrapped
+        iterator = (
+            node
+            for node in self._iterate(recursive)
+            if not any(isinstance(child, tag) for child in node.contents)
+            and match(node.text)
         )
-        return list(self._map(iterable))
+        return list(islice(self._map(iterator), limit))
+
+    def _iterate(self, recursive: bool) -> Iterator[bs4.Tag]:
+        """
+        Iterates over descendant or child tags of the node in document order.
+
+        Descendants are visited by following `next_element` links up to the
+        node following the last descendant, which avoids nested generators
+        of `bs4` traversal and its strainers, that are evaluated in python.
+        """
+        node = self.node
+        tag = self._NODE_TYPE
+
+        if not recursive:
+            return (child for child in node.contents if isinstance(child, tag))
+
+        return self._walk(node, tag)
+
+    @staticmethod
+    def _walk(node: bs4.Tag, tag: type[bs4.Tag]) -> Iterator[bs4.Tag]:
+        """Yields descendant tags of the node following `next_element` links."""
+        if not node.contents:
+            return
+
+        # element following the subtree is the next sibling of the node
+        # or of its closest ancestor, which has one
+        boundary: Optional[bs4.PageElement] = node
+
+        while boundary is not None and boundary.next_sibling is None:
+            boundary = boundary.parent
+
+        stop = boundary.next_sibling if boundary is not None else None
+        current: Optional[bs4.PageElement] = node.contents[0]
+
+        while current is not stop and current is not None:
+            if isinstance(current, tag):
+                yield current
+
+            current = current.next_element
+
+    @staticmethod
+    def _match(
+        node: bs4.Tag,
+        name: Optional[str],
+        attrs: dict[str, Union[str, Pattern[str]]],
+    ) -> bool:
+        """
+        Checks if node matches name and attributes with the same semantics
+        as `bs4` search, used to verify candidates found in the index.
+        """
+        if name is not None and node.name != name:
+            return False
+
+        return _match_attributes(node.attrs, attrs)
 
     def find_subsequent_siblings(self, limit: Optional[int] = None) -> list[Self]:
         return list(self._map(self.node.find_next_siblings(limit=limit)))
@@ -64,26 +287,23 @@ class SoupElement(IElement[bs4.Tag]):
 
     @property
     def children(self) -> Iterable[Self]:
-        generator = (
-            element
-            for element in self.node.children
-            if isinstance(element, self._NODE_TYPE)
-        )
-        return self._map(generator)
+        return self._map(self._iterate(recursive=False))
 
     @property
     def descendants(self) -> Iterable[Self]:
-        generator = (
-            element
-            for element in self.node.descendants
-            if isinstance(element, self._NODE_TYPE)
-        )
-        return self._map(generator)
+        return self._map(self._iterate(recursive=True))
 
     @property
     def parent(self) -> Optional[Self]:
         parent = self.node.parent
-        return self.from_node(parent) if parent is not None else None
+        return self._wrap(parent) if parent is not None else None
+
+    @property
+    def attributes(self) -> dict[str, str]:
+        return {
+            name: " ".join(value) if isinstance(value, list) else value
+            for name, value in self.node.attrs.items()
+        }
 
     @property
     def name(self) -> str:
@@ -97,7 +317,115 @@ class SoupElement(IElement[bs4.Tag]):
         return id(self.node)
 
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+
         if not isinstance(other, SoupElement):
             return NotImplemented
 
         return id(self.node) == id(other.node)
+
+
+class ScopeStrainer(bs4.SoupStrainer):
+    """
+    `SoupStrainer`, which allows creation of tags matched by the scope selector,
+    with the same semantics as `SoupElement` search.
+
+    Raw values of multi-valued attributes are split into tokens before matching,
+    as `bs4` does for tags of parsed document, so tag with "menu widget" class
+    is matched by `ClassSelector("menu")`.
+
+    Example
+    -------
+    >>> strainer = ScopeStrainer(TypeSelector("div") & ClassSelector("product"))
+    ... BeautifulSoup(markup, "html.parser", parse_only=strainer)
+    """
+
+    def __init__(self, scope: SoupSelector) -> None:
+        """
+        Initializes strainer with filter of the scope selector.
+
+        Parameters
+        ----------
+        scope : SoupSelector
+            Selector of tags to create, which needs to depend only
+            on tag name and attributes of the element.
+
+        Raises
+        ------
+        UnsupportedScopeException
+            If scope can not be evaluated during parsing.
+        """
+        filter_ = scope._parse_filter
+
+        if filter_ is None:
+            raise exc.UnsupportedScopeException(
+                f"Scope '{scope}' can not be evaluated during parsing, only tag name "
+                "and attribute selectors and their conjunctions are supported."
+            )
+
+        super().__init__()
+        self.scope_name, self.scope_attrs = filter_
+
+    def allow_tag_creation(
+        self,
+        nsprefix: Optional[str],
+        name: str,
+        attrs: Optional[Mapping[str, str]],
+    ) -> bool:
+        # prefixed names are matched also by their local part, as in bs4
+        names = (name, f"{nsprefix}:{name}") if nsprefix else (name,)
+
+        if self.scope_name is not None and self.scope_name not in names:
+            return False
+
+        # tables of multi-valued attributes hold lists in older versions of bs4
+        multi_valued = {*_MULTI_VALUED.get("*", ()), *_MULTI_VALUED.get(name, ())}
+        attributes: dict[str, Union[str, list[str]]] = {
+            attr: value.split() if attr in multi_valued else value
+            for attr, value in (attrs or {}).items()
+        }
+        # all values required for the same attribute need to be matched
+        return all(
+            _match_attributes(attributes, {attr: value})
+            for attr, values in self.scope_attrs.items()
+            for value in values
+        )
+
+    def allow_string_creation(self, string: str) -> bool:
+        # strings are created only within matched tags
+        return False
+
+    def search_tag(self, name: str, attrs: Optional[Mapping[str, str]]) -> bool:
+        # bs4 older than 4.13 decides about creation of tags with this method
+        return self.allow_tag_creation(None, name, attrs)
+
+
+def _match_attributes(
+    attributes: Mapping[str, Union[str, list[str]]],
+    attrs: dict[str, Union[str, Pattern[str]]],
+) -> bool:
+    """
+    Checks if attributes of the node match expected values with the same semantics
+    as `bs4` search. Values of multi-valued attributes are lists of tokens.
+    """
+    for attr, value in attrs.items():
+        attribute = attributes.get(attr)
+
+        if attribute is None:
+            return False
+
+        # multi-valued attributes match by any token or joined value
+        candidates = (
+            [*attribute, " ".join(attribute)]
+            if isinstance(attribute, list)
+            else [attribute]
+        )
+
+        if isinstance(value, Pattern):
+            if not any(value.search(candidate) for candidate in candidates):
+                return False
+        elif value not in candidates:
+            return False
+
+    return True
@@ -0,0 +1,28 @@
+"""
+Subpackage with compact, array-backed implementation of `IElement`.
+
+Documents are stored as flat arrays instead of trees of Python objects,
+which makes them cheap to keep in memory and fast to traverse
+in read-only extraction workloads.
+
+Classes
+-------
+- `CompactDocument` - Read-only, array-backed tree of a single document.
+- `CompactBuilder` - Builder of `CompactDocument` from parser events.
+- `CompactHTMLParser` - Streaming parser of html into `CompactDocument`.
+- `CompactElement` - Implementation of `IElement` for `CompactDocument`.
+- `TextView` - Lazy, read-only view of a range of text buffer.
+"""
+
+from .document import CompactBuilder, CompactDocument
+from .element import CompactElement
+from .parser import CompactHTMLParser
+from .text import TextView
+
+__all__ = [
+    "CompactDocument",
+    "CompactBuilder",
+    "CompactHTMLParser",
+    "CompactElement",
+    "TextView",
+]
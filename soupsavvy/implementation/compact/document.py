@@ -0,0 +1,689 @@
+"""
+Module with compact, array-backed representation of a parsed document.
+
+`CompactDocument` stores the whole tree as flat, preorder arrays of integers
+instead of a graph of Python objects. Structure of the tree (parent, first child,
+next sibling, depth and subtree extent), interned tag names, attributes
+in columnar layout and all text nodes in a single buffer take a small fraction
+of memory used by `bs4` or `lxml` trees and can be traversed without
+allocating any objects.
+
+Document is read-only, it is built once with `CompactBuilder`,
+which receives parser-like events, directly from html with `CompactHTMLParser`
+or from existing `lxml` or `bs4` tree.
+Built document can be saved to binary file and loaded without parsing.
+
+Classes
+-------
+- `CompactDocument` - Read-only, array-backed tree of a single document.
+- `CompactBuilder` - Builder of `CompactDocument` from parser events.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Callable, Hashable, Iterable, Mapping
+from os import PathLike
+from typing import Any, Optional, TypeVar, Union
+
+from soupsavvy.implementation.compact.text import TextView
+from soupsavvy.implementation.tracking import DocumentState
+from soupsavvy.utils.names import canonical_name
+
+T = TypeVar("T")
+
+# structure arrays are C int arrays or read-only views of such buffers
+IntArray = Union[array, memoryview]
+
+# value of structural arrays, if there is no such node
+NONE = -1
+
+# key under which materialized lxml tree is cached
+_LXML_KEY = "lxml"
+
+# name of materialized lxml elements, which names are not valid in lxml
+_PLACEHOLDER_NAME = "soupsavvy-node"
+
+# html elements, which can not have any content and are serialized without end tag
+VOID_ELEMENTS = frozenset(
+    {
+        "area",
+        "base",
+        "br",
+        "col",
+        "embed",
+        "hr",
+        "img",
+        "input",
+        "link",
+        "meta",
+        "param",
+        "source",
+        "track",
+        "wbr",
+    }
+)
+
+
+class CompactDocument:
+    """
+    Read-only tree of a single document stored in flat arrays.
+
+    Elements are identified by their preorder position in the document.
+    For each element, arrays hold:
+    - `parents`, `first_children`, `next_siblings` - structure of the tree,
+    `-1` if there is no such element.
+    - `depths` - depth of the element, root has depth 0.
+    - `ends` - position of the last descendant, subtree of the element
+    occupies contiguous range of positions `[position, end]`.
+    - `tags` - id of the tag name in `names` table.
+    - `text_starts`, `text_ends` - slice of the text buffer with text content
+    of the element, text of a subtree is always contiguous in the buffer.
+
+    Attributes are stored in columnar layout, attributes of the element occupy
+    range `[attribute_offsets[i], attribute_offsets[i + 1])` of `attribute_keys`
+    (ids in `attribute_names` table) and `attribute_values` (ids in `values` table).
+
+    Example
+    -------
+    >>> from soupsavvy.implementation.compact import CompactDocument
+    ... from lxml.etree import fromstring
+    ... document = CompactDocument.from_lxml(fromstring("<div><a>1</a></div>"))
+    ... len(document)
+    2
+
+    Notes
+    -----
+    Text content consists of text nodes only, comments and processing instructions
+    are dropped while building the document.
+    """
+
+    def __init__(
+        self,
+        tags: IntArray,
+        parents: IntArray,
+        first_children: IntArray,
+        next_siblings: IntArray,
+        depths: IntArray,
+        ends: IntArray,
+        text_starts: IntArray,
+        text_ends: IntArray,
+        attribute_offsets: IntArray,
+        attribute_keys: IntArray,
+        attribute_values: IntArray,
+        names: list[str],
+        attribute_names: list[str],
+        values: list[str],
+        text: str,
+    ) -> None:
+        """
+        Initializes document with its arrays, use `CompactBuilder`
+        or `from_lxml` and `from_bs4` constructors to build a document.
+        """
+        self.tags = tags
+        self.parents = parents
+        self.first_children = first_children
+        self.next_siblings = next_siblings
+        self.depths = depths
+        self.ends = ends
+        self.text_starts = text_starts
+        self.text_ends = text_ends
+        self.attribute_offsets = attribute_offsets
+        self.attribute_keys = attribute_keys
+        self.attribute_values = attribute_values
+        # names registered by selectors are shared with them through global table
+        self.names = [canonical_name(name) for name in names]
+        self.attribute_names = [canonical_name(name) for name in attribute_names]
+        self.values = values
+        self.text = text
+
+        self._name_ids = {name: i for i, name in enumerate(self.names)}
+        self._attribute_ids = {name: i for i, name in enumerate(self.attribute_names)}
+        self._cache: dict[Hashable, Any] = {}
+        # state of the document, created once document is tracked
+        self.state: Optional[DocumentState] = None
+        # owner of memory backing the arrays, kept alive as long as the document,
+        # assigned last, so it is released after arrays and cached values
+        self.source: Any = None
+
+    @classmethod
+    def from_lxml(cls, node: Any) -> CompactDocument:
+        """
+        Builds document from `lxml` element and all its descendants.
+
+        Parameters
+        ----------
+        node : lxml.etree._Element
+            Root of the subtree to build document from.
+
+        Returns
+        -------
+        CompactDocument
+            Document with the same elements, attributes and text.
+        """
+        builder = CompactBuilder()
+        builder.start(node.tag, node.attrib)
+        builder.data(node.text)
+        stack = [(node, iter(node))]
+
+        while stack:
+            parent, children = stack[-1]
+            child = next(children, None)
+
+            if child is None:
+                stack.pop()
+                builder.end()
+
+                # tail text belongs to the parent of the closed element
+                if stack:
+                    builder.data(parent.tail)
+
+                continue
+
+            # comments and processing instructions have callable tags
+            if not isinstance(child.tag, str):
+                builder.data(child.tail)
+                continue
+
+            builder.start(child.tag, child.attrib)
+            builder.data(child.text)
+            stack.append((child, iter(child)))
+
+        return builder.close()
+
+    @classmethod
+    def from_bs4(cls, node: Any) -> CompactDocument:
+        """
+        Builds document from `bs4` tag and all its descendants.
+
+        Parameters
+        ----------
+        node : bs4.Tag
+            Root of the subtree to build document from.
+
+        Returns
+        -------
+        CompactDocument
+            Document with the same elements, attributes and text.
+        """
+        from bs4.element import NavigableString, PreformattedString, Tag
+
+        builder = CompactBuilder()
+        builder.start(node.name, _join_attributes(node.attrs))
+        stack = [iter(node.contents)]
+
+        while stack:
+            child = next(stack[-1], None)
+
+            if child is None:
+                stack.pop()
+                builder.end()
+            elif isinstance(child, Tag):
+                builder.start(child.name, _join_attributes(child.attrs))
+                stack.append(iter(child.contents))
+            # comments, doctypes and other special strings are not text content
+            elif isinstance(child, NavigableString) and not isinstance(
+                child, PreformattedString
+            ):
+                builder.data(str(child))
+
+        return builder.close()
+
+    @classmethod
+    def from_html(cls, markup: Union[str, Iterable[str]]) -> CompactDocument:
+        """
+        Parses html directly into document with standard library tokenizer,
+        without creating `bs4` or `lxml` trees, see `CompactHTMLParser`.
+
+        Parameters
+        ----------
+        markup : str | Iterable[str]
+            Html string or iterable of its chunks, like opened text file.
+
+        Returns
+        -------
+        CompactDocument
+            Document with root element containing parsed markup.
+        """
+        from soupsavvy.implementation.compact.parser import CompactHTMLParser
+
+        return CompactHTMLParser.parse(markup)
+
+    @classmethod
+    def load(
+        cls, file: Union[str, PathLike], memory_map: bool = True
+    ) -> CompactDocument:
+        """
+        Loads document from binary file written with `save` method.
+        File is memory-mapped by default, so loading does not copy
+        nor parse structure of the document.
+
+        Parameters
+        ----------
+        file : str | os.PathLike
+            Path of the file.
+        memory_map : bool, optional
+            If True, structure arrays are views of memory-mapped file,
+            otherwise file is read into memory. Default is True.
+
+        Returns
+        -------
+        CompactDocument
+            Loaded document.
+
+        Raises
+        ------
+        InvalidDocumentFormat
+            If file is not a valid document file or it was written
+            in unsupported version of the format.
+        """
+        from soupsavvy.implementation.compact.storage import load
+
+        return load(file, memory_map=memory_map)
+
+    def save(self, file: Union[str, PathLike]) -> None:
+        """
+        Writes document to versioned binary file,
+        see `soupsavvy.implementation.compact.storage` for its layout.
+
+        Parameters
+        ----------
+        file : str | os.PathLike
+            Path of the file, existing file is overwritten.
+        """
+        from soupsavvy.implementation.compact.storage import dump
+
+        dump(self, file)
+
+    def __len__(self) -> int:
+        """Returns number of elements in the document."""
+        return len(self.tags)
+
+    def cached(self, key: Hashable, factory: Callable[[], T]) -> T:
+        """
+        Returns value derived from the document cached under the key.
+        As document is read-only, value is computed only once with the factory.
+
+        Parameters
+        ----------
+        key : Hashable
+            Key under which value is cached.
+        factory : Callable[[], T]
+            Function computing the value, called only if value is missing.
+
+        Returns
+        -------
+        T
+            Value cached under the key.
+        """
+        if key not in self._cache:
+            self._cache[key] = factory()
+
+        return self._cache[key]
+
+    def release(self) -> None:
+        """
+        Releases cached values and views of external buffers backing arrays,
+        so that memory owning them can be closed. Document can not be used
+        after it was released.
+        """
+        self._cache.clear()
+
+        for value in vars(self).values():
+            if isinstance(value, memoryview):
+                value.release()
+
+    def name_id(self, name: str) -> int:
+        """Returns id of the tag name or `-1` if no element has such name."""
+        return self._name_ids.get(name, NONE)
+
+    def attribute_id(self, name: str) -> int:
+        """Returns id of the attribute name or `-1` if no element has it."""
+        return self._attribute_ids.get(name, NONE)
+
+    def get_attribute(self, position: int, name: str) -> Optional[str]:
+        """
+        Returns value of the attribute of the element at given position.
+
+        Parameters
+        ----------
+        position : int
+            Position of the element.
+        name : str
+            Name of the attribute.
+
+        Returns
+        -------
+        str | None
+            Value of the attribute or `None` if element does not have it.
+        """
+        key = self._attribute_ids.get(name)
+
+        if key is None:
+            return None
+
+        keys = self.attribute_keys
+
+        for i in range(
+            self.attribute_offsets[position], self.attribute_offsets[position + 1]
+        ):
+            if keys[i] == key:
+                return self.values[self.attribute_values[i]]
+
+        return None
+
+    def get_attributes(self, position: int) -> dict[str, str]:
+        """Returns all attributes of the element at given position."""
+        start = self.attribute_offsets[position]
+        end = self.attribute_offsets[position + 1]
+        return {
+            self.attribute_names[self.attribute_keys[i]]: self.values[
+                self.attribute_values[i]
+            ]
+            for i in range(start, end)
+        }
+
+    def get_text(self, position: int) -> str:
+        """Returns text content of the element at given position."""
+        return self.text[self.text_starts[position] : self.text_ends[position]]
+
+    def text_view(self, position: int) -> TextView:
+        """Returns lazy view of text content of the element at given position."""
+        return TextView(self.text, self.text_starts[position], self.text_ends[position])
+
+    def children(self, position: int) -> Iterable[int]:
+        """Iterates over positions of children of the element."""
+        child = self.first_children[position]
+        next_siblings = self.next_siblings
+
+        while child != NONE:
+            yield child
+            child = next_siblings[child]
+
+    def serialize(self, position: int) -> str:
+        """
+        Serializes element at given position to html string.
+
+        Parameters
+        ----------
+        position : int
+            Position of the element.
+
+        Returns
+        -------
+        str
+            Html markup of the element with all its descendants.
+        """
+        parts: list[str] = []
+        # stack of pending elements (positions) and markup chunks (strings)
+        stack: list[Union[int, str]] = [position]
+
+        while stack:
+            current = stack.pop()
+
+            if isinstance(current, str):
+                parts.append(current)
+                continue
+
+            name = self.names[self.tags[current]]
+            parts.append(self._open_tag(current))
+
+            if name in VOID_ELEMENTS:
+                continue
+
+            # text between children is a gap between their slices of the buffer
+            items: list[Union[int, str]] = []
+            cursor = self.text_starts[current]
+
+            for child in self.children(current):
+                items.append(_escape(self.text[cursor : self.text_starts[child]]))
+                items.append(child)
+                cursor = self.text_ends[child]
+
+            items.append(_escape(self.text[cursor : self.text_ends[current]]))
+            items.append(f"</{name}>")
+            stack.extend(reversed(items))
+
+        return "".join(parts)
+
+    def to_lxml(self) -> tuple[list[Any], dict[int, int]]:
+        """
+        Materializes document as `lxml` tree, which is used for operations
+        not supported natively by compact document, like css and xpath selection.
+        Tree is built once and cached in the document.
+
+        Returns
+        -------
+        tuple[list[lxml.etree._Element], dict[int, int]]
+            List of `lxml` elements at positions of the document
+            and mapping of their ids back to positions.
+        """
+        return self.cached(_LXML_KEY, self._materialize)
+
+    def _materialize(self) -> tuple[list[Any], dict[int, int]]:
+        """Builds `lxml` tree of the document, see `to_lxml`."""
+        from lxml import etree
+
+        nodes: list[Any] = []
+        text = self.text
+
+        for position in range(len(self)):
+            parent = self.parents[position]
+            name = self.names[self.tags[position]]
+
+            try:
+                node = etree.Element(name)
+            except ValueError:
+                # names not valid in lxml, like '[document]' root of bs4
+                node = etree.Element(_PLACEHOLDER_NAME)
+
+            for key, value in self.get_attributes(position).items():
+                try:
+                    node.set(key, value)
+                except ValueError:
+                    continue
+
+            child = self.first_children[position]
+            end = self.text_starts[child] if child != NONE else self.text_ends[position]
+            node.text = text[self.text_starts[position] : end] or None
+
+            if parent != NONE:
+                nodes[parent].append(node)
+                sibling = self.next_siblings[position]
+                end = (
+                    self.text_starts[sibling]
+                    if sibling != NONE
+                    else self.text_ends[parent]
+                )
+                node.tail = text[self.text_ends[position] : end] or None
+
+            nodes.append(node)
+
+        return nodes, {id(node): i for i, node in enumerate(nodes)}
+
+    def _open_tag(self, position: int) -> str:
+        """Returns start tag of the element with its attributes."""
+        name = self.names[self.tags[position]]
+        attributes = "".join(
+            f' {key}="{_escape(value, quote=True)}"'
+            for key, value in self.get_attributes(position).items()
+        )
+        end = "/>" if name in VOID_ELEMENTS else ">"
+        return f"<{name}{attributes}{end}"
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(size={len(self)})"
+
+
+class CompactBuilder:
+    """
+    Builder of `CompactDocument` from parser-like events.
+
+    Events follow the interface of `lxml` parser targets: `start` opens
+    an element, `data` adds text to currently open element, `end` closes
+    the most recently opened element and `close` returns built document.
+
+    Example
+    -------
+    >>> builder = CompactBuilder()
+    ... builder.start("div", {"class": "menu"})
+    ... builder.data("Hello")
+    ... builder.end()
+    ... document = builder.close()
+    """
+
+    def __init__(self) -> None:
+        """Initializes empty builder."""
+        self._tags = array("i")
+        self._parents = array("i")
+        self._first_children = array("i")
+        self._next_siblings = array("i")
+        self._depths = array("i")
+        self._ends = array("i")
+        self._text_starts = array("i")
+        self._text_ends = array("i")
+        self._attribute_offsets = array("i", [0])
+        self._attribute_keys = array("i")
+        self._attribute_values = array("i")
+
+        self._names: dict[str, int] = {}
+        self._attribute_names: dict[str, int] = {}
+        self._values: dict[str, int] = {}
+        self._chunks: list[str] = []
+        self._length = 0
+
+        # positions of open elements and their most recently added children
+        self._open: list[int] = []
+        self._last_children: list[int] = []
+
+    def start(self, name: str, attributes: Mapping[str, Any]) -> int:
+        """
+        Opens new element as a child of currently open element.
+
+        Parameters
+        ----------
+        name : str
+            Tag name of the element.
+        attributes : Mapping[str, Any]
+            Attributes of the element, values are converted to strings.
+
+        Returns
+        -------
+        int
+            Position of the new element in the document.
+        """
+        position = len(self._tags)
+        parent = self._open[-1] if self._open else NONE
+
+        self._tags.append(_intern(self._names, name))
+        self._parents.append(parent)
+        self._first_children.append(NONE)
+        self._next_siblings.append(NONE)
+        self._depths.append(len(self._open))
+        self._ends.append(position)
+        self._text_starts.append(self._length)
+        self._text_ends.append(self._length)
+
+        for key, value in attributes.items():
+            self._attribute_keys.append(_intern(self._attribute_names, key))
+            self._attribute_values.append(_intern(self._values, str(value)))
+
+        self._attribute_offsets.append(len(self._attribute_keys))
+
+        if self._open:
+            previous = self._last_children[-1]
+
+            if previous == NONE:
+                self._first_children[parent] = position
+            else:
+                self._next_siblings[previous] = position
+
+            self._last_children[-1] = position
+
+        self._open.append(position)
+        self._last_children.append(NONE)
+        return position
+
+    def data(self, text: Optional[str]) -> None:
+        """
+        Adds text to the content of currently open element.
+
+        Parameters
+        ----------
+        text : str, optional
+            Text to add, `None` and empty strings are ignored.
+        """
+        if not text or not self._open:
+            return
+
+        self._chunks.append(text)
+        self._length += len(text)
+
+    def end(self, *args: Any) -> int:
+        """
+        Closes the most recently opened element.
+
+        Returns
+        -------
+        int
+            Position of the closed element.
+        """
+        position = self._open.pop()
+        self._last_children.pop()
+        self._ends[position] = len(self._tags) - 1
+        self._text_ends[position] = self._length
+        return position
+
+    def close(self) -> CompactDocument:
+        """
+        Closes all open elements and returns built document.
+
+        Returns
+        -------
+        CompactDocument
+            Document built from received events.
+        """
+        while self._open:
+            self.end()
+
+        return CompactDocument(
+            tags=self._tags,
+            parents=self._parents,
+            first_children=self._first_children,
+            next_siblings=self._next_siblings,
+            depths=self._depths,
+            ends=self._ends,
+            text_starts=self._text_starts,
+            text_ends=self._text_ends,
+            attribute_offsets=self._attribute_offsets,
+            attribute_keys=self._attribute_keys,
+            attribute_values=self._attribute_values,
+            names=list(self._names),
+            attribute_names=list(self._attribute_names),
+            values=list(self._values),
+            text="".join(self._chunks),
+        )
+
+
+def _intern(table: dict[str, int], value: str) -> int:
+    """Returns id of the value in the table, adding it if missing."""
+    id_ = table.get(value)
+
+    if id_ is None:
+        id_ = table[value] = len(table)
+
+    return id_
+
+
+def _join_attributes(attributes: Mapping[str, Any]) -> dict[str, str]:
+    """Joins multi-valued `bs4` attributes into whitespace separated strings."""
+    return {
+        key: " ".join(value) if isinstance(value, list) else value
+        for key, value in attributes.items()
+    }
+
+
+def _escape(text: str, quote: bool = False) -> str:
+    """Escapes html special characters in text or attribute value."""
+    text = text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    return text.replace('"', "&quot;") if quote else text
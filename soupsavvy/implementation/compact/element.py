@@ -0,0 +1,345 @@
+"""
+Module with compact implementation of `IElement`.
+`CompactElement` class is a lightweight handle to an element
+of `CompactDocument`, that makes it usable across the library.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from itertools import islice
+from typing import Any, NamedTuple, Optional, Pattern, Union, cast
+
+from typing_extensions import Self
+
+from soupsavvy.implementation.compact.document import NONE, CompactDocument
+from soupsavvy.implementation.compact.text import TextView
+from soupsavvy.implementation.tracking import DocumentState
+from soupsavvy.interfaces import IElement, SelectionApi
+
+# attributes with whitespace separated values, matched by any of their tokens,
+# by tag name and "*" for all tags, as `DEFAULT_CDATA_LIST_ATTRIBUTES` of bs4
+MULTI_VALUED_ATTRIBUTES: dict[str, frozenset[str]] = {
+    "*": frozenset({"class", "accesskey", "dropzone"}),
+    "a": frozenset({"rel", "rev"}),
+    "link": frozenset({"rel", "rev"}),
+    "td": frozenset({"headers"}),
+    "th": frozenset({"headers"}),
+    "form": frozenset({"accept-charset"}),
+    "object": frozenset({"archive"}),
+    "area": frozenset({"rel"}),
+    "icon": frozenset({"sizes"}),
+    "iframe": frozenset({"sandbox"}),
+    "output": frozenset({"for"}),
+}
+
+
+def is_multi_valued(tag: str, attribute: str) -> bool:
+    """Checks if attribute of elements with given tag name is multi-valued."""
+    return attribute in MULTI_VALUED_ATTRIBUTES["*"] or attribute in (
+        MULTI_VALUED_ATTRIBUTES.get(tag, frozenset())
+    )
+
+
+class CompactNode(NamedTuple):
+    """Handle of a single element, its document and position in the document."""
+
+    document: CompactDocument
+    position: int
+
+
+class CompactElement(IElement[CompactNode]):
+    """
+    Implementation of `IElement` for `CompactDocument`.
+    Each element is a handle consisting of the document and position
+    of the element in it, all data is read from arrays of the document.
+
+    Example
+    -------
+    >>> from soupsavvy.implementation.compact import CompactElement
+    ... from lxml.etree import fromstring
+    ... node = fromstring("<html><body><div>example</div></body></html>")
+    ... element = CompactElement.from_lxml(node)
+
+    Notes
+    -----
+    Compact documents are read-only, mutation methods are not supported
+    and version of the tracked document is never bumped.
+    CSS and XPath selection is performed on `lxml` tree materialized once
+    from the document on the first use, which requires `lxml` and `cssselect`.
+    """
+
+    __slots__ = ()
+
+    _NODE_TYPE = CompactNode
+
+    @classmethod
+    def from_document(cls, document: CompactDocument) -> Self:
+        """
+        Creates element representing the root of the document.
+
+        Parameters
+        ----------
+        document : CompactDocument
+            Document to create root element of.
+
+        Returns
+        -------
+        CompactElement
+            Root element of the document.
+        """
+        return cls(CompactNode(document, 0))
+
+    @classmethod
+    def from_lxml(cls, node: Any) -> Self:
+        """
+        Builds compact document from `lxml` element and returns its root.
+
+        Parameters
+        ----------
+        node : lxml.etree._Element
+            Root of the subtree to build document from.
+
+        Returns
+        -------
+        CompactElement
+            Root element of the built document.
+        """
+        return cls.from_document(CompactDocument.from_lxml(node))
+
+    @classmethod
+    def from_bs4(cls, node: Any) -> Self:
+        """
+        Builds compact document from `bs4` tag and returns its root.
+
+        Parameters
+        ----------
+        node : bs4.Tag
+            Root of the subtree to build document from.
+
+        Returns
+        -------
+        CompactElement
+            Root element of the built document.
+        """
+        return cls.from_document(CompactDocument.from_bs4(node))
+
+    @classmethod
+    def from_html(cls, markup: Union[str, Iterable[str]]) -> Self:
+        """
+        Parses html into compact document without `bs4` or `lxml`
+        and returns its root.
+
+        Parameters
+        ----------
+        markup : str | Iterable[str]
+            Html string or iterable of its chunks, like opened text file.
+
+        Returns
+        -------
+        CompactElement
+            Root element of the parsed document.
+        """
+        return cls.from_document(CompactDocument.from_html(markup))
+
+    @property
+    def document(self) -> CompactDocument:
+        """Returns document this element belongs to."""
+        return self.node.document
+
+    @property
+    def position(self) -> int:
+        """Returns position of the element in its document."""
+        return self.node.position
+
+    @property
+    def state(self) -> Optional[DocumentState]:
+        return self.document.state
+
+    def track(self) -> DocumentState:
+        # documents are read-only, version of their state is never bumped
+        document = self.document
+
+        if document.state is None:
+            document.state = DocumentState(CompactNode(document, 0))
+
+        return document.state
+
+    def find_all(
+        self,
+        name: Optional[str] = None,
+        attrs: Optional[dict[str, Union[str, Pattern[str]]]] = None,
+        recursive: bool = True,
+        limit: Optional[int] = None,
+    ) -> list[Self]:
+        document, position = self.node
+        tag = None
+
+        if name is not None:
+            tag = document.name_id(name)
+
+            # no element in the document has such name
+            if tag == NONE:
+                return []
+
+        iterator: Iterable[int] = (
+            range(position + 1, document.ends[position] + 1)
+            if recursive
+            else document.children(position)
+        )
+        tags = document.tags
+        generator = (
+            i
+            for i in iterator
+            if (tag is None or tags[i] == tag)
+            and (not attrs or self._match(document, i, attrs))
+        )
+        return [self._at(i) for i in islice(generator, limit)]
+
+    @staticmethod
+    def _match(
+        document: CompactDocument,
+        position: int,
+        attrs: dict[str, Union[str, Pattern[str]]],
+    ) -> bool:
+        """
+        Checks if element at given position matches attributes with the same
+        semantics as `bs4` search, multi-valued attributes match by any token.
+        """
+        tag = document.names[document.tags[position]]
+
+        for attr, value in attrs.items():
+            attribute = document.get_attribute(position, attr)
+
+            if attribute is None:
+                return False
+
+            candidates = (
+                [*attribute.split(), attribute]
+                if is_multi_valued(tag, attr)
+                else [attribute]
+            )
+
+            if isinstance(value, Pattern):
+                if not any(value.search(candidate) for candidate in candidates):
+                    return False
+            elif value not in candidates:
+                return False
+
+        return True
+
+    def find_subsequent_siblings(self, limit: Optional[int] = None) -> list[Self]:
+        document, position = self.node
+        siblings: list[Self] = []
+        sibling = document.next_siblings[position]
+
+        while sibling != NONE and len(siblings) != limit:
+            siblings.append(self._at(sibling))
+            sibling = document.next_siblings[sibling]
+
+        return siblings
+
+    def find_ancestors(self, limit: Optional[int] = None) -> list[Self]:
+        document, position = self.node
+        ancestors: list[Self] = []
+        ancestor = document.parents[position]
+
+        while ancestor != NONE and len(ancestors) != limit:
+            ancestors.append(self._at(ancestor))
+            ancestor = document.parents[ancestor]
+
+        return ancestors
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        return self.document.get_attribute(self.position, name)
+
+    def css(self, selector: str) -> SelectionApi:
+        from soupsavvy.selectors.css.api import CSSSelectApi
+
+        return LXMLBridgeApi(CSSSelectApi(selector))
+
+    def xpath(self, selector) -> SelectionApi:
+        from soupsavvy.selectors.xpath.api import LXMLXpathApi
+
+        return LXMLBridgeApi(LXMLXpathApi(selector))
+
+    @property
+    def children(self) -> Iterable[Self]:
+        document, position = self.node
+        return map(self._at, document.children(position))
+
+    @property
+    def descendants(self) -> Iterable[Self]:
+        document, position = self.node
+        return map(self._at, range(position + 1, document.ends[position] + 1))
+
+    @property
+    def parent(self) -> Optional[Self]:
+        parent = self.document.parents[self.position]
+        return self._at(parent) if parent != NONE else None
+
+    @property
+    def attributes(self) -> dict[str, str]:
+        return self.document.get_attributes(self.position)
+
+    @property
+    def name(self) -> str:
+        document, position = self.node
+        return document.names[document.tags[position]]
+
+    @property
+    def text(self) -> str:
+        return self.document.get_text(self.position)
+
+    @property
+    def text_view(self) -> TextView:
+        """
+        Returns lazy view of text content of the element, which references
+        text buffer of the document and is converted to string with `str`.
+        """
+        return self.document.text_view(self.position)
+
+    def match_text(self, pattern: Union[str, Pattern[str]]) -> bool:
+        return self.text_view.match(pattern)
+
+    def to_lxml(self) -> IElement:
+        """
+        Returns `lxml` counterpart of the element in materialized tree
+        of its document, see `CompactDocument.to_lxml`.
+
+        Returns
+        -------
+        LXMLElement
+            Element wrapping materialized `lxml` node.
+        """
+        from soupsavvy.implementation.lxml import LXMLElement
+
+        nodes, _ = self.document.to_lxml()
+        return LXMLElement(nodes[self.position])
+
+    def _from_lxml(self, node: Any) -> Self:
+        """Maps node of materialized `lxml` tree back to element of the document."""
+        _, positions = self.document.to_lxml()
+        return self._at(positions[id(node)])
+
+    def _at(self, position: int) -> Self:
+        """Returns element at given position of the same document."""
+        return self._wrap(CompactNode(self.node.document, position))
+
+    def __str__(self) -> str:
+        return self.document.serialize(self.position)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.name!r}, position={self.position})"
+
+
+class LXMLBridgeApi(SelectionApi):
+    """
+    Interface running `lxml` selection api on materialized `lxml` tree
+    of compact document and mapping results back to compact elements.
+    """
+
+    def select(self, element: IElement) -> list[IElement]:
+        compact = cast(CompactElement, element)
+        selected = self.selector.select(compact.to_lxml())
+        return [compact._from_lxml(match.node) for match in selected]
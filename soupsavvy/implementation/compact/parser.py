@@ -0,0 +1,167 @@
+"""
+Module with dependency-free parser of html into compact documents.
+
+`CompactHTMLParser` uses tokenizer of standard library `html.parser`
+and emits events directly into `CompactBuilder`, so no intermediate node
+objects of `bs4` or `lxml` are created. Tree is built with the same rules
+as `bs4` with `html.parser` features: void elements are closed immediately,
+end tag closes all elements opened after matching start tag, end tags
+without matching start tag are ignored and whitespace-only text is collapsed
+to single newline or space outside of `pre` and `textarea`. It is a lightweight parse path
+for short-lived workers, which need read-only extraction only.
+
+Classes
+-------
+- `CompactHTMLParser` - Streaming parser of html into `CompactDocument`.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from html.parser import HTMLParser
+from typing import Optional, Union
+
+from soupsavvy.implementation.compact.document import (
+    VOID_ELEMENTS,
+    CompactBuilder,
+    CompactDocument,
+)
+
+# name of the root element, the same as name of `bs4.BeautifulSoup` object
+ROOT_NAME = "[document]"
+
+# elements, in which whitespace-only text is preserved
+PRESERVE_WHITESPACE = frozenset({"pre", "textarea"})
+_ASCII_SPACES = "\x20\x0a\x09\x0c\x0d"
+
+
+class CompactHTMLParser(HTMLParser):
+    """
+    Streaming parser of html into `CompactDocument`.
+    Markup can be fed in chunks of any size with `feed` method,
+    `close` returns built document.
+
+    Example
+    -------
+    >>> parser = CompactHTMLParser()
+    ... parser.feed("<div><a href='/shop'>Sh")
+    ... parser.feed("op</a></div>")
+    ... document = parser.close()
+
+    Notes
+    -----
+    Comments, doctype declarations and processing instructions
+    are not part of the document, as in other compact constructors.
+    """
+
+    def __init__(self) -> None:
+        """Initializes parser with empty document containing root element only."""
+        super().__init__(convert_charrefs=True)
+        self._builder = CompactBuilder()
+        self._builder.start(ROOT_NAME, {})
+        # names of open elements, root is never closed by end tags
+        self._open: list[str] = []
+        # text is buffered until the end of text run, like in `bs4`
+        self._data: list[str] = []
+        self._preserve = 0
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, Optional[str]]]) -> None:
+        self._flush()
+        attributes = {key: "" if value is None else value for key, value in attrs}
+        self._builder.start(tag, attributes)
+
+        if tag in VOID_ELEMENTS:
+            self._builder.end()
+            return
+
+        self._open.append(tag)
+        self._preserve += tag in PRESERVE_WHITESPACE
+
+    def handle_startendtag(
+        self, tag: str, attrs: list[tuple[str, Optional[str]]]
+    ) -> None:
+        self.handle_starttag(tag, attrs)
+
+        if tag not in VOID_ELEMENTS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag: str) -> None:
+        open_ = self._open
+
+        # unmatched end tags are ignored
+        if tag not in open_:
+            return
+
+        self._flush()
+
+        while open_:
+            self._builder.end()
+            closed = open_.pop()
+            self._preserve -= closed in PRESERVE_WHITESPACE
+
+            if closed == tag:
+                break
+
+    def handle_data(self, data: str) -> None:
+        self._data.append(data)
+
+    def handle_comment(self, data: str) -> None:
+        self._flush()
+
+    def handle_decl(self, decl: str) -> None:
+        self._flush()
+
+    def handle_pi(self, data: str) -> None:
+        self._flush()
+
+    def unknown_decl(self, data: str) -> None:
+        self._flush()
+
+    def _flush(self) -> None:
+        """Adds buffered text run to the document."""
+        if not self._data:
+            return
+
+        text = "".join(self._data)
+        self._data.clear()
+
+        if not self._preserve and not text.strip(_ASCII_SPACES):
+            text = "\n" if "\n" in text else " "
+
+        self._builder.data(text)
+
+    def close(self) -> CompactDocument:  # type: ignore[override]
+        """
+        Processes remaining buffered markup, closes all open elements
+        and returns built document.
+
+        Returns
+        -------
+        CompactDocument
+            Document built from all fed markup.
+        """
+        super().close()
+        self._flush()
+        return self._builder.close()
+
+    @classmethod
+    def parse(cls, markup: Union[str, Iterable[str]]) -> CompactDocument:
+        """
+        Parses markup into compact document.
+
+        Parameters
+        ----------
+        markup : str | Iterable[str]
+            Html string or iterable of its chunks, like opened text file.
+
+        Returns
+        -------
+        CompactDocument
+            Document with root element containing parsed markup.
+        """
+        parser = cls()
+
+        for chunk in [markup] if isinstance(markup, str) else markup:
+            parser.feed(chunk)
+
+        return parser.close()
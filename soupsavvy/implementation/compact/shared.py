@@ -0,0 +1,220 @@
+"""
+Module with compact documents placed in shared memory.
+
+`SharedDocument` writes binary representation of `CompactDocument`
+into a block of `multiprocessing.shared_memory` once. Other processes attach
+to the block by its name and use the document without parsing or copying it,
+as structure arrays are views of shared memory. This allows splitting
+extraction from a single, large document across worker processes
+or running several models over the same parsed document in parallel.
+
+Classes
+-------
+- `SharedDocument` - Compact document placed in a block of shared memory.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Optional, cast
+
+from typing_extensions import Self
+
+from soupsavvy.implementation.compact.document import CompactDocument
+from soupsavvy.implementation.compact.element import CompactElement
+from soupsavvy.implementation.compact.storage import decode, encode
+
+
+class SharedDocument:
+    """
+    Compact document placed in a block of shared memory.
+
+    Process, which created the document, owns the block and is responsible
+    for unlinking it, when no other process uses it anymore. Instances are
+    pickled as the name of the block, so they can be passed to worker
+    processes, which attach to the same block when unpickling.
+
+    Example
+    -------
+    >>> from concurrent.futures import ProcessPoolExecutor
+    ... from soupsavvy.implementation.compact.shared import SharedDocument
+    ...
+    ... def extract(shared: SharedDocument) -> list[str]:
+    ...     return [element.text for element in selector.find_all(shared.root)]
+    ...
+    ... with SharedDocument.create(document) as shared:
+    ...     with ProcessPoolExecutor() as executor:
+    ...         results = list(executor.map(extract, [shared] * 4))
+
+    Notes
+    -----
+    Document and its elements can not be used after `close` was called.
+    Processes attaching to the block never unlink it, including unrelated
+    processes attaching by name on Python versions before 3.13.
+    """
+
+    def __init__(self, memory: SharedMemory, owner: bool = False) -> None:
+        """
+        Initializes document backed by the shared memory block,
+        use `create` and `attach` constructors instead.
+
+        Parameters
+        ----------
+        memory : SharedMemory
+            Block of shared memory with binary representation of the document.
+        owner : bool, optional
+            Whether this process created the block and unlinks it on exit
+            from context manager, by default False.
+        """
+        self.owner = owner
+        self.document = decode(memory.buf)
+        # memory is closed only after the document and all its views are released
+        self.document.source = memory
+        self._memory = memory
+        self._closed = False
+        # resource tracker of the owner, shared by processes it started
+        self._tracker = _OWNED.get(memory.name)
+
+    @classmethod
+    def create(
+        cls, document: CompactDocument, name: Optional[str] = None
+    ) -> SharedDocument:
+        """
+        Creates new shared memory block and writes the document into it.
+
+        Parameters
+        ----------
+        document : CompactDocument
+            Document to place in shared memory.
+        name : str, optional
+            Name of the block, by default unique name is generated.
+
+        Returns
+        -------
+        SharedDocument
+            Document backed by created block, owned by this process.
+        """
+        chunks = [memoryview(chunk).cast("B") for chunk in encode(document)]
+        size = sum(chunk.nbytes for chunk in chunks)
+        memory = SharedMemory(name=name, create=True, size=size)
+        offset = 0
+
+        for chunk in chunks:
+            memory.buf[offset : offset + chunk.nbytes] = chunk
+            offset += chunk.nbytes
+
+        _OWNED[memory.name] = _tracker_id()
+        return cls(memory, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> SharedDocument:
+        """
+        Attaches to existing shared memory block with the document.
+
+        Parameters
+        ----------
+        name : str
+            Name of the block.
+
+        Returns
+        -------
+        SharedDocument
+            Document backed by the block, which is not owned by this process.
+        """
+        return cls(_attach(name, _OWNED.get(name)))
+
+    @property
+    def name(self) -> str:
+        """Returns name of the shared memory block."""
+        return self._memory.name
+
+    @property
+    def root(self) -> CompactElement:
+        """Returns element representing the root of the document."""
+        return CompactElement.from_document(self.document)
+
+    def close(self) -> None:
+        """
+        Releases document and closes access to shared memory block
+        from this process, block is not destroyed.
+        """
+        if self._closed:
+            return
+
+        self.document.release()
+        self.document.source = None
+        self._memory.close()
+        self._closed = True
+
+    def unlink(self) -> None:
+        """
+        Destroys shared memory block, should be called once
+        by the owner, when no process uses the document anymore.
+        """
+        self._memory.unlink()
+        _OWNED.pop(self.name, None)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+        if self.owner:
+            self.unlink()
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return _unpickle, (self.name, self._tracker)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(name={self.name!r}, owner={self.owner})"
+
+
+# resource trackers of blocks created by this process by their names
+_OWNED: dict[str, Optional[tuple[int, int]]] = {}
+
+
+def _unpickle(name: str, tracker: Optional[tuple[int, int]]) -> SharedDocument:
+    """Attaches to the block of pickled document in worker process."""
+    document = SharedDocument(_attach(name, tracker))
+    document._tracker = tracker
+    return document
+
+
+def _tracker_id() -> Optional[tuple[int, int]]:
+    """
+    Returns identity of the pipe of resource tracker used by this process,
+    which is shared by processes started with `multiprocessing`.
+    Returns `None` if shared memory is not tracked on this platform.
+    """
+    if sys.version_info >= (3, 13) or os.name != "posix":
+        return None
+
+    stat = os.fstat(cast(int, resource_tracker.getfd()))
+    return stat.st_dev, stat.st_ino
+
+
+def _attach(name: str, tracker: Optional[tuple[int, int]]) -> SharedMemory:
+    """
+    Attaches to shared memory block without taking responsibility for it.
+    Resource tracker of the owner is passed, when known, as processes
+    sharing it must not unregister the block.
+    """
+    if sys.version_info >= (3, 13):
+        # block is tracked and unlinked by the process, which created it
+        return SharedMemory(name=name, track=False)
+
+    memory = SharedMemory(name=name)
+
+    # before 3.13 attaching registers the block with resource tracker,
+    # which unlinks it once all processes using the tracker have exited,
+    # unless the tracker belongs to the owner, that registered it already
+    if os.name == "posix" and _tracker_id() != tracker:
+        # block is registered under its name with the leading slash
+        registered = memory._name  # type: ignore[attr-defined]
+        resource_tracker.unregister(registered, "shared_memory")
+
+    return memory
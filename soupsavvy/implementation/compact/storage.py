@@ -0,0 +1,268 @@
+"""
+Module with versioned binary format of `CompactDocument`.
+
+Document is stored as a header followed by its structure arrays, string tables
+and text buffer. Loading memory-maps the file and structure arrays become
+read-only views of the mapping, so nothing is copied or parsed, only string
+tables and text are decoded once. Loaded document is usable with every selector
+and model, as any other compact document.
+
+Layout of the file, each section is padded to 8 bytes:
+
+- header: magic bytes, format version, byte order of arrays and sizes of sections
+- element arrays: tags, parents, first children, next siblings, depths, ends,
+text starts and text ends, each with one C int per element
+- attribute arrays: offsets (one per element and one extra), keys and values
+- string tables: names, attribute names and values, each as C int offsets
+followed by utf-8 encoded strings
+- text buffer: utf-8 encoded text of the document
+
+Functions
+---------
+- `dump` - Writes document to binary file.
+- `load` - Loads document from binary file.
+- `encode` - Returns binary representation of document as list of chunks.
+- `decode` - Creates document backed by buffer with binary representation.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Any, Union
+
+from soupsavvy.exceptions import InvalidDocumentFormat
+from soupsavvy.implementation.compact.document import CompactDocument
+
+# identifies files with compact documents
+MAGIC = b"SSVYDOC\x00"
+# incremented with every incompatible change of the layout
+VERSION = 1
+
+# magic, version, byte order, number of elements, attributes,
+# names, attribute names, values and length of encoded text
+_HEADER = struct.Struct("<8sHcxIIIIIQ")
+_ALIGNMENT = 8
+_BYTE_ORDERS = {"little": b"<", "big": b">"}
+_BYTE_ORDER = _BYTE_ORDERS[sys.byteorder]
+_ITEMSIZE = array("i").itemsize
+
+_ELEMENT_ARRAYS = (
+    "tags",
+    "parents",
+    "first_children",
+    "next_siblings",
+    "depths",
+    "ends",
+    "text_starts",
+    "text_ends",
+)
+
+PathType = Union[str, os.PathLike]
+
+
+def encode(document: CompactDocument) -> list[Any]:
+    """
+    Returns binary representation of the document as list of chunks,
+    which are buffers to be written consecutively, including padding.
+
+    Parameters
+    ----------
+    document : CompactDocument
+        Document to encode.
+
+    Returns
+    -------
+    list[bytes | array | memoryview]
+        Chunks of binary representation of the document.
+    """
+    tables = [
+        _encode_table(table)
+        for table in (document.names, document.attribute_names, document.values)
+    ]
+    text = document.text.encode("utf-8")
+    header = _HEADER.pack(
+        MAGIC,
+        VERSION,
+        _BYTE_ORDER,
+        len(document),
+        len(document.attribute_keys),
+        *(len(offsets) - 1 for offsets, _ in tables),
+        len(text),
+    )
+    sections: list[Any] = [header]
+    sections.extend(getattr(document, name) for name in _ELEMENT_ARRAYS)
+    sections.append(document.attribute_offsets)
+    sections.append(document.attribute_keys)
+    sections.append(document.attribute_values)
+
+    for offsets, blob in tables:
+        sections.append(offsets)
+        sections.append(blob)
+
+    sections.append(text)
+    chunks = []
+
+    for section in sections:
+        chunks.append(section)
+        padding = -memoryview(section).nbytes % _ALIGNMENT
+
+        if padding:
+            chunks.append(bytes(padding))
+
+    return chunks
+
+
+def decode(buffer: Any) -> CompactDocument:
+    """
+    Creates document from buffer with its binary representation.
+    Structure arrays of the document are views of the buffer,
+    which must not be modified or released while document is used.
+
+    Parameters
+    ----------
+    buffer : Any
+        Object supporting buffer protocol, like `bytes` or `mmap`.
+
+    Returns
+    -------
+    CompactDocument
+        Document backed by the buffer.
+
+    Raises
+    ------
+    InvalidDocumentFormat
+        If buffer does not contain a valid document
+        or it was written in unsupported version of the format.
+    """
+    reader = _Reader(memoryview(buffer))
+    magic, version, byte_order, size, attributes, *counts, text_length = _HEADER.unpack(
+        reader.take(_HEADER.size)
+    )
+
+    if magic != MAGIC:
+        raise InvalidDocumentFormat("Buffer does not contain compact document.")
+
+    if version != VERSION:
+        raise InvalidDocumentFormat(
+            f"Unsupported version of document format {version}, "
+            f"expected version {VERSION}."
+        )
+
+    reader.swap = byte_order != _BYTE_ORDER
+    arrays = {name: reader.array(size) for name in _ELEMENT_ARRAYS}
+    attribute_offsets = reader.array(size + 1)
+    attribute_keys = reader.array(attributes)
+    attribute_values = reader.array(attributes)
+    names, attribute_names, values = (reader.table(count) for count in counts)
+    text = str(reader.take(text_length), "utf-8")
+
+    return CompactDocument(
+        **arrays,
+        attribute_offsets=attribute_offsets,
+        attribute_keys=attribute_keys,
+        attribute_values=attribute_values,
+        names=names,
+        attribute_names=attribute_names,
+        values=values,
+        text=text,
+    )
+
+
+def dump(document: CompactDocument, file: PathType) -> None:
+    """
+    Writes document to binary file.
+
+    Parameters
+    ----------
+    document : CompactDocument
+        Document to write.
+    file : str | os.PathLike
+        Path of the file, existing file is overwritten.
+    """
+    with open(file, "wb") as stream:
+        stream.writelines(encode(document))
+
+
+def load(file: PathType, memory_map: bool = True) -> CompactDocument:
+    """
+    Loads document from binary file written with `dump`.
+
+    Parameters
+    ----------
+    file : str | os.PathLike
+        Path of the file.
+    memory_map : bool, optional
+        If True, file is memory-mapped and structure arrays are views
+        of the mapping, otherwise the whole file is read into memory.
+        Default is True.
+
+    Returns
+    -------
+    CompactDocument
+        Loaded document.
+
+    Raises
+    ------
+    InvalidDocumentFormat
+        If file is not a valid document file.
+    """
+    with open(file, "rb") as stream:
+        if not memory_map or os.fstat(stream.fileno()).st_size == 0:
+            return decode(stream.read())
+
+        # mapping stays open as long as any view of it is referenced
+        buffer = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+
+    return decode(buffer)
+
+
+class _Reader:
+    """Reads consecutive, padded sections of the buffer."""
+
+    def __init__(self, buffer: memoryview) -> None:
+        self.buffer = buffer
+        self.offset = 0
+        self.swap = False
+
+    def take(self, size: int) -> memoryview:
+        """Returns view of the next section with given size in bytes."""
+        end = self.offset + size
+
+        if end > self.buffer.nbytes:
+            raise InvalidDocumentFormat("Document buffer is truncated.")
+
+        chunk = self.buffer[self.offset : end]
+        self.offset = end + (-size % _ALIGNMENT)
+        return chunk
+
+    def array(self, count: int) -> Union[array, memoryview]:
+        """Returns next section as C int array, view if byte order matches."""
+        chunk = self.take(count * _ITEMSIZE)
+
+        if not self.swap:
+            return chunk.cast("i")
+
+        result = array("i", chunk.tobytes())
+        result.byteswap()
+        return result
+
+    def table(self, count: int) -> list[str]:
+        """Returns next section as table of strings."""
+        offsets = self.array(count + 1)
+        blob = self.take(offsets[-1])
+        return [str(blob[offsets[i] : offsets[i + 1]], "utf-8") for i in range(count)]
+
+
+def _encode_table(table: list[str]) -> tuple[array, bytes]:
+    """Encodes table of strings as offsets and concatenated utf-8 strings."""
+    encoded = [value.encode("utf-8") for value in table]
+    offsets = array("i", [0])
+
+    for value in encoded:
+        offsets.append(offsets[-1] + len(value))
+
+    return offsets, b"".join(encoded)
@@ -0,0 +1,137 @@
+"""
+Module with lazy views of text stored in the buffer of `CompactDocument`.
+
+All text nodes of compact document are stored in a single string buffer
+and text content of each element is a contiguous range of it. `TextView`
+references this range instead of copying it, comparisons and regex searches
+run directly on the buffer and string is built only when view is converted
+with `str`.
+
+Classes
+-------
+- `TextView` - Lazy, read-only view of a range of text buffer.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Optional, Pattern, Union
+
+# regex constructs, which depend on text before the searched range,
+# when searching buffer with `pos` argument instead of a sliced string
+_CONTEXT_SENSITIVE = re.compile(r"\^|\\[AbB]|\(\?<[=!]")
+
+
+class TextView:
+    """
+    Lazy, read-only view of range `[start, end)` of the text buffer.
+
+    Example
+    -------
+    >>> view = TextView("Hello World", 6, 11)
+    ... view == "World"
+    True
+    ... str(view)
+    'World'
+    """
+
+    __slots__ = ("buffer", "start", "end")
+
+    def __init__(self, buffer: str, start: int = 0, end: Optional[int] = None) -> None:
+        """
+        Initializes view of the buffer range.
+
+        Parameters
+        ----------
+        buffer : str
+            Text buffer, which is referenced and not copied.
+        start : int, optional
+            Start of the range, by default 0.
+        end : int, optional
+            End of the range (exclusive), by default end of the buffer.
+        """
+        self.buffer = buffer
+        self.start = start
+        self.end = len(buffer) if end is None else end
+
+    def search(self, pattern: Pattern[str]) -> Optional[re.Match[str]]:
+        """
+        Searches regex pattern in the text without building a string.
+        Positions of the returned match are positions in the buffer.
+
+        Parameters
+        ----------
+        pattern : Pattern[str]
+            Compiled regex pattern.
+
+        Returns
+        -------
+        re.Match | None
+            Match object or `None` if pattern was not found.
+        """
+        # anchors and lookbehinds would see text before the start of the range
+        if _CONTEXT_SENSITIVE.search(pattern.pattern):
+            return pattern.search(str(self))
+
+        return pattern.search(self.buffer, self.start, self.end)
+
+    def match(self, pattern: Union[str, Pattern[str]]) -> bool:
+        """
+        Checks if text matches the pattern, string pattern must be equal
+        to the text, regex pattern is searched in it.
+        """
+        if isinstance(pattern, Pattern):
+            return self.search(pattern) is not None
+
+        return self == pattern
+
+    def startswith(self, prefix: str) -> bool:
+        """Checks if text starts with the prefix."""
+        return self.buffer.startswith(prefix, self.start, self.end)
+
+    def endswith(self, suffix: str) -> bool:
+        """Checks if text ends with the suffix."""
+        return self.buffer.endswith(suffix, self.start, self.end)
+
+    def find(self, sub: str) -> int:
+        """Returns the lowest index of substring in the text or `-1`."""
+        index = self.buffer.find(sub, self.start, self.end)
+        return index - self.start if index != -1 else -1
+
+    def __contains__(self, sub: str) -> bool:
+        return self.find(sub) != -1
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    def __bool__(self) -> bool:
+        return self.end > self.start
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[str, TextView]:
+        if isinstance(key, int):
+            return str(self)[key]
+
+        start, stop, step = key.indices(len(self))
+
+        if step != 1:
+            return str(self)[key]
+
+        return TextView(self.buffer, self.start + start, self.start + max(start, stop))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, TextView):
+            other = str(other)
+
+        if not isinstance(other, str):
+            return NotImplemented
+
+        return len(other) == len(self) and self.startswith(other)
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+    def __str__(self) -> str:
+        return self.buffer[self.start : self.end]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({str(self)!r})"
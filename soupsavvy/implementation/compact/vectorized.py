@@ -0,0 +1,564 @@
+"""
+Module with vectorized execution engine of selectors for compact documents.
+
+Columns of `CompactDocument` are exposed as `numpy` arrays and selectors
+are evaluated as boolean masks over all elements of the document at once.
+Simple selectors are column predicates, logical selectors are mask algebra,
+nth selectors are arithmetic on counts of matching siblings and combinators
+are gathers over parent and sibling pointers.
+
+Selectors, which can not be vectorized (like `ExpressionSelector`, css
+or xpath selectors), are evaluated with their own `find_all` method.
+
+Classes
+-------
+- `DocumentColumns` - Columns of compact document as `numpy` arrays.
+
+Functions
+---------
+- `evaluate` - Evaluates selector as boolean mask over elements of the document.
+- `find_all` - Finds all elements matching selector with vectorized engine.
+- `find` - Finds first element matching selector with vectorized engine.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from functools import reduce
+from typing import Optional, Pattern, cast
+from weakref import proxy
+
+import numpy as np
+
+from soupsavvy.base import SoupSelector
+from soupsavvy.implementation.compact.document import NONE, CompactDocument
+from soupsavvy.implementation.compact.element import CompactElement, is_multi_valued
+from soupsavvy.selectors.attributes import AttributeSelector
+from soupsavvy.selectors.combinators import (
+    AncestorCombinator,
+    BaseAncestorCombinator,
+    BaseCombinator,
+    ChildCombinator,
+    DescendantCombinator,
+    NextSiblingCombinator,
+    ParentCombinator,
+    SubsequentSiblingCombinator,
+)
+from soupsavvy.selectors.general import PatternSelector, TypeSelector, UniversalSelector
+from soupsavvy.selectors.logical import (
+    AndSelector,
+    NotSelector,
+    SelectorList,
+    XORSelector,
+)
+from soupsavvy.selectors.nth.selectors import (
+    BaseNthOfSelector,
+    NthLastOfSelector,
+    OnlyOfSelector,
+)
+from soupsavvy.selectors.relative import (
+    HasSelector,
+    RelativeAncestor,
+    RelativeChild,
+    RelativeDescendant,
+    RelativeNextSibling,
+    RelativeParent,
+    RelativeSelector,
+    RelativeSubsequentSibling,
+)
+
+Mask = np.ndarray
+
+# key under which columns are cached in the document
+_COLUMNS_KEY = "columns"
+
+
+class UnsupportedSelector(Exception):
+    """Raised when selector can not be evaluated with vectorized engine."""
+
+
+class DocumentColumns:
+    """
+    Columns of `CompactDocument` as `numpy` arrays with derived columns
+    used by vectorized evaluation of selectors.
+
+    Structural arrays are zero-copy views of document arrays. Derived columns
+    group children by their parent, so counts of matching siblings
+    are computed with cumulative sums instead of iterating over the tree.
+    """
+
+    def __init__(self, document: CompactDocument) -> None:
+        """
+        Computes columns of the document.
+
+        Parameters
+        ----------
+        document : CompactDocument
+            Document to compute columns of.
+        """
+        # columns are cached in the document, proxy avoids reference cycle
+        self.document = proxy(document)
+        self.size = len(document)
+        self.tags = np.frombuffer(document.tags, dtype=np.intc)
+        self.parents = np.frombuffer(document.parents, dtype=np.intc)
+        self.ends = np.frombuffer(document.ends, dtype=np.intc)
+        self.first_children = np.frombuffer(document.first_children, dtype=np.intc)
+
+        next_siblings = np.frombuffer(document.next_siblings, dtype=np.intc)
+        self.previous_siblings = np.full(self.size, NONE, dtype=np.intc)
+        has_next = np.flatnonzero(next_siblings != NONE)
+        self.previous_siblings[next_siblings[has_next]] = has_next
+
+        # elements ordered by parent and document order, siblings are contiguous
+        self.order = np.argsort(self.parents, kind="stable")
+        grouped = self.parents[self.order]
+        first = np.ones(self.size, dtype=bool)
+        first[1:] = grouped[1:] != grouped[:-1]
+        self.group_ids = np.cumsum(first) - 1
+        self.group_starts = np.flatnonzero(first)
+        self.roots = self.parents == NONE
+
+        self._attributes: dict[str, np.ndarray] = {}
+
+    def attribute(self, name: str) -> np.ndarray:
+        """
+        Returns column with ids of values of the attribute for each element,
+        `-1` for elements without the attribute.
+        """
+        column = self._attributes.get(name)
+
+        if column is not None:
+            return column
+
+        document = self.document
+        column = np.full(self.size, NONE, dtype=np.intc)
+        key = document.attribute_id(name)
+
+        if key != NONE:
+            offsets = np.frombuffer(document.attribute_offsets, dtype=np.intc)
+            keys = np.frombuffer(document.attribute_keys, dtype=np.intc)
+            values = np.frombuffer(document.attribute_values, dtype=np.intc)
+            owners = np.repeat(np.arange(self.size), np.diff(offsets))
+            selected = keys == key
+            column[owners[selected]] = values[selected]
+
+        self._attributes[name] = column
+        return column
+
+    def sibling_counts(self, mask: Mask) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Counts matching siblings of each element.
+
+        Parameters
+        ----------
+        mask : Mask
+            Mask of matching elements.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            Number of matching siblings up to the element (inclusive)
+            and total number of matching siblings of the element.
+        """
+        matching = mask[self.order].astype(np.int64)
+        cumulative = np.cumsum(matching)
+        before = (cumulative - matching)[self.group_starts]
+        ends = np.append(self.group_starts[1:], self.size) - 1
+        totals = cumulative[ends] - before
+
+        index = np.empty(self.size, dtype=np.int64)
+        total = np.empty(self.size, dtype=np.int64)
+        index[self.order] = cumulative - before[self.group_ids]
+        total[self.order] = totals[self.group_ids]
+        return index, total
+
+    def gather(self, mask: Mask, pointers: np.ndarray) -> Mask:
+        """Returns mask value of pointed elements, False for `-1` pointers."""
+        return np.append(mask, False)[pointers]
+
+    def has_ancestor(self, mask: Mask) -> Mask:
+        """Returns mask of elements with any ancestor matching the mask."""
+        delta = np.zeros(self.size + 1, dtype=np.int64)
+        positions = np.flatnonzero(mask)
+        np.add.at(delta, positions + 1, 1)
+        np.add.at(delta, self.ends[positions] + 1, -1)
+        return np.cumsum(delta[:-1]) > 0
+
+    def has_descendant(self, mask: Mask) -> Mask:
+        """Returns mask of elements with any descendant matching the mask."""
+        cumulative: np.ndarray = np.concatenate(
+            (np.zeros(1, dtype=np.int64), np.cumsum(mask))
+        )
+        positions = np.arange(self.size)
+        return cumulative[self.ends + 1] - cumulative[positions + 1] > 0
+
+    def has_child(self, mask: Mask) -> Mask:
+        """Returns mask of elements with any child matching the mask."""
+        result = np.zeros(self.size, dtype=bool)
+        parents = self.parents[mask]
+        result[parents[parents != NONE]] = True
+        return result
+
+    def scope(self, position: int, recursive: bool) -> Mask:
+        """Returns mask of descendants or children of the element."""
+        if not recursive:
+            return self.parents == position
+
+        mask = np.zeros(self.size, dtype=bool)
+        mask[position + 1 : self.ends[position] + 1] = True
+        return mask
+
+
+def get_columns(document: CompactDocument) -> DocumentColumns:
+    """Returns columns of the document, computed once and cached."""
+    return document.cached(_COLUMNS_KEY, lambda: DocumentColumns(document))
+
+
+class MaskEvaluator:
+    """
+    Evaluates selectors as boolean masks over elements of a single document.
+
+    `select` returns mask of elements, that `find_all` method of the selector
+    would return for given element, while `mask` returns mask of context-free
+    selectors, which does not depend on the searched element.
+    """
+
+    def __init__(self, columns: DocumentColumns) -> None:
+        self.columns = columns
+
+    def select(self, selector: SoupSelector, position: int, recursive: bool) -> Mask:
+        """
+        Evaluates results of `find_all` of the selector for element
+        at given position as a mask.
+
+        Raises
+        ------
+        UnsupportedSelector
+            If selector can not be vectorized.
+        """
+        columns = self.columns
+
+        if isinstance(selector, BaseCombinator):
+            return self._combinator(selector, position, recursive)
+
+        if isinstance(selector, SelectorList):
+            matching = self._reduce(np.logical_or, selector, position, recursive)
+            return matching & columns.scope(position, recursive)
+
+        if isinstance(selector, AndSelector):
+            return self._reduce(np.logical_and, selector, position, recursive)
+
+        if isinstance(selector, NotSelector):
+            matching = self._reduce(np.logical_or, selector, position, recursive)
+            return columns.scope(position, recursive) & ~matching
+
+        if isinstance(selector, XORSelector):
+            counts = sum(
+                self.select(step, position, recursive).astype(np.int64)
+                for step in selector.selectors
+            )
+            return (counts == 1) & columns.scope(position, recursive)
+
+        return self.mask(selector) & columns.scope(position, recursive)
+
+    def mask(self, selector: SoupSelector) -> Mask:
+        """
+        Evaluates context-free selector as a mask over the whole document.
+
+        Raises
+        ------
+        UnsupportedSelector
+            If selector can not be vectorized or is not context-free.
+        """
+        columns = self.columns
+        document = columns.document
+
+        if isinstance(selector, TypeSelector):
+            return columns.tags == document.name_id(selector.name)
+
+        if isinstance(selector, UniversalSelector):
+            return np.ones(columns.size, dtype=bool)
+
+        if isinstance(selector, AttributeSelector):
+            return self._attribute(selector)
+
+        if isinstance(selector, PatternSelector):
+            return self._pattern(selector)
+
+        if isinstance(selector, SelectorList):
+            return reduce(np.logical_or, map(self.mask, selector.selectors))
+
+        if isinstance(selector, AndSelector):
+            return reduce(np.logical_and, map(self.mask, selector.selectors))
+
+        if isinstance(selector, NotSelector):
+            return ~reduce(np.logical_or, map(self.mask, selector.selectors))
+
+        if isinstance(selector, XORSelector):
+            counts = np.zeros(columns.size, dtype=np.int64)
+
+            for step in selector.selectors:
+                counts += self.mask(step)
+
+            return counts == 1
+
+        if isinstance(selector, BaseNthOfSelector):
+            return self._nth(selector)
+
+        if isinstance(selector, OnlyOfSelector):
+            inner = self.mask(selector.selector)
+            _, total = columns.sibling_counts(inner)
+            return inner & (total == 1)
+
+        if isinstance(selector, HasSelector):
+            return reduce(np.logical_or, map(self._has, selector.selectors))
+
+        raise UnsupportedSelector(
+            f"Selector {selector} can not be evaluated with vectorized engine."
+        )
+
+    def _reduce(
+        self,
+        func: Callable[[Mask, Mask], Mask],
+        selector: SoupSelector,
+        position: int,
+        recursive: bool,
+    ) -> Mask:
+        """Combines results of all selectors of composite selector."""
+        return reduce(
+            func,
+            (
+                self.select(step, position, recursive)
+                for step in selector.selectors  # type: ignore[attr-defined]
+            ),
+        )
+
+    def _attribute(self, selector: AttributeSelector) -> Mask:
+        """Evaluates attribute selector by matching unique values of the column."""
+        columns = self.columns
+        document = columns.document
+        column = columns.attribute(selector.name)
+        values = document.values
+        pattern = selector._pattern
+
+        def matches(value: str, multi_valued: bool) -> bool:
+            candidates = [*value.split(), value] if multi_valued else [value]
+
+            if isinstance(pattern, Pattern):
+                return any(pattern.search(candidate) for candidate in candidates)
+
+            return pattern in candidates
+
+        present = np.unique(column[column != NONE]).tolist()
+        matching = [id_ for id_ in present if matches(values[id_], False)]
+        mask = np.isin(column, matching)
+        # attribute is multi-valued only for some tags, their values match by tokens
+        tags = [
+            i
+            for i, name in enumerate(document.names)
+            if is_multi_valued(name, selector.name)
+        ]
+
+        if tags:
+            matching = [id_ for id_ in present if matches(values[id_], True)]
+            mask = np.where(
+                np.isin(columns.tags, tags), np.isin(column, matching), mask
+            )
+
+        return mask
+
+    def _pattern(self, selector: PatternSelector) -> Mask:
+        """Evaluates pattern selector on text of leaf elements."""
+        columns = self.columns
+        document = columns.document
+        pattern = selector.pattern
+        mask = np.zeros(columns.size, dtype=bool)
+
+        for position in np.flatnonzero(columns.first_children == NONE).tolist():
+            mask[position] = document.text_view(position).match(pattern)
+
+        return mask
+
+    def _nth(self, selector: BaseNthOfSelector) -> Mask:
+        """Evaluates nth selectors with positions among matching siblings."""
+        inner = self.mask(selector.selector)
+        index, total = self.columns.sibling_counts(inner)
+
+        if isinstance(selector, NthLastOfSelector):
+            index = total - index + 1
+
+        stop = int(total.max()) if total.size else 0
+        allowed = list(selector.nth_selector.generate(stop))
+        return inner & np.isin(index, allowed)
+
+    def _has(self, step: SoupSelector) -> Mask:
+        """Evaluates a single relative step of `HasSelector`."""
+        columns = self.columns
+
+        if not isinstance(step, RelativeSelector):
+            return columns.has_descendant(self.mask(step))
+
+        inner = self.mask(step.selector)
+
+        if isinstance(step, RelativeDescendant):
+            return columns.has_descendant(inner)
+
+        if isinstance(step, RelativeChild):
+            return columns.has_child(inner)
+
+        if isinstance(step, RelativeNextSibling):
+            next_siblings = np.frombuffer(columns.document.next_siblings, np.intc)
+            return columns.gather(inner, next_siblings)
+
+        if isinstance(step, RelativeSubsequentSibling):
+            index, total = columns.sibling_counts(inner)
+            return total - index > 0
+
+        # root is never matched by ancestor selectors, as they search within it
+        if isinstance(step, RelativeParent):
+            return columns.gather(inner & ~columns.roots, columns.parents)
+
+        if isinstance(step, RelativeAncestor):
+            return columns.has_ancestor(inner & ~columns.roots)
+
+        raise UnsupportedSelector(
+            f"Relative selector {step} can not be evaluated with vectorized engine."
+        )
+
+    def _combinator(
+        self, selector: BaseCombinator, position: int, recursive: bool
+    ) -> Mask:
+        """Evaluates combinator by propagating mask of each step to the next one."""
+        columns = self.columns
+        ancestor = isinstance(selector, BaseAncestorCombinator)
+        first, *steps = selector.selectors
+        # first step of ancestor combinators is always searched recursively
+        results = self.select(first, position, recursive or ancestor)
+
+        for step in steps:
+            inner = self.mask(step)
+
+            if isinstance(selector, ChildCombinator):
+                results = inner & columns.gather(results, columns.parents)
+            elif isinstance(selector, DescendantCombinator):
+                results = inner & columns.has_ancestor(results)
+            elif isinstance(selector, NextSiblingCombinator):
+                results = inner & columns.gather(results, columns.previous_siblings)
+            elif isinstance(selector, SubsequentSiblingCombinator):
+                index, _ = columns.sibling_counts(results)
+                # count of matching preceding siblings, excluding the element
+                results = inner & (index - results > 0)
+            elif isinstance(selector, ParentCombinator):
+                results = inner & ~columns.roots & columns.has_child(results)
+            elif isinstance(selector, AncestorCombinator):
+                results = inner & ~columns.roots & columns.has_descendant(results)
+            else:
+                raise UnsupportedSelector(
+                    f"Combinator {selector} can not be evaluated "
+                    "with vectorized engine."
+                )
+
+        # results of ancestor combinators respect recursive parameter
+        return results & columns.scope(position, recursive or not ancestor)
+
+
+def evaluate(
+    selector: SoupSelector,
+    element: CompactElement,
+    recursive: bool = True,
+) -> Optional[Mask]:
+    """
+    Evaluates selector as boolean mask over all elements of the document,
+    marking elements that `find_all` method of the selector would return.
+
+    Parameters
+    ----------
+    selector : SoupSelector
+        Selector to evaluate.
+    element : CompactElement
+        Element, which is searched.
+    recursive : bool, optional
+        If False, only direct children of the element are searched.
+        Default is True.
+
+    Returns
+    -------
+    np.ndarray | None
+        Boolean mask indexed by positions of elements in the document
+        or `None` if selector can not be vectorized.
+    """
+    evaluator = MaskEvaluator(get_columns(element.document))
+
+    try:
+        return evaluator.select(selector, element.position, recursive)
+    except UnsupportedSelector:
+        return None
+
+
+def find_all(
+    selector: SoupSelector,
+    element: CompactElement,
+    recursive: bool = True,
+    limit: Optional[int] = None,
+) -> list[CompactElement]:
+    """
+    Finds all elements matching selector with vectorized engine.
+    Falls back to `find_all` method of the selector if it can not be vectorized.
+
+    Parameters
+    ----------
+    selector : SoupSelector
+        Selector to find elements with.
+    element : CompactElement
+        Element, which is searched.
+    recursive : bool, optional
+        If False, only direct children of the element are searched.
+        Default is True.
+    limit : int, optional
+        Maximum number of returned elements, by default all are returned.
+
+    Returns
+    -------
+    list[CompactElement]
+        Matching elements in document order.
+
+    Example
+    -------
+    >>> from soupsavvy.implementation.compact.vectorized import find_all
+    ... find_all(TypeSelector("div") > ClassSelector("item"), element)
+    """
+    mask = evaluate(selector, element, recursive=recursive)
+
+    if mask is None:
+        elements = selector.find_all(element, recursive=recursive, limit=limit)
+        return cast(list[CompactElement], elements)
+
+    positions = np.flatnonzero(mask)[:limit].tolist()
+    return [element._at(position) for position in positions]
+
+
+def find(
+    selector: SoupSelector,
+    element: CompactElement,
+    recursive: bool = True,
+) -> Optional[CompactElement]:
+    """
+    Finds first element matching selector with vectorized engine.
+
+    Parameters
+    ----------
+    selector : SoupSelector
+        Selector to find element with.
+    element : CompactElement
+        Element, which is searched.
+    recursive : bool, optional
+        If False, only direct children of the element are searched.
+        Default is True.
+
+    Returns
+    -------
+    CompactElement | None
+        First matching element or `None` if nothing matches.
+    """
+    elements = find_all(selector, element, recursive=recursive, limit=1)
+    return elements[0] if elements else None
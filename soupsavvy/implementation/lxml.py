@@ -6,18 +6,26 @@ compatible with `IElement` interface and usable across the library.
 
 from __future__ import annotations
 
+import re
 from collections.abc import Iterable
+from functools import lru_cache
 from itertools import islice
-from typing import Optional, Pattern, Union
+from typing import TYPE_CHECKING, Optional, Pattern, Union
 
 import lxml.etree as etree
 from lxml.etree import _Element as LXMLNode
 from typing_extensions import Self
 
+import soupsavvy.exceptions as exc
+from soupsavvy.implementation.tracking import DocumentState
+from soupsavvy.indexing.index import get_index
 from soupsavvy.interfaces import IElement
 from soupsavvy.selectors.css.api import CSSSelectApi
 from soupsavvy.selectors.xpath.api import LXMLXpathApi
 
+if TYPE_CHECKING:
+    from soupsavvy.base import SoupSelector
+
 
 class LXMLElement(IElement[LXMLNode]):
     """
@@ -32,7 +40,96 @@ class LXMLElement(IElement[LXMLNode]):
     ... element = LXMLElement(node)
     """
 
+    __slots__ = ()
+
     _NODE_TYPE = LXMLNode
+    _POOLED = True
+
+    @classmethod
+    def from_scope(cls, markup: str, scope: SoupSelector) -> Self:
+        """
+        Parses only subtrees of the markup matched by the scope selector
+        with `lxml` html parser and returns root of the reduced document.
+
+        Matched subtrees are appended to the synthetic "root" element
+        in document order. Memory used by the document scales with extracted
+        content instead of the size of the page.
+
+        Parameters
+        ----------
+        markup : str
+            Html string to parse.
+        scope : SoupSelector
+            Selector of subtrees to parse, like scope of the model.
+            Needs to depend only on tag name and attributes of the element.
+
+        Returns
+        -------
+        LXMLElement
+            Root of the document containing only matched subtrees.
+
+        Raises
+        ------
+        UnsupportedScopeException
+            If scope can not be evaluated during parsing.
+
+        Example
+        -------
+        >>> element = LXMLElement.from_scope(markup, ProductModel.scope)
+        ... products = ProductModel.find_all(element)
+        """
+        return cls(ScopeParser.parse(markup, scope))
+
+    def track(self) -> DocumentState:
+        # lxml nodes can not store state nor be weakly referenced,
+        # state is propagated to elements derived from tracked element
+        if self._state is None:
+            self._state = DocumentState(self.node.getroottree().getroot())
+
+        return self._state
+
+    def decompose(self) -> None:
+        self._detach()
+
+    def extract(self) -> Self:
+        self._detach()
+        # extracted element is a root of a new, untracked document
+        return self.from_node(self.node)
+
+    def insert(self, position: int, element: Self) -> None:
+        element._detach()
+        self.node.insert(position, element.node)
+
+        if self._state is not None:
+            self._state.bump()
+
+        element._state = self._state
+
+    def _detach(self) -> None:
+        """
+        Removes node from its parent, keeping its tail text in the document.
+        Bumps version of the document if it is tracked.
+        """
+        node = self.node
+        parent = node.getparent()
+
+        if parent is None:
+            return
+
+        if node.tail:
+            previous = node.getprevious()
+
+            if previous is not None:
+                previous.tail = (previous.tail or "") + node.tail
+            else:
+                parent.text = (parent.text or "") + node.tail
+
+            node.tail = None
+
+        parent.remove(node)
+
+        if self._state is not None:
+            self._state.bump()
 
     def find_all(
         self,
@@ -41,11 +138,39 @@ class LXMLElement(IElement[LXMLNode]):
         recursive: bool = True,
         limit: Optional[int] = None,
     ) -> list[Self]:
-        iterator = (
-            self.node.iterdescendants(None)
-            if recursive
-            else self.node.iterchildren(None)
-        )
+        index = get_index(self) if recursive else None
+
+        if index is not None:
+            found = index.find_all(
+                self, name=name, attrs=attrs, limit=limit, match=self._match
+            )
+
+            if found is not None:
+                return found  # type: ignore
+
+        iterator: Iterable[LXMLNode]
+
+        if attrs:
+            # candidates are preselected by compiled query inside libxml2
+            # and verified, as query can only approximate token and regex matching
+            query, variables, exact = _compile(name, attrs, recursive, self._exslt)
+
+            try:
+                candidates = query(self.node, **variables)
+            except ValueError:
+                # values, which are not xml compatible, can not be used in query
+                iterator = self._iterate(None, recursive)
+            else:
+                if exact:
+                    return list(islice(self._map(candidates), limit))
+
+                iterator = candidates
+        elif name is None or _is_plain(name):
+            # elements are filtered by tag name natively
+            return list(islice(self._map(self._iterate(name, recursive)), limit))
+        else:
+            iterator = self._iterate(None, recursive)
+
         generator = (
             element
             for element in iterator
@@ -53,12 +178,53 @@ class LXMLElement(IElement[LXMLNode]):
         )
         return list(islice(self._map(generator), limit))
 
-    def _match(
+    def _find_text(
         self,
+        pattern: Union[str, Pattern[str]],
+        recursive: bool = True,
+        limit: Optional[int] = None,
+    ) -> Optional[list[Self]]:
+        if not self._exslt:
+            return None
+
+        flags = _exslt_flags(pattern)
+        regex = isinstance(pattern, Pattern)
+
+        if regex and flags is None:
+            return None
+
+        query = _text_query(regex, recursive)
+        text = pattern.pattern if regex else pattern  # type: ignore[union-attr]
+
+        try:
+            found = query(self.node, text=text, flags=flags or "")
+        except ValueError:
+            return None
+
+        return list(islice(self._map(found), limit))
+
+    @property
+    def _exslt(self) -> bool:
+        """Returns True if regex matching is performed with EXSLT for the document."""
+        return self._state is not None and self._state.is_enabled(_EXSLT_OPTION)
+
+    def _iterate(self, tag: Optional[str], recursive: bool) -> Iterable[LXMLNode]:
+        """Returns iterator over descendants or children with given tag."""
+        if recursive:
+            return self.node.iterdescendants(tag)
+
+        return self.node.iterchildren(tag)
+
+    @staticmethod
+    def _match(
         element: LXMLNode,
         name: Optional[str],
         attrs: dict[str, Union[str, Pattern[str]]],
     ) -> bool:
+        # name is compared first, as it is the cheapest check
+        if name is not None and element.tag != name:
+            return False
+
         for attr, value in attrs.items():
             attribute = element.attrib.get(attr)
 
@@ -72,9 +238,6 @@ class LXMLElement(IElement[LXMLNode]):
                 if value not in attribute.split():
                     return False
 
-        if name is not None and element.tag != name:
-            return False
-
         return True
 
     def find_subsequent_siblings(self, limit: Optional[int] = None) -> list[Self]:
@@ -107,7 +270,11 @@ class LXMLElement(IElement[LXMLNode]):
     @property
     def parent(self) -> Optional[Self]:
         parent = self.node.getparent()
-        return self.from_node(parent) if parent is not None else None
+        return self._wrap(parent) if parent is not None else None
+
+    @property
+    def attributes(self) -> dict[str, str]:
+        return dict(self.node.attrib)
 
     @property
     def name(self) -> str:
@@ -120,3 +287,294 @@ class LXMLElement(IElement[LXMLNode]):
 
     def __str__(self) -> str:
         return etree.tostring(self.node, method="html", with_tail=False).decode("utf-8")
+
+
+# characters with special meaning in tag filters of lxml iterators
+_SPECIAL = frozenset("{}*")
+# names, which can be used directly as name tests in XPath
+_NCNAME = re.compile(r"^[A-Za-z_][\w.-]*$")
+# namespaces of extensions used in queries
+_NAMESPACES = {"re": "http://exslt.org/regular-expressions"}
+# kinds of attribute tests in queries
+_CONTAINS = "contains"
+_TEST = "test"
+_PRESENT = "present"
+# option of the document enabling regex matching with EXSLT
+_EXSLT_OPTION = "exslt"
+
+
+@lru_cache(maxsize=256)
+def _query(
+    name: Optional[str],
+    attributes: tuple[tuple[Optional[str], str], ...],
+    recursive: bool,
+) -> etree.XPath:
+    """
+    Returns compiled XPath query selecting candidates for `find_all`.
+    Values are passed as variables, so the query is compiled once
+    for all searches of the same shape.
+
+    Parameters
+    ----------
+    name : str, optional
+        Name used as name test, if it is a valid XPath name.
+        Empty string, if elements are filtered by local name `$name` instead.
+    attributes : tuple[tuple[str | None, str], ...]
+        Names of attributes with kind of their test. If name is None,
+        attribute is selected by local name `$a{i}`. Value of attribute
+        needs to contain `$v{i}` for "contains" kind, match regex `$v{i}`
+        with flags `$f{i}` for "test" kind, otherwise attribute needs
+        to be present.
+    recursive : bool
+        If True, descendants are selected, otherwise only children.
+
+    Returns
+    -------
+    etree.XPath
+        Compiled XPath query.
+    """
+    predicates = ["local-name()=$name"] if name == "" else []
+
+    for i, (attribute, kind) in enumerate(attributes):
+        step = f"@{attribute}" if attribute else f"@*[local-name()=$a{i}]"
+
+        if kind == _CONTAINS:
+            step += f"[contains(., $v{i})]"
+        elif kind == _TEST:
+            step += f"[re:test(., $v{i}, $f{i})]"
+
+        predicates.append(step)
+
+    axis = "descendant" if recursive else "child"
+    query = f"{axis}::{name or '*'}"
+
+    if predicates:
+        query += f"[{' and '.join(predicates)}]"
+
+    return etree.XPath(query, namespaces=_NAMESPACES)
+
+
+@lru_cache(maxsize=8)
+def _text_query(regex: bool, recursive: bool) -> etree.XPath:
+    """
+    Returns compiled XPath query selecting leaf elements, which text
+    is equal to `$text` or matches regex `$text` with flags `$flags`.
+    """
+    axis = "descendant" if recursive else "child"
+    test = "re:test(string(.), $text, $flags)" if regex else "string(.)=$text"
+    query = f"{axis}::*[not(node()[not(self::text())])][{test}]"
+    return etree.XPath(query, namespaces=_NAMESPACES)
+
+
+def _compile(
+    name: Optional[str],
+    attrs: dict[str, Union[str, Pattern[str]]],
+    recursive: bool,
+    exslt: bool = False,
+) -> tuple[etree.XPath, dict[str, str], bool]:
+    """
+    Returns query created with `_query` and its variables for provided parameters,
+    together with flag if query selects exactly matching elements.
+
+    Names, which are not valid in XPath, are compared by their local part.
+    Literal values need to be contained in attribute value. Regex patterns
+    are tested with EXSLT if enabled and pattern is compatible,
+    otherwise only presence of the attribute is required.
+    """
+    variables = {}
+    exact = True
+
+    if name is not None and not _NCNAME.match(name):
+        variables["name"] = _local_name(name)
+        name = ""
+        exact = False
+
+    attributes = []
+
+    for i, (attr, value) in enumerate(attrs.items()):
+        if _NCNAME.match(attr):
+            key = attr
+        else:
+            key = None
+            variables[f"a{i}"] = _local_name(attr)
+            exact = False
+
+        flags = _exslt_flags(value) if exslt else None
+
+        if not isinstance(value, Pattern):
+            attributes.append((key, _CONTAINS))
+            variables[f"v{i}"] = value
+            exact = False
+        elif flags is not None:
+            attributes.append((key, _TEST))
+            variables[f"v{i}"] = value.pattern
+            variables[f"f{i}"] = flags
+        else:
+            attributes.append((key, _PRESENT))
+            exact = False
+
+    return _query(name, tuple(attributes), recursive), variables, exact
+
+
+def _exslt_flags(value: Union[str, Pattern[str]]) -> Optional[str]:
+    """
+    Returns flags of EXSLT `re:test` function, which match the same strings
+    as the pattern, or None if pattern is not compatible.
+
+    `lxml` compiles EXSLT patterns with python `re` module with unicode flag
+    and optional case-insensitivity, so pattern is compatible if it compiles
+    to the same pattern from its source with these flags only.
+    """
+    if not isinstance(value, Pattern) or not isinstance(value.pattern, str):
+        return None
+
+    ignore_case = value.flags & re.IGNORECASE
+
+    try:
+        compiled = re.compile(value.pattern, re.UNICODE | ignore_case)
+    except re.error:  # pragma: no cover
+        return None
+
+    if compiled.flags != value.flags:
+        return None
+
+    return "i" if ignore_case else ""
+
+
+def _is_plain(name: str) -> bool:
+    """
+    Checks if name can be used as tag filter of lxml iterators
+    with the same meaning as comparison with tag of the element.
+    Braces and asterisks have special meaning in lxml filters.
+    """
+    return bool(name) and not _SPECIAL.intersection(name)
+
+
+def _local_name(name: str) -> str:
+    """Returns local part of the name in Clark notation."""
+    return name.rpartition("}")[2]
+
+
+class ScopeParser:
+    """
+    Incremental `lxml` html parser, which keeps only subtrees of elements
+    matched by the scope selector, with the same semantics as `LXMLElement`
+    search. Matched subtrees are moved to the synthetic "root" element
+    in document order, when they are parsed, and other elements are discarded,
+    so only a chunk of the page is held in memory besides extracted content.
+
+    Example
+    -------
+    >>> parser = ScopeParser(ClassSelector("product"))
+    ... for chunk in chunks:
+    ...     parser.feed(chunk)
+    ... root = parser.close()
+    """
+
+    ROOT = "root"
+    # size of chunks, in which markup is fed to the parser by `parse`
+    CHUNK_SIZE = 65536
+
+    def __init__(self, scope: SoupSelector) -> None:
+        """
+        Initializes parser with filter of the scope selector.
+
+        Parameters
+        ----------
+        scope : SoupSelector
+            Selector of elements to keep, which needs to depend only
+            on tag name and attributes of the element.
+
+        Raises
+        ------
+        UnsupportedScopeException
+            If scope can not be evaluated during parsing.
+        """
+        filter_ = scope._parse_filter
+
+        if filter_ is None:
+            raise exc.UnsupportedScopeException(
+                f"Scope '{scope}' can not be evaluated during parsing, only tag name "
+                "and attribute selectors and their conjunctions are supported."
+            )
+
+        self._name, self._attrs = filter_
+        self._parser = etree.HTMLPullParser(events=("start", "end"))
+        self._root = etree.Element(self.ROOT)
+        # outermost matched element, which is being parsed
+        self._match: Optional[LXMLNode] = None
+
+    @classmethod
+    def parse(cls, markup: str, scope: SoupSelector) -> LXMLNode:
+        """Parses markup in chunks and returns root of the reduced document."""
+        parser = cls(scope)
+
+        for i in range(0, len(markup), cls.CHUNK_SIZE):
+            parser.feed(markup[i : i + cls.CHUNK_SIZE])
+
+        return parser.close()
+
+    def feed(self, chunk: str) -> None:
+        """Parses next chunk of the markup."""
+        self._parser.feed(chunk)
+        self._process()
+
+    def close(self) -> LXMLNode:
+        """Finishes parsing and returns root element with matched subtrees."""
+        self._parser.close()
+        self._process()
+        return self._root
+
+    def _matches(self, node: LXMLNode) -> bool:
+        """Checks if element matches name and all attribute values of the scope."""
+        return LXMLElement._match(node, self._name, {}) and all(
+            LXMLElement._match(node, None, {attr: value})
+            for attr, values in self._attrs.items()
+            for value in values
+        )
+
+    def _process(self) -> None:
+        """Processes events of parsed elements."""
+        for event, node in self._parser.read_events():
+            if self._match is not None:
+                if event == "end" and node is self._match:
+                    # tail text belongs to the discarded parent
+                    node.tail = None
+                    self._root.append(node)
+                    self._match = None
+            elif event == "start":
+                if self._matches(node):
+                    self._match = node
+            else:
+                # matched descendants were already moved, element can be discarded
+                node.clear(keep_tail=False)
+                parent = node.getparent()
+
+                while parent is not None and node.getprevious() is not None:
+                    del parent[0]
+
+
+def enable_exslt(element: LXMLElement) -> None:
+    """
+    Enables evaluation of regex attribute and text matching inside `lxml`
+    with EXSLT regular expressions for the document the element belongs to.
+
+    Regex patterns of `find_all` attributes and `PatternSelector` are tested
+    within compiled XPath queries, so elements are filtered without
+    iterating them in python. Patterns compiled with flags other than
+    case-insensitivity, which EXSLT can not express, are matched in python.
+
+    Parameters
+    ----------
+    element : LXMLElement
+        Any element of the document. Document is tracked and the mode
+        applies to all elements derived from tracked elements.
+
+    Example
+    -------
+    >>> from soupsavvy.implementation.lxml import LXMLElement, enable_exslt
+    ... element = LXMLElement(node)
+    ... enable_exslt(element)
+    ... PatternSelector(re.compile(r"\\d+ USD")).find_all(element)
+    """
+    element.track().enable(_EXSLT_OPTION)
@@ -3,12 +3,20 @@ from __future__ import annotations
 import re
 from itertools import islice
 from typing import Iterable, Optional, Pattern, Union
+from uuid import uuid4
 
-from playwright.sync_api import ElementHandle, Page
+from playwright.sync_api import ElementHandle, JSHandle, Page
 from typing_extensions import Self
 
 import soupsavvy.exceptions as exc
 import soupsavvy.implementation.snippets.js.playwright as js
+from soupsavvy.implementation.compact import CompactElement
+from soupsavvy.implementation.record import ElementRecord
+from soupsavvy.implementation.snapshot import (
+    SNAPSHOT_ATTRIBUTE,
+    get_snapshot,
+    parse_snapshot,
+)
 from soupsavvy.implementation.snippets import css, xpath
 from soupsavvy.interfaces import IBrowser, IElement
 from soupsavvy.selectors.css.api import PlaywrightCSSApi
@@ -32,16 +40,95 @@ class PlaywrightElement(IElement[ElementHandle]):
     ...     page.goto("https://example.com")
     ...     element = page.query_selector("h1")
     ...     playwright_element = PlaywrightElement(element)
+
+    With `prefetch` enabled, elements returned by list-returning operations
+    carry records with name, attributes and text fetched in the same call,
+    which serve subsequent reads until `refresh` is called:
+
+    >>> playwright_element = PlaywrightElement(element, prefetch=True)
     """
 
+    __slots__ = ("_id", "_prefetch", "_record")
+
     _NODE_TYPE = ElementHandle
+    # property of the element matching text returned by `text_content`
+    _TEXT_PROPERTY = "textContent"
+    # selectors are executed in the page with a single script call
+    _EXECUTES_PROGRAMS = True
 
-    def __init__(self, node: ElementHandle, *args, **kwargs):
+    def __init__(
+        self,
+        node: ElementHandle,
+        *args,
+        identifier: Optional[str] = None,
+        prefetch: bool = False,
+        record: Optional[ElementRecord] = None,
+        **kwargs,
+    ):
+        """
+        Initializes the implementation with the given handle.
+
+        Parameters
+        ----------
+        node : ElementHandle
+            Handle of the element to wrap.
+        identifier : str, optional
+            Identifier already assigned to the element in the page.
+            If not provided, it is assigned with a call to the page.
+        prefetch : bool, optional
+            If True, records of elements returned by list-returning operations
+            are fetched in the same call and serve reads of their name,
+            attributes and text. By default False.
+        record : ElementRecord, optional
+            Record of the element already fetched from the page.
+        """
         super().__init__(node, *args, **kwargs)
+        self._prefetch = prefetch
+        self._record = record
 
         # playwright does not guarantee the same identity for handles
         # from different queries, it needs to be worked around
-        self._id = self.node.evaluate(js.ADD_IDENTIFIER_SCRIPT)
+        if identifier is None:
+            identifier = self.node.evaluate(js.ADD_IDENTIFIER_SCRIPT)
+
+        self._id = identifier
+
+    def _map(self, elements: Iterable[ElementHandle]) -> list[Self]:
+        """
+        Maps handles to the implementation, assigning identifiers
+        to all elements in a single call to the page.
+        """
+        handles = list(elements)
+
+        if not handles:
+            return []
+
+        if self._prefetch:
+            # records are fetched with identifiers, so there is no extra call
+            pairs = self.node.evaluate(
+                js.ADD_RECORDS_SCRIPT, [handles, self._TEXT_PROPERTY]
+            )
+            mapped = [
+                self.__class__(
+                    handle,
+                    identifier=identifier,
+                    prefetch=True,
+                    record=ElementRecord.from_json(record),
+                )
+                for handle, (identifier, record) in zip(handles, pairs)
+            ]
+        else:
+            identifiers = self.node.evaluate(js.ADD_IDENTIFIERS_SCRIPT, handles)
+            mapped = [
+                self.__class__(handle, identifier=identifier)
+                for handle, identifier in zip(handles, identifiers)
+            ]
+
+        if self._state is not None:
+            for element in mapped:
+                element._state = self._state
+
+        return mapped
 
     def find_all(
         self,
@@ -57,11 +144,7 @@ class PlaywrightElement(IElement[ElementHandle]):
             js.FILTER_NODES_SCRIPT,
             [name, js_attrs, recursive],
         )
-        matched_elements = [
-            e.as_element()
-            for e in found.get_properties().values()
-            if e.as_element() is not None
-        ]
+        matched_elements = _as_elements(found)
 
         def match(element: ElementHandle) -> bool:
             return all(
@@ -70,25 +153,33 @@ class PlaywrightElement(IElement[ElementHandle]):
                 if isinstance(value, Pattern)
             )
 
-        return list(islice(self._map(filter(match, matched_elements)), limit))
+        # elements are matched before mapping, so only results get identifiers
+        return self._map(islice(filter(match, matched_elements), limit))
+
+    def _execute(
+        self,
+        program: list,
+        recursive: bool = True,
+        limit: Optional[int] = None,
+    ) -> Optional[list[Self]]:
+        found = self.node.evaluate_handle(
+            js.EXECUTE_PROGRAM_SCRIPT,
+            [program, recursive, limit, self._TEXT_PROPERTY],
+        )
+        return self._map(_as_elements(found))
 
     def find_subsequent_siblings(self, limit: Optional[int] = None) -> list[Self]:
         iterator = self.node.query_selector_all(
             f"xpath={xpath.FIND_SUBSEQUENT_SIBLINGS_SELECTOR}"
         )
-        return list(islice(self._map(iterator), limit))
+        return self._map(islice(iterator, limit))
 
     def find_ancestors(self, limit: Optional[int] = None) -> list[Self]:
         js_handle = self.node.evaluate_handle(
             js.FIND_ANCESTORS_SCRIPT,
             limit,
         )
-        ancestors = [
-            prop.as_element()
-            for prop in js_handle.get_properties().values()
-            if prop.as_element() is not None
-        ]
-        return list(self._map(ancestors))
+        return self._map(_as_elements(js_handle))
 
     @property
     def children(self) -> Iterable[Self]:
@@ -110,9 +201,20 @@ class PlaywrightElement(IElement[ElementHandle]):
         if element is None:
             return None
 
-        return self.from_node(element)
+        return self._map([element])[0]
+
+    def refresh(self) -> None:
+        """
+        Fetches record of the element again with a single call,
+        so that subsequent reads reflect current state of the element.
+        """
+        record = self.node.evaluate(js.RECORD_SCRIPT, self._TEXT_PROPERTY)
+        self._record = ElementRecord.from_json(record)
 
     def get_attribute(self, name: str) -> Optional[str]:
+        if self._record is not None:
+            return self._record.get_attribute(name)
+
         # get live JS property first, then html attribute
         property_ = self.node.evaluate(js.GET_ATTRIBUTE_SCRIPT, name)
 
@@ -121,8 +223,18 @@ class PlaywrightElement(IElement[ElementHandle]):
 
         return self.node.get_attribute(name)
 
+    @property
+    def attributes(self) -> dict[str, str]:
+        if self._record is not None:
+            return dict(self._record.attributes)
+
+        return self.node.evaluate(js.ATTRIBUTES_SCRIPT)
+
     @property
     def name(self) -> str:
+        if self._record is not None:
+            return self._record.name
+
         return self.node.evaluate(js.TAG_NAME_SCRIPT).lower()
 
     def __str__(self) -> str:
@@ -131,6 +243,9 @@ class PlaywrightElement(IElement[ElementHandle]):
 
     @property
     def text(self) -> str:
+        if self._record is not None:
+            return self._record.text
+
         return self.node.text_content() or ""
 
     def css(self, selector: str):
@@ -149,6 +264,12 @@ class PlaywrightElement(IElement[ElementHandle]):
         return self._id == other._id
 
 
+def _as_elements(handle: JSHandle) -> list[ElementHandle]:
+    """Returns element handles from handle of the array of elements."""
+    elements = (prop.as_element() for prop in handle.get_properties().values())
+    return [element for element in elements if element is not None]
+
+
 class PlaywrightBrowser(IBrowser[Page, PlaywrightElement]):
     """
     Implementation of `IBrowser` for `playwright` Page.
@@ -169,12 +290,13 @@ class PlaywrightBrowser(IBrowser[Page, PlaywrightElement]):
     def navigate(self, url: str) -> None:
         self.browser.goto(url)
 
-    def click(self, element: PlaywrightElement) -> None:
+    def click(self, element: IElement) -> None:
+        element = self.resolve(element)
         self.browser.evaluate(js.CLICK_ELEMENT_SCRIPT, element.node)
 
-    def send_keys(
-        self, element: PlaywrightElement, value: str, clear: bool = True
-    ) -> None:
+    def send_keys(self, element: IElement, value: str, clear: bool = True) -> None:
+        element = self.resolve(element)
+
         if clear:
             element.node.fill("")
 
@@ -188,6 +310,37 @@ class PlaywrightBrowser(IBrowser[Page, PlaywrightElement]):
 
         return PlaywrightElement(element)
 
+    def snapshot(self) -> CompactElement:
+        token = uuid4().hex
+        markup = self.browser.evaluate(js.SNAPSHOT_SCRIPT, [SNAPSHOT_ATTRIBUTE, token])
+        return parse_snapshot(markup, token)
+
+    def resolve(self, element: IElement) -> PlaywrightElement:
+        snapshot = get_snapshot(element)
+
+        if snapshot is None:
+            return element  # type: ignore[return-value]
+
+        identifier = snapshot.identifier(element)  # type: ignore[arg-type]
+
+        if identifier is None:
+            raise exc.StaleSnapshotException(
+                f"Element {element!r} of the snapshot is not present in the page."
+            )
+
+        handle = self.browser.evaluate_handle(
+            js.RESOLVE_SNAPSHOT_SCRIPT, [snapshot.token, identifier]
+        )
+        node = handle.as_element()
+
+        if node is None:
+            raise exc.StaleSnapshotException(
+                f"Element {element!r} can not be found in the page, "
+                "page has changed since the snapshot was taken."
+            )
+
+        return PlaywrightElement(node)
+
     def close(self) -> None:
         self.browser.close()
 
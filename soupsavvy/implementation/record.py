@@ -0,0 +1,55 @@
+"""
+Module with records of browser elements prefetched with the elements.
+
+Reading name, attribute or text of browser element is a separate call
+to the browser, while models usually read several of them from every element.
+Elements created with `prefetch` enabled receive record of every element
+returned by list-returning operations in the same round trip and serve
+subsequent reads locally, so cost per element does not depend on number
+of properties read. Records reflect the element at the time they were fetched,
+`refresh` method of the element fetches its record again.
+
+Classes
+-------
+- `ElementRecord` - Name, attributes and text of browser element.
+"""
+
+from __future__ import annotations
+
+from typing import NamedTuple, Optional
+
+
+class ElementRecord(NamedTuple):
+    """
+    Name, attributes and text of browser element at the time it was fetched.
+    Attributes reflected by string properties of the element, like `href`
+    or `value`, hold values of the properties, as live reads return them.
+    Names, which are not attributes of the element, are read as `None`,
+    even if element has property with such name.
+    """
+
+    name: str
+    attributes: dict[str, str]
+    text: str
+
+    @classmethod
+    def from_json(cls, value: list) -> ElementRecord:
+        """
+        Creates record from array returned by the browser.
+
+        Parameters
+        ----------
+        value : list
+            Array of tag name, attributes and text of the element.
+
+        Returns
+        -------
+        ElementRecord
+            Record of the element.
+        """
+        name, attributes, text = value
+        return cls(name=name, attributes=attributes, text=text)
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        """Returns value of the attribute or `None` if element does not have it."""
+        return self.attributes.get(name)
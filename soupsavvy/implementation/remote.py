@@ -0,0 +1,386 @@
+"""
+Module with execution of whole selectors inside the page for browser implementations.
+
+Composite selectors searched in python call `children`, `parent` or
+`get_attribute` of browser elements, and each of those calls is a round trip
+to the browser. Selectors are serialized here into programs - nested lists
+with name of the operation as the first item - which are interpreted
+by JavaScript runtime in the page and return final, ordered list of elements
+in a single call. Semantics of programs mirror the vectorized engine
+of compact documents: context-free selectors are predicates tested against
+single element, while logical selectors and combinators combine results.
+
+Selectors execute programs in their `find_all` method, if element supports it.
+Only selectors of known types, which are searched with methods of the library,
+are serialized. Selectors, which can not be serialized (like `ExpressionSelector`,
+xpath selectors, regex patterns, that can not be translated into JavaScript,
+or subclasses overriding search methods), are searched in python as a whole.
+
+Asynchronous elements execute programs with a single awaited call as well,
+while other selectors are evaluated in-process on snapshot of the element
+and results are mapped back to live elements with another call.
+
+Functions
+---------
+- `compile_program` - Serializes selector into program executed in the page.
+- `execute` - Executes selector as program with a single call to the page.
+- `afind_all` - Finds all elements matching selector in asynchronous element.
+- `afind` - Finds first element matching selector in asynchronous element.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any, Optional, Pattern, TypeVar
+
+from soupsavvy.base import SoupSelector
+from soupsavvy.interfaces import IAsyncElement, IElement
+from soupsavvy.selectors.attributes import AttributeSelector
+from soupsavvy.selectors.combinators import (
+    AncestorCombinator,
+    BaseAncestorCombinator,
+    BaseCombinator,
+    ChildCombinator,
+    DescendantCombinator,
+    NextSiblingCombinator,
+    ParentCombinator,
+    SubsequentSiblingCombinator,
+)
+from soupsavvy.selectors.css.selectors import CSSSoupSelector
+from soupsavvy.selectors.general import PatternSelector, TypeSelector, UniversalSelector
+from soupsavvy.selectors.logical import (
+    AndSelector,
+    NotSelector,
+    SelectorList,
+    XORSelector,
+)
+from soupsavvy.selectors.nth.selectors import (
+    BaseNthOfSelector,
+    NthLastOfSelector,
+    OnlyOfSelector,
+)
+from soupsavvy.selectors.relative import (
+    HasSelector,
+    RelativeAncestor,
+    RelativeChild,
+    RelativeDescendant,
+    RelativeNextSibling,
+    RelativeParent,
+    RelativeSelector,
+    RelativeSubsequentSibling,
+)
+from soupsavvy.utils.regex import to_js_regex
+
+# package, which modules implement selectors with semantics mirrored by programs
+_PACKAGE = "soupsavvy."
+
+T = TypeVar("T", bound=IElement)
+A = TypeVar("A", bound=IAsyncElement)
+
+# names of relations between anchor and matched element used by the runtime
+_COMBINATORS: dict[type[SoupSelector], str] = {
+    ChildCombinator: "child",
+    DescendantCombinator: "descendant",
+    NextSiblingCombinator: "next",
+    SubsequentSiblingCombinator: "subsequent",
+    ParentCombinator: "parent",
+    AncestorCombinator: "ancestor",
+}
+_RELATIVE: dict[type[SoupSelector], str] = {
+    RelativeChild: "child",
+    RelativeDescendant: "descendant",
+    RelativeNextSibling: "next",
+    RelativeSubsequentSibling: "subsequent",
+    RelativeParent: "parent",
+    RelativeAncestor: "ancestor",
+}
+_LOGICAL: dict[type[SoupSelector], str] = {
+    SelectorList: "or",
+    AndSelector: "and",
+    NotSelector: "not",
+    XORSelector: "xor",
+}
+
+
+class UnsupportedSelector(Exception):
+    """Raised when selector can not be serialized into program."""
+
+
+def compile_program(selector: SoupSelector) -> list:
+    """
+    Serializes selector into program, which is executed by JavaScript runtime
+    in the page and returns elements, that `find_all` method would return.
+
+    Parameters
+    ----------
+    selector : SoupSelector
+        Selector to serialize.
+
+    Returns
+    -------
+    list
+        Program as nested, json-serializable lists.
+
+    Raises
+    ------
+    UnsupportedSelector
+        If selector or any of its parts can not be executed in the page.
+
+    Example
+    -------
+    >>> compile_program(TypeSelector("div") > ClassSelector("item"))
+    ['combinator', 'child', False, ['tag', 'div'], ['attribute', 'class', ...]]
+    """
+    try:
+        # selectors without combinators are tested against each element
+        return _predicate(selector)
+    except UnsupportedSelector:
+        return _select(selector)
+
+
+def _check(selector: SoupSelector) -> None:
+    """
+    Checks if selector is searched with methods of the library, as programs
+    mirror their semantics. Selectors of other classes, like user subclasses
+    overriding search methods, can not be executed in the page.
+    """
+    searcher = type(selector)
+
+    if searcher.find_all is not SoupSelector.find_all or not (
+        searcher._find_all.__module__.startswith(_PACKAGE)
+    ):
+        raise UnsupportedSelector(
+            f"Selector {selector} is not searched with methods of the library."
+        )
+
+
+def _select(selector: SoupSelector) -> list:
+    """Serializes selector, which results depend on the searched element."""
+    _check(selector)
+
+    if isinstance(selector, BaseCombinator):
+        relation = _lookup(_COMBINATORS, selector)
+
+        if relation is None:
+            raise UnsupportedSelector(
+                f"Combinator {selector} can not be executed in the page."
+            )
+
+        first, *steps = selector.selectors
+        ancestor = isinstance(selector, BaseAncestorCombinator)
+        return [
+            "combinator",
+            relation,
+            ancestor,
+            compile_program(first),
+            *map(_predicate, steps),
+        ]
+
+    operation = _lookup(_LOGICAL, selector)
+
+    if operation is not None:
+        steps = selector.selectors  # type: ignore[attr-defined]
+        return ["set", operation, *map(compile_program, steps)]
+
+    return _predicate(selector)
+
+
+def _predicate(selector: SoupSelector) -> list:
+    """Serializes context-free selector tested against single element."""
+    _check(selector)
+
+    if isinstance(selector, TypeSelector):
+        return ["tag", selector.name]
+
+    if isinstance(selector, UniversalSelector):
+        return ["any"]
+
+    if isinstance(selector, AttributeSelector):
+        return ["attribute", selector.name, _value(selector._pattern)]
+
+    if isinstance(selector, PatternSelector):
+        return ["text", _value(selector.pattern)]
+
+    if isinstance(selector, CSSSoupSelector):
+        # scope of css selector is the searched element, not the tested one
+        if ":scope" in selector.css:
+            raise UnsupportedSelector(f"Selector {selector} depends on its scope.")
+
+        return ["css", selector.css]
+
+    operation = _lookup(_LOGICAL, selector)
+
+    if operation is not None:
+        steps = selector.selectors  # type: ignore[attr-defined]
+        return [operation, *map(_predicate, steps)]
+
+    if isinstance(selector, BaseNthOfSelector):
+        nth = selector.nth_selector
+        last = isinstance(selector, NthLastOfSelector)
+        return ["nth", _predicate(selector.selector), last, nth.step, nth.offset]
+
+    if isinstance(selector, OnlyOfSelector):
+        return ["only", _predicate(selector.selector)]
+
+    if isinstance(selector, HasSelector):
+        return ["has", *map(_relative, selector.selectors)]
+
+    raise UnsupportedSelector(f"Selector {selector} can not be executed in the page.")
+
+
+def _relative(selector: SoupSelector) -> list:
+    """Serializes single step of `HasSelector`."""
+    _check(selector)
+
+    if not isinstance(selector, RelativeSelector):
+        return ["descendant", _predicate(selector)]
+
+    relation = _lookup(_RELATIVE, selector)
+
+    if relation is None:
+        raise UnsupportedSelector(
+            f"Relative selector {selector} can not be executed in the page."
+        )
+
+    return [relation, _predicate(selector.selector)]
+
+
+def _lookup(table: Mapping[type[Any], str], selector: SoupSelector) -> Optional[str]:
+    """Returns name of the operation for the first class the selector is instance of."""
+    return next(
+        (name for class_, name in table.items() if isinstance(selector, class_)),
+        None,
+    )
+
+
+def _value(value) -> list:
+    """Serializes exact string or regex pattern matched by the runtime."""
+    if not isinstance(value, Pattern):
+        return ["string", value]
+
+    translated = to_js_regex(value)
+
+    if translated is None:
+        raise UnsupportedSelector(
+            f"Pattern {value.pattern!r} can not be translated into JavaScript."
+        )
+
+    return ["regex", list(translated)]
+
+
+def execute(
+    selector: SoupSelector,
+    element: T,
+    recursive: bool = True,
+    limit: Optional[int] = None,
+) -> Optional[list[T]]:
+    """
+    Executes selector as program within the element with a single call to the page.
+    Used by `find_all` method of selectors for elements, which execute programs.
+
+    Parameters
+    ----------
+    selector : SoupSelector
+        Selector to find elements with.
+    element : IElement
+        Element, which is searched.
+    recursive : bool, optional
+        If False, only direct children of the element are searched.
+        Default is True.
+    limit : int, optional
+        Maximum number of returned elements, by default all are returned.
+
+    Returns
+    -------
+    list[IElement] | None
+        Matching elements in document order or `None` if selector can not
+        be serialized or implementation of the element can not execute programs.
+
+    Example
+    -------
+    >>> from soupsavvy.implementation.remote import execute
+    ... execute(TypeSelector("div") > ClassSelector("item"), element)
+    """
+    try:
+        program = compile_program(selector)
+    except UnsupportedSelector:
+        return None
+
+    return element._execute(program, recursive=recursive, limit=limit)
+
+
+async def afind_all(
+    selector: SoupSelector,
+    element: A,
+    recursive: bool = True,
+    limit: Optional[int] = None,
+) -> list[A]:
+    """
+    Finds all elements matching selector in asynchronous element.
+    Selector is executed as program with a single awaited call to the page.
+    If it can not be serialized, it is searched in snapshot of the element
+    and matching elements are mapped back to live elements.
+
+    Parameters
+    ----------
+    selector : SoupSelector
+        Selector to find elements with.
+    element : IAsyncElement
+        Element, which is searched.
+    recursive : bool, optional
+        If False, only direct children of the element are searched.
+        Default is True.
+    limit : int, optional
+        Maximum number of returned elements, by default all are returned.
+
+    Returns
+    -------
+    list[IAsyncElement]
+        Matching live elements in document order.
+
+    Example
+    -------
+    >>> from soupsavvy.implementation.remote import afind_all
+    ... await afind_all(TypeSelector("div") > ClassSelector("item"), element)
+    """
+    try:
+        program = compile_program(selector)
+    except UnsupportedSelector:
+        program = None
+
+    if program is not None:
+        found = await element._execute(program, recursive=recursive, limit=limit)
+
+        if found is not None:
+            return found
+
+    snapshot = await element.snapshot()
+    matched = selector.find_all(snapshot, recursive=recursive, limit=limit)
+    return await element.resolve(matched)
+
+
+async def afind(
+    selector: SoupSelector,
+    element: A,
+    recursive: bool = True,
+) -> Optional[A]:
+    """
+    Finds first element matching selector in asynchronous element.
+
+    Parameters
+    ----------
+    selector : SoupSelector
+        Selector to find element with.
+    element : IAsyncElement
+        Element, which is searched.
+    recursive : bool, optional
+        If False, only direct children of the element are searched.
+        Default is True.
+
+    Returns
+    -------
+    IAsyncElement | None
+        First matching live element or `None` if nothing matches.
+    """
+    elements = await afind_all(selector, element, recursive=recursive, limit=1)
+    return elements[0] if elements else None
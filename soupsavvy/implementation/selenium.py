@@ -10,6 +10,7 @@ from __future__ import annotations
 
 from itertools import islice
 from typing import Iterable, Optional, Pattern, Union
+from uuid import uuid4
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
@@ -18,10 +19,18 @@ from typing_extensions import Self
 
 import soupsavvy.exceptions as exc
 import soupsavvy.implementation.snippets.js.selenium as js
+from soupsavvy.implementation.compact import CompactElement
+from soupsavvy.implementation.record import ElementRecord
+from soupsavvy.implementation.snapshot import (
+    SNAPSHOT_ATTRIBUTE,
+    get_snapshot,
+    parse_snapshot,
+)
 from soupsavvy.implementation.snippets import css, xpath
 from soupsavvy.interfaces import IBrowser, IElement
 from soupsavvy.selectors.css.api import SeleniumCSSApi
 from soupsavvy.selectors.xpath.api import SeleniumXPathApi
+from soupsavvy.utils.regex import to_js_regex
 
 
 class SeleniumElement(IElement[WebElement]):
@@ -35,9 +44,70 @@ class SeleniumElement(IElement[WebElement]):
     ... from selenium.ISeleniumDriver.common.by import By
     ... node = driver.find_element(By.TAG_NAME, "div")
     ... element = SeleniumElement(node)
+
+    With `prefetch` enabled, records with name, attributes and text
+    of all elements returned by list-returning operations are fetched
+    with a single call, which serve subsequent reads until `refresh` is called:
+
+    >>> element = SeleniumElement(node, prefetch=True)
     """
 
+    __slots__ = ("_prefetch", "_record")
+
     _NODE_TYPE = WebElement
+    # property of the element approximating text returned by `selenium`
+    _TEXT_PROPERTY = "innerText"
+    # selectors are executed in the page with a single script call
+    _EXECUTES_PROGRAMS = True
+
+    def __init__(
+        self,
+        node: WebElement,
+        *args,
+        prefetch: bool = False,
+        record: Optional[ElementRecord] = None,
+        **kwargs,
+    ):
+        """
+        Initializes the implementation with the given web element.
+
+        Parameters
+        ----------
+        node : WebElement
+            Web element to wrap.
+        prefetch : bool, optional
+            If True, records of elements returned by list-returning operations
+            are fetched with a single call and serve reads of their name,
+            attributes and text. By default False.
+        record : ElementRecord, optional
+            Record of the element already fetched from the page.
+        """
+        super().__init__(node, *args, **kwargs)
+        self._prefetch = prefetch
+        self._record = record
+
+    def _map(self, elements: Iterable[WebElement]) -> Iterable[Self]:
+        """
+        Maps web elements to the implementation. If prefetch is enabled,
+        records of all elements are fetched in a single call to the page.
+        """
+        if not self._prefetch:
+            return super()._map(elements)
+
+        nodes = list(elements)
+
+        if not nodes:
+            return []
+
+        driver: WebDriver = self.node.parent
+        records = driver.execute_script(js.RECORDS_SCRIPT, nodes, self._TEXT_PROPERTY)
+        mapped = list(super()._map(nodes))
+
+        for element, record in zip(mapped, records):
+            element._prefetch = True
+            element._record = ElementRecord.from_json(record)
+
+        return mapped
 
     def find_all(
         self,
@@ -48,30 +118,66 @@ class SeleniumElement(IElement[WebElement]):
     ) -> list[Self]:
         attrs = attrs or {}
         js_attrs = {k: None if isinstance(v, Pattern) else v for k, v in attrs.items()}
+        patterns: dict[str, tuple[str, str]] = {}
+        fetched: dict[str, Pattern[str]] = {}
+
+        for attr, value in attrs.items():
+            if not isinstance(value, Pattern):
+                continue
+
+            translated = to_js_regex(value)
+
+            if translated is not None:
+                patterns[attr] = translated
+            else:
+                fetched[attr] = value
 
         driver: WebDriver = self.node.parent
-        matched_elements: list[WebElement] = driver.execute_script(
+        # elements are returned with values of attributes, that need to be
+        # matched in python, so there is a single round trip per search
+        matched: list[tuple[WebElement, list[Optional[str]]]] = driver.execute_script(
             js.FILTER_NODES_SCRIPT,
             self.node,
             name,
             js_attrs,
+            patterns,
+            list(fetched),
             recursive,
+            None if fetched else limit,
         )
 
-        def match(element: WebElement) -> bool:
-            return all(
-                value.search(element.get_attribute(attr) or "")
-                for attr, value in attrs.items()
-                if isinstance(value, Pattern)
+        iterator = (
+            element
+            for element, values in matched
+            if all(
+                value.search(attribute or "")
+                for value, attribute in zip(fetched.values(), values)
             )
+        )
+        return list(self._map(islice(iterator, limit)))
 
-        return list(islice(self._map(filter(match, matched_elements)), limit))
+    def _execute(
+        self,
+        program: list,
+        recursive: bool = True,
+        limit: Optional[int] = None,
+    ) -> Optional[list[Self]]:
+        driver: WebDriver = self.node.parent
+        found = driver.execute_script(
+            js.EXECUTE_PROGRAM_SCRIPT,
+            self.node,
+            program,
+            recursive,
+            limit,
+            self._TEXT_PROPERTY,
+        )
+        return list(self._map(found))
 
     def find_subsequent_siblings(self, limit: Optional[int] = None) -> list[Self]:
         iterator = self.node.find_elements(
             By.XPATH, xpath.FIND_SUBSEQUENT_SIBLINGS_SELECTOR
         )
-        return list(islice(self._map(iterator), limit))
+        return list(self._map(islice(iterator, limit)))
 
     def find_ancestors(self, limit: Optional[int] = None) -> list[Self]:
         driver: WebDriver = self.node.parent
@@ -98,13 +204,36 @@ class SeleniumElement(IElement[WebElement]):
     def parent(self) -> Optional[Self]:
         driver: WebDriver = self.node.parent
         element = driver.execute_script(js.FIND_PARENT_NODE_SCRIPT, self.node)
-        return self.from_node(element) if element is not None else None
+        return next(iter(self._map([element]))) if element is not None else None
+
+    def refresh(self) -> None:
+        """
+        Fetches record of the element again with a single call,
+        so that subsequent reads reflect current state of the element.
+        """
+        driver: WebDriver = self.node.parent
+        record = driver.execute_script(js.RECORD_SCRIPT, self.node, self._TEXT_PROPERTY)
+        self._record = ElementRecord.from_json(record)
 
     def get_attribute(self, name: str) -> Optional[str]:
+        if self._record is not None:
+            return self._record.get_attribute(name)
+
         return self.node.get_attribute(name)
 
+    @property
+    def attributes(self) -> dict[str, str]:
+        if self._record is not None:
+            return dict(self._record.attributes)
+
+        driver: WebDriver = self.node.parent
+        return driver.execute_script(js.ATTRIBUTES_SCRIPT, self.node)
+
     @property
     def name(self) -> str:
+        if self._record is not None:
+            return self._record.name
+
         return self.node.tag_name
 
     def __str__(self) -> str:
@@ -112,6 +241,9 @@ class SeleniumElement(IElement[WebElement]):
 
     @property
     def text(self) -> str:
+        if self._record is not None:
+            return self._record.text
+
         return self.node.text
 
     def css(self, selector: str) -> SeleniumCSSApi:
@@ -137,12 +269,13 @@ class SeleniumBrowser(IBrowser[WebDriver, SeleniumElement]):
     def navigate(self, url: str) -> None:
         self.browser.get(url)
 
-    def click(self, element: SeleniumElement) -> None:
+    def click(self, element: IElement) -> None:
+        element = self.resolve(element)
         self.browser.execute_script(js.CLICK_ELEMENT_SCRIPT, element.node)
 
-    def send_keys(
-        self, element: SeleniumElement, value: str, clear: bool = True
-    ) -> None:
+    def send_keys(self, element: IElement, value: str, clear: bool = True) -> None:
+        element = self.resolve(element)
+
         if clear:
             element.node.clear()
 
@@ -156,6 +289,38 @@ class SeleniumBrowser(IBrowser[WebDriver, SeleniumElement]):
 
         return SeleniumElement(elements[0])
 
+    def snapshot(self) -> CompactElement:
+        token = uuid4().hex
+        markup = self.browser.execute_script(
+            js.SNAPSHOT_SCRIPT, SNAPSHOT_ATTRIBUTE, token
+        )
+        return parse_snapshot(markup, token)
+
+    def resolve(self, element: IElement) -> SeleniumElement:
+        snapshot = get_snapshot(element)
+
+        if snapshot is None:
+            return element  # type: ignore[return-value]
+
+        identifier = snapshot.identifier(element)  # type: ignore[arg-type]
+
+        if identifier is None:
+            raise exc.StaleSnapshotException(
+                f"Element {element!r} of the snapshot is not present in the page."
+            )
+
+        node = self.browser.execute_script(
+            js.RESOLVE_SNAPSHOT_SCRIPT, snapshot.token, identifier
+        )
+
+        if node is None:
+            raise exc.StaleSnapshotException(
+                f"Element {element!r} can not be found in the page, "
+                "page has changed since the snapshot was taken."
+            )
+
+        return SeleniumElement(node)
+
     def close(self) -> None:
         self.browser.quit()
 
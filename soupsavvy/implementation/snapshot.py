@@ -0,0 +1,164 @@
+"""
+Module with snapshots of browser pages for read-only extraction.
+
+Searching live page calls the browser for every step of the selector,
+while extraction usually only reads the rendered page. Snapshot fetches
+markup of the whole page in a single call and parses it into compact document,
+which is searched in-process with any selectors and models.
+
+Each element of the markup carries its index in the live page, which is
+stripped while parsing and kept by position of the element in the document.
+Elements of the snapshot are mapped back to live elements by the browser,
+when they are passed to browser actions, like `click` or `send_keys`.
+
+Classes
+-------
+- `Snapshot` - Mapping of elements of snapshot document to the live page.
+- `SnapshotParser` - Parser of snapshot markup into compact document.
+
+Functions
+---------
+- `parse_snapshot` - Parses snapshot markup and returns its html element.
+- `get_snapshot` - Returns snapshot, the element belongs to.
+"""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from typing import Optional, Union
+
+from soupsavvy.implementation.compact.document import NONE
+from soupsavvy.implementation.compact.element import CompactElement
+from soupsavvy.implementation.compact.parser import CompactHTMLParser
+from soupsavvy.interfaces import IAsyncElement, IElement
+
+# attribute carrying index of the element in the live page
+SNAPSHOT_ATTRIBUTE = "data-soupsavvy-snapshot"
+# key under which snapshot is cached in the document
+_SNAPSHOT_KEY = "snapshot"
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """
+    Mapping of elements of snapshot document to elements of the live page.
+
+    Parameters
+    ----------
+    token : str
+        Unique token of the snapshot, the same token identifies elements
+        kept in the page, so stale snapshots are not mapped to wrong elements.
+    identifiers : array
+        Index of element in the live page for each position of the document,
+        `-1` for elements, which are not present in the page,
+        like root of the document.
+    root : IAsyncElement, optional
+        Live element, the snapshot was taken of, for snapshots of elements,
+        which are mapped back within this element. `None` for snapshots
+        of the whole page, which are mapped back by the browser.
+    """
+
+    token: str
+    identifiers: array
+    root: Optional[IAsyncElement] = None
+
+    @property
+    def is_page(self) -> bool:
+        """Returns True if snapshot was taken of the whole page."""
+        return self.root is None
+
+    def identifier(self, element: CompactElement) -> Optional[int]:
+        """
+        Returns index of the element in the live page.
+
+        Parameters
+        ----------
+        element : CompactElement
+            Element of the snapshot document.
+
+        Returns
+        -------
+        int | None
+            Index of the element or `None` if element is not present in the page.
+        """
+        identifier = self.identifiers[element.position]
+        return None if identifier == NONE else identifier
+
+
+class SnapshotParser(CompactHTMLParser):
+    """
+    Parser of snapshot markup into compact document.
+    Strips attribute carrying index of element in the live page
+    and collects indexes by position of elements in the document.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        # root of the document is not an element of the page
+        self.identifiers = array("i", [NONE])
+
+    def handle_starttag(self, tag, attrs) -> None:
+        identifier = NONE
+        attributes = []
+
+        for key, value in attrs:
+            if key == SNAPSHOT_ATTRIBUTE and value is not None:
+                identifier = int(value)
+            else:
+                attributes.append((key, value))
+
+        self.identifiers.append(identifier)
+        super().handle_starttag(tag, attributes)
+
+
+def parse_snapshot(
+    markup: str,
+    token: str,
+    root: Optional[IAsyncElement] = None,
+) -> CompactElement:
+    """
+    Parses snapshot markup into compact document and returns its html element.
+
+    Parameters
+    ----------
+    markup : str
+        Markup of the page, which elements carry their indexes in the page.
+    token : str
+        Token identifying the snapshot in the page.
+    root : IAsyncElement, optional
+        Live element, the snapshot was taken of, if it is not a page snapshot.
+
+    Returns
+    -------
+    CompactElement
+        Html element of the snapshot document.
+    """
+    parser = SnapshotParser()
+    parser.feed(markup)
+    document = parser.close()
+    snapshot = Snapshot(token=token, identifiers=parser.identifiers, root=root)
+    document.cached(_SNAPSHOT_KEY, lambda: snapshot)
+
+    element = CompactElement.from_document(document)
+    return next(iter(element.children), element)
+
+
+def get_snapshot(element: Union[IElement, IAsyncElement]) -> Optional[Snapshot]:
+    """
+    Returns snapshot, the element belongs to.
+
+    Parameters
+    ----------
+    element : IElement | IAsyncElement
+        Any element.
+
+    Returns
+    -------
+    Snapshot | None
+        Snapshot of the element or `None` if element is not part of a snapshot.
+    """
+    if not isinstance(element, CompactElement):
+        return None
+
+    return element.document.cached(_SNAPSHOT_KEY, lambda: None)
@@ -1,5 +1,14 @@
 """JavaScript snippets for playwright implementation."""
 
+from soupsavvy.implementation.snippets.js.record import RECORD
+from soupsavvy.implementation.snippets.js.runtime import RUNTIME
+from soupsavvy.implementation.snippets.js.snapshot import (
+    RESOLVE,
+    RESOLVE_ELEMENTS,
+    SNAPSHOT,
+    SNAPSHOT_ELEMENT,
+)
+
 FIND_ANCESTORS_SCRIPT = """
 (element, limit) => {
   function findAncestors(el, lim) {
@@ -61,8 +70,78 @@ el => {
 }
 """
 
+ADD_IDENTIFIERS_SCRIPT = """
+(_, elements) => elements.map(el => {
+    if (!el._uid) {
+        el._uid = Math.random().toString(36).substr(2, 9);
+    }
+    return el._uid;
+})
+"""
+
+ADD_RECORDS_SCRIPT = f"""
+(_, [elements, textProperty]) => {{
+{RECORD}
+  return elements.map(el => {{
+    if (!el._uid) {{
+      el._uid = Math.random().toString(36).substr(2, 9);
+    }}
+    return [el._uid, elementRecord(el, textProperty)];
+  }});
+}}
+"""
+
+RECORD_SCRIPT = f"""
+(el, textProperty) => {{
+{RECORD}
+  return elementRecord(el, textProperty);
+}}
+"""
+
+ATTRIBUTES_SCRIPT = f"""
+el => {{
+{RECORD}
+  return elementAttributes(el);
+}}
+"""
+
 PARENT_ELEMENT_SCRIPT = "el => el.parentElement"
 TAG_NAME_SCRIPT = "el => el.tagName"
 OUTER_HTML_SCRIPT = "el => el.outerHTML"
 CLICK_ELEMENT_SCRIPT = "el => el.click()"
 GET_ATTRIBUTE_SCRIPT = "(el, name) => el[name]"
+
+EXECUTE_PROGRAM_SCRIPT = f"""
+(root, args) => {{
+{RUNTIME}
+  return runSelectorProgram(root, ...args);
+}}
+"""
+
+SNAPSHOT_SCRIPT = f"""
+([attribute, token]) => {{
+{SNAPSHOT}
+  return takeSnapshot(attribute, token);
+}}
+"""
+
+RESOLVE_SNAPSHOT_SCRIPT = f"""
+([token, index]) => {{
+{RESOLVE}
+  return resolveSnapshot(token, index);
+}}
+"""
+
+SNAPSHOT_ELEMENT_SCRIPT = f"""
+(root, attribute) => {{
+{SNAPSHOT_ELEMENT}
+  return takeElementSnapshot(root, attribute);
+}}
+"""
+
+RESOLVE_ELEMENTS_SCRIPT = f"""
+(root, targets) => {{
+{RESOLVE_ELEMENTS}
+  return resolveElements(root, targets);
+}}
+"""
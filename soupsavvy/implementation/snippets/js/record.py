@@ -0,0 +1,28 @@
+"""
+JavaScript functions building records of browser elements.
+
+Record is an array of tag name, attributes and text of the element,
+which is returned together with elements, so that their properties
+can be read without further calls to the browser.
+"""
+
+RECORD = """
+function elementAttributes(element) {
+  const attributes = {};
+
+  for (const { name, value } of element.attributes) {
+    // string properties reflect current state, as live reads of attributes do
+    const property = element[name];
+    attributes[name] = typeof property === "string" ? property : value;
+  }
+  return attributes;
+}
+
+function elementRecord(element, textProperty) {
+  return [
+    element.tagName.toLowerCase(),
+    elementAttributes(element),
+    element[textProperty] || "",
+  ];
+}
+"""
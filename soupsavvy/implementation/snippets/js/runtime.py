@@ -0,0 +1,260 @@
+"""
+JavaScript runtime executing serialized selector programs in the page.
+
+Programs are nested arrays produced by `soupsavvy.implementation.remote`
+module, with operation name as the first item. Runtime is shared
+by browser implementations, which wrap it into their own calling convention.
+"""
+
+RUNTIME = """
+function runSelectorProgram(root, program, recursive, limit, textProperty) {
+  function scope(element, recursive) {
+    return Array.from(recursive ? element.querySelectorAll("*") : element.children);
+  }
+
+  function isRoot(element) {
+    // root is never matched by ancestor selectors, as they search within it
+    return element.parentElement === null;
+  }
+
+  function regex(node) {
+    if (!node.compiled) {
+      node.compiled = new RegExp(node[1][0], node[1][1]);
+    }
+    return node.compiled;
+  }
+
+  function matchesValue(value, expected) {
+    if (expected[0] === "string") {
+      return value === expected[1];
+    }
+    return regex(expected).test(value);
+  }
+
+  function siblings(node, element) {
+    // matching siblings are computed once per parent for each nth node
+    if (!node.cache) {
+      node.cache = new Map();
+    }
+    const parent = element.parentNode;
+    let matching = node.cache.get(parent);
+
+    if (!matching) {
+      matching = new Map();
+
+      for (const sibling of parent.children) {
+        if (test(node[1], sibling)) {
+          matching.set(sibling, matching.size + 1);
+        }
+      }
+      node.cache.set(parent, matching);
+    }
+    return matching;
+  }
+
+  function nth(step, offset, index) {
+    const difference = index - offset;
+
+    if (step === 0) {
+      return difference === 0;
+    }
+    return difference % step === 0 && difference / step >= 0;
+  }
+
+  function related(relation, element, node) {
+    switch (relation) {
+      case "child":
+        for (const child of element.children) {
+          if (test(node, child)) return true;
+        }
+        return false;
+      case "descendant":
+        for (const descendant of element.querySelectorAll("*")) {
+          if (test(node, descendant)) return true;
+        }
+        return false;
+      case "next": {
+        const sibling = element.nextElementSibling;
+        return sibling !== null && test(node, sibling);
+      }
+      case "subsequent":
+        for (let sibling = element.nextElementSibling; sibling; sibling = sibling.nextElementSibling) {
+          if (test(node, sibling)) return true;
+        }
+        return false;
+      case "parent": {
+        const parent = element.parentElement;
+        return parent !== null && !isRoot(parent) && test(node, parent);
+      }
+      case "ancestor":
+        for (let parent = element.parentElement; parent && !isRoot(parent); parent = parent.parentElement) {
+          if (test(node, parent)) return true;
+        }
+        return false;
+    }
+    throw new Error("Unknown relation: " + relation);
+  }
+
+  function test(node, element) {
+    switch (node[0]) {
+      case "any":
+        return true;
+      case "tag":
+        return element.tagName.toLowerCase() === node[1].toLowerCase();
+      case "attribute": {
+        const value = element.getAttribute(node[1]);
+
+        if (value === null) {
+          return false;
+        }
+        if (node[2][0] === "string") {
+          return value.split(" ").includes(node[2][1]);
+        }
+        return regex(node[2]).test(value);
+      }
+      case "text":
+        // only leaf elements are matched by text
+        return (
+          element.firstElementChild === null &&
+          matchesValue(element[textProperty] || "", node[1])
+        );
+      case "css":
+        return element.matches(node[1]);
+      case "or":
+        return node.slice(1).some((child) => test(child, element));
+      case "and":
+        return node.slice(1).every((child) => test(child, element));
+      case "not":
+        return !node.slice(1).some((child) => test(child, element));
+      case "xor":
+        return node.slice(1).filter((child) => test(child, element)).length === 1;
+      case "nth": {
+        if (!test(node[1], element)) {
+          return false;
+        }
+        const matching = siblings(node, element);
+        const index = node[2] ? matching.size - matching.get(element) + 1 : matching.get(element);
+        return nth(node[3], node[4], index);
+      }
+      case "only":
+        return test(node[1], element) && siblings(node, element).size === 1;
+      case "has":
+        return node.slice(1).some(([relation, child]) => related(relation, element, child));
+    }
+    throw new Error("Unknown operation: " + node[0]);
+  }
+
+  function documentOrder(elements) {
+    return elements.sort((a, b) =>
+      a === b ? 0 : a.compareDocumentPosition(b) & Node.DOCUMENT_POSITION_FOLLOWING ? -1 : 1
+    );
+  }
+
+  function step(relation, anchors, node) {
+    const found = new Set();
+
+    function add(element) {
+      if (test(node, element)) found.add(element);
+    }
+
+    if (relation === "descendant") {
+      // descendants of nested anchors are already visited by the outer one
+      let last = null;
+
+      for (const anchor of documentOrder(Array.from(anchors))) {
+        if (last !== null && last.contains(anchor)) continue;
+        anchor.querySelectorAll("*").forEach(add);
+        last = anchor;
+      }
+      return found;
+    }
+
+    const visited = new Set();
+
+    for (const anchor of anchors) {
+      switch (relation) {
+        case "child":
+          Array.from(anchor.children).forEach(add);
+          break;
+        case "next":
+          if (anchor.nextElementSibling) add(anchor.nextElementSibling);
+          break;
+        case "subsequent":
+          // siblings after next anchor are visited from that anchor
+          for (let sibling = anchor.nextElementSibling; sibling; sibling = sibling.nextElementSibling) {
+            add(sibling);
+            if (anchors.has(sibling)) break;
+          }
+          break;
+        case "parent": {
+          const parent = anchor.parentElement;
+          if (parent && !isRoot(parent)) add(parent);
+          break;
+        }
+        case "ancestor":
+          for (let parent = anchor.parentElement; parent && !isRoot(parent) && !visited.has(parent); parent = parent.parentElement) {
+            visited.add(parent);
+            add(parent);
+          }
+          break;
+        default:
+          throw new Error("Unknown relation: " + relation);
+      }
+    }
+    return found;
+  }
+
+  function select(node, element, recursive, limit) {
+    if (node[0] === "combinator") {
+      const [, relation, ancestor, first, ...steps] = node;
+      // first step of ancestor combinators is always searched recursively
+      let found = new Set(select(first, element, recursive || ancestor));
+
+      for (const child of steps) {
+        if (found.size === 0) break;
+        found = step(relation, found, child);
+      }
+      // results of ancestor combinators respect recursive parameter
+      return limited(scope(element, recursive || !ancestor), (x) => found.has(x), limit);
+    }
+
+    if (node[0] === "set") {
+      const [, operation, ...children] = node;
+      const counts = new Map();
+
+      for (const child of children) {
+        for (const found of select(child, element, recursive)) {
+          counts.set(found, (counts.get(found) || 0) + 1);
+        }
+      }
+
+      const conditions = {
+        or: (count) => count > 0,
+        and: (count) => count === children.length,
+        not: (count) => count === 0,
+        xor: (count) => count === 1,
+      };
+      const condition = conditions[operation];
+      // results of intersection are not limited to children of the element
+      const elements = scope(element, recursive || operation === "and");
+      return limited(elements, (x) => condition(counts.get(x) || 0), limit);
+    }
+
+    return limited(scope(element, recursive), (x) => test(node, x), limit);
+  }
+
+  function limited(elements, predicate, limit) {
+    const results = [];
+
+    for (const element of elements) {
+      if (predicate(element)) {
+        results.push(element);
+        if (limit && results.length >= limit) break;
+      }
+    }
+    return results;
+  }
+
+  return select(program, root, recursive, limit);
+}
+"""
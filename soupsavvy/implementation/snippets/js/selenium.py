@@ -1,8 +1,16 @@
 """JavaScript snippets for selenium implementation."""
 
+from soupsavvy.implementation.snippets.js.record import RECORD
+from soupsavvy.implementation.snippets.js.runtime import RUNTIME
+from soupsavvy.implementation.snippets.js.snapshot import RESOLVE, SNAPSHOT
+
 FILTER_NODES_SCRIPT = """
-function findMatchingElements(root, tagName, attrs, recursive) {
-  function matchesAttributes(element, attrs) {
+function findMatchingElements(root, tagName, attrs, patterns, fetched, recursive, limit) {
+  const regexes = Object.entries(patterns).map(
+    ([key, [source, flags]]) => [key, new RegExp(source, flags)]
+  );
+
+  function matchesAttributes(element) {
     for (let [key, val] of Object.entries(attrs)) {
       let attrVal = element.getAttribute(key);
 
@@ -14,31 +22,44 @@ function findMatchingElements(root, tagName, attrs, recursive) {
         return false;
       }
     }
+
+    for (let [key, regex] of regexes) {
+      let attrVal = element.getAttribute(key);
+
+      if (attrVal === null || !regex.test(attrVal)) {
+        return false;
+      }
+    }
     return true;
   }
 
-  function collectElements(element, recursive) {
-    let matches = [];
-    let elements = recursive ? element.querySelectorAll("*") : element.children;
+  let matches = [];
+  let elements = recursive ? root.querySelectorAll("*") : root.children;
+
+  for (let el of elements) {
+    if (
+      (!tagName || el.tagName.toLowerCase() === tagName.toLowerCase()) &&
+      matchesAttributes(el)
+    ) {
+      // values of attributes matched in python are returned with the element
+      matches.push([el, fetched.map((key) => el.getAttribute(key))]);
 
-    for (let el of elements) {
-      if (
-        (!tagName || el.tagName.toLowerCase() === tagName.toLowerCase()) &&
-        matchesAttributes(el, attrs)
-      ) {
-        matches.push(el);
+      if (limit && matches.length >= limit) {
+        break;
       }
     }
-    return matches;
   }
-  return collectElements(root, recursive);
+  return matches;
 }
 
 return findMatchingElements(
   arguments[0],
   arguments[1],
   arguments[2],
-  arguments[3]
+  arguments[3],
+  arguments[4],
+  arguments[5],
+  arguments[6]
 );
 """
 
@@ -58,3 +79,31 @@ return findAncestors(arguments[0], arguments[1]);
 
 FIND_PARENT_NODE_SCRIPT = "return arguments[0].parentNode;"
 CLICK_ELEMENT_SCRIPT = "arguments[0].click();"
+
+EXECUTE_PROGRAM_SCRIPT = (
+    RUNTIME
+    + """
+return runSelectorProgram(
+  arguments[0],
+  arguments[1],
+  arguments[2],
+  arguments[3],
+  arguments[4]
+);
+"""
+)
+
+SNAPSHOT_SCRIPT = SNAPSHOT + "\nreturn takeSnapshot(arguments[0], arguments[1]);"
+RESOLVE_SNAPSHOT_SCRIPT = (
+    RESOLVE + "\nreturn resolveSnapshot(arguments[0], arguments[1]);"
+)
+
+RECORDS_SCRIPT = (
+    RECORD
+    + """
+const textProperty = arguments[1];
+return arguments[0].map((element) => elementRecord(element, textProperty));
+"""
+)
+RECORD_SCRIPT = RECORD + "\nreturn elementRecord(arguments[0], arguments[1]);"
+ATTRIBUTES_SCRIPT = RECORD + "\nreturn elementAttributes(arguments[0]);"
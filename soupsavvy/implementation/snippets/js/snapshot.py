@@ -0,0 +1,60 @@
+"""
+JavaScript functions taking snapshots of the page for browser implementations.
+
+Snapshot is a markup of the whole document, in which each element carries
+its index in document order. Live elements are kept in the page under
+the same indexes, so elements of the snapshot can be mapped back to them.
+Only the most recent snapshot of the page can be mapped back.
+
+Snapshots of single elements keep nothing in the page, their elements
+are looked up by index within the element, when they are mapped back.
+"""
+
+SNAPSHOT = """
+function takeSnapshot(attribute, token) {
+  const root = document.documentElement;
+  // indexes are set on a copy, so the page itself is not modified
+  const copy = root.cloneNode(true);
+  const elements = [root, ...root.querySelectorAll("*")];
+  const copies = [copy, ...copy.querySelectorAll("*")];
+
+  copies.forEach((element, index) => element.setAttribute(attribute, index));
+  window.__soupsavvySnapshot = { token: token, elements: elements };
+  return copy.outerHTML;
+}
+"""
+
+RESOLVE = """
+function resolveSnapshot(token, index) {
+  const snapshot = window.__soupsavvySnapshot;
+
+  if (!snapshot || snapshot.token !== token) {
+    return null;
+  }
+
+  const element = snapshot.elements[index];
+  return element && element.isConnected ? element : null;
+}
+"""
+
+SNAPSHOT_ELEMENT = """
+function takeElementSnapshot(root, attribute) {
+  const copy = root.cloneNode(true);
+  const copies = [copy, ...copy.querySelectorAll("*")];
+
+  copies.forEach((element, index) => element.setAttribute(attribute, index));
+  return copy.outerHTML;
+}
+"""
+
+RESOLVE_ELEMENTS = """
+function resolveElements(root, targets) {
+  const elements = [root, ...root.querySelectorAll("*")];
+
+  // element at the index is verified by its name, as element could have changed
+  return targets.map(([index, name]) => {
+    const element = elements[index];
+    return element && element.tagName.toLowerCase() === name ? element : null;
+  });
+}
+"""
@@ -0,0 +1,149 @@
+"""
+Module with components for tracking mutations of documents.
+
+Any cache or index built over a document goes stale once the tree is mutated.
+`DocumentState` keeps a version counter of a single document, which is bumped
+by `soupsavvy`-aware mutation methods of `IElement` (`decompose`, `extract`,
+`insert`). Values cached in the state are tagged with the version they were
+computed for and are recomputed lazily once the document changes.
+Options enabled for the document are kept in the state regardless of version.
+
+Classes
+-------
+- `DocumentState` - Version counter and versioned cache of a single document.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class DocumentState:
+    """
+    State of a single tracked document, shared by all elements of the tree.
+    Holds version counter of the document and cache of values computed for it.
+
+    Version is incremented each time the document is mutated with `soupsavvy`-aware
+    mutation methods of `IElement`. Cached values are bound to the version they
+    were computed for, so they are invalidated precisely, only when the document
+    they were computed from has changed.
+
+    Options enabled for the document, like indexing or EXSLT matching,
+    are not versioned and stay enabled after the document was mutated.
+
+    Example
+    -------
+    >>> from soupsavvy.implementation.bs4 import SoupElement
+    ... element = SoupElement(soup)
+    ... state = element.track()
+    ... state.version
+    0
+    >>> element.find_all("script")[0].decompose()
+    ... state.version
+    1
+
+    Notes
+    -----
+    Mutations performed directly on the underlying nodes (bypassing `IElement`
+    mutation methods) are not tracked. In such case `bump` must be called manually
+    to invalidate cached values.
+    """
+
+    def __init__(self, root: Any) -> None:
+        """
+        Initializes state of the document with given root node.
+
+        Parameters
+        ----------
+        root : Any
+            Root node of the tracked document.
+        """
+        self.root = root
+        self._version = 0
+        self._cache: dict[Hashable, tuple[int, Any]] = {}
+        self._options: set[str] = set()
+
+    @property
+    def version(self) -> int:
+        """Returns current version of the document."""
+        return self._version
+
+    def bump(self) -> int:
+        """
+        Increments version of the document, which invalidates all cached values.
+
+        Returns
+        -------
+        int
+            New version of the document.
+        """
+        self._version += 1
+        return self._version
+
+    def cached(self, key: Hashable, factory: Callable[[], T]) -> T:
+        """
+        Returns value cached under the key for current version of the document.
+        If value is missing or was computed for previous version,
+        it is computed again with provided factory and stored.
+
+        Parameters
+        ----------
+        key : Hashable
+            Key under which value is cached.
+        factory : Callable[[], T]
+            Function computing the value, called only if cached value is not valid.
+
+        Returns
+        -------
+        T
+            Value valid for current version of the document.
+        """
+        entry = self._cache.get(key)
+
+        if entry is not None and entry[0] == self._version:
+            return entry[1]
+
+        value = factory()
+        self._cache[key] = (self._version, value)
+        return value
+
+    def enable(self, option: str) -> None:
+        """
+        Enables option for the document, which is kept after mutations.
+
+        Parameters
+        ----------
+        option : str
+            Name of the option to enable.
+        """
+        self._options.add(option)
+
+    def is_enabled(self, option: str) -> bool:
+        """
+        Checks if option was enabled for the document.
+
+        Parameters
+        ----------
+        option : str
+            Name of the option to check.
+
+        Returns
+        -------
+        bool
+            True if option was enabled with `enable`, False otherwise.
+        """
+        return option in self._options
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Checks if any value, valid or stale, was cached under the key."""
+        return key in self._cache
+
+    def clear(self) -> None:
+        """Removes all cached values of the document."""
+        self._cache.clear()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(version={self._version})"
@@ -0,0 +1,17 @@
+"""
+Subpackage with opt-in indexes of documents, that speed up repeated searches.
+
+Classes
+-------
+- `DocumentIndex` - Inverted index of tag names and attributes of a document,
+optionally with trigrams of attribute values and text of leaf elements.
+
+Functions
+---------
+- `index_document` - Enables index for the document of the element.
+- `get_index` - Returns index of the document of the element if enabled.
+"""
+
+from .index import DocumentIndex, get_index, index_document
+
+__all__ = ["DocumentIndex", "index_document", "get_index"]
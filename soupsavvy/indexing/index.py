@@ -0,0 +1,836 @@
+"""
+Module with inverted index of a document.
+
+`DocumentIndex` is built in a single pass over the tree and maps tag names,
+class tokens, ids and attribute names to sorted preorder positions of elements.
+Together with subtree extents, it turns search within any element of the document
+into binary-search range queries instead of linear scan of its descendants.
+Positions and extents form interval numbering of the tree, which answers
+ancestor-descendant checks in constant time and is used by selectors
+to restrict and order results without walking subtrees.
+
+Index is opt-in, it needs to be enabled for the document with `index_document`.
+It is bound to the version of the tracked document and rebuilt lazily
+after the document was mutated. Optionally, index stores trigrams
+of attribute values, which answer substring and regex queries
+with required literals by candidate lookup instead of scanning all elements
+with the attribute. Full-text index of leaf elements maps their exact text
+and word tokens to positions and answers queries of `PatternSelector`.
+
+Each element carries a bloom summary of tag names and class tokens present
+in its subtree, which lets relative searches skip subtrees, that definitely
+do not contain anything the selector requires.
+
+Classes
+-------
+- `DocumentIndex` - Inverted index of tag names and attributes of a document.
+
+Functions
+---------
+- `index_document` - Enables index for the document of the element.
+- `get_index` - Returns index of the document of the element if enabled.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Callable, Iterable
+from itertools import islice
+from typing import Any, Optional, Pattern, Union
+
+from soupsavvy.indexing.ngrams import ngrams, required_literals
+from soupsavvy.indexing.tokens import required_tokens, tokenize
+from soupsavvy.interfaces import IElement
+
+# key under which index is cached in document state,
+# also name of the option enabling index for the document
+_INDEX_KEY = "index"
+# option of the document storing n-grams of attribute values in its index
+_NGRAMS_OPTION = "ngrams"
+# option of the document storing text of leaf elements in its index
+_TEXT_OPTION = "text"
+
+# attributes with whitespace separated tokens indexed separately
+CLASS_ATTRIBUTE = "class"
+ID_ATTRIBUTE = "id"
+
+# number of bits of subtree summaries and bits set for each key
+SUMMARY_BITS = 128
+SUMMARY_HASHES = 2
+
+AttrsType = dict[str, Union[str, Pattern[str]]]
+MatchFunction = Callable[[Any, Optional[str], AttrsType], bool]
+
+
+class DocumentIndex:
+    """
+    Inverted index of a single document, built in one preorder pass.
+
+    Each element of the document is assigned its preorder position and extent
+    of its subtree (position of its last descendant). Postings of tag names,
+    class tokens, id tokens and attribute names are sorted lists of positions,
+    so searching within the subtree of any element is a range query.
+
+    Example
+    -------
+    >>> from soupsavvy.indexing import index_document
+    ... index = index_document(element)
+    ... index.find_all(element, name="div")
+
+    Index is used transparently by `find_all` of `SoupElement` and `LXMLElement`,
+    if it was enabled for the document, so all selectors delegating
+    to `IElement.find_all` benefit from it.
+    """
+
+    def __init__(
+        self, root: IElement, ngrams: bool = False, text: bool = False
+    ) -> None:
+        """
+        Builds index of the document with provided root element.
+
+        Parameters
+        ----------
+        root : IElement
+            Root element of the document to index.
+        ngrams : bool, optional
+            If True, trigrams of attribute values are indexed as well,
+            see `enable_ngrams`. By default False.
+        text : bool, optional
+            If True, text of leaf elements is indexed as well,
+            see `enable_text`. By default False.
+        """
+        self._elements: list[IElement] = []
+        self._parents: list[int] = []
+        self._ends: list[int] = []
+        self._summaries: list[int] = []
+        self._positions: dict[int, int] = {}
+
+        self._tags: dict[Any, list[int]] = {}
+        self._classes: dict[str, list[int]] = {}
+        self._ids: dict[str, list[int]] = {}
+        self._attributes: dict[str, list[int]] = {}
+        self._ngrams: Optional[dict[tuple[str, str], list[int]]] = None
+        self._leaves: list[int] = []
+        self._texts: Optional[dict[str, list[int]]] = None
+        self._tokens: dict[str, list[int]] = {}
+
+        self._build(root)
+
+        if ngrams:
+            self.enable_ngrams()
+
+        if text:
+            self.enable_text()
+
+    def _build(self, root: IElement) -> None:
+        """Indexes all elements of the tree in preorder with iterative traversal."""
+        stack: list[tuple[IElement, int]] = [(root, -1)]
+
+        while stack:
+            element, parent = stack.pop()
+            position = len(self._elements)
+
+            self._elements.append(element)
+            self._parents.append(parent)
+            self._ends.append(position)
+            self._summaries.append(self._summarize(element))
+            self._positions[id(element.node)] = position
+            self._index_element(element, position)
+
+            children = list(element.children)
+
+            if not children:
+                self._leaves.append(position)
+
+            stack.extend((child, position) for child in reversed(children))
+
+        # subtree of each element is contiguous in preorder,
+        # its extent is the greatest position among its descendants
+        for position in range(len(self._elements) - 1, 0, -1):
+            parent = self._parents[position]
+            self._ends[parent] = max(self._ends[parent], self._ends[position])
+            self._summaries[parent] |= self._summaries[position]
+
+    def _index_element(self, element: IElement, position: int) -> None:
+        """Adds element at given position to postings of the index."""
+        self._tags.setdefault(element.name, []).append(position)
+
+        for attr, value in element.attributes.items():
+            self._attributes.setdefault(attr, []).append(position)
+
+            if attr == CLASS_ATTRIBUTE:
+                postings = self._classes
+            elif attr == ID_ATTRIBUTE:
+                postings = self._ids
+            else:
+                continue
+
+            for token in set(value.split()):
+                postings.setdefault(token, []).append(position)
+
+    def _summarize(self, element: IElement) -> int:
+        """Returns bloom summary of tag name and class tokens of the element."""
+        keys = [("tag", element.name)]
+        value = element.attributes.get(CLASS_ATTRIBUTE)
+
+        if value is not None:
+            keys.extend(("class", token) for token in value.split())
+
+        return _bloom(keys)
+
+    def __len__(self) -> int:
+        """Returns number of indexed elements."""
+        return len(self._elements)
+
+    @property
+    def ngrams(self) -> bool:
+        """Returns True if index stores n-grams of attribute values."""
+        return self._ngrams is not None
+
+    def enable_ngrams(self) -> None:
+        """
+        Indexes trigrams of values of all attributes of indexed elements.
+        Queries for attribute values containing literals of at least three
+        characters (string values or regex patterns with required literals)
+        are answered by lookup of elements with all their trigrams.
+        """
+        if self._ngrams is not None:
+            return
+
+        postings: dict[tuple[str, str], list[int]] = {}
+
+        for position, element in enumerate(self._elements):
+            for attr, value in element.attributes.items():
+                for gram in ngrams(value):
+                    postings.setdefault((attr, gram), []).append(position)
+
+        self._ngrams = postings
+
+    @property
+    def text(self) -> bool:
+        """Returns True if index stores text of leaf elements."""
+        return self._texts is not None
+
+    def enable_text(self) -> None:
+        """
+        Indexes exact text and word tokens of all leaf elements.
+        Queries for exact text are answered by direct lookup, regex queries
+        by lookup of elements with all tokens required by the pattern.
+        """
+        if self._texts is not None:
+            return
+
+        texts: dict[str, list[int]] = {}
+
+        for position in self._leaves:
+            text = self._elements[position].text
+            texts.setdefault(text, []).append(position)
+
+            for token in tokenize(text):
+                self._tokens.setdefault(token, []).append(position)
+
+        self._texts = texts
+
+    def position(self, element: IElement) -> Optional[int]:
+        """
+        Returns preorder position of the element in the document.
+
+        Parameters
+        ----------
+        element : IElement
+            Element to find position of.
+
+        Returns
+        -------
+        int | None
+            Preorder position of the element or `None` if element
+            is not a part of indexed document.
+        """
+        return self._positions.get(id(element.node))
+
+    def extent(self, element: IElement) -> Optional[tuple[int, int]]:
+        """
+        Returns interval of preorder positions covered by subtree of the element.
+
+        Parameters
+        ----------
+        element : IElement
+            Element to find extent of.
+
+        Returns
+        -------
+        tuple[int, int] | None
+            Preorder position of the element and position of its last descendant,
+            `None` if element is not a part of indexed document.
+        """
+        position = self.position(element)
+
+        if position is None:
+            return None
+
+        return position, self._ends[position]
+
+    def contains(
+        self,
+        scope: IElement,
+        element: IElement,
+        recursive: bool = True,
+    ) -> Optional[bool]:
+        """
+        Checks in constant time if element is a descendant of the scope element.
+
+        Parameters
+        ----------
+        scope : IElement
+            Element, which is checked to be an ancestor.
+        element : IElement
+            Element, which is checked to be a descendant.
+        recursive : bool, optional
+            If `False`, checks only if element is a direct child of the scope.
+            By default `True`.
+
+        Returns
+        -------
+        bool | None
+            Result of the check or `None` if any of elements
+            is not a part of indexed document.
+        """
+        start = self.position(scope)
+        position = self.position(element)
+
+        if start is None or position is None:
+            return None
+
+        if not recursive:
+            return self._parents[position] == start
+
+        return start < position <= self._ends[start]
+
+    def elements(
+        self,
+        scope: IElement,
+        recursive: bool = True,
+    ) -> Optional[list[IElement]]:
+        """
+        Returns descendants or children of the scope element in document order.
+
+        Parameters
+        ----------
+        scope : IElement
+            Element to get descendants of.
+        recursive : bool, optional
+            If `False`, returns only direct children. By default `True`.
+
+        Returns
+        -------
+        list[IElement] | None
+            List of elements or `None` if scope is not a part of indexed document.
+        """
+        position = self.position(scope)
+
+        if position is None:
+            return None
+
+        end = self._ends[position]
+
+        if recursive:
+            return self._elements[position + 1 : end + 1]
+
+        children = []
+        child = position + 1
+
+        while child <= end:
+            children.append(self._elements[child])
+            # next sibling starts right after subtree of the child
+            child = self._ends[child] + 1
+
+        return children
+
+    def positions(self, elements: Iterable[IElement]) -> Optional[list[int]]:
+        """
+        Returns sorted, unique preorder positions of the elements.
+
+        Parameters
+        ----------
+        elements : Iterable[IElement]
+            Elements to get positions of.
+
+        Returns
+        -------
+        list[int] | None
+            Sorted positions or `None` if any of elements
+            is not a part of indexed document.
+        """
+        positions = set()
+
+        for element in elements:
+            position = self.position(element)
+
+            if position is None:
+                return None
+
+            positions.add(position)
+
+        return sorted(positions)
+
+    def restrict(
+        self,
+        scope: IElement,
+        elements: Iterable[IElement],
+        recursive: bool = True,
+    ) -> Optional[list[IElement]]:
+        """
+        Restricts elements to descendants (or children) of the scope element.
+        Results are unique and ordered by their position in the document.
+
+        Parameters
+        ----------
+        scope : IElement
+            Element to restrict results to.
+        elements : Iterable[IElement]
+            Elements to restrict.
+        recursive : bool, optional
+            If `False`, keeps only direct children of the scope. By default `True`.
+
+        Returns
+        -------
+        list[IElement] | None
+            Restricted elements or `None` if any of elements
+            is not a part of indexed document.
+        """
+        start = self.position(scope)
+        positions = self.positions(elements)
+
+        if start is None or positions is None:
+            return None
+
+        end = self._ends[start]
+        positions = positions[bisect_left(positions, start + 1) :]
+        positions = positions[: bisect_left(positions, end + 1)]
+
+        if not recursive:
+            positions = [i for i in positions if self._parents[i] == start]
+
+        return [self._elements[i] for i in positions]
+
+    def descendants_of(
+        self,
+        anchors: Iterable[IElement],
+        elements: Iterable[IElement],
+    ) -> Optional[list[IElement]]:
+        """
+        Filters elements, that are descendants of any of anchor elements.
+        Results are unique and ordered by their position in the document.
+
+        Parameters
+        ----------
+        anchors : Iterable[IElement]
+            Elements, which subtrees are searched.
+        elements : Iterable[IElement]
+            Elements to filter.
+
+        Returns
+        -------
+        list[IElement] | None
+            Filtered elements or `None` if any of elements
+            is not a part of indexed document.
+        """
+        starts = self.positions(anchors)
+        positions = self.positions(elements)
+
+        if starts is None or positions is None:
+            return None
+
+        # merge intervals of nested anchors, they are already sorted by start
+        intervals: list[tuple[int, int]] = []
+
+        for start in starts:
+            if intervals and start <= intervals[-1][1]:
+                continue
+
+            intervals.append((start, self._ends[start]))
+
+        results: list[IElement] = []
+
+        for start, end in intervals:
+            low = bisect_left(positions, start + 1)
+            high = bisect_left(positions, end + 1)
+            results.extend(self._elements[i] for i in positions[low:high])
+
+        return results
+
+    def has_within(self, scope: IElement, positions: list[int]) -> Optional[bool]:
+        """
+        Checks if any of sorted positions lies within subtree of the scope element,
+        excluding the scope itself.
+
+        Parameters
+        ----------
+        scope : IElement
+            Element, which subtree is checked.
+        positions : list[int]
+            Sorted preorder positions, see `positions` method.
+
+        Returns
+        -------
+        bool | None
+            Result of the check or `None` if scope
+            is not a part of indexed document.
+        """
+        start = self.position(scope)
+
+        if start is None:
+            return None
+
+        i = bisect_left(positions, start + 1)
+        return i < len(positions) and positions[i] <= self._ends[start]
+
+    def parent_position(self, element: IElement) -> Optional[int]:
+        """
+        Returns preorder position of the parent of the element.
+
+        Parameters
+        ----------
+        element : IElement
+            Element to get parent position of.
+
+        Returns
+        -------
+        int | None
+            Position of the parent, -1 for root element or `None`
+            if element is not a part of indexed document.
+        """
+        position = self.position(element)
+        return None if position is None else self._parents[position]
+
+    def find_all(
+        self,
+        element: IElement,
+        name: Optional[str] = None,
+        attrs: Optional[AttrsType] = None,
+        recursive: bool = True,
+        limit: Optional[int] = None,
+        match: Optional[MatchFunction] = None,
+    ) -> Optional[list[IElement]]:
+        """
+        Finds all elements within element that match name and attributes.
+        Candidates are taken from the most selective posting within
+        subtree of the element and verified with provided match function.
+
+        Parameters
+        ----------
+        element : IElement
+            Element to search within.
+        name : str, optional
+            Name of the element to search for. If `None`, matches all elements.
+        attrs : dict[str, str | Pattern[str]], optional
+            Dictionary of attributes to match.
+        recursive : bool, optional
+            If `True`, searches all descendants, otherwise only direct children.
+        limit : int, optional
+            Maximum number of elements to return.
+        match : Callable, optional
+            Function verifying if node matches name and attributes with semantics
+            of specific implementation. If not provided, candidates are not verified.
+
+        Returns
+        -------
+        list[IElement] | None
+            List of matching elements in document order or `None` if element
+            is not a part of indexed document and search needs to fall back
+            to linear scan.
+        """
+        position = self.position(element)
+
+        if position is None:
+            return None
+
+        attrs = attrs or {}
+        start, stop = position + 1, self._ends[position] + 1
+        candidates: Iterable[int] = self._candidates(name, attrs, start, stop)
+
+        if not recursive:
+            candidates = (i for i in candidates if self._parents[i] == position)
+
+        if match is not None:
+            candidates = (
+                i
+                for i in candidates
+                if match(self._elements[i].node, name, attrs)  # type: ignore
+            )
+
+        return [self._elements[i] for i in islice(candidates, limit)]
+
+    def may_contain(
+        self, element: IElement, requirements: Iterable[tuple[str, str]]
+    ) -> Optional[bool]:
+        """
+        Checks with bloom summary if subtree of the element can contain
+        elements with all required tag names and class tokens.
+        False positives are possible, false negatives are not.
+
+        Parameters
+        ----------
+        element : IElement
+            Element, which subtree is checked.
+        requirements : Iterable[tuple[str, str]]
+            Keys of required tag names ("tag", name)
+            and class tokens ("class", token).
+
+        Returns
+        -------
+        bool | None
+            False if subtree definitely lacks any of requirements, True otherwise,
+            `None` if element is not a part of indexed document.
+        """
+        position = self.position(element)
+
+        if position is None:
+            return None
+
+        mask = _bloom(requirements)
+        return self._summaries[position] & mask == mask
+
+    def find_text(
+        self,
+        element: IElement,
+        pattern: Union[str, Pattern[str]],
+        recursive: bool = True,
+        limit: Optional[int] = None,
+    ) -> Optional[list[IElement]]:
+        """
+        Finds all leaf elements within element, which text matches the pattern.
+        Candidates are taken from exact text or token postings
+        and verified with `match_text` of the element.
+
+        Parameters
+        ----------
+        element : IElement
+            Element to search within.
+        pattern : str | Pattern[str]
+            Exact text or regex pattern to match.
+        recursive : bool, optional
+            If `True`, searches all descendants, otherwise only direct children.
+        limit : int, optional
+            Maximum number of elements to return.
+
+        Returns
+        -------
+        list[IElement] | None
+            List of matching elements in document order or `None` if text
+            is not indexed or element is not a part of indexed document
+            and search needs to fall back to linear scan.
+        """
+        position = self.position(element)
+
+        if self._texts is None or position is None:
+            return None
+
+        if not isinstance(pattern, Pattern):
+            posting = self._texts.get(pattern, [])
+        else:
+            tokens = set(required_tokens(pattern))
+            posting = (
+                _intersect([self._tokens.get(token, []) for token in tokens])
+                if tokens
+                else self._leaves
+            )
+
+        start, stop = position + 1, self._ends[position] + 1
+        candidates: Iterable[int] = islice(
+            posting, bisect_left(posting, start), bisect_left(posting, stop)
+        )
+
+        if not recursive:
+            candidates = (i for i in candidates if self._parents[i] == position)
+
+        if isinstance(pattern, Pattern):
+            candidates = (
+                i for i in candidates if self._elements[i].match_text(pattern)
+            )
+
+        return [self._elements[i] for i in islice(candidates, limit)]
+
+    def _candidates(
+        self,
+        name: Optional[str],
+        attrs: AttrsType,
+        start: int,
+        stop: int,
+    ) -> Iterable[int]:
+        """
+        Returns positions of candidates in range from the most selective posting,
+        that can possibly match provided name and attributes.
+        """
+        postings: list[list[int]] = []
+
+        if name is not None:
+            postings.append(self._tags.get(name, []))
+
+        for attr, value in attrs.items():
+            # literal tokens can be looked up directly, other values
+            # require only presence of the attribute
+            literal = isinstance(value, str) and value and len(value.split()) == 1
+
+            if attr == CLASS_ATTRIBUTE and literal:
+                postings.append(self._classes.get(value, []))  # type: ignore
+            elif attr == ID_ATTRIBUTE and literal:
+                postings.append(self._ids.get(value, []))  # type: ignore
+            else:
+                posting = self._ngram_candidates(attr, value)
+                postings.append(
+                    posting if posting is not None else self._attributes.get(attr, [])
+                )
+
+        if not postings:
+            return range(start, stop)
+
+        posting = min(postings, key=len)
+        return islice(posting, bisect_left(posting, start), bisect_left(posting, stop))
+
+    def _ngram_candidates(
+        self, attr: str, value: Union[str, Pattern[str]]
+    ) -> Optional[list[int]]:
+        """
+        Returns sorted positions of elements, which values of the attribute
+        contain all trigrams of literals required by the value,
+        `None` if n-grams are not indexed or value has no usable literals.
+        """
+        if self._ngrams is None:
+            return None
+
+        grams = set().union(*map(ngrams, required_literals(value)))
+
+        if not grams:
+            return None
+
+        return _intersect([self._ngrams.get((attr, gram), []) for gram in grams])
+
+
+def index_document(
+    element: IElement, ngrams: bool = False, text: bool = False
+) -> DocumentIndex:
+    """
+    Enables index for the document the element belongs to and returns it.
+    Document is tracked and index is rebuilt lazily after each mutation.
+
+    Parameters
+    ----------
+    element : IElement
+        Any element of the document to index.
+    ngrams : bool, optional
+        If True, index stores trigrams of attribute values, which speed up
+        substring and regex queries on attributes at the cost of memory
+        and build time. Once enabled, they are kept after rebuilds.
+        By default False.
+    text : bool, optional
+        If True, index stores text of leaf elements, which speeds up
+        `PatternSelector` queries. Once enabled, it is kept after rebuilds.
+        By default False.
+
+    Returns
+    -------
+    DocumentIndex
+        Index of the current version of the document.
+
+    Raises
+    ------
+    TypeError
+        If element belongs to compact document, which elements are located
+        by their positions in arrays of the document and are not indexed.
+    """
+    from soupsavvy.implementation.compact import CompactElement
+
+    if isinstance(element, CompactElement):
+        raise TypeError(
+            "Compact documents can not be indexed, their elements are already "
+            "located by positions in arrays of the document."
+        )
+
+    state = element.track()
+
+    state.enable(_INDEX_KEY)
+
+    if ngrams:
+        state.enable(_NGRAMS_OPTION)
+
+    if text:
+        state.enable(_TEXT_OPTION)
+
+    index = state.cached(_INDEX_KEY, lambda: _build_index(element))
+
+    if ngrams:
+        index.enable_ngrams()
+
+    if text:
+        index.enable_text()
+
+    return index
+
+
+def get_index(element: IElement) -> Optional[DocumentIndex]:
+    """
+    Returns index of the document the element belongs to,
+    if it was enabled with `index_document`.
+
+    Parameters
+    ----------
+    element : IElement
+        Any element of the document.
+
+    Returns
+    -------
+    DocumentIndex | None
+        Index of the current version of the document,
+        `None` if index was not enabled for the document.
+    """
+    state = element.state
+
+    if state is None or not state.is_enabled(_INDEX_KEY):
+        return None
+
+    return state.cached(_INDEX_KEY, lambda: _build_index(element))
+
+
+def _build_index(element: IElement) -> DocumentIndex:
+    """Builds index of the whole document with options enabled for it."""
+    state = element.track()
+    return DocumentIndex(
+        element._wrap(state.root),
+        ngrams=state.is_enabled(_NGRAMS_OPTION),
+        text=state.is_enabled(_TEXT_OPTION),
+    )
+
+
+def _bloom(keys: Iterable[tuple[str, str]]) -> int:
+    """Returns bloom filter of the keys with bits derived from their hashes."""
+    bits = 0
+
+    for key in keys:
+        hash_ = hash(key)
+
+        for _ in range(SUMMARY_HASHES):
+            bits |= 1 << (hash_ % SUMMARY_BITS)
+            hash_ //= SUMMARY_BITS
+
+    return bits
+
+
+def _intersect(postings: list[list[int]]) -> list[int]:
+    """Returns sorted positions contained in all sorted postings."""
+    candidates, *others = sorted(postings, key=len)
+
+    # candidates from the shortest posting are checked in all other postings
+    for posting in others:
+        if not candidates:
+            break
+
+        candidates = [i for i in candidates if _contains(posting, i)]
+
+    return candidates
+
+
+def _contains(posting: list[int], position: int) -> bool:
+    """Checks if sorted posting contains the position."""
+    i = bisect_left(posting, position)
+    return i < len(posting) and posting[i] == position
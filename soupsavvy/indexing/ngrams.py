@@ -0,0 +1,138 @@
+"""
+Module with helpers of n-gram index of attribute values.
+
+Attribute values are split into overlapping trigrams. Any value containing
+a literal contains all trigrams of that literal, so candidates for substring
+and regex queries are elements having all trigrams of literals, that every
+match of the query has to contain. Candidates are verified afterwards,
+trigrams only narrow down the scan.
+
+Functions
+---------
+- `ngrams` - Returns set of n-grams of the text.
+- `required_literals` - Returns literals, which every match of pattern contains.
+- `literal_runs` - Returns required literals of pattern with word boundaries.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Pattern, Union
+
+try:
+    # python 3.11+
+    from re import _parser as sre_parse  # type: ignore[attr-defined]
+except ImportError:  # pragma: no cover
+    import sre_parse  # type: ignore[no-redef]
+
+# length of n-grams stored in the index
+N = 3
+
+
+def ngrams(text: str, n: int = N) -> set[str]:
+    """
+    Returns set of all n-grams of the text.
+
+    Parameters
+    ----------
+    text : str
+        Text to split.
+    n : int, optional
+        Length of n-grams, by default 3.
+
+    Returns
+    -------
+    set[str]
+        Unique n-grams, empty set if text is shorter than n.
+    """
+    return {text[i : i + n] for i in range(len(text) - n + 1)}
+
+
+def required_literals(value: Union[str, Pattern[str]]) -> list[str]:
+    """
+    Returns literal substrings, which every string matching the value contains.
+    String values are literals themselves, for regex patterns maximal runs
+    of literal characters in top-level sequence of the pattern are returned.
+
+    Parameters
+    ----------
+    value : str | Pattern[str]
+        Literal value or compiled regex pattern.
+
+    Returns
+    -------
+    list[str]
+        Required literals, empty list if pattern has none, which can be used.
+
+    Example
+    -------
+    >>> required_literals(re.compile(r"/product/\\d+/reviews"))
+    ['/product/', '/reviews']
+    """
+    if not isinstance(value, Pattern):
+        return [value]
+
+    return [literal for literal, _, _ in literal_runs(value)]
+
+
+def literal_runs(pattern: Pattern[str]) -> list[tuple[str, bool, bool]]:
+    """
+    Returns maximal runs of literal characters in top-level sequence
+    of the pattern, which every match of the pattern contains.
+    Each run is returned with flags indicating if it is guaranteed
+    to start and end at word boundary, which is the case if it is adjacent
+    to start or end anchor or to `\\b` assertion.
+
+    Parameters
+    ----------
+    pattern : Pattern[str]
+        Compiled regex pattern.
+
+    Returns
+    -------
+    list[tuple[str, bool, bool]]
+        Literal runs with flags of boundaries on the left and on the right,
+        empty list if pattern is case-insensitive or cannot be analyzed.
+    """
+    # case-insensitive patterns match literals in any case
+    if pattern.flags & re.IGNORECASE:
+        return []
+
+    try:
+        parsed = sre_parse.parse(pattern.pattern, pattern.flags)
+    except Exception:  # pragma: no cover
+        return []
+
+    # with ascii flag, `\\b` does not treat non-ascii letters as word characters
+    anchors = {
+        sre_parse.AT_BEGINNING,
+        sre_parse.AT_BEGINNING_STRING,
+        sre_parse.AT_END,
+        sre_parse.AT_END_STRING,
+    }
+
+    if not pattern.flags & re.ASCII:
+        anchors.add(sre_parse.AT_BOUNDARY)
+
+    runs = []
+    run: list[str] = []
+    left = False
+    previous = None
+
+    # items of top-level sequence are all required, alternation is a single item
+    for op, argument in parsed:
+        if op == sre_parse.LITERAL:
+            if not run:
+                left = previous in anchors
+            run.append(chr(argument))
+        elif run:
+            right = op == sre_parse.AT and argument in anchors
+            runs.append(("".join(run), left, right))
+            run = []
+
+        previous = argument if op == sre_parse.AT else None
+
+    if run:
+        runs.append(("".join(run), left, False))
+
+    return runs
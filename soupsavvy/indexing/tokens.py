@@ -0,0 +1,72 @@
+"""
+Module with helpers of full-text index of leaf elements.
+
+Text of leaf elements is split into word tokens, maximal runs of word
+characters. A literal, which is bounded by non-word characters or word
+boundaries, occurs in text only as a whole token, so candidates for regex
+queries are leaf elements having all tokens of required literals.
+Tokens are case-sensitive, as matching of patterns is.
+
+Functions
+---------
+- `tokenize` - Returns set of word tokens of the text.
+- `required_tokens` - Returns tokens, which every match of pattern contains.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Pattern
+
+from soupsavvy.indexing.ngrams import literal_runs
+
+# the same definition of word character as used by `\b` of str patterns
+TOKEN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> set[str]:
+    """
+    Returns set of word tokens of the text.
+
+    Parameters
+    ----------
+    text : str
+        Text to split.
+
+    Returns
+    -------
+    set[str]
+        Unique tokens of the text.
+    """
+    return set(TOKEN.findall(text))
+
+
+def required_tokens(pattern: Pattern[str]) -> list[str]:
+    """
+    Returns whole tokens, which text of every element matching the pattern contains.
+    Words at edges of literal runs are included only if they are known
+    to end at word boundary, otherwise they can be parts of longer tokens.
+
+    Parameters
+    ----------
+    pattern : Pattern[str]
+        Compiled regex pattern.
+
+    Returns
+    -------
+    list[str]
+        Required tokens, empty list if pattern has none.
+
+    Example
+    -------
+    >>> required_tokens(re.compile(r"\\bAdd to cart"))
+    ['Add', 'to']
+    """
+    tokens = []
+
+    for literal, left, right in literal_runs(pattern):
+        for match in TOKEN.finditer(literal):
+            if (match.start() > 0 or left) and (match.end() < len(literal) or right):
+                tokens.append(match.group())
+
+    return tokens
@@ -7,18 +7,33 @@ Module with `soupsavvy` interfaces used across the package.
 - `IElement` - Interface for any tree structure compatible with `soupsavvy`.
 - `SelectionApi` - Interface for selection of elements based on specific selector.
 - `IBrowser` - Interface for browser implementations compatible with `soupsavvy`.
+- `IAsyncElement` - Interface for elements accessed asynchronously.
+- `IAsyncBrowser` - Interface for browser implementations driven asynchronously.
 """
 
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from collections.abc import Iterable
-from typing import Any, Generic, NoReturn, Optional, Pattern, TypeVar, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Generic,
+    NoReturn,
+    Optional,
+    Pattern,
+    TypeVar,
+    Union,
+)
+from weakref import WeakValueDictionary
 
 from typing_extensions import Self
 
 import soupsavvy.exceptions as exc
 
+if TYPE_CHECKING:
+    from soupsavvy.implementation.tracking import DocumentState
+
 
 def _raise_not_implemented(self) -> NoReturn:
     """Raises a `NotImplementedError` indicating that this method is abstract."""
@@ -34,6 +49,8 @@ class Executable(ABC):
     Derived classes must implement the `execute` method.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def execute(self, arg: Any) -> Any:
         """Executes the operation on the given argument."""
@@ -46,6 +63,8 @@ class Comparable(ABC):
     Derived classes must implement the `__eq__` method.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def __eq__(self, x: Any) -> bool:
         _raise_not_implemented(self)
@@ -57,6 +76,8 @@ class JSONSerializable(ABC):
     They must have `json` method that returns any JSON serializable object.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def json(self) -> Any:
         """Serializes the object to a JSON-compatible format."""
@@ -70,6 +91,8 @@ class TagSearcher(ABC):
     that process `IElement` object and return results.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def find(
         self,
@@ -127,6 +150,67 @@ class TagSearcher(ABC):
         """
         _raise_not_implemented(self)
 
+    async def afind(
+        self,
+        tag: IAsyncElement,
+        strict: bool = False,
+        recursive: bool = True,
+    ) -> Any:
+        """
+        Processes `IAsyncElement` object and returns result.
+        Snapshot of the element is fetched with a single awaited call
+        and processed in-process with `find` method.
+
+        Parameters
+        ----------
+        tag : IAsyncElement
+            Any `IAsyncElement` object to process.
+        strict : bool, optional
+            If True, enforces results to be found in the element, by default False.
+        recursive : bool, optional
+            Specifies if search should be recursive.
+            If set to `False`, only direct children of the element will be searched.
+            By default `True`.
+
+        Returns
+        -------
+        Any
+            Processed result from the snapshot of the element.
+        """
+        snapshot = await tag.snapshot()
+        return self.find(snapshot, strict=strict, recursive=recursive)
+
+    async def afind_all(
+        self,
+        tag: IAsyncElement,
+        recursive: bool = True,
+        limit: Optional[int] = None,
+    ) -> list[Any]:
+        """
+        Processes `IAsyncElement` object and returns list of results.
+        Snapshot of the element is fetched with a single awaited call
+        and processed in-process with `find_all` method.
+
+        Parameters
+        ----------
+        tag : IAsyncElement
+            Any `IAsyncElement` object to process.
+        recursive : bool, optional
+            Specifies if search should be recursive.
+            If set to `False`, only direct children of the element will be searched.
+            By default `True`.
+        limit : int, optional
+            Specifies maximum number of results to return in a list.
+            By default `None`, everything is returned.
+
+        Returns
+        -------
+        list[Any]
+            A list of results from processed snapshot of the element.
+        """
+        snapshot = await tag.snapshot()
+        return self.find_all(snapshot, recursive=recursive, limit=limit)
+
 
 class TagSearcherMeta(type(ABC)):
     """
@@ -192,6 +276,61 @@ class TagSearcherMeta(type(ABC)):
         """
         ...
 
+    async def afind(
+        cls,
+        tag: IAsyncElement,
+        strict: bool = False,
+        recursive: bool = True,
+    ) -> Any:
+        """
+        Processes `IAsyncElement` object and returns result.
+
+        Parameters
+        ----------
+        tag : IAsyncElement
+            Any `IAsyncElement` object to process.
+        strict : bool, optional
+            If True, enforces results to be found in the element, by default False.
+        recursive : bool, optional
+            Specifies if search should be recursive.
+            If set to `False`, only direct children of the element will be searched.
+            By default `True`.
+
+        Returns
+        -------
+        Any
+            Processed result from the element.
+        """
+        ...
+
+    async def afind_all(
+        cls,
+        tag: IAsyncElement,
+        recursive: bool = True,
+        limit: Optional[int] = None,
+    ) -> list[Any]:
+        """
+        Processes `IAsyncElement` object and returns list of results.
+
+        Parameters
+        ----------
+        tag : IAsyncElement
+            Any `IAsyncElement` object to process.
+        recursive : bool, optional
+            Specifies if search should be recursive.
+            If set to `False`, only direct children of the element will be searched.
+            By default `True`.
+        limit : int, optional
+            Specifies maximum number of results to return in a list.
+            By default `None`, everything is returned.
+
+        Returns
+        -------
+        list[Any]
+            A list of results from processed element.
+        """
+        ...
+
 
 # valid TagSearcher types
 TagSearcherType = Union[TagSearcher, TagSearcherMeta]
@@ -223,6 +362,15 @@ class IElement(ABC, Generic[N]):
         "IElement is an abstract interface and does not implement this method."
     )
     _NODE_TYPE: type[Any] = object
+    # implementations wrapping stable node objects reuse wrappers of nodes,
+    # pool is shared by all elements derived from the same element
+    _POOLED = False
+    # implementations executing selector programs natively, like browsers,
+    # are searched by selectors with a single call to `_execute` if possible
+    _EXECUTES_PROGRAMS = False
+
+    # elements are created for every visited node, fixed layout keeps them small
+    __slots__ = ("_node", "_state", "_pool", "__weakref__")
 
     def __init__(self, node: N, *args, **kwargs) -> None:
         """
@@ -244,6 +392,9 @@ class IElement(ABC, Generic[N]):
             )
 
         self._node = node
+        # state of tracked document, propagated to elements derived from this one
+        self._state: Optional[DocumentState] = None
+        self._pool: Optional[WeakValueDictionary[int, Self]] = None
 
     @classmethod
     def from_node(cls, node: N) -> Self:
@@ -406,6 +557,18 @@ class IElement(ABC, Generic[N]):
         """
         self._raise_not_implemented()
 
+    @property
+    def attributes(self) -> dict[str, str]:
+        """
+        Returns all attributes of this element.
+
+        Returns
+        -------
+        dict[str, str]
+            Dictionary mapping attribute names to their values as strings.
+        """
+        self._raise_not_implemented()
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -431,6 +594,86 @@ class IElement(ABC, Generic[N]):
         """
         self._raise_not_implemented()
 
+    def _find_text(
+        self,
+        pattern: Union[str, Pattern[str]],
+        recursive: bool = True,
+        limit: Optional[int] = None,
+    ) -> Optional[list[Self]]:
+        """
+        Finds leaf elements, which text content matches the pattern,
+        if implementation can search them natively.
+
+        Parameters
+        ----------
+        pattern : str | Pattern[str]
+            Exact text or regex pattern to match.
+        recursive : bool, optional
+            If `True`, searches all descendants, otherwise only direct children.
+        limit : int, optional
+            Maximum number of elements to return.
+
+        Returns
+        -------
+        list[Self] | None
+            Matching elements in document order or `None` if search
+            is not supported and needs to fall back to linear scan.
+        """
+        return None
+
+    def _execute(
+        self,
+        program: list,
+        recursive: bool = True,
+        limit: Optional[int] = None,
+    ) -> Optional[list[Self]]:
+        """
+        Executes serialized selector program within this element,
+        if implementation can run it natively, like browsers in the page.
+        Called by `find_all` of selectors, if `_EXECUTES_PROGRAMS` is set.
+
+        Parameters
+        ----------
+        program : list
+            Selector program serialized with `soupsavvy.implementation.remote`.
+        recursive : bool, optional
+            If `True`, searches all descendants, otherwise only direct children.
+        limit : int, optional
+            Maximum number of elements to return.
+
+        Returns
+        -------
+        list[Self] | None
+            Matching elements in document order or `None` if programs
+            are not supported and selector needs to be searched in python.
+        """
+        return None
+
+    def match_text(self, pattern: Union[str, Pattern[str]]) -> bool:
+        """
+        Checks if text content of this element matches the pattern.
+        String pattern must be equal to the text, regex pattern is searched in it.
+
+        Implementations can override this method to match the pattern
+        without building text content string.
+
+        Parameters
+        ----------
+        pattern : str | Pattern[str]
+            Exact text or regex pattern to match.
+
+        Returns
+        -------
+        bool
+            True if text content matches the pattern, False otherwise.
+        """
+        text = self.text
+
+        if isinstance(pattern, Pattern):
+            return pattern.search(text) is not None
+
+        return text == pattern
+
     def css(self, selector: Any) -> SelectionApi:
         """
         Returns a `SelectionApi` for CSS-based selection.
@@ -463,21 +706,116 @@ class IElement(ABC, Generic[N]):
         """
         self._raise_not_implemented()
 
+    @property
+    def state(self) -> Optional[DocumentState]:
+        """
+        Returns state of the tracked document this element belongs to.
+
+        Returns
+        -------
+        DocumentState | None
+            State of the document or `None` if document is not tracked.
+        """
+        return self._state
+
+    def track(self) -> DocumentState:
+        """
+        Attaches version tracking to the document this element belongs to.
+        If document is already tracked, its existing state is returned.
+
+        Version of the document is bumped by mutation methods of `IElement`
+        (`decompose`, `extract`, `insert`), which invalidates caches and indexes
+        built for the document.
+
+        Returns
+        -------
+        DocumentState
+            State of the document this element belongs to.
+        """
+        self._raise_not_implemented()
+
+    def decompose(self) -> None:
+        """
+        Removes this element from the tree and destroys it.
+        Bumps version of the document if it is tracked.
+        """
+        self._raise_not_implemented()
+
+    def extract(self) -> Self:
+        """
+        Removes this element from the tree and returns it as a root
+        of a new, untracked document. Bumps version of the document if it is tracked.
+
+        Returns
+        -------
+        Self
+            Element removed from the tree.
+        """
+        self._raise_not_implemented()
+
+    def insert(self, position: int, element: Self) -> None:
+        """
+        Inserts element as a child of this element at given position.
+        If element is a part of any tree, it is moved from its current place.
+        Bumps version of affected documents if they are tracked.
+
+        Parameters
+        ----------
+        position : int
+            Position among child elements (see `children`) at which
+            element is inserted. If greater than number of children,
+            element is appended at the end.
+        element : IElement
+            Element of the same implementation to insert.
+        """
+        self._raise_not_implemented()
+
     @classmethod
     def _raise_not_implemented(cls) -> NoReturn:
         """Raises a `NotImplementedError` indicating that this method is abstract."""
         raise NotImplementedError(cls._NOT_IMPLEMENTED_MESSAGE)
 
-    @classmethod
-    def _map(cls, elements: Iterable[Any]) -> Iterable[Self]:
-        """Maps elements to the current implementation."""
-        return map(cls.from_node, elements)
+    def _wrap(self, node: Any) -> Self:
+        """
+        Wraps node of the same document into the current implementation.
+        Propagates state of tracked document to the new element.
+
+        If implementation is pooled, the same wrapper is returned for the same
+        node as long as the wrapper is in use. Pool references wrappers weakly,
+        so it does not keep them or their nodes alive. Each wrapper keeps
+        its node alive, so ids of nodes in the pool are not reused.
+        """
+        if self._POOLED:
+            pool = self._pool
+
+            if pool is None:
+                pool = self._pool = WeakValueDictionary({id(self.node): self})
+
+            element = pool.get(id(node))
+
+            if element is None:
+                element = pool[id(node)] = self.from_node(node)
+                element._pool = pool
+        else:
+            element = self.from_node(node)
+
+        if self._state is not None:
+            element._state = self._state
+
+        return element
+
+    def _map(self, elements: Iterable[Any]) -> Iterable[Self]:
+        """Maps elements of the same document to the current implementation."""
+        return map(self._wrap, elements)
 
     def __hash__(self):
         """Hashes element object using the wrapped node's hash."""
         return hash((self.node, self.__class__))
 
     def __eq__(self, other):
+        if self is other:
+            return True
+
         if not isinstance(other, self.__class__):
             return NotImplemented
 
@@ -591,7 +929,7 @@ class IBrowser(ABC, Generic[B, E]):
         self._raise_not_implemented()
 
     @abstractmethod
-    def click(self, element: E) -> None:
+    def click(self, element: IElement) -> None:
         """
         Performs a click action on the specified element.
 
@@ -599,12 +937,12 @@ class IBrowser(ABC, Generic[B, E]):
         ----------
         element : IElement
             The target element of implementation compatible with browser
-            that will be clicked.
+            or element of the snapshot of the page or element, that will be clicked.
         """
         self._raise_not_implemented()
 
     @abstractmethod
-    def send_keys(self, element: E, value: str, clear: bool = True) -> None:
+    def send_keys(self, element: IElement, value: str, clear: bool = True) -> None:
         """
         Sends keystrokes to the specified element.
 
@@ -612,7 +950,7 @@ class IBrowser(ABC, Generic[B, E]):
         ----------
         element : IElement
             The target element of implementation compatible with browser
-            to interact with.
+            or element of the snapshot of the page or element to interact with.
         value : str
             The value to insert into the element.
         clear : bool, optional
@@ -639,6 +977,45 @@ class IBrowser(ABC, Generic[B, E]):
         """
         self._raise_not_implemented()
 
+    def snapshot(self) -> IElement:
+        """
+        Returns read-only snapshot of the current page, which is fetched
+        in a single call and searched in-process without calls to the browser.
+        Elements of the snapshot can be passed to browser actions,
+        which map them back to live elements of the page.
+
+        Returns
+        -------
+        IElement
+            The html element of the snapshot of the current page.
+        """
+        self._raise_not_implemented()
+
+    def resolve(self, element: IElement) -> E:
+        """
+        Returns live element of the page for the element of the snapshot.
+        Elements of snapshots of elements are mapped within the element
+        the snapshot was taken of. Elements, which are not part
+        of any snapshot, are returned unchanged.
+
+        Parameters
+        ----------
+        element : IElement
+            Element of the snapshot or live element of the page.
+
+        Returns
+        -------
+        IElement
+            Live element of the page, compatible with the browser.
+
+        Raises
+        ------
+        StaleSnapshotException
+            If element can not be mapped back to the live element,
+            because page has changed since the snapshot was taken.
+        """
+        return element  # type: ignore[return-value]
+
     @abstractmethod
     def close(self) -> None:
         """Closes the browser and releases resources."""
@@ -669,3 +1046,383 @@ class IBrowser(ABC, Generic[B, E]):
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self.browser!r})"
+
+
+class IAsyncElement(ABC, Generic[N]):
+    """
+    Interface representing HTML node of a tree, which is accessed asynchronously,
+    like elements of browser pages driven by `asyncio` event loop.
+
+    Searchers of `soupsavvy` are synchronous, so asynchronous elements are not
+    traversed node by node. Each search is awaited as a single call, which
+    either executes selector program in the page or fetches read-only snapshot
+    of the element, that is searched in-process with any searcher.
+
+    Current Implementations:
+    - `AsyncPlaywrightElement`: Wraps asynchronous `Playwright ElementHandle`.
+    """
+
+    _NOT_IMPLEMENTED_MESSAGE = (
+        "IAsyncElement is an abstract interface and does not implement this method."
+    )
+    _NODE_TYPE: type[Any] = object
+
+    __slots__ = ("_node", "__weakref__")
+
+    def __init__(self, node: N, *args, **kwargs) -> None:
+        """
+        Initializes the implementation with the given node.
+
+        Parameters
+        ----------
+        node : Any
+            Node to wrap for specific implementation.
+        *args: Any
+            Additional positional arguments to pass to the constructor.
+        **kwargs: Any
+            Additional keyword arguments to pass to the constructor.
+        """
+        if not isinstance(node, self._NODE_TYPE):
+            raise TypeError(
+                f"Expected node to be of type {self._NODE_TYPE}, "
+                f"but got {type(node)} instead."
+            )
+
+        self._node = node
+
+    @property
+    def node(self) -> N:
+        """Returns the underlying node wrapped by the instance."""
+        return self._node  # pragma: no cover
+
+    def get(self) -> N:
+        """Returns the node wrapped by the instance."""
+        return self.node  # pragma: no cover
+
+    @abstractmethod
+    async def snapshot(self) -> IElement:
+        """
+        Returns read-only snapshot of the element fetched in a single call,
+        which can be searched in-process by any `soupsavvy` searcher.
+
+        Returns
+        -------
+        IElement
+            Copy of the element with its whole subtree.
+        """
+        self._raise_not_implemented()
+
+    @abstractmethod
+    async def resolve(self, elements: Iterable[IElement]) -> list[Self]:
+        """
+        Maps elements of the snapshot of this element back to live elements
+        in a single call.
+
+        Parameters
+        ----------
+        elements : Iterable[IElement]
+            Elements of the snapshot returned by `snapshot` method of this element.
+
+        Returns
+        -------
+        list[Self]
+            Live elements in the same order.
+
+        Raises
+        ------
+        StaleSnapshotException
+            If any element is not part of the snapshot of this element
+            or can not be found, because element has changed since.
+        """
+        self._raise_not_implemented()
+
+    @abstractmethod
+    async def get_name(self) -> str:
+        """Returns the tag name of this element."""
+        self._raise_not_implemented()
+
+    @abstractmethod
+    async def get_text(self) -> str:
+        """
+        Gets the combined text content of this element.
+
+        Returns
+        -------
+        str
+            Text content of this element, or an empty string if none is found.
+        """
+        self._raise_not_implemented()
+
+    @abstractmethod
+    async def get_attribute(self, name: str) -> Optional[str]:
+        """
+        Retrieves the value of a specified attribute for this element.
+
+        Parameters
+        ----------
+        name : str
+            Name of the attribute.
+
+        Returns
+        -------
+        Optional[str]
+            The attribute value as a string, or `None` if the attribute does not exist.
+        """
+        self._raise_not_implemented()
+
+    @abstractmethod
+    async def get_attributes(self) -> dict[str, str]:
+        """
+        Returns all attributes of this element.
+
+        Returns
+        -------
+        dict[str, str]
+            Dictionary mapping attribute names to their values as strings.
+        """
+        self._raise_not_implemented()
+
+    @abstractmethod
+    async def get_parent(self) -> Optional[Self]:
+        """
+        Returns the immediate parent element of this element, if it exists.
+
+        Returns
+        -------
+        Optional[Self]
+            The parent element, or `None` if this is the root element.
+        """
+        self._raise_not_implemented()
+
+    @abstractmethod
+    async def get_children(self) -> list[Self]:
+        """
+        Returns the direct child elements of this element.
+        Only tag elements are included; text and comment nodes are excluded.
+
+        Returns
+        -------
+        list[Self]
+            Direct child elements, in document order.
+        """
+        self._raise_not_implemented()
+
+    async def _execute(
+        self,
+        program: list,
+        recursive: bool = True,
+        limit: Optional[int] = None,
+    ) -> Optional[list[Self]]:
+        """
+        Executes serialized selector program within this element,
+        if implementation can run it natively, like browsers in the page.
+
+        Parameters
+        ----------
+        program : list
+            Selector program serialized with `soupsavvy.implementation.remote`.
+        recursive : bool, optional
+            If `True`, searches all descendants, otherwise only direct children.
+        limit : int, optional
+            Maximum number of elements to return.
+
+        Returns
+        -------
+        list[Self] | None
+            Matching elements in document order or `None` if programs
+            are not supported and selector needs to be searched in snapshot.
+        """
+        return None
+
+    @classmethod
+    def _raise_not_implemented(cls) -> NoReturn:
+        """Raises a `NotImplementedError` indicating that this method is abstract."""
+        raise NotImplementedError(cls._NOT_IMPLEMENTED_MESSAGE)
+
+    def __hash__(self):
+        """Hashes element object using the wrapped node's hash."""
+        return hash((self.node, self.__class__))
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+
+        return self.node == other.node
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.node!r})"
+
+
+AE = TypeVar("AE", bound=IAsyncElement)
+
+
+class IAsyncBrowser(ABC, Generic[B, AE]):
+    """
+    Interface representing a browser driven asynchronously,
+    the awaitable counterpart of `IBrowser`.
+
+    Current Implementations:
+    - `AsyncPlaywrightBrowser`: Wraps asynchronous `Playwright Page` instance.
+    """
+
+    _NOT_IMPLEMENTED_MESSAGE = (
+        "IAsyncBrowser is an abstract interface and does not implement this method."
+    )
+
+    def __init__(self, browser: B, *args, **kwargs) -> None:
+        """
+        Initializes the implementation with the given browser instance.
+
+        Parameters
+        ----------
+        browser : Any
+            Browser instance to wrap for specific implementation.
+        *args: Any
+            Additional positional arguments to pass to the constructor.
+        **kwargs: Any
+            Additional keyword arguments to pass to the constructor.
+        """
+        self._browser = browser
+
+    @property
+    def browser(self) -> B:
+        """Returns the underlying browser wrapped by the instance."""
+        return self._browser  # pragma: no cover
+
+    def get(self) -> B:
+        """Returns the browser wrapped by the instance."""
+        return self.browser  # pragma: no cover
+
+    @abstractmethod
+    async def navigate(self, url: str) -> None:
+        """
+        Navigates the browser to the specified URL.
+
+        Parameters
+        ----------
+        url : str
+            The URL to navigate to.
+        """
+        self._raise_not_implemented()
+
+    @abstractmethod
+    async def click(self, element: AE) -> None:
+        """
+        Performs a click action on the specified element.
+
+        Parameters
+        ----------
+        element : IAsyncElement
+            The target element of implementation compatible with browser
+            or element of the snapshot of the page or element, that will be clicked.
+        """
+        self._raise_not_implemented()
+
+    @abstractmethod
+    async def send_keys(self, element: AE, value: str, clear: bool = True) -> None:
+        """
+        Sends keystrokes to the specified element.
+
+        Parameters
+        ----------
+        element : IAsyncElement
+            The target element of implementation compatible with browser
+            or element of the snapshot of the page or element to interact with.
+        value : str
+            The value to insert into the element.
+        clear : bool, optional
+            If `True`, clears existing content before sending keys.
+            Defaults to `True`.
+        """
+        self._raise_not_implemented()
+
+    @abstractmethod
+    async def get_document(self) -> AE:
+        """
+        Returns the html document of the current page as an `IAsyncElement`.
+
+        Returns
+        -------
+        IAsyncElement
+            The html document of the current page, soupsavvy implementation
+            compatible with the browser.
+
+        Raises
+        ------
+        TagNotFoundException
+            If the <html> element is not found on the page.
+        """
+        self._raise_not_implemented()
+
+    async def snapshot(self) -> IElement:
+        """
+        Returns read-only snapshot of the current page, which is fetched
+        in a single call and searched in-process without calls to the browser.
+        Elements of the snapshot can be passed to browser actions,
+        which map them back to live elements of the page.
+
+        Returns
+        -------
+        IElement
+            The html element of the snapshot of the current page.
+        """
+        self._raise_not_implemented()
+
+    async def resolve(self, element: Any) -> AE:
+        """
+        Returns live element of the page for the element of the snapshot.
+        Elements of snapshots of elements are mapped within the element
+        the snapshot was taken of. Elements, which are not part
+        of any snapshot, are returned unchanged.
+
+        Parameters
+        ----------
+        element : IElement | IAsyncElement
+            Element of the snapshot or live element of the page.
+
+        Returns
+        -------
+        IAsyncElement
+            Live element of the page, compatible with the browser.
+
+        Raises
+        ------
+        StaleSnapshotException
+            If element can not be mapped back to the live element,
+            because page has changed since the snapshot was taken.
+        """
+        return element
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Closes the browser and releases resources."""
+        self._raise_not_implemented()
+
+    @abstractmethod
+    async def get_current_url(self) -> str:
+        """Returns the current URL of the browser."""
+        self._raise_not_implemented()
+
+    @classmethod
+    def _raise_not_implemented(cls) -> NoReturn:
+        """Raises a `NotImplementedError` indicating that this method is abstract."""
+        raise NotImplementedError(cls._NOT_IMPLEMENTED_MESSAGE)
+
+    def __hash__(self):
+        """Hashes element object using the wrapped browser's id."""
+        return hash((id(self.browser), self.__class__))
+
+    def __eq__(self, other):
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+
+        return self.browser == other.browser
+
+    def __str__(self) -> str:
+        return str(self.browser)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.browser!r})"
@@ -24,6 +24,7 @@ import soupsavvy.models.constants as c
 from soupsavvy.base import BaseOperation, SoupSelector, check_operation, check_selector
 from soupsavvy.interfaces import (
     Comparable,
+    IAsyncElement,
     IElement,
     JSONSerializable,
     TagSearcher,
@@ -118,7 +119,6 @@ def _is_json_serializable(obj) -> tuple[bool, Optional[Exception]]:
         return False, e
 
 
-@dataclass
 class Field(TagSearcher, Comparable):
     """
     Model field wrapper, that defined field metadata.
@@ -155,10 +155,19 @@ class Field(TagSearcher, Comparable):
     is equivalent to default behavior.
     """
 
-    selector: TagSearcherType
-    repr: bool = True
-    compare: bool = True
-    migrate: bool = True
+    __slots__ = ("selector", "repr", "compare", "migrate")
+
+    def __init__(
+        self,
+        selector: TagSearcherType,
+        repr: bool = True,
+        compare: bool = True,
+        migrate: bool = True,
+    ) -> None:
+        self.selector = selector
+        self.repr = repr
+        self.compare = compare
+        self.migrate = migrate
 
     def find_all(
         self, tag: IElement, recursive: bool = True, limit: Optional[int] = None
@@ -571,6 +580,71 @@ class BaseModel(TagSearcher, Comparable, JSONSerializable, metaclass=ModelMeta):
         elements = cls.scope.find_all(tag=tag, recursive=recursive, limit=limit)
         return [cls._find(element) for element in elements]
 
+    @classmethod
+    async def afind(
+        cls,
+        tag: IAsyncElement,
+        strict: bool = False,
+        recursive: bool = True,
+    ) -> Optional[Self]:
+        """
+        Searches for and returns an instance of the model within the provided
+        asynchronous element. Snapshot of the element is fetched with a single
+        awaited call and the model is found in it with `find` method.
+
+        Parameters
+        ----------
+        tag : IAsyncElement
+            Any `IAsyncElement` object to search within for the model.
+        strict : bool, optional
+            If True, enforces model scope to be found in the element.
+        recursive : bool, optional
+            Whether the search for the model scope element should be recursive.
+            Default is True.
+
+        Returns
+        -------
+        Self | None
+            An instance of the model if found, otherwise None.
+
+        Notes
+        -----
+        Fields, which are elements, are elements of the snapshot.
+        """
+        snapshot = await tag.snapshot()
+        return cls.find(snapshot, strict=strict, recursive=recursive)
+
+    @classmethod
+    async def afind_all(
+        cls,
+        tag: IAsyncElement,
+        recursive: bool = True,
+        limit: Optional[int] = None,
+    ) -> list[Self]:
+        """
+        Searches for and returns all instances of the model within the provided
+        asynchronous element. Snapshot of the element is fetched with a single
+        awaited call and models are found in it with `find_all` method.
+
+        Parameters
+        ----------
+        tag : IAsyncElement
+            Any `IAsyncElement` object to search within for the model.
+        recursive : bool, optional
+            Whether the search for the model scope element should be recursive.
+            Default is True.
+        limit : int, optional
+            Maximum number of model instances to return. Default is None, which
+            returns all instances found.
+
+        Returns
+        -------
+        list[Self]
+            A list of model instances found within the element.
+        """
+        snapshot = await tag.snapshot()
+        return cls.find_all(snapshot, recursive=recursive, limit=limit)
+
     def migrate(
         self,
         model: Type[T],
@@ -40,6 +40,8 @@ class ApplyTo(BrowserOperation):
         If the element cannot be found using the provided selector.
     """
 
+    __slots__ = ("selector", "action")
+
     def __init__(self, selector: SoupSelector, action: ElementAction) -> None:
         self.selector = selector
         self.action = action
@@ -78,6 +80,8 @@ class Navigate(BrowserOperation):
     ... operation.execute(browser)
     """
 
+    __slots__ = ("url",)
+
     def __init__(self, url: str) -> None:
         """
         Initializes the Navigate operation with the specified URL.
@@ -127,6 +131,8 @@ class WaitImplicitly(BaseOperation):
     a browser instance to operate and can be used independently.
     """
 
+    __slots__ = ("seconds",)
+
     def __init__(self, seconds: float) -> None:
         """
         Initializes the WaitImplicitly operation with the specified wait time.
@@ -180,6 +186,8 @@ class Click(ElementAction):
     ... operation.execute(browser)
     """
 
+    __slots__ = ()
+
     def _execute(self, browser: IBrowser, element: IElement) -> None:
         browser.click(element)
 
@@ -221,6 +229,8 @@ class SendKeys(ElementAction):
     ... operation.execute(browser)
     """
 
+    __slots__ = ("value", "clear")
+
     def __init__(self, value: str, clear: bool = True) -> None:
         """
         Initializes the SendKeys action with the specified input value.
@@ -251,6 +261,8 @@ class _FindBase(BrowserOperation):
     Base class for searching browser operations to share common functionality.
     """
 
+    __slots__ = ("selector", "method")
+
     _PASSTHROUGH_BROWSER = False
 
     def __init__(self, selector: TagSearcher, method: Callable, kwargs: dict) -> None:
@@ -288,6 +300,8 @@ class Find(_FindBase):
     from web pages, for example: navigate -> click -> wait -> find.
     """
 
+    __slots__ = ()
+
     def __init__(self, selector: TagSearcher, strict: bool = False) -> None:
         """
         Initializes the Find operation with the specified selector.
@@ -328,6 +342,8 @@ class FindAll(_FindBase):
     from web pages, for example: navigate -> click -> wait -> find_all.
     """
 
+    __slots__ = ()
+
     def __init__(self, selector: TagSearcher, limit: Optional[int] = None) -> None:
         """
         Initializes the FindAll operation with the specified selector.
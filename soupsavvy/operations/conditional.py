@@ -52,6 +52,8 @@ class IfElse(OperationSearcherMixin):
     www.example.com
     """
 
+    __slots__ = ("_condition", "_if_operation", "_else_operation")
+
     def __init__(
         self,
         condition: Condition,
@@ -126,6 +128,8 @@ class Break(OperationSearcherMixin):
     so next operation is not executed.
     """
 
+    __slots__ = ()
+
     def _execute(self, arg: Any) -> Any:
         raise exc.BreakOperationException(arg)
 
@@ -162,6 +166,8 @@ class Continue(OperationSearcherMixin):
     operation is skipped and the next one is executed.
     """
 
+    __slots__ = ()
+
     def _execute(self, arg: Any) -> Any:
         return arg
 
@@ -51,6 +51,8 @@ class Text(OperationSearcherMixin):
     as each of them extracts text differently.
     """
 
+    __slots__ = ()
+
     def _execute(self, arg: IElement) -> str:
         """Extracts text from `IElement`."""
         return arg.text
@@ -89,6 +91,8 @@ class Href(OperationSearcherMixin):
     "www.example.com"
     """
 
+    __slots__ = ()
+
     _ATTRIBUTE_NAME = "href"
 
     def _execute(self, arg: IElement) -> Optional[str]:
@@ -37,6 +37,8 @@ class OperationPipeline(OperationSearcherMixin):
     with `find` method, which would produce the same result.
     """
 
+    __slots__ = ("operations",)
+
     def __init__(
         self,
         operation1: BaseOperation,
@@ -128,6 +130,8 @@ class Operation(OperationSearcherMixin):
     with `find` method, which would produce the same result.
     """
 
+    __slots__ = ("operation", "args", "kwargs")
+
     def __init__(self, func: Callable, *args, **kwargs) -> None:
         """
         Initializes `Operation` with provided function and optional arguments.
@@ -29,6 +29,8 @@ class SelectionPipeline(TagSearcher, Comparable):
     on selector and operation.
     """
 
+    __slots__ = ("_selector", "_operation")
+
     def __init__(self, selector: TagSearcherType, operation: BaseOperation) -> None:
         """
         Initializes `SelectionPipeline` with selector and operation.
@@ -20,6 +20,8 @@ class JSON(BaseOperation):
     "{'field1': 'value1', 'field2': 'value2'}"
     """
 
+    __slots__ = ()
+
     def _execute(self, obj: JSONSerializable) -> dict:
         return obj.json()
 
@@ -25,6 +25,8 @@ class OperationWrapper(OperationSearcherMixin):
     Acts as a higher order operation, which controls behavior of the wrapped operation.
     """
 
+    __slots__ = ("operation",)
+
     def __init__(self, operation: BaseOperation) -> None:
         """
         Initialize Operation Wrapper.
@@ -85,6 +87,8 @@ class SkipNone(OperationWrapper):
     and returns None.
     """
 
+    __slots__ = ()
+
     def _execute(self, arg: Any) -> Any:
         if arg is None:
             return None
@@ -144,6 +148,8 @@ class Suppress(OperationWrapper):
     FailedOperationExecution
     """
 
+    __slots__ = ("_category",)
+
     def __init__(
         self,
         operation: BaseOperation,
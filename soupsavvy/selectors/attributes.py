@@ -16,6 +16,7 @@ import soupsavvy.selectors.namespace as ns
 from soupsavvy.base import SoupSelector
 from soupsavvy.interfaces import IElement
 from soupsavvy.selectors.namespace import PatternType
+from soupsavvy.utils.names import intern_name
 
 
 @dataclass
@@ -65,11 +66,14 @@ class AttributeSelector(SoupSelector):
     https://developer.mozilla.org/en-US/docs/Web/CSS/Attribute_selectors
     """
 
+    _CONTEXT_FREE = True
+
     name: str
     value: Optional[PatternType] = None
 
     def __post_init__(self) -> None:
         """Sets pattern attribute used in `SoupSelector` find operations."""
+        self.name = intern_name(self.name)
         self._pattern = self._parse_pattern()
 
     def _parse_pattern(self) -> PatternType:
@@ -83,7 +87,7 @@ class AttributeSelector(SoupSelector):
         # value is already a compiled regex pattern
         return self.value
 
-    def find_all(
+    def _find_all(
         self,
         tag: IElement,
         recursive: bool = True,
@@ -92,6 +96,24 @@ class AttributeSelector(SoupSelector):
         params = {self.name: self._pattern}
         return tag.find_all(attrs=params, recursive=recursive, limit=limit)
 
+    @property
+    def _requirements(self) -> frozenset[tuple[str, str]]:
+        # only single class token is known to be present on matched elements
+        if (
+            self.name == "class"
+            and isinstance(self._pattern, str)
+            and len(self._pattern.split()) == 1
+        ):
+            return frozenset({("class", self._pattern)})
+
+        return frozenset()
+
+    @property
+    def _parse_filter(
+        self,
+    ) -> Optional[tuple[Optional[str], dict[str, list[PatternType]]]]:
+        return None, {self.name: [self._pattern]}
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, self.__class__):
             return NotImplemented
@@ -27,6 +27,7 @@ from typing import Optional, Type
 from typing_extensions import deprecated
 
 from soupsavvy.base import CompositeSoupSelector, SoupSelector
+from soupsavvy.indexing.index import get_index
 from soupsavvy.interfaces import IElement
 from soupsavvy.selectors.logical import SelectorList as _SelectorList
 from soupsavvy.selectors.relative import (
@@ -38,7 +39,7 @@ from soupsavvy.selectors.relative import (
     RelativeSelector,
     RelativeSubsequentSibling,
 )
-from soupsavvy.utils.selector_utils import TagIterator, TagResultSet
+from soupsavvy.utils.selector_utils import TagResultSet
 
 
 @deprecated("`SelectorList` was moved to `soupsavvy.selectors.logical` module.")
@@ -136,6 +137,36 @@ class BaseCombinator(CompositeSoupSelector):
         """
         return TagResultSet(step.find_all(tag, recursive=recursive))
 
+    def _find_next_step(
+        self, step: SoupSelector, results: TagResultSet, tag: IElement
+    ) -> TagResultSet:
+        """
+        Returns results of the next step in the combinator selector,
+        given results of the previous step, which are used as anchors.
+
+        Parameters
+        ----------
+        step: SoupSelector
+            Selector of the next step in the combinator.
+        results: TagResultSet
+            Results of the previous step in the combinator.
+        tag: Tag
+            Initial Tag object that was passed to find_all method.
+
+        Returns
+        -------
+        TagResultSet
+            Results of the next step in the combinator selector.
+        """
+        selector = self._selector(step)
+        return TagResultSet(
+            reduce(
+                list.__add__,
+                # each relative selector has defined recursive behavior
+                (selector.find_all(element) for element in results.fetch()),
+            )
+        )
+
     def _order_results(
         self, results: TagResultSet, tag: IElement, recursive: bool
     ) -> TagResultSet:
@@ -157,9 +188,9 @@ class BaseCombinator(CompositeSoupSelector):
         TagResultSet
             Ordered results of the combinator selector.
         """
-        return TagResultSet(list(TagIterator(tag, recursive=True))) & results
+        return results.within(tag, recursive=True)
 
-    def find_all(
+    def _find_all(
         self,
         tag: IElement,
         recursive: bool = True,
@@ -177,14 +208,7 @@ class BaseCombinator(CompositeSoupSelector):
             if not results:
                 break
 
-            selector = self._selector(step)
-            results = TagResultSet(
-                reduce(
-                    list.__add__,
-                    # each relative selector has defined recursive behavior
-                    (selector.find_all(element) for element in results.fetch()),
-                )
-            )
+            results = self._find_next_step(step=step, results=results, tag=tag)
 
         results = self._order_results(results=results, tag=tag, recursive=recursive)
         return results.fetch(limit)
@@ -211,7 +235,7 @@ class BaseAncestorCombinator(BaseCombinator):
         self, results: TagResultSet, tag: IElement, recursive: bool
     ) -> TagResultSet:
         # respect recursive parameter while ordering results
-        return TagResultSet(list(TagIterator(tag, recursive=recursive))) & results
+        return results.within(tag, recursive=recursive)
 
 
 class ChildCombinator(BaseCombinator):
@@ -395,6 +419,38 @@ class DescendantCombinator(BaseCombinator):
     def _selector(self) -> Type[RelativeSelector]:
         return RelativeDescendant
 
+    def _find_next_step(
+        self, step: SoupSelector, results: TagResultSet, tag: IElement
+    ) -> TagResultSet:
+        # with indexed document, context-free step is searched only once
+        # and its results are filtered with interval checks of anchors,
+        # which avoids repeated searches of nested anchors
+        index = get_index(tag)
+
+        if index is None or not step._context_free:
+            return super()._find_next_step(step=step, results=results, tag=tag)
+
+        anchors = results.fetch()
+        extents = [index.extent(anchor) for anchor in anchors]
+        scope = index.extent(tag)
+
+        if scope is None or None in extents:
+            return super()._find_next_step(step=step, results=results, tag=tag)
+
+        # searching anchors separately is cheaper, if their subtrees
+        # do not cover at least as many elements as the initial element
+        covered = sum(end - start for start, end in extents)  # type: ignore
+
+        if covered < scope[1] - scope[0]:
+            return super()._find_next_step(step=step, results=results, tag=tag)
+
+        elements = index.descendants_of(anchors, step.find_all(tag))
+
+        if elements is None:
+            return super()._find_next_step(step=step, results=results, tag=tag)
+
+        return TagResultSet(elements)
+
 
 class ParentCombinator(BaseAncestorCombinator):
     """
@@ -18,7 +18,7 @@ class SoupsieveApi(SelectionApi):
         super().__init__(compiled)
 
     def select(self, element: IElement) -> list[IElement]:
-        return [element.from_node(node) for node in self.selector.select(element.node)]
+        return [element._wrap(node) for node in self.selector.select(element.node)]
 
 
 class CSSSelectApi(SelectionApi):
@@ -38,7 +38,7 @@ class CSSSelectApi(SelectionApi):
         super().__init__(compiled)
 
     def select(self, element: IElement) -> list[IElement]:
-        return [element.from_node(node) for node in self.selector(element.node)]
+        return [element._wrap(node) for node in self.selector(element.node)]
 
 
 class SeleniumCSSApi(SelectionApi):
@@ -56,7 +56,7 @@ class SeleniumCSSApi(SelectionApi):
                 f"is not valid: {self.selector}"
             ) from e
 
-        return [element.from_node(node) for node in found]
+        return [element._wrap(node) for node in found]
 
 
 class PlaywrightCSSApi(SelectionApi):
@@ -73,4 +73,4 @@ class PlaywrightCSSApi(SelectionApi):
                 f"is not valid: {self.selector}"
             ) from e
 
-        return [element.from_node(node) for node in found]
+        return list(element._map(found))
@@ -27,7 +27,7 @@ from typing import Optional
 
 from soupsavvy.base import SelectableCSS, SoupSelector
 from soupsavvy.interfaces import IElement
-from soupsavvy.utils.selector_utils import TagIterator, TagResultSet
+from soupsavvy.utils.selector_utils import TagResultSet
 
 
 class CSSSoupSelector(SoupSelector, SelectableCSS):
@@ -60,7 +60,7 @@ class CSSSoupSelector(SoupSelector, SelectableCSS):
     def css(self) -> str:
         return self._selector
 
-    def find_all(
+    def _find_all(
         self,
         tag: IElement,
         recursive: bool = True,
@@ -68,8 +68,7 @@ class CSSSoupSelector(SoupSelector, SelectableCSS):
     ) -> list[IElement]:
         api = tag.css(self._selector)
         selected = api.select(tag)
-        iterator = TagIterator(tag, recursive=recursive)
-        result = TagResultSet(list(iterator)) & TagResultSet(selected)
+        result = TagResultSet(selected).within(tag, recursive=recursive)
         return result.fetch(limit)
 
     def __eq__(self, other: object) -> bool:
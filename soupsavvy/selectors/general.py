@@ -19,7 +19,9 @@ from typing_extensions import deprecated
 
 import soupsavvy.selectors.namespace as ns
 from soupsavvy.base import SelectableCSS, SoupSelector
+from soupsavvy.indexing.index import get_index
 from soupsavvy.interfaces import IElement
+from soupsavvy.utils.names import intern_name
 from soupsavvy.utils.selector_utils import TagIterator
 
 
@@ -65,9 +67,15 @@ class TypeSelector(SoupSelector, SelectableCSS):
     https://developer.mozilla.org/en-US/docs/Web/CSS/Type_selectors
     """
 
+    _CONTEXT_FREE = True
+
     name: str
 
-    def find_all(
+    def __post_init__(self) -> None:
+        """Replaces name with its interned, identity-comparable instance."""
+        self.name = intern_name(self.name)
+
+    def _find_all(
         self,
         tag: IElement,
         recursive: bool = True,
@@ -75,6 +83,16 @@ class TypeSelector(SoupSelector, SelectableCSS):
     ) -> list[IElement]:
         return tag.find_all(name=self.name, recursive=recursive, limit=limit)
 
+    @property
+    def _requirements(self) -> frozenset[tuple[str, str]]:
+        return frozenset({("tag", self.name)})
+
+    @property
+    def _parse_filter(
+        self,
+    ) -> Optional[tuple[Optional[str], dict[str, list[ns.PatternType]]]]:
+        return self.name, {}
+
     @property
     def css(self) -> str:
         # css selector for tag name is just the tag name ex. "div"
@@ -130,6 +148,8 @@ class PatternSelector(SoupSelector):
     Only leaf nodes can be returned by `PatternSelector` find methods.
     """
 
+    _CONTEXT_FREE = True
+
     pattern: ns.PatternType
 
     def __post_init__(self) -> None:
@@ -138,12 +158,25 @@ class PatternSelector(SoupSelector):
             str(self.pattern) if not isinstance(self.pattern, Pattern) else self.pattern
         )
 
-    def find_all(
+    def _find_all(
         self,
         tag: IElement,
         recursive: bool = True,
         limit: Optional[int] = None,
     ) -> list[IElement]:
+        index = get_index(tag)
+
+        if index is not None:
+            found = index.find_text(tag, self.pattern, recursive=recursive, limit=limit)
+
+            if found is not None:
+                return found
+
+        found = tag._find_text(self.pattern, recursive=recursive, limit=limit)
+
+        if found is not None:
+            return found
+
         iterator = TagIterator(tag, recursive=recursive)
 
         def _has_children(x: IElement) -> bool:
@@ -157,12 +190,7 @@ class PatternSelector(SoupSelector):
             return True
 
         filter_ = filter(
-            lambda x: not _has_children(x)
-            and (
-                self.pattern.search(x.text)
-                if isinstance(self.pattern, Pattern)
-                else x.text == self.pattern
-            ),
+            lambda x: not _has_children(x) and x.match_text(self.pattern),
             iterator,
         )
         return list(itertools.islice(filter_, limit))
@@ -204,7 +232,9 @@ class UniversalSelector(SoupSelector, SelectableCSS):
     https://developer.mozilla.org/en-US/docs/Web/CSS/Universal_selectors
     """
 
-    def find_all(
+    _CONTEXT_FREE = True
+
+    def _find_all(
         self,
         tag: IElement,
         recursive: bool = True,
@@ -245,7 +275,7 @@ class SelfSelector(SoupSelector):
     Can be used in user-defined model for scope if element itself is the scope.
     """
 
-    def find_all(
+    def _find_all(
         self,
         tag: IElement,
         recursive: bool = True,
@@ -294,9 +324,11 @@ class ExpressionSelector(SoupSelector):
     If raised, it will be propagated to the caller.
     """
 
+    _CONTEXT_FREE = True
+
     f: Callable[[IElement], bool]
 
-    def find_all(
+    def _find_all(
         self,
         tag: IElement,
         recursive: bool = True,
@@ -12,7 +12,7 @@ Classes
 
 from collections import Counter
 from functools import reduce
-from typing import Optional
+from typing import Optional, Pattern, Union
 
 from soupsavvy.base import CompositeSoupSelector, SoupSelector
 from soupsavvy.interfaces import IElement
@@ -56,6 +56,8 @@ class SelectorList(CompositeSoupSelector):
     https://developer.mozilla.org/en-US/docs/Web/CSS/Selector_list
     """
 
+    _CONTEXT_FREE = True
+
     def __init__(
         self,
         selector1: SoupSelector,
@@ -78,7 +80,7 @@ class SelectorList(CompositeSoupSelector):
         """
         super().__init__([selector1, selector2, *selectors])
 
-    def find_all(
+    def _find_all(
         self,
         tag: IElement,
         recursive: bool = True,
@@ -92,7 +94,7 @@ class SelectorList(CompositeSoupSelector):
             )
 
         # keep order of tags and limit
-        results = TagResultSet(list(TagIterator(tag, recursive=recursive))) & results
+        results = results.within(tag, recursive=recursive)
         return results.fetch(limit)
 
 
@@ -138,6 +140,8 @@ class NotSelector(CompositeSoupSelector):
     https://developer.mozilla.org/en-US/docs/Web/CSS/:not
     """
 
+    _CONTEXT_FREE = True
+
     def __init__(
         self,
         selector: SoupSelector,
@@ -161,7 +165,7 @@ class NotSelector(CompositeSoupSelector):
         self._multiple = bool(selectors)
         super().__init__([selector, *selectors])
 
-    def find_all(
+    def _find_all(
         self,
         tag: IElement,
         recursive: bool = True,
@@ -227,6 +231,8 @@ class AndSelector(CompositeSoupSelector):
     https://developer.mozilla.org/en-US/docs/Web/CSS/CSS_selectors/Selector_structure#compound_selector
     """
 
+    _CONTEXT_FREE = True
+
     def __init__(
         self,
         selector1: SoupSelector,
@@ -249,7 +255,7 @@ class AndSelector(CompositeSoupSelector):
         """
         super().__init__([selector1, selector2, *selectors])
 
-    def find_all(
+    def _find_all(
         self,
         tag: IElement,
         recursive: bool = True,
@@ -264,6 +270,40 @@ class AndSelector(CompositeSoupSelector):
         )
         return matching.fetch(limit)
 
+    @property
+    def _requirements(self) -> frozenset[tuple[str, str]]:
+        # matched elements satisfy requirements of all selectors
+        return frozenset().union(*(step._requirements for step in self.selectors))
+
+    @property
+    def _parse_filter(
+        self,
+    ) -> Optional[tuple[Optional[str], dict[str, list[Union[str, Pattern[str]]]]]]:
+        name = None
+        attrs: dict[str, list[Union[str, Pattern[str]]]] = {}
+
+        # filters of all selectors are merged, unless tag names conflict,
+        # element needs to match all values required for the same attribute
+        for step in self.selectors:
+            filter_ = step._parse_filter
+
+            if filter_ is None:
+                return None
+
+            step_name, step_attrs = filter_
+
+            if step_name is not None:
+                if name is not None and name != step_name:
+                    return None
+
+                name = step_name
+
+            for attr, values in step_attrs.items():
+                required = attrs.setdefault(attr, [])
+                required.extend(value for value in values if value not in required)
+
+        return name, attrs
+
 
 class XORSelector(CompositeSoupSelector):
     """
@@ -293,6 +333,8 @@ class XORSelector(CompositeSoupSelector):
     ... xor = (selector1 & (~selector2)) | ((~selector1) & selector2)
     """
 
+    _CONTEXT_FREE = True
+
     def __init__(
         self,
         selector1: SoupSelector,
@@ -315,7 +357,7 @@ class XORSelector(CompositeSoupSelector):
         """
         super().__init__([selector1, selector2, *selectors])
 
-    def find_all(
+    def _find_all(
         self,
         tag: IElement,
         recursive: bool = True,
@@ -334,5 +376,5 @@ class XORSelector(CompositeSoupSelector):
             ]
         )
         # keep order of tags and limit
-        results = TagResultSet(list(TagIterator(tag, recursive=recursive))) & results
+        results = results.within(tag, recursive=recursive)
         return results.fetch(limit)
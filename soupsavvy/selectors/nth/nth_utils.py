@@ -61,6 +61,8 @@ class NthGenerator:
     to filter out the elements that match the selector.
     """
 
+    __slots__ = ("step", "offset")
+
     step: int
     offset: int
 
@@ -59,7 +59,13 @@ class BaseNthOfSelector(SoupSelector):
         """
         return self._selector
 
-    def find_all(
+    @property
+    def _context_free(self) -> bool:
+        # selector is anchored at parents of matched elements,
+        # which is independent of searched element only for context-free selector
+        return self.selector._context_free
+
+    def _find_all(
         self,
         tag: IElement,
         recursive: bool = True,
@@ -82,9 +88,7 @@ class BaseNthOfSelector(SoupSelector):
             ]
 
         # keep order of tags and limit
-        results = TagResultSet(
-            list(TagIterator(tag, recursive=recursive))
-        ) & TagResultSet(matches)
+        results = TagResultSet(matches).within(tag, recursive=recursive)
 
         return results.fetch(limit)
 
@@ -208,7 +212,13 @@ class OnlyOfSelector(SoupSelector):
         """
         self.selector = check_selector(selector)
 
-    def find_all(
+    @property
+    def _context_free(self) -> bool:
+        # matching siblings are searched from their parent, which gives the same
+        # results regardless of searched element only for context-free selector
+        return self.selector._context_free
+
+    def _find_all(
         self,
         tag: IElement,
         recursive: bool = True,
@@ -226,9 +236,7 @@ class OnlyOfSelector(SoupSelector):
         matches = [elements[0] for elements in matching if len(elements) == 1]
 
         # keep order of tags and limit
-        results = TagResultSet(
-            list(TagIterator(tag, recursive=recursive))
-        ) & TagResultSet(matches)
+        results = TagResultSet(matches).within(tag, recursive=recursive)
 
         return results.fetch(limit)
 
@@ -15,9 +15,11 @@ Classes
 """
 
 from abc import abstractmethod
+from collections.abc import Callable
 from typing import Optional
 
 from soupsavvy.base import CompositeSoupSelector, SoupSelector, check_selector
+from soupsavvy.indexing.index import DocumentIndex, get_index
 from soupsavvy.interfaces import IElement
 from soupsavvy.utils.selector_utils import TagIterator, TagResultSet
 
@@ -115,7 +117,7 @@ class BaseRelativeSibling(RelativeSelector):
             "Method '_func' needs to be implemented in child class."
         )
 
-    def find_all(
+    def _find_all(
         self,
         tag: IElement,
         recursive: bool = True,
@@ -144,7 +146,7 @@ class BaseAncestorSelector(RelativeSelector):
 
     _limit: Optional[int]
 
-    def find_all(
+    def _find_all(
         self,
         tag: IElement,
         recursive: bool = True,
@@ -194,12 +196,15 @@ class RelativeChild(RelativeSelector):
     and `ChildCombinator` selectors.
     """
 
-    def find_all(
+    def _find_all(
         self,
         tag: IElement,
         recursive: bool = True,
         limit: Optional[int] = None,
     ) -> list[IElement]:
+        if _cannot_contain(tag, self.selector):
+            return []
+
         return self.selector.find_all(tag, recursive=False, limit=limit)
 
 
@@ -233,12 +238,15 @@ class RelativeDescendant(RelativeSelector):
     'HasSelector' and `DescendantCombinator` selectors.
     """
 
-    def find_all(
+    def _find_all(
         self,
         tag: IElement,
         recursive: bool = True,
         limit: Optional[int] = None,
     ) -> list[IElement]:
+        if _cannot_contain(tag, self.selector):
+            return []
+
         return self.selector.find_all(tag, recursive=True, limit=limit)
 
 
@@ -582,7 +590,71 @@ class HasSelector(CompositeSoupSelector):
         """
         super().__init__([selector, *selectors])
 
-    def find_all(
+    @property
+    def _context_free(self) -> bool:
+        # selectors are always anchored at checked element,
+        # regardless of the element the search was started from
+        return True
+
+    def _get_check(
+        self,
+        step: SoupSelector,
+        tag: IElement,
+        index: Optional[DocumentIndex],
+    ) -> Callable[[IElement], bool]:
+        """
+        Returns function checking if anything matching the step
+        is found when anchored against the element.
+
+        If document is indexed and selector of descendant or child step
+        is context-free, it is searched only once in the initial element
+        and each element is checked in constant time with its interval numbering,
+        instead of searching separately anchored against each element.
+
+        Parameters
+        ----------
+        step : SoupSelector
+            Selector, which is anchored against checked elements.
+        tag : IElement
+            Initial element that was passed to find_all method.
+        index : DocumentIndex, optional
+            Index of the document, if enabled.
+
+        Returns
+        -------
+        Callable[[IElement], bool]
+            Function checking if the element is matched by the step.
+        """
+        selector = step.selector if isinstance(step, RelativeSelector) else step
+
+        if index is None or not selector._context_free:
+            return lambda element: bool(step.find(element))
+
+        if isinstance(step, RelativeChild):
+            parents = {
+                index.parent_position(element) for element in selector.find_all(tag)
+            }
+
+            if None not in parents:
+                return lambda element: index.position(element) in parents
+
+        elif not isinstance(step, RelativeSelector) or isinstance(
+            step, RelativeDescendant
+        ):
+            positions = index.positions(selector.find_all(tag))
+
+            if positions is not None:
+                return lambda element: bool(index.has_within(element, positions))
+
+        if not isinstance(step, RelativeSelector):
+            # plain selector is searched within element, its subtree can be pruned
+            return lambda element: not _cannot_contain(element, step, index) and bool(
+                step.find(element)
+            )
+
+        return lambda element: bool(step.find(element))
+
+    def _find_all(
         self,
         tag: IElement,
         recursive: bool = True,
@@ -590,14 +662,52 @@ class HasSelector(CompositeSoupSelector):
     ) -> list[IElement]:
 
         elements = TagIterator(tag, recursive=recursive)
+        index = get_index(tag)
+        checks = [
+            self._get_check(step, tag=tag, index=index) for step in self.selectors
+        ]
         matching: list[IElement] = []
 
         for element in elements:
             # we only care if anything matching was found
-            if any(step.find(element) for step in self.selectors):
+            if any(check(element) for check in checks):
                 matching.append(element)
 
                 if len(matching) == limit:
                     break
 
         return matching
+
+
+def _cannot_contain(
+    tag: IElement,
+    selector: SoupSelector,
+    index: Optional[DocumentIndex] = None,
+) -> bool:
+    """
+    Checks with subtree summary of indexed document if subtree of the element
+    definitely does not contain anything matching the selector.
+
+    Parameters
+    ----------
+    tag : IElement
+        Element, which subtree is going to be searched.
+    selector : SoupSelector
+        Selector used for search.
+    index : DocumentIndex, optional
+        Index of the document, retrieved from the element if not provided.
+
+    Returns
+    -------
+    bool
+        True if search can be skipped, False otherwise.
+    """
+    requirements = selector._requirements
+
+    if not requirements:
+        return False
+
+    if index is None:
+        index = get_index(tag)
+
+    return index is not None and index.may_contain(tag, requirements) is False
@@ -38,7 +38,7 @@ class LXMLXpathApi(SelectionApi):
             )
             return []
 
-        return [element.from_node(node) for node in selected]
+        return [element._wrap(node) for node in selected]
 
 
 class SeleniumXPathApi(SelectionApi):
@@ -56,7 +56,7 @@ class SeleniumXPathApi(SelectionApi):
                 f"is not valid: {self.selector}"
             ) from e
 
-        return [element.from_node(node) for node in selected]
+        return [element._wrap(node) for node in selected]
 
 
 class PlaywrightXPathApi(SelectionApi):
@@ -73,4 +73,4 @@ class PlaywrightXPathApi(SelectionApi):
                 f"is not valid: {self.selector}"
             ) from e
 
-        return [element.from_node(node) for node in selected]
+        return list(element._map(selected))
@@ -12,7 +12,7 @@ from typing import Any, Optional
 
 from soupsavvy.base import SoupSelector
 from soupsavvy.interfaces import IElement
-from soupsavvy.utils.selector_utils import TagIterator, TagResultSet
+from soupsavvy.utils.selector_utils import TagResultSet
 
 
 class XPathSelector(SoupSelector):
@@ -61,7 +61,7 @@ class XPathSelector(SoupSelector):
         """
         self.xpath = xpath
 
-    def find_all(
+    def _find_all(
         self,
         tag: IElement,
         recursive: bool = True,
@@ -69,8 +69,7 @@ class XPathSelector(SoupSelector):
     ) -> list[IElement]:
         api = tag.xpath(self.xpath)
         selected = api.select(tag)
-        iterator = TagIterator(tag, recursive=recursive)
-        result = TagResultSet(list(iterator)) & TagResultSet(selected)
+        result = TagResultSet(selected).within(tag, recursive=recursive)
         return result.fetch(limit)
 
     def __eq__(self, other: Any) -> bool:
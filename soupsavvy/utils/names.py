@@ -0,0 +1,144 @@
+"""
+Module with global table of interned tag and attribute names of selectors.
+
+Names of tags and attributes repeat across all elements and documents,
+while selectors compare them millions of times per page. Selectors register
+their names in `NAMES` table, which holds a single canonical instance
+of each name. Compact documents reuse canonical instances for names
+of their per-document tables, which are already registered by selectors,
+so comparisons of such names succeed on identity check of `str` equality.
+
+Only selectors register names, so the table is bounded by the number
+of selectors created by the program and does not grow with names
+of parsed documents, which may be unique per page, like scoped style
+attributes generated by frontend frameworks.
+
+Notes
+-----
+`bs4` and `lxml` backends do not benefit from the table, as their parsers
+create name strings, which are not controlled by `soupsavvy`.
+
+Classes
+-------
+- `NameTable` - Table of interned names.
+
+Functions
+---------
+- `intern_name` - Registers the name in global table and returns its instance.
+- `canonical_name` - Returns registered instance of the name if there is one.
+"""
+
+from __future__ import annotations
+
+import sys
+from threading import Lock
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+class NameTable:
+    """
+    Table of interned names, which maps names to their canonical instances.
+
+    Example
+    -------
+    >>> table = NameTable()
+    ... table.intern("".join(["d", "iv"])) is table.intern("div")
+    True
+    ... table.canonical("".join(["d", "iv"])) is table.intern("div")
+    True
+    """
+
+    def __init__(self) -> None:
+        """Initializes empty table."""
+        self._names: dict[str, str] = {}
+        self._lock = Lock()
+
+    def intern(self, name: str) -> str:
+        """
+        Returns canonical instance of the name, registering it if missing.
+
+        Parameters
+        ----------
+        name : str
+            Name of tag or attribute.
+
+        Returns
+        -------
+        str
+            Canonical instance equal to the name.
+        """
+        canonical = self._names.get(name)
+
+        if canonical is not None:
+            return canonical
+
+        with self._lock:
+            return self._names.setdefault(name, sys.intern(name))
+
+    def canonical(self, name: str) -> str:
+        """
+        Returns canonical instance of the name without registering it.
+
+        Parameters
+        ----------
+        name : str
+            Name of tag or attribute.
+
+        Returns
+        -------
+        str
+            Canonical instance equal to the name if it was registered,
+            otherwise the name itself.
+        """
+        return self._names.get(name, name)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._names
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+
+# global table of names registered by selectors
+NAMES = NameTable()
+
+
+def intern_name(name: T) -> T:
+    """
+    Registers the name in global table and returns its canonical instance.
+    Values other than strings are returned unchanged.
+
+    Parameters
+    ----------
+    name : str
+        Name of tag or attribute used by selector.
+
+    Returns
+    -------
+    str
+        Canonical, identity-comparable instance of the name.
+    """
+    if type(name) is not str:
+        return name
+
+    return NAMES.intern(name)  # type: ignore[return-value]
+
+
+def canonical_name(name: str) -> str:
+    """
+    Returns canonical instance of the name from global table
+    if it was registered by any selector, otherwise the name itself.
+
+    Parameters
+    ----------
+    name : str
+        Name of tag or attribute of the document.
+
+    Returns
+    -------
+    str
+        Canonical instance of the name or the name itself.
+    """
+    return NAMES.canonical(name)
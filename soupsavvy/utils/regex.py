@@ -0,0 +1,226 @@
+"""
+Module with translation of python regex patterns into JavaScript.
+
+Browser implementations evaluate regex patterns in the page to avoid
+a round trip per matched element. Patterns are translated from parsed
+python pattern into JavaScript source with unicode flag, which matches
+the same strings, so results of the page are not verified again.
+Patterns using features, that can not be expressed in JavaScript with the
+same semantics, like case-insensitive matching, which folds case differently,
+are not translated and need to be matched in python.
+
+Functions
+---------
+- `to_js_regex` - Translates python pattern into JavaScript source and flags.
+"""
+
+from __future__ import annotations
+
+import re
+import sys
+from typing import Optional, Pattern
+
+try:
+    # python 3.11+
+    from re import _parser as sre_parse  # type: ignore[attr-defined]
+except ImportError:  # pragma: no cover
+    import sre_parse  # type: ignore[no-redef]
+
+# flags of JavaScript patterns, unicode flag enables `\u{...}` and `\p{...}`
+FLAGS = "u"
+# flags, which are translated into the pattern itself or have no effect
+_SUPPORTED_FLAGS = re.UNICODE | re.ASCII | re.MULTILINE | re.DOTALL | re.VERBOSE
+
+# characters matched by `\s` in python, which differs from JavaScript
+_ASCII_SPACE = " \t\n\r\f\v"
+_UNICODE_SPACE = (
+    _ASCII_SPACE + "\x1c\x1d\x1e\x1f\x85\xa0\u1680\u2000\u2001\u2002\u2003\u2004"
+    "\u2005\u2006\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000"
+)
+
+
+class _Untranslatable(Exception):
+    """Raised when part of the pattern can not be translated."""
+
+
+def to_js_regex(pattern: Pattern[str]) -> Optional[tuple[str, str]]:
+    """
+    Translates python regex pattern into JavaScript pattern source and flags,
+    which matches the same strings with `RegExp.prototype.test`,
+    as `re.search` does in python.
+
+    Parameters
+    ----------
+    pattern : Pattern[str]
+        Compiled python regex pattern.
+
+    Returns
+    -------
+    tuple[str, str] | None
+        Source and flags of JavaScript pattern,
+        None if pattern can not be translated.
+
+    Example
+    -------
+    >>> to_js_regex(re.compile(r"^/product/\\d+$"))
+    ('(?<![\\s\\S])\\u{2f}product\\u{2f}\\p{Nd}{1,}(?=\\n?(?![\\s\\S]))', 'u')
+    """
+    if not isinstance(pattern.pattern, str) or pattern.flags & ~_SUPPORTED_FLAGS:
+        return None
+
+    try:
+        parsed = sre_parse.parse(pattern.pattern, pattern.flags)
+        source = _Translator(pattern.flags).sequence(parsed)
+    except (_Untranslatable, re.error):
+        return None
+
+    return source, FLAGS
+
+
+class _Translator:
+    """Translates parsed python pattern into JavaScript source."""
+
+    def __init__(self, flags: int) -> None:
+        self.ascii = bool(flags & re.ASCII)
+        self.multiline = bool(flags & re.MULTILINE)
+        self.dotall = bool(flags & re.DOTALL)
+
+    def sequence(self, items) -> str:
+        """Translates sequence of parsed items."""
+        return "".join(self.item(op, argument) for op, argument in items)
+
+    def item(self, op, argument) -> str:
+        """Translates single parsed item."""
+        if op is sre_parse.LITERAL:
+            return _escape(argument)
+
+        if op is sre_parse.NOT_LITERAL:
+            return f"[^{_escape(argument)}]"
+
+        if op is sre_parse.ANY:
+            return r"[\s\S]" if self.dotall else r"[^\n]"
+
+        if op is sre_parse.IN:
+            return self.set(argument)
+
+        if op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT):
+            low, high, items = argument
+            high = "" if high == sre_parse.MAXREPEAT else str(high)
+            lazy = "?" if op is sre_parse.MIN_REPEAT else ""
+            return f"(?:{self.sequence(items)}){{{low},{high}}}{lazy}"
+
+        if op is sre_parse.SUBPATTERN:
+            group, add_flags, del_flags, items = argument
+
+            if add_flags or del_flags:
+                raise _Untranslatable("scoped flags")
+
+            prefix = "" if group is not None else "?:"
+            return f"({prefix}{self.sequence(items)})"
+
+        if op is sre_parse.BRANCH:
+            _, branches = argument
+            return f"(?:{'|'.join(self.sequence(branch) for branch in branches)})"
+
+        if op is sre_parse.GROUPREF:
+            return f"\\{argument}"
+
+        if op in (sre_parse.ASSERT, sre_parse.ASSERT_NOT):
+            direction, items = argument
+            behind = "<" if direction < 0 else ""
+            sign = "=" if op is sre_parse.ASSERT else "!"
+            return f"(?{behind}{sign}{self.sequence(items)})"
+
+        if op is sre_parse.AT:
+            return self.at(argument)
+
+        raise _Untranslatable(str(op))
+
+    def at(self, argument) -> str:
+        """Translates anchors and boundaries."""
+        if argument is sre_parse.AT_BEGINNING_STRING or (
+            argument is sre_parse.AT_BEGINNING and not self.multiline
+        ):
+            return r"(?<![\s\S])"
+
+        if argument is sre_parse.AT_BEGINNING:
+            return r"(?<![^\n])"
+
+        if argument is sre_parse.AT_END_STRING:
+            return r"(?![\s\S])"
+
+        if argument is sre_parse.AT_END:
+            return r"(?=\n|(?![\s\S]))" if self.multiline else r"(?=\n?(?![\s\S]))"
+
+        word = self.category(sre_parse.CATEGORY_WORD)
+
+        if argument is sre_parse.AT_BOUNDARY:
+            return f"(?:(?<=[{word}])(?![{word}])|(?<![{word}])(?=[{word}]))"
+
+        if argument is sre_parse.AT_NON_BOUNDARY:
+            # python before 3.14 does not match `\B` in empty string,
+            # so at least one character needs to be adjacent to the position
+            adjacent = (
+                "" if sys.version_info >= (3, 14) else r"(?:(?<=[\s\S])|(?=[\s\S]))"
+            )
+            return f"(?:(?<=[{word}])(?=[{word}])|(?<![{word}])(?![{word}]){adjacent})"
+
+        raise _Untranslatable(str(argument))  # pragma: no cover
+
+    def set(self, items) -> str:
+        """Translates character set."""
+        negate = False
+        parts = []
+
+        for op, argument in items:
+            if op is sre_parse.NEGATE:
+                negate = True
+            elif op is sre_parse.LITERAL:
+                parts.append(_escape(argument))
+            elif op is sre_parse.RANGE:
+                low, high = argument
+                parts.append(f"{_escape(low)}-{_escape(high)}")
+            elif op is sre_parse.CATEGORY and argument in _NEGATED:
+                # negated category can not be combined with other items
+                if len(items) != 1:
+                    raise _Untranslatable("negated category in set")
+
+                return f"[^{self.category(_NEGATED[argument])}]"
+            elif op is sre_parse.CATEGORY:
+                parts.append(self.category(argument))
+            else:
+                raise _Untranslatable(str(op))
+
+        return f"[{'^' if negate else ''}{''.join(parts)}]"
+
+    def category(self, category) -> str:
+        """Returns items of character set matching the category."""
+        if category is sre_parse.CATEGORY_DIGIT:
+            return r"\d" if self.ascii else r"\p{Nd}"
+
+        if category is sre_parse.CATEGORY_WORD:
+            return r"\w" if self.ascii else r"\p{L}\p{N}_"
+
+        if category is sre_parse.CATEGORY_SPACE:
+            space = _ASCII_SPACE if self.ascii else _UNICODE_SPACE
+            return "".join(map(_escape, map(ord, space)))
+
+        raise _Untranslatable(str(category))  # pragma: no cover
+
+
+# negated categories mapped to their positive counterparts
+_NEGATED = {
+    sre_parse.CATEGORY_NOT_DIGIT: sre_parse.CATEGORY_DIGIT,
+    sre_parse.CATEGORY_NOT_WORD: sre_parse.CATEGORY_WORD,
+    sre_parse.CATEGORY_NOT_SPACE: sre_parse.CATEGORY_SPACE,
+}
+
+
+def _escape(code: int) -> str:
+    """Escapes character, so it is matched literally in JavaScript pattern."""
+    char = chr(code)
+
+    if char.isascii() and char.isalnum():
+        return char
+
+    return f"\\u{{{code:x}}}"
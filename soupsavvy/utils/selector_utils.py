@@ -12,38 +12,57 @@ Classes
 from __future__ import annotations
 
 from collections.abc import Iterable, Iterator
-from dataclasses import dataclass
 from itertools import chain
 from typing import Optional
 
+from soupsavvy.indexing.index import get_index
 from soupsavvy.interfaces import IElement
 
 
-@dataclass
 class TagIterator:
     """
     Wrapper class for iterating over `IElement` instances.
-
-    Parameters
-    ----------
-    tag : IElement
-        `IElement` to iterate over.
-    recursive : bool, optional
-        If True, iterates over all descendants, otherwise only over direct children.
-        Default is True.
-    include_self : bool, optional
-        If True, includes the element itself in iteration, default is False.
     """
 
-    tag: IElement
-    recursive: bool = True
-    include_self: bool = False
+    __slots__ = ("tag", "recursive", "include_self", "_iter")
+
+    def __init__(
+        self,
+        tag: IElement,
+        recursive: bool = True,
+        include_self: bool = False,
+    ) -> None:
+        """
+        Initializes iterator over the element.
+
+        Parameters
+        ----------
+        tag : IElement
+            `IElement` to iterate over.
+        recursive : bool, optional
+            If True, iterates over all descendants, otherwise only over direct children.
+            Default is True.
+        include_self : bool, optional
+            If True, includes the element itself in iteration, default is False.
+        """
+        self.tag = tag
+        self.recursive = recursive
+        self.include_self = include_self
 
     def _get_iterator(self) -> Iterator:
         """
         Returns iterator over `IElement` descendants or children
         based on recursive parameter value.
+        If document of the element is indexed, elements are taken from the index.
         """
+        index = get_index(self.tag)
+
+        if index is not None:
+            elements = index.elements(self.tag, recursive=self.recursive)
+
+            if elements is not None:
+                return iter(elements)
+
         return iter(self.tag.descendants if self.recursive else self.tag.children)
 
     def __iter__(self) -> TagIterator:
@@ -61,15 +80,32 @@ class TagIterator:
         return next(self._iter)
 
 
-@dataclass
 class ElementWrapper:
     """
     Wrapper class for `IElement` instances for operations applied in `TagResultSet`.
-    Operations such as setting attributes are performed on wrapper,
-    and original `IElement` instance is not modified.
+    Keeps position of the element in its collection and flag if the collection
+    is a base of set operation, used for restoring order of results.
     """
 
-    element: IElement
+    __slots__ = ("element", "order", "base")
+
+    def __init__(self, element: IElement, order: int = 0, base: bool = False) -> None:
+        """
+        Initializes wrapper of the element.
+
+        Parameters
+        ----------
+        element : IElement
+            Wrapped element.
+        order : int, optional
+            Position of the element in its collection, default is 0.
+        base : bool, optional
+            If True, collection of the element is a base of set operation,
+            default is False.
+        """
+        self.element = element
+        self.order = order
+        self.base = base
 
     def __hash__(self):
         """Hashes instance by `IElement` instance hash value."""
@@ -82,6 +118,9 @@ class ElementWrapper:
 
         return hash(self) == hash(other)
 
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(element={self.element!r})"
+
 
 class TagResultSet:
     """
@@ -95,9 +134,7 @@ class TagResultSet:
     It provides operations on sets of results like intersection and union.
     """
 
-    # constants used inside the class
-    _ORDER_ATTR = "_order"
-    _IS_BASE = "_base"
+    __slots__ = ("_elements",)
 
     def __init__(self, elements: Optional[list[IElement]] = None) -> None:
         """
@@ -131,6 +168,38 @@ class TagResultSet:
         ordered = self._sort(set_)
         return ordered[:n]
 
+    def within(self, tag: IElement, recursive: bool = True) -> TagResultSet:
+        """
+        Restricts results to descendants of provided element,
+        ordered by their appearance in the document.
+
+        If document of the element is indexed, it uses constant time interval
+        checks of the index, otherwise results are intersected with
+        all descendants of the element.
+
+        Parameters
+        ----------
+        tag : IElement
+            Element to restrict results to.
+        recursive : bool, optional
+            If False, only direct children of the element are kept.
+            Default is True.
+
+        Returns
+        -------
+        TagResultSet
+            New `TagResultSet` instance with restricted results.
+        """
+        index = get_index(tag)
+
+        if index is not None:
+            elements = index.restrict(tag, self._elements, recursive=recursive)
+
+            if elements is not None:
+                return TagResultSet(elements)
+
+        return TagResultSet(list(TagIterator(tag, recursive=recursive))) & self
+
     def _to_set(self, base: bool) -> set[ElementWrapper]:
         """
         Converts list of `IElement` from collection to set of UniqueTag instances.
@@ -144,16 +213,11 @@ class TagResultSet:
         Returns
         -------
         set[ElementWrapper]
-            Set of ElementWrapper instances with set helper attributes.
+            Set of ElementWrapper instances with their order and base flag.
         """
-        elements = [ElementWrapper(element) for element in self._elements]
-
-        for i, element in enumerate(elements):
-            # setting attributes used for restoring order
-            setattr(element, self._ORDER_ATTR, i)
-            setattr(element, self._IS_BASE, int(base))
-
-        return set(elements)
+        return {
+            ElementWrapper(element, i, base) for i, element in enumerate(self._elements)
+        }
 
     def _sort(self, it: Iterable[ElementWrapper]) -> list[IElement]:
         """
@@ -175,9 +239,9 @@ class TagResultSet:
                 it,
                 key=lambda x: (
                     # Sorting by base descending - base goes first
-                    -getattr(x, self.__class__._IS_BASE),
+                    not x.base,
                     # Sorting by order ascending
-                    getattr(x, self._ORDER_ATTR),
+                    x.order,
                 ),
             )
         ]
@@ -4,8 +4,9 @@ BS4 = "bs4"
 LXML = "lxml"
 SELENIUM = "selenium"
 PLAYWRIGHT = "playwright"
+COMPACT = "compact"
 
-IMPLEMENTATIONS = [BS4, LXML, SELENIUM, PLAYWRIGHT]
+IMPLEMENTATIONS = [BS4, LXML, SELENIUM, PLAYWRIGHT, COMPACT]
 
 
 def pytest_addoption(parser):
@@ -13,7 +13,7 @@ if sys.platform.startswith("win"):
     asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
 
 import threading
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from http.server import HTTPServer, SimpleHTTPRequestHandler
 from pathlib import Path
 from typing import Any, Optional, cast
@@ -26,16 +26,18 @@ from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
+from typing_extensions import Self
 
 from soupsavvy.base import BaseOperation, SoupSelector
 from soupsavvy.exceptions import BreakOperationException
 from soupsavvy.implementation.bs4 import SoupElement
+from soupsavvy.implementation.compact import CompactElement
 from soupsavvy.implementation.lxml import LXMLElement
 from soupsavvy.implementation.playwright import PlaywrightElement
 from soupsavvy.implementation.selenium import SeleniumElement
-from soupsavvy.interfaces import IElement
+from soupsavvy.interfaces import IAsyncElement, IElement
 from soupsavvy.models import BaseModel
-from tests.conftest import BS4, LXML, PLAYWRIGHT, SELENIUM
+from tests.conftest import BS4, COMPACT, LXML, PLAYWRIGHT, SELENIUM
 
 # default bs4 parser
 PARSER = "lxml"
@@ -56,6 +58,8 @@ def to_element(implementation: str) -> Callable[[str], IElement]:
         return to_selenium
     elif implementation == PLAYWRIGHT:
         return to_playwright
+    elif implementation == COMPACT:
+        return to_compact
     else:
         raise ValueError(f"Unknown implementation type: {implementation}")
 
@@ -69,10 +73,15 @@ def to_lxml(html: str, parser: str = PARSER) -> IElement:
     return find_body_element(LXMLElement(root))
 
 
+def to_compact(html: str, parser: str = PARSER) -> IElement:
+    root = fromstring(str(BeautifulSoup(html, parser)))
+    return find_body_element(CompactElement.from_lxml(root))
+
+
 @pytest.fixture(scope="session", autouse=True)
 def http_server(request):
     """Set up a simple HTTP server to serve the HTML file."""
-    if request.config.getoption("--impl") != SELENIUM:
+    if request.config.getoption("--impl") not in {SELENIUM, PLAYWRIGHT}:
         yield
         return
 
@@ -270,6 +279,50 @@ class MockClassWidgetSelector(_MockSimpleComparable):
         return tag.find_all(attrs={"class": "widget"}, recursive=recursive, limit=limit)
 
 
+class MockAsyncElement(IAsyncElement[IElement]):
+    """
+    Mock asynchronous element for testing purposes.
+    Wrapped element is its own snapshot and its elements are resolved unchanged.
+    Names of awaited methods are recorded in `calls` attribute.
+    """
+
+    __slots__ = ("calls",)
+
+    _NODE_TYPE = IElement
+
+    def __init__(self, node: IElement) -> None:
+        super().__init__(node)
+        self.calls: list[str] = []
+
+    async def snapshot(self) -> IElement:
+        self.calls.append("snapshot")
+        return self.node
+
+    async def resolve(self, elements: Iterable[IElement]) -> list[Self]:
+        self.calls.append("resolve")
+        # elements of the snapshot are the live elements of the mock
+        return cast(list[Self], list(elements))
+
+    async def get_name(self) -> str:
+        return self.node.name
+
+    async def get_text(self) -> str:
+        return self.node.text
+
+    async def get_attribute(self, name: str) -> Optional[str]:
+        return self.node.get_attribute(name)
+
+    async def get_attributes(self) -> dict[str, str]:
+        return self.node.attributes
+
+    async def get_parent(self) -> Optional[Self]:
+        parent = self.node.parent
+        return None if parent is None else self.__class__(parent)
+
+    async def get_children(self) -> list[Self]:
+        return [self.__class__(child) for child in self.node.children]
+
+
 class BaseMockOperation(BaseOperation):
     """
     Base class for mock operations used in tests.
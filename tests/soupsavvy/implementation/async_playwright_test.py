@@ -0,0 +1,401 @@
+"""
+Module with unit tests for asynchronous playwright implementation.
+Tests `AsyncPlaywrightElement` and `AsyncPlaywrightBrowser` components
+and the way they are searched with asynchronous methods of soupsavvy.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import cast
+
+import pytest
+from playwright.async_api import Page, async_playwright
+
+import soupsavvy.exceptions as exc
+from soupsavvy import ClassSelector, ExpressionSelector, TypeSelector
+from soupsavvy.implementation.async_playwright import (
+    AsyncPlaywrightBrowser,
+    AsyncPlaywrightElement,
+)
+from soupsavvy.implementation.compact import CompactElement
+from soupsavvy.implementation.snapshot import SNAPSHOT_ATTRIBUTE
+from soupsavvy.interfaces import IAsyncElement, IElement
+from soupsavvy.models import BaseModel
+from soupsavvy.operations import Text
+from tests.soupsavvy.conftest import URL
+
+HTML = """
+    <div class="item" id="first"><a href="/1">One</a></div>
+    <div class="item" id="second"><a href="/2">Two</a></div>
+    <p id="other"><a href="/3">Three</a></p>
+"""
+
+
+def run(test: Callable[[Page], Awaitable[None]]) -> None:
+    """
+    Runs asynchronous test with a new page in its own event loop.
+    Loop is run in separate thread, as event loop of the main thread
+    is used by synchronous playwright of other tests.
+    """
+
+    async def main() -> None:
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=True)
+
+            try:
+                await test(await browser.new_page())
+            finally:
+                await browser.close()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        executor.submit(asyncio.run, main()).result()
+
+
+async def to_element(page: Page, html: str) -> AsyncPlaywrightElement:
+    """Sets content of the page and returns its body element."""
+    await page.set_content(html)
+    body = await page.query_selector("body")
+    assert body is not None
+    return await AsyncPlaywrightElement.from_node(body)
+
+
+async def ids(elements: Sequence[IAsyncElement]) -> list:
+    """Returns ids of live elements."""
+    return [
+        await cast(AsyncPlaywrightElement, element).node.get_attribute("id")
+        for element in elements
+    ]
+
+
+class MockItem(BaseModel):
+    """Mock model for testing purposes."""
+
+    __scope__ = ClassSelector("item")
+
+    link = TypeSelector("a")
+    text = TypeSelector("a") | Text()
+
+
+class MockButton(BaseModel):
+    """Mock model with a button for testing purposes."""
+
+    __scope__ = ClassSelector("item")
+
+    button = TypeSelector("button")
+
+
+@pytest.mark.playwright
+@pytest.mark.implementation
+class TestAsyncPlaywrightElement:
+    """Class with unit tests for `AsyncPlaywrightElement` component."""
+
+    def test_raises_exception_when_invalid_init_node(self):
+        """
+        Tests if TypeError is raised when object of invalid type
+        is passed to constructor.
+        """
+        with pytest.raises(TypeError):
+            AsyncPlaywrightElement("<div></div>", identifier="1")  # type: ignore
+
+    def test_elements_of_the_same_node_are_equal(self):
+        """
+        Tests if elements created from different handles of the same node
+        are equal and have the same hash, while elements of other nodes are not.
+        """
+
+        async def test(page: Page):
+            await page.set_content(HTML)
+            first = await AsyncPlaywrightElement.from_node(
+                await page.query_selector("#first")  # type: ignore[arg-type]
+            )
+            same = await AsyncPlaywrightElement.from_node(
+                await page.query_selector("div.item")  # type: ignore[arg-type]
+            )
+            other = await AsyncPlaywrightElement.from_node(
+                await page.query_selector("#second")  # type: ignore[arg-type]
+            )
+
+            assert first == same
+            assert hash(first) == hash(same)
+            assert first != other
+
+        run(test)
+
+    def test_accessors_return_properties_of_live_element(self):
+        """
+        Tests if awaited accessors return name, text and attributes
+        of live element, reflecting its current state in the page.
+        """
+
+        async def test(page: Page):
+            element = await to_element(page, HTML)
+            found = await ClassSelector("item").afind(element, strict=True)
+            assert isinstance(found, AsyncPlaywrightElement)
+
+            assert await found.get_name() == "div"
+            assert await found.get_text() == "One"
+            assert await found.get_attributes() == {"class": "item", "id": "first"}
+            assert await found.get_attribute("id") == "first"
+            assert await found.get_attribute("title") is None
+
+            await page.evaluate(
+                "document.querySelector('#first').setAttribute('title', 'New')"
+            )
+            assert await found.get_attribute("title") == "New"
+
+        run(test)
+
+    def test_parent_and_children_are_live_elements(self):
+        """
+        Tests if `get_parent` and `get_children` return live elements
+        equal to elements found by selectors.
+        """
+
+        async def test(page: Page):
+            element = await to_element(page, HTML)
+            link = await TypeSelector("a").afind(element, strict=True)
+            assert isinstance(link, AsyncPlaywrightElement)
+
+            parent = await link.get_parent()
+            children = await element.get_children()
+
+            assert parent == await ClassSelector("item").afind(element)
+            assert await ids(children) == ["first", "second", "other"]
+            assert [await child.get_name() for child in children] == [
+                "div",
+                "div",
+                "p",
+            ]
+
+            document = await element.get_parent()
+            assert document is not None
+            assert await document.get_parent() is None
+
+        run(test)
+
+    def test_afind_all_executes_selector_in_page(self):
+        """
+        Tests if `afind_all` of the selector returns live elements
+        matching selector in document order.
+        """
+
+        async def test(page: Page):
+            element = await to_element(page, HTML)
+            selector = TypeSelector("div") | TypeSelector("p")
+
+            result = await selector.afind_all(element)
+
+            assert all(isinstance(found, AsyncPlaywrightElement) for found in result)
+            assert await ids(result) == ["first", "second", "other"]
+            assert await ids(await selector.afind_all(element, limit=1)) == ["first"]
+
+        run(test)
+
+    def test_afind_all_maps_results_of_unsupported_selectors_to_page(self):
+        """
+        Tests if selectors, which can not be executed in the page,
+        are searched in snapshot and their results are live elements.
+        """
+
+        async def test(page: Page):
+            element = await to_element(page, HTML)
+            selector = ExpressionSelector(
+                lambda element: element.get_attribute("id") == "second"
+            )
+
+            result = await selector.afind_all(element)
+
+            assert await ids(result) == ["second"]
+            assert result == (await TypeSelector("div").afind_all(element))[1:]
+
+        run(test)
+
+    def test_afind_returns_first_element_or_raises_if_strict(self):
+        """
+        Tests if `afind` returns first matching live element or None,
+        and raises `TagNotFoundException` if `strict` is True.
+        """
+
+        async def test(page: Page):
+            element = await to_element(page, HTML)
+
+            found = await ClassSelector("item").afind(element)
+            assert found is not None
+            assert await ids([found]) == ["first"]
+            assert await TypeSelector("table").afind(element) is None
+
+            with pytest.raises(exc.TagNotFoundException):
+                await TypeSelector("table").afind(element, strict=True)
+
+        run(test)
+
+    def test_snapshot_returns_copy_of_element(self):
+        """
+        Tests if snapshot of the element is a compact copy of the element
+        with its subtree and without attributes used for mapping.
+        """
+
+        async def test(page: Page):
+            element = await to_element(page, HTML)
+            snapshot = await element.snapshot()
+
+            assert isinstance(snapshot, CompactElement)
+            assert snapshot.name == "body"
+            assert SNAPSHOT_ATTRIBUTE not in str(snapshot)
+            assert [found.text for found in TypeSelector("a").find_all(snapshot)] == [
+                "One",
+                "Two",
+                "Three",
+            ]
+
+        run(test)
+
+    def test_models_are_found_in_snapshot(self):
+        """
+        Tests if models are found in snapshot of the element
+        and their elements can be mapped back to live elements.
+        """
+
+        async def test(page: Page):
+            element = await to_element(page, HTML)
+
+            models = await MockItem.afind_all(element)
+
+            assert [model.text for model in models] == ["One", "Two"]
+            links = await element.resolve([model.link for model in models])
+            assert [await link.node.text_content() for link in links] == ["One", "Two"]
+
+        run(test)
+
+    def test_resolve_raises_exception_for_stale_elements(self):
+        """
+        Tests if `resolve` raises `StaleSnapshotException` for elements
+        of snapshot of other element and for elements, that were changed.
+        """
+
+        async def test(page: Page):
+            element = await to_element(page, HTML)
+            snapshot = await element.snapshot()
+            link = TypeSelector("a").find(snapshot, strict=True)
+
+            other = await AsyncPlaywrightElement.from_node(
+                await page.query_selector("#first")  # type: ignore[arg-type]
+            )
+
+            with pytest.raises(exc.StaleSnapshotException):
+                await other.resolve([link])
+
+            await page.evaluate("document.querySelector('a').replaceWith('text')")
+
+            with pytest.raises(exc.StaleSnapshotException):
+                await element.resolve([link])
+
+        run(test)
+
+    def test_pages_are_searched_concurrently(self):
+        """Tests if elements of multiple pages can be searched concurrently."""
+
+        async def test(page: Page):
+            other_page = await page.context.new_page()
+            elements = await asyncio.gather(
+                to_element(page, HTML),
+                to_element(other_page, "<a id='other-page'>Other</a>"),
+            )
+            results = await asyncio.gather(
+                *(TypeSelector("a").afind_all(element) for element in elements)
+            )
+
+            assert [len(result) for result in results] == [3, 1]
+            assert await ids(results[1]) == ["other-page"]
+
+        run(test)
+
+
+@pytest.mark.playwright
+@pytest.mark.implementation
+class TestAsyncPlaywrightBrowser:
+    """Class with unit tests for `AsyncPlaywrightBrowser` component."""
+
+    def test_navigates_to_served_page_and_returns_document(self):
+        """
+        Tests if browser navigates to locally served page
+        and `get_document` returns its html element.
+        """
+
+        async def test(page: Page):
+            browser = AsyncPlaywrightBrowser(page)
+            await browser.navigate(URL)
+
+            assert await browser.get_current_url() == URL
+
+            document = await browser.get_document()
+            text = await (TypeSelector("p") | Text()).afind(document)
+            assert text == "Hello World"
+
+        run(test)
+
+    def test_clicks_element_of_snapshot(self):
+        """
+        Tests if element of the page snapshot is mapped back to live element
+        and clicked, while stale snapshot elements raise exception.
+        """
+
+        async def test(page: Page):
+            await page.set_content(
+                """<button onclick="this.textContent = 'Clicked'">Click</button>"""
+            )
+            browser = AsyncPlaywrightBrowser(page)
+            snapshot = await browser.snapshot()
+            button = TypeSelector("button").find(snapshot, strict=True)
+
+            await browser.click(button)
+            assert await page.text_content("button") == "Clicked"
+
+            await browser.snapshot()
+
+            with pytest.raises(exc.StaleSnapshotException):
+                await browser.click(button)
+
+        run(test)
+
+    def test_clicks_element_of_element_snapshot(self):
+        """
+        Tests if element of the snapshot of the element, like field of the model,
+        is mapped back to live element within that element and clicked.
+        """
+
+        async def test(page: Page):
+            await page.set_content(
+                """
+                <div class="item">
+                    <button onclick="this.textContent = 'Clicked'">Click</button>
+                </div>
+                """
+            )
+            browser = AsyncPlaywrightBrowser(page)
+            document = await browser.get_document()
+            model = await MockButton.afind(document, strict=True)
+            assert isinstance(model, MockButton)
+            button = model.button
+            assert isinstance(button, IElement)
+
+            await browser.click(button)
+            assert await page.text_content("button") == "Clicked"
+
+        run(test)
+
+    def test_keys_are_send_properly(self):
+        """Tests if `send_keys` sends keys to the element and clears it first."""
+
+        async def test(page: Page):
+            await page.set_content("""<input id="editable" value="Old" />""")
+            browser = AsyncPlaywrightBrowser(page)
+            document = await browser.get_document()
+            element = await TypeSelector("input").afind(document, strict=True)
+            assert isinstance(element, AsyncPlaywrightElement)
+
+            await browser.send_keys(element, "Hello World")
+            assert await page.input_value("#editable") == "Hello World"
+
+        run(test)
@@ -4,11 +4,19 @@ Tests `SoupElement` component and the way it interacts with soupsavvy.
 """
 
 import re
+import weakref
 
 import pytest
 from bs4 import BeautifulSoup, Tag
 
-from soupsavvy.implementation.bs4 import SoupElement
+from soupsavvy import (
+    AttributeSelector,
+    ClassSelector,
+    IdSelector,
+    TypeSelector,
+)
+from soupsavvy.exceptions import UnsupportedScopeException
+from soupsavvy.implementation.bs4 import ScopeStrainer, SoupElement
 from soupsavvy.selectors.css.api import SoupsieveApi
 from tests.soupsavvy.conftest import strip
 
@@ -817,3 +825,271 @@ class TestSoupElement:
         element = SoupElement(bs)
         result = element.get_attribute("class")
         assert result == "menu widget"
+
+    def test_state_is_none_when_document_is_not_tracked(self):
+        """Tests if `state` property returns None if document is not tracked."""
+        bs = BeautifulSoup("<div><p>Hello</p></div>", features="lxml")
+        element = SoupElement(bs)
+        assert element.state is None
+
+    def test_track_attaches_state_shared_by_all_elements_of_document(self):
+        """
+        Tests if `track` method attaches state to the document, which is shared
+        by all elements of the document, including newly created ones.
+        """
+        bs = BeautifulSoup("<div><p>Hello</p></div>", features="lxml")
+        element = SoupElement(bs)
+        state = element.track()
+
+        assert element.track() is state
+        assert element.find_all("p")[0].state is state
+        assert SoupElement(bs.find("p")).state is state  # type: ignore
+        assert state.version == 0
+
+    def test_decompose_removes_element_and_bumps_version(self):
+        """
+        Tests if `decompose` method removes element from the tree
+        and bumps version of tracked document.
+        """
+        text = """<div><p>Hello</p><script>code</script><span>World</span></div>"""
+        bs = BeautifulSoup(text, features="lxml")
+        element = SoupElement(bs)
+        state = element.track()
+
+        element.find_all("script")[0].decompose()
+
+        assert state.version == 1
+        assert strip(str(bs.div)) == "<div><p>Hello</p><span>World</span></div>"
+
+    def test_extract_returns_untracked_element_and_bumps_version(self):
+        """
+        Tests if `extract` method removes element from the tree, bumps version
+        of tracked document and returns element, that is not tracked.
+        """
+        text = """<div><p>Hello</p><span>World</span></div>"""
+        bs = BeautifulSoup(text, features="lxml")
+        element = SoupElement(bs)
+        state = element.track()
+
+        result = element.find_all("span")[0].extract()
+
+        assert state.version == 1
+        assert result.state is None
+        assert strip(str(result)) == "<span>World</span>"
+        assert strip(str(bs.div)) == "<div><p>Hello</p></div>"
+
+    def test_insert_inserts_element_at_position_among_child_elements(self):
+        """
+        Tests if `insert` method inserts element at position among child elements,
+        ignoring text nodes, and bumps version of tracked document.
+        """
+        text = """<div>text<p>Hello</p>text<span>World</span></div>"""
+        bs = BeautifulSoup(text, features="lxml")
+        element = SoupElement(bs.div)  # type: ignore
+        state = element.track()
+
+        new = SoupElement(BeautifulSoup("<a>Link</a>", features="html.parser").a)  # type: ignore
+        element.insert(1, new)
+
+        assert state.version == 1
+        assert new.state is state
+        assert strip(str(bs.div)) == (
+            "<div>text<p>Hello</p>text<a>Link</a><span>World</span></div>"
+        )
+
+    def test_insert_appends_element_if_position_exceeds_children(self):
+        """
+        Tests if `insert` method appends element at the end
+        if position is greater than number of child elements.
+        """
+        text = """<div><p>Hello</p></div>"""
+        bs = BeautifulSoup(text, features="lxml")
+        element = SoupElement(bs.div)  # type: ignore
+
+        new = SoupElement(BeautifulSoup("<a>Link</a>", features="html.parser").a)  # type: ignore
+        element.insert(5, new)
+
+        assert strip(str(bs.div)) == "<div><p>Hello</p><a>Link</a></div>"
+
+    def test_attributes_returns_all_attributes_as_strings(self):
+        """
+        Tests if `attributes` property returns all attributes of the element,
+        with multi-valued attributes joined into strings.
+        """
+        text = """<div class="menu widget" id="main" role="list"></div>"""
+        bs = BeautifulSoup(text, features="lxml").div
+        assert bs is not None
+
+        element = SoupElement(bs)
+        assert element.attributes == {
+            "class": "menu widget",
+            "id": "main",
+            "role": "list",
+        }
+
+    def test_derived_elements_reuse_wrappers_of_the_same_nodes(self):
+        """
+        Tests if elements derived from the same element in different traversals
+        are the same wrapper objects, shared through the pool of the element.
+        """
+        text = """<div><p>Hello</p><span><a>Link</a></span></div>"""
+        element = SoupElement(BeautifulSoup(text, features="lxml"))
+
+        descendants = list(element.descendants)
+        link = element.find_all("a")[0]
+
+        assert link is descendants[-1]
+        assert link.parent is descendants[-2]
+        assert list(descendants[-2].children) == [link]
+        assert SoupElement(link.node) == link
+        assert SoupElement(link.node) is not link
+
+    def test_pool_does_not_keep_wrappers_alive(self):
+        """
+        Tests if wrappers of the pool are released, when they are not referenced
+        outside of the pool and the same node is wrapped again when visited.
+        """
+        text = """<div><p>Hello</p><span><a>Link</a></span></div>"""
+        element = SoupElement(BeautifulSoup(text, features="lxml"))
+
+        link = element.find_all("a")[0]
+        reference = weakref.ref(link)
+        del link
+
+        assert reference() is None
+        assert element.find_all("a")[0].text == "Link"
+
+    @pytest.mark.parametrize(
+        argnames="params",
+        argvalues=[
+            {},
+            {"name": "p"},
+            {"name": "p", "recursive": False},
+            {"attrs": {"class": "menu"}},
+            {"attrs": {"class": "menu widget"}},
+            {"attrs": {"class": re.compile(r"^wid")}},
+            {"name": "a", "attrs": {"href": "/shop", "title": ""}},
+            {"name": "svg:rect"},
+            {"name": "rect"},
+            {"limit": 2},
+        ],
+    )
+    def test_find_all_returns_the_same_nodes_as_bs4_search(self, params: dict):
+        """
+        Tests if `find_all` traversing nodes directly returns the same nodes
+        in the same order as `find_all` of `bs4`, which is used as reference.
+        """
+        text = """
+            <div class="menu widget">Text<!-- comment -->
+                <p class="menu">1<span class="widget">2</span></p>
+                <a href="/shop" title="">3</a><svg:rect></svg:rect>
+            </div>
+            <p>4<b></b></p>
+        """
+        bs = BeautifulSoup(text, features="html.parser")
+        element = SoupElement(bs)
+
+        result = [x.node for x in element.find_all(**params)]
+        assert result == bs.find_all(**params)
+
+    def test_descendants_and_children_are_tags_in_document_order(self):
+        """
+        Tests if `descendants` and `children` yield only tags in document order
+        and traversal of descendants stops at the end of the element.
+        """
+        text = """<div>a<p>b<span>c</span></p><!-- d --><i></i></div><b>e</b>"""
+        bs = BeautifulSoup(text, features="html.parser")
+        element = SoupElement(bs.div)
+
+        assert [x.name for x in element.descendants] == ["p", "span", "i"]
+        assert [x.name for x in element.children] == ["p", "i"]
+        assert list(SoupElement(bs.i).descendants) == []
+
+    @pytest.mark.parametrize(
+        argnames="pattern",
+        argvalues=["2", "", re.compile(r"\d"), re.compile(r"^$")],
+    )
+    def test_find_text_returns_matching_leaf_elements(self, pattern):
+        """
+        Tests if `_find_text` returns only elements without child elements,
+        which text matches the pattern, as generic scan does.
+        """
+        text = """<div><p>1<span>2</span></p><i>2</i><b></b><a>3<!-- c --></a></div>"""
+        element = SoupElement(BeautifulSoup(text, features="html.parser"))
+
+        expected = [
+            x
+            for x in element.descendants
+            if not list(x.children) and x.match_text(pattern)
+        ]
+        assert element._find_text(pattern) == expected
+        assert element._find_text(pattern, limit=1) == expected[:1]
+
+    @pytest.mark.parametrize(
+        argnames="scope",
+        argvalues=[
+            TypeSelector("p"),
+            ClassSelector("menu"),
+            IdSelector("main"),
+            AttributeSelector("role"),
+            TypeSelector("a") & ClassSelector("menu"),
+            ClassSelector("menu") & ClassSelector("widget"),
+            ClassSelector("link") & ClassSelector("menu") & TypeSelector("a"),
+        ],
+    )
+    def test_from_scope_parses_only_subtrees_matched_by_scope(self, scope):
+        """
+        Tests if `from_scope` builds document with only subtrees matched
+        by the scope and scope finds the same elements in it as in whole page.
+        """
+        text = """
+            <div id="main" class="widget menu">Text<a class="menu">1</a></div>
+            <p role="list">2<span class="menu">3</span></p>tail
+            <section><a class="link menu" v-on:click="go">4</a><p>5</p></section>
+        """
+        element = SoupElement.from_scope(text, scope)
+        whole = SoupElement(BeautifulSoup(text, features="html.parser"))
+
+        result = scope.find_all(element)
+        expected = scope.find_all(whole)
+
+        assert [(x.name, x.text) for x in result] == [
+            (x.name, x.text) for x in expected
+        ]
+        # only matched elements are kept at the top level
+        assert all(x in result for x in element.children)
+
+    def test_scope_strainer_allows_tags_matched_by_scope(self):
+        """
+        Tests if `ScopeStrainer` allows creation of tags matched by the scope
+        with both methods used by `bs4`, `search_tag` of versions before 4.13
+        and `allow_tag_creation`, and never allows creation of strings.
+        """
+        strainer = ScopeStrainer(TypeSelector("a") & ClassSelector("menu"))
+
+        assert strainer.search_tag("a", {"class": "link menu"})
+        assert strainer.allow_tag_creation(None, "a", {"class": "menu"})
+        assert not strainer.search_tag("a", {"class": "menus"})
+        assert not strainer.allow_tag_creation(None, "p", {"class": "menu"})
+        assert not strainer.allow_string_creation("menu")
+
+    def test_scope_strainer_requires_all_values_of_the_same_attribute(self):
+        """
+        Tests if `ScopeStrainer` of conjunction of selectors of the same attribute
+        allows creation of tags, which match all of them.
+        """
+        strainer = ScopeStrainer(ClassSelector("link") & ClassSelector("menu"))
+
+        assert strainer.allow_tag_creation(None, "a", {"class": "menu link"})
+        assert not strainer.allow_tag_creation(None, "a", {"class": "menu"})
+        assert not strainer.allow_tag_creation(None, "a", {"class": "link"})
+
+    def test_from_scope_raises_exception_for_unsupported_scope(self):
+        """
+        Tests if `from_scope` raises `UnsupportedScopeException` if scope
+        can not be evaluated while parsing, as it depends on relatives of element.
+        """
+        with pytest.raises(UnsupportedScopeException):
+            SoupElement.from_scope(
+                "<div><p></p></div>", TypeSelector("div") > TypeSelector("p")
+            )
@@ -0,0 +1,150 @@
+"""Module with unit tests for `CompactDocument` and `CompactBuilder` components."""
+
+import pytest
+from bs4 import BeautifulSoup
+from lxml.etree import fromstring
+
+from soupsavvy import TypeSelector
+from soupsavvy.implementation.compact import CompactBuilder, CompactDocument
+from soupsavvy.utils.names import NAMES, intern_name
+from tests.soupsavvy.conftest import strip
+
+HTML = """
+    <div class="menu widget" id="main">Hello
+        <a href="/shop">Shop</a>
+        <p>Text<br><span>nested</span> tail</p><!-- comment -->
+    </div>
+    <div>Last</div>
+"""
+
+
+def to_lxml(html: str):
+    return fromstring(str(BeautifulSoup(html, features="lxml")))
+
+
+@pytest.mark.compact
+@pytest.mark.implementation
+class TestCompactDocument:
+    """Class with unit tests for `CompactDocument` component."""
+
+    def test_builder_creates_structure_arrays_in_preorder(self):
+        """
+        Tests if builder assigns preorder positions to elements and fills
+        structure arrays with parents, children, siblings, depths and extents.
+        """
+        builder = CompactBuilder()
+        builder.start("div", {})
+        builder.start("a", {})
+        builder.start("span", {})
+        builder.end()
+        builder.end()
+        builder.start("p", {})
+        builder.end()
+        builder.end()
+        document = builder.close()
+
+        assert len(document) == 4
+        assert [document.names[x] for x in document.tags] == ["div", "a", "span", "p"]
+        assert list(document.parents) == [-1, 0, 1, 0]
+        assert list(document.first_children) == [1, 2, -1, -1]
+        assert list(document.next_siblings) == [-1, 3, -1, -1]
+        assert list(document.depths) == [0, 1, 2, 1]
+        assert list(document.ends) == [3, 2, 2, 3]
+
+    def test_builder_interns_names_and_attribute_values(self):
+        """Tests if repeated tag names, attributes and values are stored once."""
+        builder = CompactBuilder()
+        builder.start("div", {})
+
+        for _ in range(3):
+            builder.start("a", {"class": "link"})
+            builder.end()
+
+        document = builder.close()
+
+        assert document.names == ["div", "a"]
+        assert document.attribute_names == ["class"]
+        assert document.values == ["link"]
+        assert document.get_attributes(3) == {"class": "link"}
+
+    def test_text_of_subtree_is_contiguous_slice_of_buffer(self):
+        """
+        Tests if text of each element is a slice of single text buffer
+        and comments are not included in text content.
+        """
+        document = CompactDocument.from_lxml(to_lxml(HTML))
+        span = document.name_id("span")
+        position = list(document.tags).index(span)
+        div = list(document.tags).index(document.name_id("div"))
+
+        assert document.get_text(position) == "nested"
+        assert "comment" not in document.text
+        assert document.get_text(div).startswith("Hello")
+        assert document.text_starts[div] <= document.text_starts[position]
+        assert document.text_ends[position] <= document.text_ends[div]
+
+    def test_documents_built_from_lxml_and_bs4_are_the_same(self):
+        """Tests if document built from bs4 tree has the same content as from lxml."""
+        soup = BeautifulSoup(HTML, features="lxml")
+        from_bs4 = CompactDocument.from_bs4(soup.html)
+        from_lxml = CompactDocument.from_lxml(to_lxml(HTML))
+
+        assert from_bs4.text == from_lxml.text
+        assert from_bs4.names == from_lxml.names
+        assert list(from_bs4.tags) == list(from_lxml.tags)
+        assert list(from_bs4.ends) == list(from_lxml.ends)
+        assert from_bs4.serialize(0) == from_lxml.serialize(0)
+
+    def test_serialize_returns_markup_of_element(self):
+        """
+        Tests if serialized element has the same markup as `bs4` tree,
+        except for comments, which are not stored.
+        """
+        html = """<div class="a b" id="x">1 &amp; 2<br><p>t<span>s</span>u</p></div>"""
+        soup = BeautifulSoup(html, features="lxml")
+        document = CompactDocument.from_bs4(soup.div)
+
+        assert document.serialize(0) == strip(str(soup.div))
+
+    def test_get_attribute_returns_value_or_none(self):
+        """Tests if `get_attribute` returns value of attribute or None if missing."""
+        document = CompactDocument.from_lxml(to_lxml(HTML))
+        div = list(document.tags).index(document.name_id("div"))
+
+        assert document.get_attribute(div, "class") == "menu widget"
+        assert document.get_attribute(div, "href") is None
+        assert document.get_attribute(div, "unknown") is None
+
+    def test_to_lxml_materializes_tree_once(self):
+        """
+        Tests if `to_lxml` materializes equivalent lxml tree with mapping
+        of nodes back to positions and caches it.
+        """
+        document = CompactDocument.from_lxml(to_lxml(HTML))
+        nodes, positions = document.to_lxml()
+
+        assert len(nodes) == len(document)
+        assert [node.tag for node in nodes] == [
+            document.names[tag] for tag in document.tags
+        ]
+        assert "".join(nodes[0].itertext()) == document.text
+        assert all(positions[id(node)] == i for i, node in enumerate(nodes))
+        assert document.to_lxml() is document.to_lxml()
+
+    def test_names_are_shared_with_selectors_through_global_table(self):
+        """
+        Tests if tag and attribute names of the document, which are registered
+        by selectors, are canonical instances from global name table,
+        while other names are not added to the table.
+        """
+        selector = TypeSelector("span")
+        intern_name("href")
+        document = CompactDocument.from_html(
+            '<div data-v-3a9f1c2e=""><a href="/">1</a><span>2</span></div>'
+        )
+
+        assert document.names[document.name_id("span")] is selector.name
+        assert document.attribute_names[document.attribute_id("href")] is (
+            intern_name("href")
+        )
+        assert "data-v-3a9f1c2e" not in NAMES
@@ -0,0 +1,213 @@
+"""
+Module with unit tests for compact implementation of IElement.
+Tests `CompactElement` component and the way it interacts with soupsavvy.
+"""
+
+import re
+from typing import Any
+
+import pytest
+from bs4 import BeautifulSoup
+from bs4.builder import HTMLTreeBuilder
+from lxml.etree import fromstring
+
+from soupsavvy.implementation.compact import CompactDocument, CompactElement
+from soupsavvy.implementation.compact.element import (
+    MULTI_VALUED_ATTRIBUTES,
+    CompactNode,
+)
+from soupsavvy.indexing import index_document
+from tests.soupsavvy.conftest import strip
+
+HTML = """
+    <div class="menu widget" id="main">Hello
+        <a class="link" href="/shop">Shop</a>
+        <p>Text<span>nested</span></p>
+        <a href="/about">About</a>
+    </div>
+    <div class="widget-box">Last</div>
+"""
+
+
+def to_compact(html: str) -> CompactElement:
+    root = fromstring(str(BeautifulSoup(html, features="lxml")))
+    return CompactElement.from_lxml(root).find_all("body")[0]
+
+
+@pytest.mark.compact
+@pytest.mark.implementation
+class TestCompactElement:
+    """Class with unit tests for `CompactElement` component."""
+
+    def test_raises_exception_when_invalid_init_node(self):
+        """
+        Tests if TypeError is raised when object of invalid type
+        is passed to constructor.
+        """
+        with pytest.raises(TypeError):
+            CompactElement("<div></div>")  # type: ignore
+
+    def test_elements_are_equal_if_point_to_the_same_position(self):
+        """
+        Tests if elements are equal and have the same hash, if they point
+        to the same position of the same document.
+        """
+        document = CompactDocument.from_lxml(fromstring("<div><a></a></div>"))
+        element = CompactElement(CompactNode(document, 1))
+
+        assert element == CompactElement.from_document(document).find_all("a")[0]
+        assert hash(element) == hash(CompactElement(CompactNode(document, 1)))
+        assert element != CompactElement(CompactNode(document, 0))
+
+    def test_str_and_repr_are_correct(self):
+        """Tests if `str` returns markup of the element and repr its name."""
+        element = to_compact(HTML).find_all("p")[0]
+
+        assert str(element) == "<p>Text<span>nested</span></p>"
+        assert repr(element) == f"CompactElement('p', position={element.position})"
+
+    @pytest.mark.parametrize(
+        argnames="params, expected",
+        argvalues=[
+            ({"name": "a"}, ["Shop", "About"]),
+            ({"attrs": {"class": "widget"}}, ["Hello"]),
+            ({"attrs": {"class": re.compile("widget")}}, ["Hello", "Last"]),
+            ({"attrs": {"class": "menu widget"}}, ["Hello"]),
+            ({"attrs": {"href": re.compile("about")}}, ["About"]),
+            ({"attrs": {"id": "mai"}}, []),
+            ({"name": "table"}, []),
+        ],
+    )
+    def test_find_all_matches_name_and_attributes(
+        self, params: dict, expected: list[str]
+    ):
+        """
+        Tests if `find_all` matches name and attributes with the same semantics
+        as `bs4`, multi-valued attributes are matched by any token or whole value.
+        """
+        result = to_compact(HTML).find_all(**params)
+        assert [element.text.strip()[:5] for element in result] == expected
+
+    @pytest.mark.parametrize(
+        argnames="attrs",
+        argvalues=[
+            {"rel": "next"},
+            {"rel": "next prev"},
+            {"archive": "p"},
+            {"class": "menu"},
+        ],
+    )
+    def test_multi_valued_attributes_depend_on_tag_name(self, attrs: dict[str, Any]):
+        """
+        Tests if attributes are multi-valued only for tag names,
+        for which `bs4` splits them into tokens.
+        """
+        html = """
+            <a rel="next prev">Link</a>
+            <div rel="next prev" class="menu">Div</div>
+            <object archive="p q">Object</object>
+            <p archive="p q">Paragraph</p>
+        """
+        soup = BeautifulSoup(html, features="lxml")
+
+        result = to_compact(html).find_all(attrs=attrs)
+        assert [x.text for x in result] == [x.text for x in soup.find_all(None, attrs)]
+
+    def test_multi_valued_attributes_are_the_same_as_in_bs4(self):
+        """Tests if multi-valued attributes of tags are the same as in `bs4`."""
+        expected = {
+            tag: frozenset(attributes)
+            for tag, attributes in HTMLTreeBuilder.DEFAULT_CDATA_LIST_ATTRIBUTES.items()
+        }
+        assert MULTI_VALUED_ATTRIBUTES == expected
+
+    def test_find_all_respects_recursive_and_limit(self):
+        """Tests if `find_all` respects `recursive` and `limit` parameters."""
+        div = to_compact(HTML).find_all("div")[0]
+
+        assert [x.name for x in div.find_all(recursive=False)] == ["a", "p", "a"]
+        assert [x.name for x in div.find_all(limit=3)] == ["a", "p", "span"]
+
+    def test_navigation_returns_elements_of_the_same_document(self):
+        """
+        Tests if children, descendants, parent, siblings and ancestors
+        are read from arrays of the document.
+        """
+        body = to_compact(HTML)
+        div = body.find_all("div")[0]
+        span = div.find_all("span")[0]
+
+        assert [x.name for x in div.children] == ["a", "p", "a"]
+        assert [x.name for x in div.descendants] == ["a", "p", "span", "a"]
+        assert span.parent == div.find_all("p")[0]
+        assert [x.name for x in span.find_ancestors()] == ["p", "div", "body", "html"]
+        assert [x.name for x in span.find_ancestors(limit=2)] == ["p", "div"]
+        assert [x.name for x in div.find_subsequent_siblings()] == ["div"]
+        assert body.find_all("html") == []
+        assert body.parent is not None and body.parent.parent is None
+
+    def test_attributes_and_text_are_read_from_document(self):
+        """Tests if attributes and text are read from columns and text buffer."""
+        div = to_compact(HTML).find_all("div")[0]
+
+        assert div.attributes == {"class": "menu widget", "id": "main"}
+        assert div.get_attribute("id") == "main"
+        assert div.get_attribute("href") is None
+        assert div.find_all("p")[0].text == "Textnested"
+
+    def test_text_view_references_text_buffer_of_document(self):
+        """
+        Tests if `text_view` returns lazy view of the document text buffer
+        and `match_text` matches patterns against it.
+        """
+        span = to_compact(HTML).find_all("span")[0]
+        view = span.text_view
+
+        assert view.buffer is span.document.text
+        assert view == "nested"
+        assert span.match_text("nested") is True
+        assert span.match_text("nest") is False
+        assert span.match_text(re.compile("^nest")) is True
+        assert span.match_text(re.compile("Text")) is False
+
+    def test_css_and_xpath_select_elements_of_compact_document(self):
+        """
+        Tests if css and xpath selection is performed on materialized
+        lxml tree and results are mapped back to compact elements.
+        """
+        body = to_compact(HTML)
+
+        css = body.css("div > a.link").select(body)
+        xpath = body.xpath(".//p/span").select(body)
+
+        assert css == [body.find_all("a")[0]]
+        assert xpath == [body.find_all("span")[0]]
+        assert all(isinstance(x, CompactElement) for x in css + xpath)
+
+    def test_element_built_from_bs4_has_the_same_content(self):
+        """Tests if element built from bs4 tree has the same markup and text."""
+        soup = BeautifulSoup(HTML, features="lxml")
+        element = CompactElement.from_bs4(soup).find_all("body")[0]
+
+        assert strip(str(element)) == strip(str(soup.body))
+        assert element.text == soup.body.text
+
+    def test_tracked_document_state_is_shared_and_never_bumped(self):
+        """
+        Tests if `track` returns state shared by all elements of the document,
+        which version stays the same, as document is read-only.
+        """
+        element = to_compact(HTML)
+        assert element.state is None
+
+        state = element.track()
+
+        assert element.find_all("a")[0].state is state
+        assert element.parent is not None
+        assert element.parent.track() is state
+        assert state.version == 0
+
+    def test_index_document_raises_exception_for_compact_element(self):
+        """Tests if `index_document` raises TypeError for compact elements."""
+        with pytest.raises(TypeError, match="Compact documents"):
+            index_document(to_compact(HTML))
@@ -0,0 +1,83 @@
+"""Module with unit tests for `CompactHTMLParser` component."""
+
+import pytest
+from bs4 import BeautifulSoup
+
+from soupsavvy import ClassSelector, TypeSelector
+from soupsavvy.implementation.compact import (
+    CompactDocument,
+    CompactElement,
+    CompactHTMLParser,
+)
+
+PAGES = [
+    """
+    <!DOCTYPE html>
+    <html><head><title>Shop &amp; more</title></head>
+    <body><div class="menu widget" id="main">Hello
+        <a class="link" href="/shop?a=1&amp;b=2">Shop</a>
+        <p>Text<br><span>nested</span> tail</p><!-- comment -->
+    </div></body></html>
+    """,
+    "<p>a<p>b<div>c</p>d</div><br>e<input disabled a=1 a=2>&nbsp;</span>",
+    "<ul><li>1<li>2</ul><img src=x /><custom/>text",
+    "<script>if (a < b && c > d) {}</script><style>p > a {}</style>",
+    "<pre>  \n  </pre><textarea>   </textarea><p> \t </p>a<!-- c -->  <![CDATA[x]]>",
+    "plain text without tags",
+    "",
+]
+
+
+@pytest.mark.compact
+@pytest.mark.implementation
+class TestCompactHTMLParser:
+    """Class with unit tests for `CompactHTMLParser` component."""
+
+    @pytest.mark.parametrize(argnames="markup", argvalues=PAGES)
+    def test_builds_the_same_document_as_bs4_html_parser(self, markup: str):
+        """
+        Tests if parsed document has the same structure, attributes and text
+        as document built from `bs4` tree parsed with `html.parser` features.
+        """
+        document = CompactDocument.from_html(markup)
+        expected = CompactDocument.from_bs4(BeautifulSoup(markup, "html.parser"))
+
+        assert document.names == expected.names
+        assert list(document.tags) == list(expected.tags)
+        assert list(document.parents) == list(expected.parents)
+        assert list(document.ends) == list(expected.ends)
+        assert document.text == expected.text
+        assert document.serialize(0) == expected.serialize(0)
+
+    def test_markup_can_be_fed_in_chunks(self):
+        """Tests if document parsed from chunks is the same as from whole markup."""
+        markup = PAGES[0]
+        chunks = [markup[i : i + 7] for i in range(0, len(markup), 7)]
+        parser = CompactHTMLParser()
+
+        for chunk in chunks:
+            parser.feed(chunk)
+
+        document = parser.close()
+
+        assert document.serialize(0) == CompactDocument.from_html(markup).serialize(0)
+        assert CompactHTMLParser.parse(iter(chunks)).text == document.text
+
+    def test_root_contains_parsed_markup_with_decoded_references(self):
+        """
+        Tests if root of parsed document has the same name as `bs4` document
+        and character references in text and attributes are decoded.
+        """
+        element = CompactElement.from_html(PAGES[0])
+
+        assert element.name == "[document]"
+        assert element.find_all("title")[0].text == "Shop & more"
+        assert element.find_all("a")[0].get_attribute("href") == "/shop?a=1&b=2"
+
+    def test_selectors_work_on_parsed_document(self):
+        """Tests if selectors find elements in document parsed with the parser."""
+        element = CompactElement.from_html(PAGES[0])
+        selector = TypeSelector("div") > ClassSelector("link")
+
+        assert [x.text for x in selector.find_all(element)] == ["Shop"]
+        assert [x.name for x in TypeSelector("span").find_all(element)] == ["span"]
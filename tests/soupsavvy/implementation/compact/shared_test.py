@@ -0,0 +1,135 @@
+"""Module with unit tests for compact documents placed in shared memory."""
+
+import os
+import pickle
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+import pytest
+from bs4 import BeautifulSoup
+from lxml.etree import fromstring
+
+from soupsavvy import ClassSelector, TypeSelector
+from soupsavvy.implementation.compact import CompactDocument, CompactElement, vectorized
+from soupsavvy.implementation.compact.shared import SharedDocument
+
+HTML = """
+    <div class="menu">
+        <a class="link" href="/shop">Shop</a>
+        <p>Text<span class="link">nested</span></p>
+    </div>
+    <div><a class="link">Last</a></div>
+"""
+
+SELECTOR = TypeSelector("div") >> ClassSelector("link")
+
+
+@pytest.fixture
+def document() -> CompactDocument:
+    node = fromstring(str(BeautifulSoup(HTML, features="lxml")))
+    return CompactDocument.from_lxml(node)
+
+
+def extract(shared: SharedDocument) -> list[str]:
+    """Extracts text of matching elements in worker process."""
+    return [element.text for element in SELECTOR.find_all(shared.root)]
+
+
+@pytest.mark.compact
+@pytest.mark.implementation
+class TestSharedDocument:
+    """Class with unit tests for `SharedDocument` component."""
+
+    def test_attached_document_is_the_same_as_created(self, document: CompactDocument):
+        """
+        Tests if document attached by name has the same content as placed
+        in shared memory and its arrays are views of shared memory.
+        """
+        with SharedDocument.create(document) as shared:
+            attached = SharedDocument.attach(shared.name)
+
+            assert attached.owner is False and shared.owner is True
+            assert list(attached.document.tags) == list(document.tags)
+            assert attached.document.text == document.text
+            assert isinstance(attached.document.tags, memoryview)
+            assert str(attached.root) == str(CompactElement.from_document(document))
+
+            attached.close()
+
+    def test_selectors_work_on_shared_document(self, document: CompactDocument):
+        """Tests if selectors find the same elements as in original document."""
+        expected = [
+            x.text for x in SELECTOR.find_all(CompactElement.from_document(document))
+        ]
+
+        with SharedDocument.create(document) as shared:
+            assert extract(shared) == expected
+            # cached columns of vectorized engine are released on close
+            assert vectorized.find_all(SELECTOR, shared.root) == SELECTOR.find_all(
+                shared.root
+            )
+
+    def test_pickled_document_attaches_to_the_same_block(
+        self, document: CompactDocument
+    ):
+        """Tests if document is pickled as name of the block and attached back."""
+        with SharedDocument.create(document) as shared:
+            restored = pickle.loads(pickle.dumps(shared))
+
+            assert restored.name == shared.name
+            assert restored.owner is False
+            assert extract(restored) == extract(shared)
+
+            restored.close()
+
+    def test_worker_processes_use_shared_document(self, document: CompactDocument):
+        """Tests if worker processes extract data from the shared document."""
+        with SharedDocument.create(document) as shared:
+            expected = extract(shared)
+
+            with ProcessPoolExecutor(max_workers=2) as executor:
+                results = list(executor.map(extract, [shared] * 3))
+
+        assert results == [expected] * 3
+
+    def test_block_is_destroyed_on_exit_by_owner(self, document: CompactDocument):
+        """
+        Tests if block is closed and unlinked on exit from context manager
+        of the owner and closing is idempotent.
+        """
+        with SharedDocument.create(document) as shared:
+            name = shared.name
+
+        shared.close()
+
+        with pytest.raises(FileNotFoundError):
+            SharedMemory(name=name)
+
+    def test_block_outlives_unrelated_process_attached_to_it(
+        self, document: CompactDocument
+    ):
+        """
+        Tests if block is not destroyed, when unrelated process,
+        which attached to it by name, exits.
+        """
+        with SharedDocument.create(document) as shared:
+            code = (
+                "from soupsavvy.implementation.compact.shared import SharedDocument\n"
+                f"shared = SharedDocument.attach({shared.name!r})\n"
+                "print(shared.root.text.strip())\n"
+                "shared.close()\n"
+            )
+            result = subprocess.run(
+                [sys.executable, "-c", code],
+                capture_output=True,
+                text=True,
+                env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+                check=True,
+            )
+            assert result.stdout.strip() == shared.root.text.strip()
+
+            attached = SharedDocument.attach(shared.name)
+            assert list(attached.document.tags) == list(document.tags)
+            attached.close()
@@ -0,0 +1,174 @@
+"""Module with unit tests for binary format of compact documents."""
+
+import struct
+from array import array
+from pathlib import Path
+
+import pytest
+from bs4 import BeautifulSoup
+from lxml.etree import fromstring
+
+from soupsavvy import CSS, ClassSelector, TypeSelector
+from soupsavvy.exceptions import InvalidDocumentFormat
+from soupsavvy.implementation.compact import CompactDocument, CompactElement, storage
+
+HTML = """
+    <div class="menu widget" id="main">Hello ünïcödé
+        <a class="link" href="/shop">Shop &amp; more</a>
+        <p>Text<br><span class="link">nested</span> tail</p>
+    </div>
+    <div>Last</div>
+"""
+
+ARRAYS = [
+    "tags",
+    "parents",
+    "first_children",
+    "next_siblings",
+    "depths",
+    "ends",
+    "text_starts",
+    "text_ends",
+    "attribute_offsets",
+    "attribute_keys",
+    "attribute_values",
+]
+
+
+@pytest.fixture
+def document() -> CompactDocument:
+    node = fromstring(str(BeautifulSoup(HTML, features="lxml")))
+    return CompactDocument.from_lxml(node)
+
+
+def assert_documents_equal(first: CompactDocument, second: CompactDocument):
+    for name in ARRAYS:
+        assert list(getattr(first, name)) == list(getattr(second, name))
+
+    assert first.names == second.names
+    assert first.attribute_names == second.attribute_names
+    assert first.values == second.values
+    assert first.text == second.text
+
+
+@pytest.mark.compact
+@pytest.mark.implementation
+class TestStorage:
+    """Class with unit tests for binary format of compact documents."""
+
+    @pytest.mark.parametrize(argnames="memory_map", argvalues=[True, False])
+    def test_loaded_document_is_the_same_as_saved(
+        self, document: CompactDocument, tmp_path: Path, memory_map: bool
+    ):
+        """Tests if document loaded from file has the same content as saved one."""
+        path = tmp_path / "document.bin"
+        document.save(path)
+        loaded = CompactDocument.load(path, memory_map=memory_map)
+
+        assert_documents_equal(loaded, document)
+        assert loaded.serialize(0) == document.serialize(0)
+
+    def test_structure_arrays_are_views_of_memory_mapped_file(
+        self, document: CompactDocument, tmp_path: Path
+    ):
+        """Tests if structure arrays of loaded document are not copied."""
+        path = tmp_path / "document.bin"
+        document.save(path)
+        loaded = CompactDocument.load(path)
+
+        assert all(isinstance(getattr(loaded, name), memoryview) for name in ARRAYS)
+        assert isinstance(loaded.tags, memoryview)
+        assert loaded.tags.readonly
+
+    def test_selectors_work_on_loaded_document(
+        self, document: CompactDocument, tmp_path: Path
+    ):
+        """
+        Tests if selectors find the same elements in loaded document
+        as in the document before saving.
+        """
+        path = tmp_path / "document.bin"
+        document.save(path)
+        element = CompactElement.from_document(document)
+        loaded = CompactElement.from_document(CompactDocument.load(path))
+
+        for selector in [
+            TypeSelector("div") > ClassSelector("link"),
+            TypeSelector("p") >> TypeSelector("span"),
+        ]:
+            expected = selector.find_all(element)
+            result = selector.find_all(loaded)
+
+            assert [str(x) for x in result] == [str(x) for x in expected]
+            assert [x.text for x in result] == [x.text for x in expected]
+
+        assert [x.name for x in CSS("p > span").find_all(loaded)] == ["span"]
+
+    def test_decode_reads_document_from_encoded_buffer(self, document: CompactDocument):
+        """Tests if `decode` restores document from chunks returned by `encode`."""
+        buffer = b"".join(bytes(chunk) for chunk in storage.encode(document))
+        assert_documents_equal(storage.decode(buffer), document)
+
+    def test_decode_swaps_byte_order_of_arrays_if_it_does_not_match(
+        self, document: CompactDocument
+    ):
+        """
+        Tests if document written on platform with different byte order
+        is loaded with arrays converted to native byte order.
+        """
+        chunks = storage.encode(document)
+        header = list(storage._HEADER.unpack(chunks[0]))
+        header[2] = b">" if storage._BYTE_ORDER == b"<" else b"<"
+        swapped = [storage._HEADER.pack(*header)]
+
+        for chunk in chunks[1:]:
+            if isinstance(chunk, array):
+                chunk = array("i", chunk)
+                chunk.byteswap()
+
+            swapped.append(bytes(chunk))
+
+        assert_documents_equal(storage.decode(b"".join(swapped)), document)
+
+    @pytest.mark.parametrize(
+        argnames="buffer",
+        argvalues=[
+            b"",
+            b"<html></html>",
+            storage._HEADER.pack(b"NOTADOC\x00", 1, b"<", 0, 0, 0, 0, 0, 0),
+        ],
+        ids=["empty", "html", "magic"],
+    )
+    def test_raises_exception_if_buffer_is_not_document(self, buffer: bytes):
+        """Tests if `InvalidDocumentFormat` is raised for invalid buffers."""
+        with pytest.raises(InvalidDocumentFormat):
+            storage.decode(buffer)
+
+    def test_raises_exception_if_version_is_not_supported(
+        self, document: CompactDocument, tmp_path: Path
+    ):
+        """Tests if `InvalidDocumentFormat` is raised for unsupported version."""
+        path = tmp_path / "document.bin"
+        document.save(path)
+        content = bytearray(path.read_bytes())
+        struct.pack_into("<H", content, 8, storage.VERSION + 1)
+        path.write_bytes(content)
+
+        with pytest.raises(InvalidDocumentFormat, match="version"):
+            CompactDocument.load(path)
+
+    def test_raises_exception_if_file_is_truncated(
+        self, document: CompactDocument, tmp_path: Path
+    ):
+        """Tests if `InvalidDocumentFormat` is raised for truncated file."""
+        path = tmp_path / "document.bin"
+        document.save(path)
+        path.write_bytes(path.read_bytes()[:100])
+
+        with pytest.raises(InvalidDocumentFormat, match="truncated"):
+            CompactDocument.load(path)
+
+        path.write_bytes(b"")
+
+        with pytest.raises(InvalidDocumentFormat):
+            CompactDocument.load(path)
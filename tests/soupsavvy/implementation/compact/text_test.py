@@ -0,0 +1,95 @@
+"""Module with unit tests for `TextView` component."""
+
+import re
+
+import pytest
+
+from soupsavvy.implementation.compact import TextView
+
+BUFFER = "Menu\nHello World 42 tail"
+
+
+@pytest.mark.compact
+@pytest.mark.implementation
+class TestTextView:
+    """Class with unit tests for `TextView` component."""
+
+    def test_str_returns_text_of_the_range(self):
+        """Tests if view is converted to string with text of its range."""
+        view = TextView(BUFFER, 5, 16)
+
+        assert str(view) == "Hello World"
+        assert repr(view) == "TextView('Hello World')"
+        assert len(view) == 11
+        assert bool(view) is True
+        assert bool(TextView(BUFFER, 3, 3)) is False
+        assert str(TextView("abc")) == "abc"
+
+    def test_view_is_equal_to_string_with_the_same_text(self):
+        """Tests if view is compared with strings and views by text."""
+        view = TextView(BUFFER, 5, 10)
+
+        assert view == "Hello"
+        assert view != "Hello World"
+        assert view != "Hell"
+        assert view == TextView("Hello")
+        assert hash(view) == hash("Hello")
+        assert view != 5
+
+    def test_string_methods_work_within_the_range(self):
+        """Tests if string methods only see text within the range of the view."""
+        view = TextView(BUFFER, 5, 16)
+
+        assert view.startswith("Hello")
+        assert not view.startswith("Menu")
+        assert view.endswith("World")
+        assert not view.endswith("42")
+        assert view.find("World") == 6
+        assert view.find("tail") == -1
+        assert "lo W" in view
+        assert "Menu" not in view
+
+    def test_slicing_returns_view_of_subrange(self):
+        """Tests if slicing returns view and indexing returns character."""
+        view = TextView(BUFFER, 5, 16)
+        sliced = view[6:]
+
+        assert isinstance(sliced, TextView)
+        assert sliced == "World"
+        assert sliced.buffer is BUFFER
+        assert view[-5:-1] == "Worl"
+        assert view[4:2] == ""
+        assert view[::2] == "HloWrd"
+        assert view[0] == "H"
+
+    @pytest.mark.parametrize(
+        argnames="pattern, expected",
+        argvalues=[
+            (r"World", True),
+            (r"\d+", False),
+            (r"Menu", False),
+            (r"^Hello", True),
+            (r"^World", False),
+            (r"World$", True),
+            (r"\AHello World\Z", True),
+            (r"\bHello", True),
+            (r"(?<=\n)Hello", False),
+            (r"(?m)^Menu", False),
+        ],
+    )
+    def test_search_matches_pattern_only_within_the_range(
+        self, pattern: str, expected: bool
+    ):
+        """
+        Tests if regex patterns, including anchors and lookbehinds,
+        match as if text of the view was a separate string.
+        """
+        view = TextView(BUFFER, 5, 16)
+        assert view.match(re.compile(pattern)) is expected
+
+    def test_match_compares_string_pattern_for_equality(self):
+        """Tests if string pattern must be equal to the text to match."""
+        view = TextView(BUFFER, 5, 16)
+
+        assert view.match("Hello World") is True
+        assert view.match("Hello") is False
@@ -0,0 +1,160 @@
+"""
+Module with unit tests for vectorized engine of compact documents.
+Tests if results of vectorized evaluation are the same as results
+of `find_all` method of selectors.
+"""
+
+import re
+
+import pytest
+from bs4 import BeautifulSoup
+from lxml.etree import fromstring
+
+from soupsavvy import (
+    AttributeSelector,
+    ClassSelector,
+    ExpressionSelector,
+    IdSelector,
+    NthLastOfSelector,
+    NthOfSelector,
+    OnlyOfSelector,
+    PatternSelector,
+    TypeSelector,
+    UniversalSelector,
+)
+from soupsavvy.base import SoupSelector
+from soupsavvy.implementation.compact import CompactElement, vectorized
+from soupsavvy.selectors.css.selectors import FirstChild, LastChild
+from soupsavvy.selectors.relative import Anchor, HasSelector
+
+HTML = """
+    <div class="menu widget" id="main">Hello
+        <a class="link" href="/shop">Shop</a>
+        <p>Text<span class="link">nested</span><a>Inner</a></p>
+        <a href="/about" rel="next prev">About</a>
+        <div><p><span>Deep</span></p><a class="link">Shop</a></div>
+    </div>
+    <p class="widget-box">Last<span>Tail</span></p>
+    <a id="footer">Footer</a>
+    <div rel="next prev"><span>Only</span></div>
+"""
+
+DIV = TypeSelector("div")
+P = TypeSelector("p")
+A = TypeSelector("a")
+SPAN = TypeSelector("span")
+LINK = ClassSelector("link")
+
+SELECTORS = [
+    DIV,
+    UniversalSelector(),
+    TypeSelector("table"),
+    LINK,
+    ClassSelector("widget"),
+    ClassSelector(re.compile("box")),
+    IdSelector("main"),
+    AttributeSelector("href"),
+    AttributeSelector("href", re.compile("^/s")),
+    AttributeSelector("missing"),
+    AttributeSelector("rel", "next"),
+    AttributeSelector("rel", re.compile("^prev")),
+    AttributeSelector("rel", "next prev"),
+    PatternSelector("Shop"),
+    PatternSelector(re.compile("^T")),
+    DIV | P,
+    A & LINK,
+    ~A,
+    ~(A | SPAN),
+    A ^ LINK,
+    NthOfSelector(A, "2n+1"),
+    NthOfSelector(LINK, "1"),
+    NthLastOfSelector(UniversalSelector(), "1"),
+    NthLastOfSelector(SPAN, "-n+2"),
+    OnlyOfSelector(SPAN),
+    OnlyOfSelector(A),
+    HasSelector(SPAN),
+    HasSelector(Anchor > A),
+    HasSelector(Anchor >> LINK),
+    HasSelector(Anchor + A),
+    HasSelector(Anchor * DIV),
+    HasSelector(Anchor < P),
+    HasSelector(Anchor << DIV, Anchor + SPAN),
+    DIV > A,
+    DIV >> SPAN,
+    P + A,
+    A * DIV,
+    SPAN < P,
+    SPAN << DIV,
+    DIV > P > SPAN,
+    (DIV >> P) + A,
+    DIV > NthOfSelector(A, "1"),
+    (DIV > A) | (P > SPAN),
+    (DIV > A) ^ LINK,
+    ~(DIV > A),
+    (DIV >> A) & LINK,
+    HasSelector(A) > SPAN,
+]
+
+
+@pytest.fixture(scope="module")
+def root() -> CompactElement:
+    node = fromstring(str(BeautifulSoup(HTML, features="lxml")))
+    return CompactElement.from_lxml(node)
+
+
+@pytest.mark.compact
+@pytest.mark.implementation
+class TestVectorized:
+    """Class with unit tests for vectorized engine of compact documents."""
+
+    @pytest.mark.parametrize(argnames="selector", argvalues=SELECTORS, ids=repr)
+    @pytest.mark.parametrize(argnames="recursive", argvalues=[True, False])
+    def test_results_are_the_same_as_find_all(
+        self, root: CompactElement, selector: SoupSelector, recursive: bool
+    ):
+        """
+        Tests if vectorized evaluation of selector returns the same elements
+        in the same order as `find_all` method, for root and nested element.
+        """
+        body = root.find_all("body")[0]
+        menu = body.find_all("div")[0]
+
+        for element in [root, body, menu]:
+            expected = selector.find_all(element, recursive=recursive)
+            assert vectorized.evaluate(selector, element, recursive) is not None
+            assert vectorized.find_all(selector, element, recursive) == expected
+
+    def test_find_all_respects_limit(self, root: CompactElement):
+        """Tests if `find_all` returns at most `limit` first elements."""
+        result = vectorized.find_all(A, root, limit=2)
+        assert result == A.find_all(root)[:2]
+
+    def test_find_returns_first_match_or_none(self, root: CompactElement):
+        """Tests if `find` returns first matching element or None."""
+        assert vectorized.find(LINK, root) == LINK.find_all(root)[0]
+        assert vectorized.find(TypeSelector("table"), root) is None
+
+    @pytest.mark.parametrize(
+        argnames="selector",
+        argvalues=[
+            ExpressionSelector(lambda element: element.name == "a"),
+            FirstChild(),
+            DIV > LastChild(),
+            NthOfSelector(DIV > A, "1"),
+        ],
+        ids=repr,
+    )
+    def test_falls_back_to_find_all_for_unsupported_selectors(
+        self, root: CompactElement, selector: SoupSelector
+    ):
+        """
+        Tests if selectors, which can not be vectorized, are not evaluated
+        as mask and `find_all` falls back to their own `find_all` method.
+        """
+        assert vectorized.evaluate(selector, root) is None
+        assert vectorized.find_all(selector, root) == selector.find_all(root)
+
+    def test_columns_are_cached_in_document(self, root: CompactElement):
+        """Tests if columns are computed only once for the document."""
+        columns = vectorized.get_columns(root.document)
+        assert vectorized.get_columns(root.document) is columns
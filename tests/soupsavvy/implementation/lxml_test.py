@@ -4,13 +4,23 @@ Tests `LXMLElement` component and the way it interacts with soupsavvy.
 """
 
 import re
+import weakref
 
 import pytest
 from bs4 import BeautifulSoup
+from lxml import html
 from lxml.etree import _Element as HtmlElement
 from lxml.etree import fromstring, tostring
 
-from soupsavvy.implementation.lxml import LXMLElement
+from soupsavvy import (
+    AttributeSelector,
+    ClassSelector,
+    IdSelector,
+    PatternSelector,
+    TypeSelector,
+)
+from soupsavvy.exceptions import UnsupportedScopeException
+from soupsavvy.implementation.lxml import LXMLElement, enable_exslt
 from soupsavvy.selectors.css.api import CSSSelectApi
 from soupsavvy.selectors.xpath.api import LXMLXpathApi
 from tests.soupsavvy.conftest import strip
@@ -839,3 +849,266 @@ class TestLXMLElement:
         element = LXMLElement(node)
         result = element.get_attribute("class")
         assert result == "menu widget"
+
+    def test_state_is_none_when_document_is_not_tracked(self):
+        """Tests if `state` property returns None if document is not tracked."""
+        element = LXMLElement(to_lxml("<div><p>Hello</p></div>"))
+        assert element.state is None
+
+    def test_track_attaches_state_propagated_to_derived_elements(self):
+        """
+        Tests if `track` method attaches state to the element, which is propagated
+        to all elements derived from it.
+        """
+        element = LXMLElement(to_lxml("<div><p>Hello</p></div>"))
+        state = element.track()
+
+        assert element.track() is state
+        p = element.find_all("p")[0]
+        assert p.state is state
+        assert p.parent.state is state  # type: ignore
+        assert state.version == 0
+
+    def test_decompose_removes_element_keeping_tail_and_bumps_version(self):
+        """
+        Tests if `decompose` method removes element from the tree, keeps its tail
+        text in the document and bumps version of tracked document.
+        """
+        text = """<div><p>Hello</p><script>code</script>tail<span>World</span></div>"""
+        node = to_lxml(text)
+        element = LXMLElement(node)
+        state = element.track()
+
+        element.find_all("script")[0].decompose()
+
+        assert state.version == 1
+        assert strip(str(element.find_all("div")[0])) == (
+            "<div><p>Hello</p>tail<span>World</span></div>"
+        )
+
+    def test_extract_returns_untracked_element_and_bumps_version(self):
+        """
+        Tests if `extract` method removes element from the tree, bumps version
+        of tracked document and returns element, that is not tracked.
+        """
+        text = """<div><p>Hello</p><span>World</span></div>"""
+        element = LXMLElement(to_lxml(text))
+        state = element.track()
+
+        result = element.find_all("span")[0].extract()
+
+        assert state.version == 1
+        assert result.state is None
+        assert strip(str(result)) == "<span>World</span>"
+        assert strip(str(element.find_all("div")[0])) == "<div><p>Hello</p></div>"
+
+    def test_insert_inserts_element_at_position_among_child_elements(self):
+        """
+        Tests if `insert` method inserts element at position among child elements
+        and bumps version of tracked document.
+        """
+        text = """<div>text<p>Hello</p>text<span>World</span></div>"""
+        element = LXMLElement(to_lxml(text)).find_all("div")[0]
+        state = element.track()
+
+        new = LXMLElement(fromstring("<a>Link</a>"))
+        element.insert(1, new)
+
+        assert state.version == 1
+        assert new.state is state
+        assert strip(str(element)) == (
+            "<div>text<p>Hello</p>text<a>Link</a><span>World</span></div>"
+        )
+
+    def test_attributes_returns_all_attributes_as_strings(self):
+        """Tests if `attributes` property returns all attributes of the element."""
+        text = """<div class="menu widget" id="main" role="list"></div>"""
+        node = to_lxml(text).find(".//div")
+        assert node is not None
+
+        element = LXMLElement(node)
+        assert element.attributes == {
+            "class": "menu widget",
+            "id": "main",
+            "role": "list",
+        }
+
+    def test_derived_elements_reuse_wrappers_of_the_same_nodes(self):
+        """
+        Tests if elements derived from the same element in different traversals
+        are the same wrapper objects, shared through the pool of the element.
+        """
+        text = """<div><p>Hello</p><span><a>Link</a></span></div>"""
+        element = LXMLElement(to_lxml(text))
+
+        descendants = list(element.descendants)
+        link = element.find_all("a")[0]
+
+        assert link is descendants[-1]
+        assert link.parent is descendants[-2]
+        assert list(descendants[-2].children) == [link]
+        assert LXMLElement(link.node) == link
+        assert LXMLElement(link.node) is not link
+
+    def test_pool_does_not_keep_wrappers_alive(self):
+        """
+        Tests if wrappers of the pool are released, when they are not referenced
+        outside of the pool and the same node is wrapped again when visited.
+        """
+        text = """<div><p>Hello</p><span><a>Link</a></span></div>"""
+        element = LXMLElement(to_lxml(text))
+
+        link = element.find_all("a")[0]
+        reference = weakref.ref(link)
+        del link
+
+        assert reference() is None
+        assert element.find_all("a")[0].text == "Link"
+
+    @pytest.mark.parametrize(
+        argnames="params, expected",
+        argvalues=[
+            ({"attrs": {"class": "menu"}}, ["1", "3"]),
+            ({"name": "p", "attrs": {"class": "menu"}}, ["3"]),
+            ({"attrs": {"class": "menu-item"}}, ["2"]),
+            ({"attrs": {"class": "menu item"}}, []),
+            ({"attrs": {"v-on:click": "go"}}, ["4"]),
+            ({"attrs": {"class": "x\x0b"}}, []),
+            ({"attrs": {"class": re.compile("^menu$")}}, ["1"]),
+            ({"name": "{}p"}, []),
+            ({"name": "*"}, []),
+            ({"name": "p", "recursive": False}, ["3", "5"]),
+        ],
+    )
+    def test_find_all_with_native_queries_matches_tokens_exactly(
+        self, params: dict, expected: list[str]
+    ):
+        """
+        Tests if `find_all` with tag filters and compiled queries performed
+        by lxml returns the same results as matching names and attribute tokens
+        of each element, including whitespace not handled by XPath.
+        """
+        node = html.fragment_fromstring(
+            """
+            <div>
+                <div><span class="menu">1</span><a class="menu-item">2</a></div>
+                <p class="widgetmenu">3</p>
+                <a v-on:click="go">4</a>
+                <p>5</p>
+            </div>
+            """
+        )
+        node.find("div").append(html.fragment_fromstring("<p>6</p>"))
+        element = LXMLElement(node)
+
+        assert [x.text for x in element.find_all(**params)] == expected
+
+    @pytest.mark.parametrize(
+        argnames="value",
+        argvalues=[
+            re.compile(r"^menu"),
+            re.compile(r"MENU\b", re.IGNORECASE),
+            re.compile(r"^item$", re.MULTILINE),
+            re.compile(r"menu.item", re.DOTALL),
+            re.compile(r"[a-z]+-\w+", re.ASCII),
+            re.compile(r"(?i)widget"),
+        ],
+    )
+    def test_find_all_with_exslt_matches_regex_as_python(self, value: re.Pattern):
+        """
+        Tests if `find_all` with regex attributes returns the same elements
+        with EXSLT enabled as with matching in python, including patterns
+        with flags not supported by EXSLT, which fall back to python.
+        """
+        markup = """
+            <div>
+                <span class="menu">1</span><a class="menu-item">2</a>
+                <p class="Widget\nitem">3</p><p class="menu\nitem">4</p>
+                <a class="ménu-ä">5</a>
+            </div>
+        """
+        expected = LXMLElement(html.fragment_fromstring(markup))
+        element = LXMLElement(html.fragment_fromstring(markup))
+        enable_exslt(element)
+
+        result = [x.text for x in element.find_all(attrs={"class": value})]
+        limited = element.find_all(attrs={"class": value}, limit=1)
+
+        assert result == [x.text for x in expected.find_all(attrs={"class": value})]
+        assert [x.text for x in limited] == result[:1]
+
+    @pytest.mark.parametrize(
+        argnames="pattern",
+        argvalues=[
+            "Price",
+            re.compile(r"\d+ USD$"),
+            re.compile(r"^price", re.IGNORECASE),
+            re.compile(r"^USD$", re.MULTILINE),
+        ],
+    )
+    def test_pattern_selector_with_exslt_matches_text_as_python(
+        self, pattern: re.Pattern
+    ):
+        """
+        Tests if `PatternSelector` finds the same leaf elements with EXSLT
+        enabled as with matching text in python, skipping elements with children.
+        """
+        markup = """
+            <div>
+                <span>Price</span><p>10 USD</p><p>Price<br></p>
+                <div><b>20</b> USD</div><p>price\nUSD</p><p></p>
+            </div>
+        """
+        expected = LXMLElement(html.fragment_fromstring(markup))
+        element = LXMLElement(html.fragment_fromstring(markup))
+        enable_exslt(element)
+
+        selector = PatternSelector(pattern)
+        result = selector.find_all(element)
+
+        assert [x.text for x in result] == [x.text for x in selector.find_all(expected)]
+        assert expected._find_text(pattern) is None
+
+    @pytest.mark.parametrize(
+        argnames="scope",
+        argvalues=[
+            TypeSelector("p"),
+            ClassSelector("menu"),
+            IdSelector("main"),
+            AttributeSelector("role"),
+            TypeSelector("a") & ClassSelector("menu"),
+            ClassSelector("menu") & ClassSelector("widget"),
+            ClassSelector("link") & ClassSelector("menu") & TypeSelector("a"),
+        ],
+    )
+    def test_from_scope_parses_only_subtrees_matched_by_scope(self, scope):
+        """
+        Tests if `from_scope` builds document with only subtrees matched
+        by the scope and scope finds the same elements in it as in whole page.
+        """
+        text = """
+            <div id="main" class="widget menu">Text<a class="menu">1</a></div>
+            <p role="list">2<span class="menu">3</span></p>tail
+            <section><a class="link menu" v-on:click="go">4</a><p>5</p></section>
+        """
+        element = LXMLElement.from_scope(text, scope)
+        whole = LXMLElement(html.fromstring(text))
+
+        result = scope.find_all(element)
+        expected = scope.find_all(whole)
+
+        assert [(x.name, x.text) for x in result] == [
+            (x.name, x.text) for x in expected
+        ]
+        # only matched elements are kept at the top level
+        assert all(x in result for x in element.children)
+
+    def test_from_scope_raises_exception_for_unsupported_scope(self):
+        """
+        Tests if `from_scope` raises `UnsupportedScopeException` if scope
+        can not be evaluated while parsing, as it depends on relatives of element.
+        """
+        with pytest.raises(UnsupportedScopeException):
+            LXMLElement.from_scope(
+                "<div><p></p></div>", TypeSelector("div") > TypeSelector("p")
+            )
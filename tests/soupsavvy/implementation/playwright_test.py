@@ -7,9 +7,10 @@ and the way they interact with soupsavvy.
 import re
 
 import pytest
-from playwright.sync_api import Error, Page, TimeoutError
+from playwright.sync_api import ElementHandle, Error, Page, TimeoutError
 
 import soupsavvy.exceptions as exc
+from soupsavvy import ClassSelector, TypeSelector
 from soupsavvy.implementation.playwright import PlaywrightBrowser, PlaywrightElement
 from soupsavvy.selectors.css.api import PlaywrightCSSApi
 from soupsavvy.selectors.xpath.api import PlaywrightXPathApi
@@ -279,6 +280,156 @@ class TestPlaywrightElement:
             "<a>Earth</a>",
         ]
 
+    def test_derived_elements_are_identified_in_single_call(
+        self, playwright_page: Page, monkeypatch: pytest.MonkeyPatch
+    ):
+        """
+        Tests if elements returned by list-producing methods get identifiers
+        in a single call to the page, which are consistent with identifiers
+        of elements created separately from handles of the same nodes.
+        """
+        text = """
+            <div>
+                <p>Hello</p>
+                <span><a>Earth</a></span>
+            </div>
+        """
+        playwright_page.set_content(text)
+        node = playwright_page.query_selector("div")
+        assert node is not None
+        element = PlaywrightElement(node)
+
+        calls = []
+        evaluate = ElementHandle.evaluate
+
+        def spy(self, expression, *args, **kwargs):
+            calls.append(expression)
+            return evaluate(self, expression, *args, **kwargs)
+
+        monkeypatch.setattr(ElementHandle, "evaluate", spy)
+        descendants = list(element.descendants)
+
+        assert len(calls) == 1
+        assert len(set(descendants)) == 4
+
+        monkeypatch.undo()
+        link = playwright_page.query_selector("a")
+        assert link is not None
+
+        assert descendants[-1] == PlaywrightElement(link)
+        assert element.find_all("a") == [descendants[-1]]
+        assert element.find_all("b") == []
+
+    def test_executes_selector_program_in_single_evaluation(
+        self, playwright_page: Page, monkeypatch: pytest.MonkeyPatch
+    ):
+        """
+        Tests if composite selector is executed in the page with a single
+        evaluation by its `find_all` method and returns the same elements
+        as search of the selector in python.
+        """
+        text = """
+            <div>
+                <p class="widget">Hello</p>
+                <a>Earth</a>
+                <span><a>Mars</a></span>
+            </div>
+            <a>Venus</a>
+        """
+        playwright_page.set_content(text)
+        node = playwright_page.query_selector("html")
+        assert node is not None
+        element = PlaywrightElement(node)
+        selector = (TypeSelector("div") > TypeSelector("a")) | (
+            ClassSelector("widget") + TypeSelector("a")
+        )
+
+        with monkeypatch.context() as patch:
+            # elements found by the selector in python
+            patch.setattr(PlaywrightElement, "_EXECUTES_PROGRAMS", False)
+            expected = selector.find_all(element)
+
+        calls = []
+        evaluate_handle = ElementHandle.evaluate_handle
+
+        def spy(self, expression, *args, **kwargs):
+            calls.append(expression)
+            return evaluate_handle(self, expression, *args, **kwargs)
+
+        monkeypatch.setattr(ElementHandle, "evaluate_handle", spy)
+        result = selector.find_all(element)
+
+        assert len(calls) == 1
+        assert result == expected
+        assert [strip(str(x)) for x in result] == ["<a>Earth</a>"]
+
+    def test_prefetched_elements_are_read_without_calls_to_page(
+        self, playwright_page: Page, monkeypatch: pytest.MonkeyPatch
+    ):
+        """
+        Tests if elements returned by list-producing methods of element
+        with prefetch enabled get records in the same call, that assigns
+        their identifiers, and their name, attributes and text are read
+        without further calls, with the same values as live reads.
+        """
+        text = """
+            <div>
+                <a id="shop" class="link menu">Shop</a>
+                <p>Text</p>
+            </div>
+        """
+        playwright_page.set_content(text)
+        node = playwright_page.query_selector("div")
+        assert node is not None
+        element = PlaywrightElement(node, prefetch=True)
+
+        calls = []
+        evaluate = ElementHandle.evaluate
+
+        def spy(self, expression, *args, **kwargs):
+            calls.append(expression)
+            return evaluate(self, expression, *args, **kwargs)
+
+        monkeypatch.setattr(ElementHandle, "evaluate", spy)
+        link, paragraph = element.children
+        result = [(x.name, x.text, x.get_attribute("class")) for x in (link, paragraph)]
+
+        assert len(calls) == 1
+        assert link.attributes == {"id": "shop", "class": "link menu"}
+        assert link.get_attribute("missing") is None
+
+        monkeypatch.undo()
+        live = [PlaywrightElement(link.node), PlaywrightElement(paragraph.node)]
+        assert result == [(x.name, x.text, x.get_attribute("class")) for x in live]
+        assert result == [
+            ("a", "Shop", "link menu"),
+            ("p", "Text", None),
+        ]
+
+    def test_prefetched_record_is_updated_on_refresh(self, playwright_page: Page):
+        """
+        Tests if record of prefetched element reflects the element at the time
+        it was fetched, prefetch is propagated to derived elements
+        and `refresh` fetches current state of the element.
+        """
+        text = """<div><p><a class="link">Shop</a></p></div>"""
+        playwright_page.set_content(text)
+        node = playwright_page.query_selector("div")
+        assert node is not None
+        element = PlaywrightElement(node, prefetch=True)
+
+        paragraph = element.find_all("p")[0]
+        link = paragraph.find_all("a")[0]
+        playwright_page.evaluate(
+            "() => { const a = document.querySelector('a');"
+            "a.textContent = 'Changed'; a.className = 'other'; }"
+        )
+
+        assert (link.text, link.get_attribute("class")) == ("Shop", "link")
+        link.refresh()
+        assert (link.text, link.get_attribute("class")) == ("Changed", "other")
+        assert link.parent == paragraph
+
     def test_descendants_returns_empty_iterator_if_no_descendants_of_element(
         self, playwright_page: Page
     ):
@@ -1136,6 +1287,53 @@ class TestPlaywrightBrowser:
         browser.click(element)
         assert element.text == "Clicked"
 
+    def test_snapshot_elements_are_mapped_back_to_page(self, playwright_page: Page):
+        """
+        Tests if snapshot of the page is searched in-process and its elements
+        are mapped back to live elements, when passed to browser actions.
+        """
+        text = """
+            <div class="menu"><a href="/shop">Shop</a></div>
+            <button onclick="this.innerText='Clicked'">Not clicked</button>
+            <input type="text" />
+        """
+        playwright_page.set_content(text)
+        browser = PlaywrightBrowser(playwright_page)
+        snapshot = browser.snapshot()
+
+        link = (TypeSelector("div") > TypeSelector("a")).find(snapshot, strict=True)
+        button = TypeSelector("button").find(snapshot, strict=True)
+        input_ = TypeSelector("input").find(snapshot, strict=True)
+
+        assert link.get_attribute("href") == "/shop"
+        node = playwright_page.query_selector("a")
+        assert node is not None
+        assert browser.resolve(link) == PlaywrightElement(node)
+
+        browser.click(button)
+        browser.send_keys(input_, "Hello")
+
+        assert playwright_page.inner_text("button") == "Clicked"
+        assert playwright_page.input_value("input") == "Hello"
+
+    def test_stale_snapshot_elements_are_not_mapped_back(self, playwright_page: Page):
+        """
+        Tests if elements of the snapshot can not be mapped back to the page,
+        when newer snapshot was taken or element was removed from the page.
+        """
+        playwright_page.set_content("<p>Hello</p><span>World</span>")
+        browser = PlaywrightBrowser(playwright_page)
+        paragraph = TypeSelector("p").find(browser.snapshot(), strict=True)
+        span = TypeSelector("span").find(browser.snapshot(), strict=True)
+
+        with pytest.raises(exc.StaleSnapshotException):
+            browser.resolve(paragraph)
+
+        playwright_page.evaluate("document.querySelector('span').remove()")
+
+        with pytest.raises(exc.StaleSnapshotException):
+            browser.click(span)
+
     def test_click_element_covered_by_other(self, playwright_page: Page):
         """
         Tests that `click` method works even when the element
@@ -0,0 +1,386 @@
+"""
+Module with unit tests for execution of selectors inside the page.
+Tests if selectors are serialized into programs and if results of programs
+are the same as results of `find_all` method of selectors.
+"""
+
+import asyncio
+import re
+from typing import Callable, Optional
+
+import pytest
+from bs4 import BeautifulSoup, Tag
+from typing_extensions import Self
+
+import soupsavvy.exceptions as exc
+from soupsavvy import (
+    AttributeSelector,
+    ClassSelector,
+    ExpressionSelector,
+    IdSelector,
+    NthLastOfSelector,
+    NthOfSelector,
+    OnlyOfSelector,
+    PatternSelector,
+    SelfSelector,
+    TypeSelector,
+    UniversalSelector,
+)
+from soupsavvy.base import SoupSelector
+from soupsavvy.implementation import remote
+from soupsavvy.implementation.bs4 import SoupElement
+from soupsavvy.interfaces import IElement
+from soupsavvy.selectors.css.selectors import CSS, FirstChild, LastChild
+from soupsavvy.selectors.relative import Anchor, HasSelector
+from tests.soupsavvy.conftest import MockAsyncElement
+
+HTML = """
+    <div class="menu widget" id="main">
+        <a class="link" href="/shop">Shop</a>
+        <p><span class="link">nested</span><a>Inner</a></p>
+        <a href="/about">About</a>
+        <div><p><span>Deep</span></p><a class="link">Shop</a></div>
+    </div>
+    <p class="widget-box"><span>Tail</span></p>
+    <a id="footer">Footer</a>
+    <div><span>Only</span></div>
+"""
+
+DIV = TypeSelector("div")
+P = TypeSelector("p")
+A = TypeSelector("a")
+SPAN = TypeSelector("span")
+LINK = ClassSelector("link")
+
+SELECTORS = [
+    DIV,
+    UniversalSelector(),
+    LINK,
+    ClassSelector(re.compile("box")),
+    IdSelector("main"),
+    AttributeSelector("href", re.compile(r"^/s\w+$")),
+    PatternSelector("Shop"),
+    PatternSelector(re.compile("^T")),
+    DIV | P,
+    A & LINK,
+    ~(A | SPAN),
+    A ^ LINK,
+    NthOfSelector(A, "2n+1"),
+    NthLastOfSelector(SPAN, "-n+2"),
+    OnlyOfSelector(SPAN),
+    FirstChild(),
+    HasSelector(Anchor > A),
+    HasSelector(Anchor + A, Anchor < P),
+    HasSelector(Anchor << DIV, Anchor * SPAN),
+    DIV > A,
+    DIV >> SPAN,
+    P + A,
+    A * DIV,
+    SPAN < P,
+    SPAN << DIV,
+    (DIV >> P) + A,
+    DIV > LastChild(),
+    (DIV > A) | (P > SPAN),
+    ~(DIV > A),
+    (DIV >> A) & LINK,
+    HasSelector(A) > SPAN,
+]
+
+
+def find_in_python(
+    selector: SoupSelector,
+    element: IElement,
+    recursive: bool = True,
+    limit: Optional[int] = None,
+) -> list[IElement]:
+    """Returns elements found by selector in python, without executing programs."""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(type(element), "_EXECUTES_PROGRAMS", False)
+        return selector.find_all(element, recursive=recursive, limit=limit)
+
+
+class MockProgramElement(SoupElement):
+    """Mock element, which records executed programs and returns itself."""
+
+    _EXECUTES_PROGRAMS = True
+
+    def __init__(self, node: Tag) -> None:
+        super().__init__(node)
+        self.programs: list[list] = []
+
+    def _execute(
+        self,
+        program: list,
+        recursive: bool = True,
+        limit: Optional[int] = None,
+    ) -> Optional[list[Self]]:
+        self.programs.append(program)
+        return [self]
+
+
+class MockExecutingElement(MockAsyncElement):
+    """Mock asynchronous element, which executes programs in its snapshot."""
+
+    async def _execute(
+        self,
+        program: list,
+        recursive: bool = True,
+        limit: Optional[int] = None,
+    ) -> Optional[list[Self]]:
+        self.calls.append("execute")
+        return []
+
+
+@pytest.mark.implementation
+class TestRemote:
+    """Class with unit tests for execution of selector programs in the page."""
+
+    @pytest.mark.parametrize(argnames="selector", argvalues=SELECTORS, ids=repr)
+    @pytest.mark.parametrize(argnames="recursive", argvalues=[True, False])
+    def test_results_are_the_same_as_find_all(
+        self,
+        to_element: Callable[[str], IElement],
+        selector: SoupSelector,
+        recursive: bool,
+    ):
+        """
+        Tests if selector is executed as program and returns the same elements
+        in the same order as search of the selector in python.
+        Implementations, which do not execute programs, return None.
+        """
+        element = to_element(HTML)
+        expected = find_in_python(selector, element, recursive=recursive)
+        executed = remote.execute(selector, element, recursive=recursive)
+
+        assert executed is None or executed == expected
+        assert selector.find_all(element, recursive=recursive) == expected
+
+    def test_find_all_respects_limit(self, to_element: Callable[[str], IElement]):
+        """Tests if `find_all` returns at most `limit` first elements."""
+        element = to_element(HTML)
+        selector = DIV >> A
+
+        result = selector.find_all(element, limit=2)
+        assert result == find_in_python(selector, element)[:2]
+
+    def test_find_returns_first_match_or_none(
+        self, to_element: Callable[[str], IElement]
+    ):
+        """Tests if `find` returns first matching element or None."""
+        element = to_element(HTML)
+
+        assert LINK.find(element) == find_in_python(LINK, element)[0]
+        assert TypeSelector("table").find(element) is None
+
+    def test_selectors_execute_programs_in_elements_supporting_them(self):
+        """
+        Tests if `find_all` and `find` of selectors execute whole selector
+        as program, if element supports it, and other selectors
+        are searched in python as a whole, without executing nested selectors.
+        """
+        element = MockProgramElement(BeautifulSoup(HTML, "html.parser"))
+        selector = DIV > A
+
+        assert selector.find_all(element) == [element]
+        assert selector.find(element) == element
+        assert element.programs == [remote.compile_program(selector)] * 2
+
+        element.programs.clear()
+        expression = ExpressionSelector(lambda element: element.name == "a")
+        selector = (expression | DIV) > (DIV | A)
+
+        assert selector.find_all(element) == find_in_python(selector, element)
+        assert element.programs == []
+
+    def test_compiles_selector_once_if_it_falls_back_to_python(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        """
+        Tests if selector, which can not be serialized, is dispatched only once
+        at the outermost `find_all` and its nested selectors are not compiled again.
+        """
+        element = MockProgramElement(BeautifulSoup(HTML, "html.parser"))
+        expression = ExpressionSelector(lambda element: element.name == "a")
+        selector = (DIV >> (expression | P)) | HasSelector(Anchor > SPAN)
+        executed: list[SoupSelector] = []
+        execute = remote.execute
+
+        def recorded(selector: SoupSelector, *args, **kwargs):
+            executed.append(selector)
+            return execute(selector, *args, **kwargs)
+
+        monkeypatch.setattr(remote, "execute", recorded)
+
+        assert selector.find_all(element) == find_in_python(selector, element)
+        assert executed == [selector]
+        assert element.programs == []
+
+    def test_does_not_execute_subclasses_overriding_find_all(self):
+        """
+        Tests if subclass of known selector, which overrides `find_all`,
+        is not serialized and its own method is called for program elements.
+        """
+
+        class VisibleDiv(TypeSelector):
+            def find_all(self, tag, recursive=True, limit=None):
+                return [
+                    element
+                    for element in super().find_all(tag, recursive, limit)
+                    if element.get_attribute("hidden") is None
+                ]
+
+        class OwnDiv(TypeSelector):
+            def _find_all(self, tag, recursive=True, limit=None):
+                return []
+
+        element = MockProgramElement(BeautifulSoup(HTML, "html.parser"))
+        selector = VisibleDiv("div")
+
+        with pytest.raises(remote.UnsupportedSelector):
+            remote.compile_program(selector)
+
+        with pytest.raises(remote.UnsupportedSelector):
+            remote.compile_program(DIV > OwnDiv("div"))
+
+        assert selector.find_all(element) == find_in_python(DIV, element)
+        assert OwnDiv("div").find_all(element) == []
+        assert element.programs == []
+
+    @pytest.mark.parametrize(
+        argnames="selector",
+        argvalues=[
+            ExpressionSelector(lambda element: element.name == "a"),
+            DIV > SelfSelector(),
+            AttributeSelector("class", re.compile("LINK", re.I)),
+            HasSelector(Anchor > CSS(":scope > a")),
+        ],
+        ids=repr,
+    )
+    def test_falls_back_to_find_all_for_unsupported_selectors(
+        self, to_element: Callable[[str], IElement], selector: SoupSelector
+    ):
+        """
+        Tests if selectors, which can not be executed in the page,
+        are not serialized and are searched in python.
+        """
+        element = to_element(HTML)
+
+        with pytest.raises(remote.UnsupportedSelector):
+            remote.compile_program(selector)
+
+        assert remote.execute(selector, element) is None
+        assert selector.find_all(element) == find_in_python(selector, element)
+
+    def test_compiles_combinator_into_nested_program(self):
+        """
+        Tests if combinator is serialized with its relation and steps,
+        and logical selectors without combinators are compiled as predicates.
+        """
+        selector = (DIV | P) > NthOfSelector(LINK, "2n+1")
+
+        assert remote.compile_program(selector) == [
+            "combinator",
+            "child",
+            False,
+            ["or", ["tag", "div"], ["tag", "p"]],
+            ["nth", ["attribute", "class", ["string", "link"]], False, 2, 1],
+        ]
+
+    def test_compiles_logical_selector_with_combinators_into_set_operation(self):
+        """
+        Tests if logical selector is serialized as set operation on results
+        of its steps, if any of them is combinator.
+        """
+        selector = (SPAN << DIV) ^ HasSelector(Anchor + A)
+
+        assert remote.compile_program(selector) == [
+            "set",
+            "xor",
+            ["combinator", "ancestor", True, ["tag", "span"], ["tag", "div"]],
+            ["has", ["next", ["tag", "a"]]],
+        ]
+
+    def test_compiles_regex_into_javascript_pattern(self):
+        """Tests if regex patterns are translated into JavaScript source and flags."""
+        selector = PatternSelector(re.compile("shop"))
+        assert remote.compile_program(selector) == ["text", ["regex", ["shop", "u"]]]
+
+
+@pytest.mark.implementation
+class TestRemoteAsync:
+    """Class with unit tests for searching selectors in asynchronous elements."""
+
+    @pytest.mark.parametrize(
+        argnames="selector",
+        argvalues=[DIV >> A, ExpressionSelector(lambda element: element.name == "a")],
+        ids=repr,
+    )
+    @pytest.mark.parametrize(argnames="recursive", argvalues=[True, False])
+    def test_afind_all_searches_snapshot_if_programs_are_not_supported(
+        self,
+        to_element: Callable[[str], IElement],
+        selector: SoupSelector,
+        recursive: bool,
+    ):
+        """
+        Tests if `afind_all` finds elements in snapshot of the element
+        and maps them back, if element does not execute programs,
+        and returns the same elements as `find_all` method of the selector.
+        """
+        element = to_element(HTML)
+        async_element = MockAsyncElement(element)
+
+        result = asyncio.run(selector.afind_all(async_element, recursive=recursive))
+
+        assert result == selector.find_all(element, recursive=recursive)
+        assert async_element.calls == ["snapshot", "resolve"]
+
+    def test_afind_all_executes_program_in_element(
+        self, to_element: Callable[[str], IElement]
+    ):
+        """
+        Tests if `afind_all` executes serialized selector in the element
+        and does not take its snapshot.
+        """
+        async_element = MockExecutingElement(to_element(HTML))
+        asyncio.run((DIV >> A).afind_all(async_element, limit=2))
+
+        assert async_element.calls == ["execute"]
+
+    def test_afind_all_searches_snapshot_for_unsupported_selectors(
+        self, to_element: Callable[[str], IElement]
+    ):
+        """
+        Tests if `afind_all` searches snapshot of the element for selectors,
+        which can not be serialized, even if element executes programs.
+        """
+        element = to_element(HTML)
+        async_element = MockExecutingElement(element)
+        selector = DIV > SelfSelector()
+
+        result = asyncio.run(selector.afind_all(async_element))
+
+        assert result == selector.find_all(element)
+        assert async_element.calls == ["snapshot", "resolve"]
+
+    def test_afind_returns_first_match_or_none(
+        self, to_element: Callable[[str], IElement]
+    ):
+        """Tests if `afind` returns first matching element or None."""
+        element = to_element(HTML)
+        async_element = MockAsyncElement(element)
+
+        assert asyncio.run(LINK.afind(async_element)) == LINK.find(element)
+        assert asyncio.run(TypeSelector("table").afind(async_element)) is None
+
+    def test_afind_raises_exception_if_strict_and_nothing_matches(
+        self, to_element: Callable[[str], IElement]
+    ):
+        """
+        Tests if `afind` raises `TagNotFoundException` if nothing matches
+        and `strict` is set to True.
+        """
+        async_element = MockAsyncElement(to_element(HTML))
+
+        with pytest.raises(exc.TagNotFoundException):
+            asyncio.run(TypeSelector("table").afind(async_element, strict=True))
@@ -12,6 +12,7 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 
 import soupsavvy.exceptions as exc
+from soupsavvy import ClassSelector, TypeSelector
 from soupsavvy.implementation.selenium import SeleniumBrowser, SeleniumElement
 from soupsavvy.selectors.css.api import SeleniumCSSApi
 from soupsavvy.selectors.xpath.api import SeleniumXPathApi
@@ -770,6 +771,152 @@ class TestSeleniumElement:
             """<span class="menu your_widget">Hello</span>""",
         ]
 
+    @pytest.mark.parametrize(
+        argnames="pattern",
+        argvalues=[re.compile(r"^widget\d*$"), re.compile(r"^WIDGET\d*$", re.I)],
+        ids=["in_page", "in_python"],
+    )
+    def test_finds_all_elements_with_regex_in_single_script_call(
+        self,
+        driver_selenium: WebDriver,
+        monkeypatch: pytest.MonkeyPatch,
+        pattern: re.Pattern,
+    ):
+        """
+        Tests if `find_all` with regex attribute makes a single script call,
+        whether pattern is translated and matched in the page or attribute
+        values are returned with elements and matched in python.
+        """
+        text = """
+            <div>
+                <p class="widget123">Hello</p>
+                <span class="widget menu">Hi</span>
+            </div>
+            <h1 class="widget">Welcome</h1>
+            <span class="widget4">Hello</span>
+        """
+        insert(text, driver=driver_selenium)
+        node = driver_selenium.find_element(By.TAG_NAME, "html")
+        element = SeleniumElement(node)
+
+        calls = []
+        execute_script = driver_selenium.execute_script
+
+        def spy(*args):
+            calls.append(args)
+            return execute_script(*args)
+
+        monkeypatch.setattr(driver_selenium, "execute_script", spy)
+        result = element.find_all(attrs={"class": pattern}, limit=2)
+
+        assert len(calls) == 1
+        assert [strip(str(x)) for x in result] == [
+            """<p class="widget123">Hello</p>""",
+            """<h1 class="widget">Welcome</h1>""",
+        ]
+
+    def test_executes_selector_program_in_single_script_call(
+        self, driver_selenium: WebDriver, monkeypatch: pytest.MonkeyPatch
+    ):
+        """
+        Tests if composite selector is executed in the page with a single
+        script call by its `find_all` method and returns the same elements
+        as search of the selector in python.
+        """
+        text = """
+            <div>
+                <p class="widget">Hello</p>
+                <a>Earth</a>
+                <span><a>Mars</a></span>
+            </div>
+            <a>Venus</a>
+        """
+        insert(text, driver=driver_selenium)
+        node = driver_selenium.find_element(By.TAG_NAME, "html")
+        element = SeleniumElement(node)
+        selector = (TypeSelector("div") > TypeSelector("a")) | (
+            ClassSelector("widget") + TypeSelector("a")
+        )
+
+        with monkeypatch.context() as patch:
+            # elements found by the selector in python
+            patch.setattr(SeleniumElement, "_EXECUTES_PROGRAMS", False)
+            expected = selector.find_all(element)
+
+        calls = []
+        execute_script = driver_selenium.execute_script
+
+        def spy(*args):
+            calls.append(args)
+            return execute_script(*args)
+
+        monkeypatch.setattr(driver_selenium, "execute_script", spy)
+        result = selector.find_all(element)
+
+        assert len(calls) == 1
+        assert result == expected
+        assert [strip(str(x)) for x in result] == ["<a>Earth</a>"]
+
+    def test_prefetched_elements_are_read_without_calls_to_page(
+        self, driver_selenium: WebDriver, monkeypatch: pytest.MonkeyPatch
+    ):
+        """
+        Tests if elements returned by list-producing methods of element
+        with prefetch enabled get records in a single call for all of them,
+        and their name, attributes and text are read without further calls.
+        """
+        text = """
+            <div>
+                <a id="shop" class="link menu">Shop</a>
+                <p>Text</p>
+            </div>
+        """
+        insert(text, driver=driver_selenium)
+        node = driver_selenium.find_element(By.TAG_NAME, "div")
+        element = SeleniumElement(node, prefetch=True)
+
+        calls = []
+        execute = driver_selenium.execute
+
+        def spy(*args, **kwargs):
+            calls.append(args)
+            return execute(*args, **kwargs)
+
+        monkeypatch.setattr(driver_selenium, "execute", spy)
+        link, paragraph = element.find_all()
+        result = [(x.name, x.text, x.get_attribute("class")) for x in (link, paragraph)]
+
+        assert len(calls) == 2
+        assert link.attributes == {"id": "shop", "class": "link menu"}
+        assert link.get_attribute("missing") is None
+        assert result == [
+            ("a", "Shop", "link menu"),
+            ("p", "Text", None),
+        ]
+
+    def test_prefetched_record_is_updated_on_refresh(self, driver_selenium: WebDriver):
+        """
+        Tests if record of prefetched element reflects the element at the time
+        it was fetched, prefetch is propagated to derived elements
+        and `refresh` fetches current state of the element.
+        """
+        text = """<div><p><a class="link">Shop</a></p></div>"""
+        insert(text, driver=driver_selenium)
+        node = driver_selenium.find_element(By.TAG_NAME, "div")
+        element = SeleniumElement(node, prefetch=True)
+
+        paragraph = element.find_all("p")[0]
+        link = paragraph.find_all("a")[0]
+        driver_selenium.execute_script(
+            "const a = document.querySelector('a');"
+            "a.textContent = 'Changed'; a.className = 'other';"
+        )
+
+        assert (link.text, link.get_attribute("class")) == ("Shop", "link")
+        link.refresh()
+        assert (link.text, link.get_attribute("class")) == ("Changed", "other")
+        assert link.parent == paragraph
+
     def test_finds_all_elements_with_matching_multiple_attributes(
         self, driver_selenium: WebDriver
     ):
@@ -1084,6 +1231,58 @@ class TestSeleniumBrowser:
         browser.click(element)
         assert element.text == "Clicked"
 
+    def test_snapshot_elements_are_mapped_back_to_page(
+        self, driver_selenium: WebDriver
+    ):
+        """
+        Tests if snapshot of the page is searched in-process and its elements
+        are mapped back to live elements, when passed to browser actions.
+        """
+        text = """
+            <div class="menu"><a href="/shop">Shop</a></div>
+            <button onclick="this.innerText='Clicked'">Not clicked</button>
+            <input type="text" />
+        """
+        insert(text, driver=driver_selenium)
+        browser = SeleniumBrowser(driver_selenium)
+        snapshot = browser.snapshot()
+
+        link = (TypeSelector("div") > TypeSelector("a")).find(snapshot, strict=True)
+        button = TypeSelector("button").find(snapshot, strict=True)
+        input_ = TypeSelector("input").find(snapshot, strict=True)
+
+        assert link.get_attribute("href") == "/shop"
+        assert browser.resolve(link) == SeleniumElement(
+            driver_selenium.find_element(By.TAG_NAME, "a")
+        )
+
+        browser.click(button)
+        browser.send_keys(input_, "Hello")
+
+        assert driver_selenium.find_element(By.TAG_NAME, "button").text == "Clicked"
+        node = driver_selenium.find_element(By.TAG_NAME, "input")
+        assert node.get_attribute("value") == "Hello"
+
+    def test_stale_snapshot_elements_are_not_mapped_back(
+        self, driver_selenium: WebDriver
+    ):
+        """
+        Tests if elements of the snapshot can not be mapped back to the page,
+        when newer snapshot was taken or element was removed from the page.
+        """
+        insert("<p>Hello</p><span>World</span>", driver=driver_selenium)
+        browser = SeleniumBrowser(driver_selenium)
+        paragraph = TypeSelector("p").find(browser.snapshot(), strict=True)
+        span = TypeSelector("span").find(browser.snapshot(), strict=True)
+
+        with pytest.raises(exc.StaleSnapshotException):
+            browser.resolve(paragraph)
+
+        insert("<span>World</span>", driver=driver_selenium)
+
+        with pytest.raises(exc.StaleSnapshotException):
+            browser.click(span)
+
     def test_click_element_covered_by_other(self, driver_selenium: WebDriver):
         """
         Tests that `click` method works even when the element
@@ -0,0 +1,116 @@
+"""Module with unit tests for snapshots of browser pages."""
+
+import pytest
+from bs4 import BeautifulSoup
+
+from soupsavvy import ClassSelector, TypeSelector
+from soupsavvy.implementation.bs4 import SoupElement
+from soupsavvy.implementation.compact import CompactElement
+from soupsavvy.implementation.snapshot import (
+    SNAPSHOT_ATTRIBUTE,
+    get_snapshot,
+    parse_snapshot,
+)
+from tests.soupsavvy.conftest import MockAsyncElement
+
+TOKEN = "token"
+
+
+def mark(markup: str) -> str:
+    """Adds indexes of elements in document order, as the page does."""
+    soup = BeautifulSoup(markup, "html.parser")
+
+    for index, tag in enumerate(soup.find_all(True)):
+        tag[SNAPSHOT_ATTRIBUTE] = str(index)
+
+    return str(soup)
+
+
+MARKUP = """
+    <html><head><title>Shop</title></head>
+    <body><div class="menu"><a class="link" href="/shop">Shop</a><br>
+    <p>Text<span class="link">nested</span></p></div></body></html>
+"""
+
+
+@pytest.mark.implementation
+class TestSnapshot:
+    """Class with unit tests for parsing snapshots of browser pages."""
+
+    def test_returns_html_element_without_snapshot_attributes(self):
+        """
+        Tests if snapshot is parsed into compact document, which html element
+        is returned, and attributes with indexes are not part of the document.
+        """
+        element = parse_snapshot(mark(MARKUP), TOKEN)
+        expected = BeautifulSoup(MARKUP, "html.parser").html
+
+        assert isinstance(element, CompactElement)
+        assert element.name == "html"
+        assert str(element) == str(expected)
+        assert SNAPSHOT_ATTRIBUTE not in str(element)
+
+    def test_elements_are_mapped_to_indexes_in_page(self):
+        """
+        Tests if each element of the snapshot is mapped to its index
+        in document order of the page.
+        """
+        element = parse_snapshot(mark(MARKUP), TOKEN)
+        snapshot = get_snapshot(element)
+        assert snapshot is not None
+
+        elements = [element, *element.descendants]
+
+        assert snapshot.token == TOKEN
+        assert [snapshot.identifier(x) for x in elements] == list(range(9))
+
+    def test_elements_not_present_in_page_are_not_mapped(self):
+        """
+        Tests if elements without index, like root of the document,
+        are not mapped to any element of the page.
+        """
+        markup = f'<table {SNAPSHOT_ATTRIBUTE}="0"><tr {SNAPSHOT_ATTRIBUTE}="1">'
+        element = parse_snapshot(markup, TOKEN)
+        snapshot = get_snapshot(element)
+        assert snapshot is not None
+
+        assert snapshot.identifier(element) == 0
+        assert snapshot.identifier(element.parent) is None  # type: ignore
+
+    def test_selectors_find_elements_mapped_to_page(self):
+        """Tests if elements found by selectors in snapshot keep their mapping."""
+        element = parse_snapshot(mark(MARKUP), TOKEN)
+        selector = TypeSelector("div") >> ClassSelector("link")
+        snapshot = get_snapshot(element)
+        assert snapshot is not None
+
+        result = selector.find_all(element)
+
+        assert [x.name for x in result] == ["a", "span"]
+        assert [snapshot.identifier(x) for x in result] == [5, 8]
+        assert all(get_snapshot(x) is snapshot for x in result)
+
+    def test_returns_none_for_elements_not_being_part_of_snapshot(self):
+        """Tests if `get_snapshot` returns None for any other elements."""
+        soup = SoupElement(BeautifulSoup(MARKUP, "html.parser"))
+        compact = CompactElement.from_html(MARKUP)
+
+        assert get_snapshot(soup) is None
+        assert get_snapshot(compact) is None
+
+    def test_records_root_element_of_element_snapshots(self):
+        """
+        Tests if snapshot records live element it was taken of,
+        while snapshots of the page have no root element.
+        """
+        root = MockAsyncElement(CompactElement.from_html(MARKUP))
+
+        page = get_snapshot(parse_snapshot(mark(MARKUP), TOKEN))
+        snapshot = get_snapshot(parse_snapshot(mark(MARKUP), TOKEN, root=root))
+        assert page is not None
+        assert snapshot is not None
+
+        assert page.root is None
+        assert page.is_page
+        assert snapshot.root is root
+        assert not snapshot.is_page
@@ -0,0 +1,82 @@
+"""Module with unit tests for document tracking components."""
+
+import pytest
+
+from soupsavvy.implementation.tracking import DocumentState
+
+
+@pytest.mark.implementation
+class TestDocumentState:
+    """Class with unit tests for `DocumentState` component."""
+
+    def test_version_is_zero_after_initialization(self):
+        """Tests if version of the document is 0 after initialization."""
+        root = object()
+        state = DocumentState(root)
+
+        assert state.version == 0
+        assert state.root is root
+
+    def test_bump_increments_version(self):
+        """Tests if `bump` method increments version and returns new one."""
+        state = DocumentState(object())
+
+        assert state.bump() == 1
+        assert state.bump() == 2
+        assert state.version == 2
+
+    def test_cached_returns_value_computed_once_for_version(self):
+        """
+        Tests if `cached` method computes value only once for the same version
+        of the document and returns cached value afterwards.
+        """
+        state = DocumentState(object())
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return len(calls)
+
+        assert state.cached("key", factory) == 1
+        assert state.cached("key", factory) == 1
+        assert len(calls) == 1
+
+    def test_cached_recomputes_value_after_version_bump(self):
+        """Tests if `cached` method recomputes value after version was bumped."""
+        state = DocumentState(object())
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return len(calls)
+
+        assert state.cached("key", factory) == 1
+        state.bump()
+        assert state.cached("key", factory) == 2
+        assert state.cached("key", factory) == 2
+
+    def test_clear_removes_cached_values(self):
+        """Tests if `clear` method removes all cached values."""
+        state = DocumentState(object())
+        values = iter([1, 2])
+
+        assert state.cached("key", lambda: next(values)) == 1
+        state.clear()
+        assert state.cached("key", lambda: next(values)) == 2
+
+    def test_enabled_options_are_kept_after_version_bump(self):
+        """
+        Tests if options enabled for the document are kept after version bump
+        and clearing cache, and are independent of cached values.
+        """
+        state = DocumentState(object())
+        state.cached("option", lambda: 1)
+
+        assert state.is_enabled("option") is False
+
+        state.enable("option")
+        state.bump()
+        state.clear()
+
+        assert state.is_enabled("option") is True
+        assert state.is_enabled("other") is False
@@ -0,0 +1,410 @@
+"""Module with unit tests for `DocumentIndex` component."""
+
+import re
+
+import pytest
+
+from soupsavvy.base import SoupSelector
+from soupsavvy.indexing import DocumentIndex, get_index, index_document
+from soupsavvy.selectors.attributes import ClassSelector
+from soupsavvy.selectors.combinators import ChildCombinator, DescendantCombinator
+from soupsavvy.selectors.general import (
+    PatternSelector,
+    SelfSelector,
+    TypeSelector,
+    UniversalSelector,
+)
+from soupsavvy.selectors.logical import AndSelector, NotSelector, SelectorList
+from soupsavvy.selectors.relative import (
+    Anchor,
+    HasSelector,
+    RelativeChild,
+    RelativeDescendant,
+)
+from tests.soupsavvy.conftest import ToElement, strip
+
+HTML = """
+    <div class="menu" id="main">
+        <a class="link widget" href="/shop">1</a>
+        <p><a class="link" href="/product/1">2</a></p>
+        <span id="content"><a href="/product/2">3</a></span>
+    </div>
+    <div class="widget"><a class="link">4</a></div>
+"""
+
+
+@pytest.mark.skip_selenium
+@pytest.mark.skip_playwright
+@pytest.mark.skip_compact
+@pytest.mark.implementation
+class TestDocumentIndex:
+    """Class with unit tests for `DocumentIndex` component."""
+
+    def test_get_index_returns_none_if_index_not_enabled(self, to_element: ToElement):
+        """Tests if `get_index` returns None if index was not enabled for document."""
+        element = to_element(HTML)
+        assert get_index(element) is None
+
+    def test_index_document_enables_index_for_document(self, to_element: ToElement):
+        """
+        Tests if `index_document` enables index, which is shared by all
+        elements of the document and returned by `get_index`.
+        """
+        element = to_element(HTML)
+        index = index_document(element)
+
+        assert isinstance(index, DocumentIndex)
+        assert get_index(element) is index
+        assert get_index(element.find_all("a")[0]) is index
+
+    def test_elements_have_preorder_positions(self, to_element: ToElement):
+        """Tests if elements are assigned increasing positions in document order."""
+        element = to_element(HTML)
+        index = index_document(element)
+
+        positions = [index.position(x) for x in element.descendants]
+        known = [position for position in positions if position is not None]
+        assert known == positions
+        assert known == sorted(known)
+        assert len(set(known)) == len(known)
+
+    @pytest.mark.parametrize(
+        argnames="params",
+        argvalues=[
+            {"name": "a"},
+            {"attrs": {"class": "link"}},
+            {"attrs": {"class": "widget"}},
+            {"attrs": {"id": "content"}},
+            {"attrs": {"href": re.compile("product")}},
+            {"name": "a", "attrs": {"class": "link", "href": re.compile("/")}},
+            {"name": "span", "attrs": {"class": "link"}},
+            {},
+        ],
+    )
+    def test_find_all_returns_the_same_results_as_linear_scan(
+        self, to_element: ToElement, params: dict
+    ):
+        """
+        Tests if `find_all` of element with enabled index returns the same
+        results as linear scan of the document.
+        """
+        expected = [str(x) for x in to_element(HTML).find_all(**params)]
+
+        element = to_element(HTML)
+        index_document(element)
+        result = [str(x) for x in element.find_all(**params)]
+
+        assert result == expected
+
+    def test_find_all_is_scoped_to_subtree_of_element(self, to_element: ToElement):
+        """Tests if index search returns only elements within searched element."""
+        element = to_element(HTML)
+        index = index_document(element)
+        scope = element.find_all("span")[0]
+
+        result = index.find_all(scope, name="a")
+
+        assert result is not None
+        assert [strip(str(x)) for x in result] == ['<a href="/product/2">3</a>']
+
+    def test_find_all_respects_recursive_and_limit(self, to_element: ToElement):
+        """Tests if index search respects `recursive` and `limit` parameters."""
+        element = to_element(HTML)
+        index = index_document(element)
+        scope = element.find_all("div")[0]
+
+        children = index.find_all(scope, name="a", recursive=False)
+        limited = index.find_all(scope, name="a", limit=2)
+
+        assert children is not None
+        assert limited is not None
+        assert [x.text for x in children] == ["1"]
+        assert [x.text for x in limited] == ["1", "2"]
+
+    def test_find_all_returns_none_for_element_outside_document(
+        self, to_element: ToElement
+    ):
+        """
+        Tests if index search returns None for element, which is not a part
+        of indexed document, so search can fall back to linear scan.
+        """
+        index = index_document(to_element(HTML))
+        other = to_element(HTML)
+
+        assert index.position(other) is None
+        assert index.find_all(other, name="a") is None
+
+    def test_index_is_rebuilt_after_document_is_mutated(self, to_element: ToElement):
+        """
+        Tests if index is rebuilt after document was mutated
+        and search reflects the change.
+        """
+        element = to_element(HTML)
+        index = index_document(element)
+
+        element.find_all("span")[0].decompose()
+
+        assert get_index(element) is not index
+        assert [x.text for x in element.find_all("a")] == ["1", "2", "4"]
+
+    def test_contains_checks_descendants_and_children(self, to_element: ToElement):
+        """
+        Tests if `contains` checks ancestor-descendant relationship
+        with interval numbering, optionally only for direct children.
+        """
+        element = to_element(HTML)
+        index = index_document(element)
+        div, p = element.find_all("div")[0], element.find_all("p")[0]
+        nested, other = div.find_all("a")[1], element.find_all("div")[1]
+
+        assert index.contains(div, nested) is True
+        assert index.contains(div, nested, recursive=False) is False
+        assert index.contains(p, nested, recursive=False) is True
+        assert index.contains(other, nested) is False
+        assert index.contains(div, div) is False
+        assert index.contains(to_element(HTML), nested) is None
+
+    def test_elements_returns_descendants_or_children(self, to_element: ToElement):
+        """Tests if `elements` returns descendants or children in document order."""
+        element = to_element(HTML)
+        index = index_document(element)
+        div = element.find_all("div")[0]
+
+        descendants = index.elements(div)
+        children = index.elements(div, recursive=False)
+
+        assert descendants == list(div.descendants)
+        assert children == list(div.children)
+
+    def test_restrict_keeps_unique_elements_within_scope(self, to_element: ToElement):
+        """
+        Tests if `restrict` keeps only unique elements within the scope,
+        ordered by their position in the document.
+        """
+        element = to_element(HTML)
+        index = index_document(element)
+        div = element.find_all("div")[0]
+        links = element.find_all("a")
+
+        result = index.restrict(div, [links[2], links[3], links[0], links[2]])
+        children = index.restrict(div, links, recursive=False)
+
+        assert result is not None
+        assert children is not None
+        assert [x.text for x in result] == ["1", "3"]
+        assert [x.text for x in children] == ["1"]
+
+    def test_descendants_of_filters_elements_within_any_anchor(
+        self, to_element: ToElement
+    ):
+        """
+        Tests if `descendants_of` returns unique elements, which are descendants
+        of any of anchors, including nested anchors.
+        """
+        element = to_element(HTML)
+        index = index_document(element)
+        anchors = [*element.find_all("div"), element.find_all("p")[0]]
+
+        result = index.descendants_of(anchors, element.find_all("a"))
+
+        assert result is not None
+        assert [x.text for x in result] == ["1", "2", "3", "4"]
+
+    def test_has_within_checks_positions_in_subtree(self, to_element: ToElement):
+        """Tests if `has_within` checks if any position lies in subtree of element."""
+        element = to_element(HTML)
+        index = index_document(element)
+        positions = index.positions(element.find_all("span"))
+
+        assert positions is not None
+        assert index.has_within(element.find_all("div")[0], positions) is True
+        assert index.has_within(element.find_all("div")[1], positions) is False
+        assert index.has_within(element.find_all("span")[0], positions) is False
+
+    @pytest.mark.parametrize(
+        argnames="selector",
+        argvalues=[
+            DescendantCombinator(TypeSelector("div"), TypeSelector("a")),
+            DescendantCombinator(UniversalSelector(), ClassSelector("link")),
+            DescendantCombinator(
+                TypeSelector("div"), TypeSelector("p") > TypeSelector("a")
+            ),
+            HasSelector(TypeSelector("a")),
+            HasSelector(Anchor > ClassSelector("link")),
+            HasSelector(Anchor + TypeSelector("span")),
+            SelectorList(TypeSelector("span"), ClassSelector("link")),
+            NotSelector(TypeSelector("a")),
+            HasSelector(TypeSelector("a") & ClassSelector("widget")),
+            HasSelector(TypeSelector("span") & SelfSelector()),
+            DescendantCombinator(
+                TypeSelector("div"), ClassSelector("link") & SelfSelector()
+            ),
+            ChildCombinator(
+                UniversalSelector(), TypeSelector("a") & ClassSelector("link")
+            ),
+        ],
+    )
+    def test_selectors_return_the_same_results_with_index(
+        self, to_element: ToElement, selector: SoupSelector
+    ):
+        """
+        Tests if selectors using interval checks of the index return
+        the same results as without index.
+        """
+        expected = [str(x) for x in selector.find_all(to_element(HTML))]
+
+        element = to_element(HTML)
+        index_document(element)
+        result = [str(x) for x in selector.find_all(element)]
+
+        assert result == expected
+
+    def test_may_contain_checks_subtree_summary(self, to_element: ToElement):
+        """
+        Tests if `may_contain` reports subtrees lacking required tag names
+        or class tokens and never rejects subtrees, which contain them.
+        """
+        element = to_element(HTML)
+        index = index_document(element)
+        first, second = element.find_all("div")
+
+        assert index.may_contain(first, [("tag", "span"), ("class", "menu")])
+        assert index.may_contain(second, [("tag", "a"), ("class", "link")])
+        assert index.may_contain(second, [("tag", "span")]) is False
+        assert index.may_contain(second, [("class", "menu")]) is False
+        assert index.may_contain(to_element(HTML), [("tag", "a")]) is None
+
+    def test_relative_searches_skip_subtrees_lacking_requirements(
+        self, to_element: ToElement, monkeypatch: pytest.MonkeyPatch
+    ):
+        """
+        Tests if descendant and child searches are not performed in subtrees,
+        which summaries lack tag name or class required by the selector.
+        """
+        element = to_element(HTML)
+        index_document(element)
+        searched = []
+        find_all = AndSelector.find_all
+
+        def spy(self, tag, *args, **kwargs):
+            searched.append(tag)
+            return find_all(self, tag, *args, **kwargs)
+
+        monkeypatch.setattr(AndSelector, "find_all", spy)
+        selector = TypeSelector("a") & ClassSelector("link")
+        divs = element.find_all("div")
+
+        assert len(RelativeDescendant(selector).find_all(divs[0])) == 2
+        assert len(RelativeChild(selector).find_all(divs[1])) == 1
+        assert RelativeDescendant(selector).find_all(element.find_all("span")[0]) == []
+        assert RelativeChild(selector).find_all(element.find_all("span")[0]) == []
+        assert searched == divs
+
+    def test_ngrams_are_disabled_by_default(self, to_element: ToElement):
+        """Tests if n-grams are indexed only if requested and kept after rebuild."""
+        element = to_element(HTML)
+
+        assert index_document(element).ngrams is False
+        assert index_document(element, ngrams=True).ngrams is True
+
+        element.find_all("p")[0].decompose()
+        assert get_index(element).ngrams is True  # type: ignore[union-attr]
+
+    @pytest.mark.parametrize(
+        argnames="params",
+        argvalues=[
+            {"attrs": {"href": re.compile(r"/product/\d")}},
+            {"attrs": {"href": re.compile("shop|product")}},
+            {"attrs": {"href": re.compile("missing")}},
+            {"attrs": {"href": "/shop"}},
+            {"attrs": {"class": re.compile("wid")}},
+            {"attrs": {"class": re.compile("ink wid")}},
+            {"name": "a", "attrs": {"href": re.compile("(?i)PRODUCT")}},
+            {"name": "a", "attrs": {"href": re.compile("^/pr")}},
+        ],
+    )
+    def test_find_all_with_ngrams_returns_the_same_results_as_linear_scan(
+        self, to_element: ToElement, params: dict
+    ):
+        """
+        Tests if `find_all` of element with enabled n-gram index returns
+        the same results as linear scan of the document.
+        """
+        expected = [str(x) for x in to_element(HTML).find_all(**params)]
+
+        element = to_element(HTML)
+        index_document(element, ngrams=True)
+        result = [str(x) for x in element.find_all(**params)]
+
+        assert result == expected
+
+    def test_ngrams_narrow_down_candidates(self, to_element: ToElement):
+        """
+        Tests if candidates of queries with required literals are limited
+        to elements containing all trigrams of the literals.
+        """
+        element = to_element(HTML)
+        index = index_document(element, ngrams=True)
+        links = element.find_all("a")
+
+        candidates = index._ngram_candidates("href", re.compile(r"/product/\d"))
+        assert candidates == [index.position(x) for x in links[1:3]]
+        assert index._ngram_candidates("href", re.compile("missing")) == []
+        assert index._ngram_candidates("href", re.compile(r"\d")) is None
+
+    @pytest.mark.parametrize(
+        argnames="pattern",
+        argvalues=[
+            "2",
+            "Add to cart",
+            "missing",
+            re.compile(r"\bto cart\b"),
+            re.compile(r"Add to"),
+            re.compile(r"^Price: \d+"),
+            re.compile(r"(?i)add"),
+            re.compile(r"\d"),
+        ],
+    )
+    def test_pattern_selector_returns_the_same_results_with_text_index(
+        self, to_element: ToElement, pattern
+    ):
+        """
+        Tests if `PatternSelector` returns the same results with enabled
+        text index as with linear scan of the document.
+        """
+        html = (
+            HTML
+            + """
+            <div><button>Add to cart</button><span>Price: 10</span></div>
+            <p>Quickadd to cart<b>Add to cart</b></p>
+        """
+        )
+        selector = PatternSelector(pattern)
+        expected = [str(x) for x in selector.find_all(to_element(html))]
+
+        element = to_element(html)
+        index_document(element, text=True)
+
+        assert [str(x) for x in selector.find_all(element)] == expected
+        assert [str(x) for x in selector.find_all(element, recursive=False)] == [
+            str(x) for x in selector.find_all(to_element(html), recursive=False)
+        ]
+
+    def test_text_index_narrows_down_candidates(self, to_element: ToElement):
+        """
+        Tests if `find_text` returns None without text index and looks up
+        only leaves with exact text or all required tokens.
+        """
+        element = to_element(HTML)
+        index = index_document(element)
+
+        assert index.text is False
+        assert index.find_text(element, "2") is None
+
+        index = index_document(element, text=True)
+        links = element.find_all("a")
+
+        assert index.text is True
+        assert index.find_text(element, "3") == [links[2]]
+        assert index.find_text(element, re.compile(r"\b4$")) == [links[3]]
+        assert index._tokens["4"] == [index.position(links[3])]
@@ -0,0 +1,48 @@
+"""Module with unit tests for helpers of n-gram index."""
+
+import re
+
+import pytest
+
+from soupsavvy.indexing.ngrams import ngrams, required_literals
+
+
+@pytest.mark.implementation
+class TestNgrams:
+    """Class with unit tests for `ngrams` function."""
+
+    def test_returns_unique_overlapping_ngrams(self):
+        """Tests if all unique, overlapping trigrams of text are returned."""
+        assert ngrams("abcabc") == {"abc", "bca", "cab"}
+
+    def test_returns_empty_set_for_short_text(self):
+        """Tests if empty set is returned if text is shorter than n."""
+        assert ngrams("ab") == set()
+        assert ngrams("ab", n=2) == {"ab"}
+
+
+@pytest.mark.implementation
+class TestRequiredLiterals:
+    """Class with unit tests for `required_literals` function."""
+
+    @pytest.mark.parametrize(
+        argnames="value, expected",
+        argvalues=[
+            ("/product", ["/product"]),
+            (re.compile(r"/product/\d+/reviews"), ["/product/", "/reviews"]),
+            (re.compile(r"^https://shop\.com$"), ["https://shop.com"]),
+            (re.compile("ab*c"), ["a", "c"]),
+            (re.compile("shop|product"), []),
+            (re.compile("(?:shop)+"), []),
+            (re.compile("shop", re.IGNORECASE), []),
+            (re.compile("(?i)shop"), []),
+            (re.compile(r"\d+"), []),
+        ],
+    )
+    def test_returns_literals_required_by_every_match(self, value, expected):
+        """
+        Tests if maximal runs of literals in top-level sequence of pattern
+        are returned, and none if pattern has no literals, that are required
+        in the same case.
+        """
+        assert required_literals(value) == expected
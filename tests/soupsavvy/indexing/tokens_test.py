@@ -0,0 +1,48 @@
+"""Module with unit tests for helpers of full-text index."""
+
+import re
+
+import pytest
+
+from soupsavvy.indexing.tokens import required_tokens, tokenize
+
+
+@pytest.mark.implementation
+class TestTokenize:
+    """Class with unit tests for `tokenize` function."""
+
+    def test_returns_unique_word_tokens(self):
+        """Tests if text is split into unique runs of word characters."""
+        assert tokenize("Add to cart, add to list!") == {
+            "Add",
+            "to",
+            "cart",
+            "add",
+            "list",
+        }
+        assert tokenize(" - ") == set()
+
+
+@pytest.mark.implementation
+class TestRequiredTokens:
+    """Class with unit tests for `required_tokens` function."""
+
+    @pytest.mark.parametrize(
+        argnames="pattern, expected",
+        argvalues=[
+            (r"Add to cart", ["to"]),
+            (r"\bAdd to cart\b", ["Add", "to", "cart"]),
+            (r"^Price: \d+", ["Price"]),
+            (r"total: (\d+) USD$", ["USD"]),
+            (r"(?a)\bcart\b", []),
+            (r"cart|basket", []),
+            (r"(?i)\bcart\b", []),
+            (r"\bcart", []),
+        ],
+    )
+    def test_returns_tokens_bounded_in_every_match(self, pattern, expected):
+        """
+        Tests if only words of literals, which are known to be bounded
+        by non-word characters or word boundaries, are returned.
+        """
+        assert required_tokens(re.compile(pattern)) == expected
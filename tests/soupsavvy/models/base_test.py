@@ -6,6 +6,8 @@ and all its utilities, including Field and decorators.
 
 # mypy: disable-error-code="arg-type"
 
+import asyncio
+
 import pytest
 
 import soupsavvy.exceptions as exc
@@ -14,6 +16,7 @@ from soupsavvy.models import Required
 from soupsavvy.models.base import BaseModel, Field, MigrationSchema, post, serializer
 from soupsavvy.operations.selection_pipeline import SelectionPipeline
 from tests.soupsavvy.conftest import (
+    MockAsyncElement,
     MockClassMenuSelector,
     MockClassWidgetSelector,
     MockDivSelector,
@@ -658,6 +661,30 @@ class TestBaseModel:
             MockModel(title="Title3", price=30),
         ]
 
+    def test_afind_and_afind_all_find_models_in_snapshot_of_async_element(
+        self, to_element: ToElement
+    ):
+        """
+        Tests if `afind` and `afind_all` class methods find models
+        in snapshot of asynchronous element, the same as `find` and `find_all`.
+        """
+        text = """
+            <span><a>Not in scope</a></span>
+            <div><a>Title</a><p class="widget">10</p></div>
+            <div><a>Title2</a><p class="widget">20</p></div>
+        """
+        async_element = MockAsyncElement(to_element(text))
+
+        result = asyncio.run(MockModel.afind(async_element))
+        assert result == MockModel(title="Title", price=10)
+
+        results = asyncio.run(MockModel.afind_all(async_element, limit=2))
+        assert results == [
+            MockModel(title="Title", price=10),
+            MockModel(title="Title2", price=20),
+        ]
+        assert async_element.calls == ["snapshot", "snapshot"]
+
     def test_find_all_returns_empty_list_if_no_scope_was_found(
         self, to_element: ToElement
     ):
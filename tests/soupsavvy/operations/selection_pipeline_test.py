@@ -2,6 +2,8 @@
 
 # mypy: disable-error-code="arg-type"
 
+import asyncio
+
 import pytest
 
 import soupsavvy.exceptions as exc
@@ -9,6 +11,7 @@ from soupsavvy.operations.general import OperationPipeline
 from soupsavvy.operations.selection_pipeline import SelectionPipeline
 from tests.soupsavvy.conftest import (
     BaseMockOperation,
+    MockAsyncElement,
     MockDivSelector,
     MockIntOperation,
     MockLinkSelector,
@@ -158,6 +161,25 @@ class TestSelectionPipeline:
         result = selector.find_all(bs)
         assert result == ["1", "2", "3", "Text Hello"]
 
+    def test_afind_and_afind_all_process_snapshot_of_async_element(
+        self, to_element: ToElement
+    ):
+        """
+        Tests if `afind` and `afind_all` process snapshot of asynchronous element
+        and return the same results as `find` and `find_all`.
+        """
+        text = """
+            <div href="github"></div>
+            <a>1</a>
+            <div><a>2</a></div>
+        """
+        async_element = MockAsyncElement(to_element(text))
+        selector = SelectionPipeline(MockLinkSelector(), MockTextOperation())
+
+        assert asyncio.run(selector.afind(async_element)) == "1"
+        assert asyncio.run(selector.afind_all(async_element)) == ["1", "2"]
+        assert async_element.calls == ["snapshot", "snapshot"]
+
     def test_find_returns_first_matching_child_if_recursive_false(
         self,
         to_element: ToElement,
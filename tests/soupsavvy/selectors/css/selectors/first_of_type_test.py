@@ -10,6 +10,7 @@ from tests.soupsavvy.conftest import ToElement, strip
 @pytest.mark.css
 @pytest.mark.selector
 @pytest.mark.skip_lxml
+@pytest.mark.skip_compact
 class TestFirstOfType:
     """Class with unit tests for FirstOfType selector."""
 
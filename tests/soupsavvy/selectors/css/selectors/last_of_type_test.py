@@ -9,6 +9,7 @@ from tests.soupsavvy.conftest import ToElement, strip
 @pytest.mark.css
 @pytest.mark.selector
 @pytest.mark.skip_lxml
+@pytest.mark.skip_compact
 class TestLastOfType:
     """Class with unit tests for LastOfType selector."""
 
@@ -12,6 +12,7 @@ from tests.soupsavvy.conftest import ToElement, strip
 @pytest.mark.css
 @pytest.mark.selector
 @pytest.mark.skip_lxml
+@pytest.mark.skip_compact
 class TestNthLastOfType:
     """Class with unit tests for NthLastOfType selector."""
 
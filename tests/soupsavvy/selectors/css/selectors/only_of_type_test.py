@@ -10,6 +10,7 @@ from tests.soupsavvy.conftest import ToElement, strip
 @pytest.mark.css
 @pytest.mark.selector
 @pytest.mark.skip_lxml
+@pytest.mark.skip_compact
 class TestOnlyOfType:
     """Class with unit tests for OnlyOfType selector."""
 
@@ -3,6 +3,8 @@
 import pytest
 
 from soupsavvy.exceptions import NotSoupSelectorException, TagNotFoundException
+from soupsavvy.selectors.attributes import AttributeSelector, ClassSelector
+from soupsavvy.selectors.general import TypeSelector
 from soupsavvy.selectors.logical import AndSelector
 from tests.soupsavvy.conftest import (
     MockClassMenuSelector,
@@ -355,3 +357,35 @@ class TestAndSelector:
             strip("""<a class="menu">1</a>"""),
             strip("""<a class="menu"><span>2</span></a>"""),
         ]
+
+    @pytest.mark.parametrize(
+        argnames="selectors, expected",
+        argvalues=[
+            (
+                [TypeSelector("div"), ClassSelector("menu")],
+                ("div", {"class": ["menu"]}),
+            ),
+            (
+                [ClassSelector("menu"), AttributeSelector("role", "list")],
+                (None, {"class": ["menu"], "role": ["list"]}),
+            ),
+            ([TypeSelector("div"), TypeSelector("div")], ("div", {})),
+            ([TypeSelector("div"), TypeSelector("span")], None),
+            (
+                [ClassSelector("menu"), ClassSelector("widget")],
+                (None, {"class": ["menu", "widget"]}),
+            ),
+            (
+                [ClassSelector("menu"), ClassSelector("menu")],
+                (None, {"class": ["menu"]}),
+            ),
+            ([TypeSelector("div"), MockClassMenuSelector()], None),
+        ],
+    )
+    def test_parse_filter_merges_filters_of_selectors(self, selectors: list, expected):
+        """
+        Tests if `_parse_filter` merges tag names and attributes of all selectors
+        requiring all values of the same attribute and returns None
+        if any selector has no filter or tag names conflict.
+        """
+        assert AndSelector(*selectors)._parse_filter == expected
@@ -0,0 +1,65 @@
+"""Module for testing global table of interned tag and attribute names."""
+
+import pytest
+
+from soupsavvy import AttributeSelector, ClassSelector, TypeSelector
+from soupsavvy.utils.names import NAMES, NameTable, canonical_name, intern_name
+
+
+def fresh(name: str) -> str:
+    """Returns new string object equal to the name, which is not interned."""
+    return "".join(list(name))
+
+
+@pytest.mark.selector
+class TestNameTable:
+    """Class with unit tests for `NameTable` component."""
+
+    def test_intern_returns_the_same_instance_for_equal_names(self):
+        """Tests if equal names are interned as the same, canonical instance."""
+        table = NameTable()
+        first = table.intern(fresh("custom-element"))
+
+        assert first == "custom-element"
+        assert table.intern(fresh("custom-element")) is first
+        assert len(table) == 1
+
+    def test_canonical_returns_registered_instance_without_registering(self):
+        """
+        Tests if `canonical` returns registered instance of the name,
+        while names, which are not registered, are returned unchanged
+        and are not added to the table.
+        """
+        table = NameTable()
+        registered = table.intern(fresh("div"))
+        name = fresh("data-v-3a9f1c2e")
+
+        assert table.canonical(fresh("div")) is registered
+        assert table.canonical(name) is name
+        assert name not in table
+        assert len(table) == 1
+
+    def test_intern_name_uses_global_table(self):
+        """
+        Tests if `intern_name` interns strings in global table
+        and returns other values unchanged.
+        """
+        name = intern_name(fresh("data-soupsavvy-test"))
+
+        assert name in NAMES
+        assert intern_name(fresh("data-soupsavvy-test")) is name
+        assert intern_name(None) is None
+
+    def test_canonical_name_does_not_register_names(self):
+        """Tests if `canonical_name` does not add names to global table."""
+        name = fresh("data-soupsavvy-unregistered")
+
+        assert canonical_name(name) is name
+        assert name not in NAMES
+        assert canonical_name(fresh("class")) is intern_name("class")
+
+    def test_selectors_store_interned_names(self):
+        """Tests if selectors store canonical instances of tag and attribute names."""
+        assert TypeSelector(fresh("section")).name is intern_name("section")
+        assert AttributeSelector(fresh("data-id")).name is intern_name("data-id")
+        assert ClassSelector("menu").name is intern_name("class")
@@ -0,0 +1,76 @@
+"""Module with unit tests for translation of regex patterns into JavaScript."""
+
+import re
+
+import pytest
+
+from soupsavvy.utils.regex import FLAGS, to_js_regex
+
+
+@pytest.mark.implementation
+class TestToJsRegex:
+    """Class with unit tests for `to_js_regex` function."""
+
+    @pytest.mark.parametrize(
+        argnames="pattern, expected",
+        argvalues=[
+            (re.compile(r"menu"), "menu"),
+            (re.compile(r"a.c"), r"a[^\n]c"),
+            (re.compile(r"a.c", re.DOTALL), r"a[\s\S]c"),
+            (re.compile(r"^a"), r"(?<![\s\S])a"),
+            (re.compile(r"^a", re.MULTILINE), r"(?<![^\n])a"),
+            (re.compile(r"a$"), r"a(?=\n?(?![\s\S]))"),
+            (re.compile(r"a\Z"), r"a(?![\s\S])"),
+            (re.compile(r"\d+"), r"(?:[\p{Nd}]){1,}"),
+            (re.compile(r"\d{2,3}?", re.ASCII), r"(?:[\d]){2,3}?"),
+            (re.compile(r"\W"), r"[^\p{L}\p{N}_]"),
+            (re.compile(r"(?P<x>a)(?P=x)|b"), r"(?:(a)\1|b)"),
+            (re.compile(r"(?<!/)x"), r"(?<!\u{2f})x"),
+        ],
+    )
+    def test_translates_pattern_into_equivalent_source(self, pattern, expected):
+        """
+        Tests if pattern is translated into JavaScript source, which matches
+        the same strings, with unicode flag.
+        """
+        assert to_js_regex(pattern) == (expected, FLAGS)
+
+    def test_translates_unicode_space_as_python_whitespace(self):
+        """
+        Tests if `\\s` is translated into explicit set of characters,
+        which python treats as whitespace, as it differs from JavaScript.
+        """
+        source, _ = to_js_regex(re.compile(r"\s"))  # type: ignore[misc]
+
+        assert r"\u{a0}" in source
+        assert r"\u{1c}" in source
+        assert r"\u{feff}" not in source
+
+    @pytest.mark.parametrize(
+        argnames="pattern",
+        argvalues=[
+            re.compile(r"menu", re.IGNORECASE),
+            re.compile(r"(?i:menu)"),
+            re.compile(r"(a)?(?(1)a|b)"),
+            re.compile(r"[\W\d]"),
+            re.compile(rb"menu"),
+        ],
+    )
+    def test_returns_none_if_pattern_can_not_be_translated(self, pattern):
+        """
+        Tests if None is returned for patterns, which JavaScript can not match
+        with the same semantics, like case-insensitive or conditional patterns.
+        """
+        assert to_js_regex(pattern) is None
+
+    @pytest.mark.parametrize(argnames="text", argvalues=["", " ", "a", "ab", "a b"])
+    def test_non_boundary_matches_the_same_strings(self, text):
+        """
+        Tests if `\\B` is translated into source, which matches the same strings,
+        including empty string, which python does not match.
+        Source of ascii pattern is valid python pattern with the same semantics.
+        """
+        pattern = re.compile(r"\B", re.ASCII)
+        source, _ = to_js_regex(pattern)  # type: ignore[misc]
+
+        assert bool(re.search(source, text)) == bool(pattern.search(text))
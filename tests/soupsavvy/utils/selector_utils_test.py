@@ -90,6 +90,19 @@ class TestElementWrapper:
         tag1 = ElementWrapper(mock_element)
         assert tag1 != other
 
+    def test_stores_order_and_base_in_fixed_fields(self, mock_element: IElement):
+        """
+        Tests that ElementWrapper keeps order and base flag in its slots
+        and does not accept any other attributes.
+        """
+        wrapper = ElementWrapper(mock_element, order=3, base=True)
+
+        assert (wrapper.order, wrapper.base) == (3, True)
+        assert ElementWrapper(mock_element) == wrapper
+
+        with pytest.raises(AttributeError):
+            wrapper._order = 1  # type: ignore[attr-defined]
+
 
 class TestTagIterator:
     """Class with unit tests for TagIterator class."""